@@ -0,0 +1,300 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Análise Vetorizada
+
+Este módulo exporta as ocorrências da central para arrays NumPy e calcula
+indicadores agregados sem laços em Python: tempo até o despacho, tempo até a
+resolução, contagens por região × severidade × status, produtividade de cada
+equipe e taxas de chegada em janelas móveis.
+
+Requer NumPy (pip install numpy); o restante do sistema não depende dele.
+"""
+
+from datetime import timedelta
+
+from armazenamento_colunar import SEM_DATA, STATUS_CONHECIDOS, ArmazenamentoColunar
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: só este módulo precisa dele
+    np = None
+
+MICROSSEGUNDOS_POR_MINUTO = 60_000_000
+MICROSSEGUNDOS_POR_HORA = 3_600_000_000
+
+
+def _exigir_numpy():
+    if np is None:
+        raise ImportError("O módulo de análise requer NumPy: pip install numpy")
+
+
+class ColunasOcorrencias:
+    """
+    Cópia das ocorrências em arrays NumPy, uma coluna por campo.
+
+    Regiões, status e equipes são códigos inteiros nas tabelas correspondentes;
+    datas são microssegundos desde 1970-01-01, com SEM_DATA (-1) quando ausentes.
+
+    Atributos:
+        ids (np.ndarray[int64]): IDs das ocorrências
+        severidades (np.ndarray[int8]): Severidades (1-5)
+        regioes (np.ndarray[uint16]): Códigos de região em `nomes_regioes`
+        status (np.ndarray[uint8]): Códigos de status em `nomes_status`
+        equipes (np.ndarray[uint16]): Códigos de equipe em `tabela_equipes` (0 = sem equipe)
+        data_registro, data_atendimento, data_resolucao (np.ndarray[int64]): Datas em µs
+        nomes_regioes (list[str]): Região de cada código
+        nomes_status (list[str]): Status de cada código
+        tabela_equipes (list[Equipe | None]): Equipe de cada código
+    """
+
+    def __init__(self, ids, severidades, regioes, status, equipes, data_registro, data_atendimento,
+                 data_resolucao, nomes_regioes, nomes_status, tabela_equipes):
+        self.ids = ids
+        self.severidades = severidades
+        self.regioes = regioes
+        self.status = status
+        self.equipes = equipes
+        self.data_registro = data_registro
+        self.data_atendimento = data_atendimento
+        self.data_resolucao = data_resolucao
+        self.nomes_regioes = nomes_regioes
+        self.nomes_status = nomes_status
+        self.tabela_equipes = tabela_equipes
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def exportar(ocorrencias) -> ColunasOcorrencias:
+    """
+    Copia as ocorrências para arrays NumPy.
+
+    Com um ArmazenamentoColunar a cópia é feita coluna a coluna, direto dos
+    buffers dos arrays tipados (sem passar por objetos Python). Qualquer outra
+    fonte (o dicionário da central, uma lista) é antes convertida em colunas.
+    As colunas são copiadas, e não compartilhadas, para que o armazenamento
+    continue podendo crescer enquanto a análise é usada.
+
+    Args:
+        ocorrencias (ArmazenamentoColunar | dict[int, Ocorrencia] | Iterable[Ocorrencia]):
+            Ocorrências da central (ex.: central.ocorrencias)
+
+    Returns:
+        ColunasOcorrencias: Colunas prontas para análise
+    """
+    _exigir_numpy()
+    if isinstance(ocorrencias, ArmazenamentoColunar):
+        armazenamento = ocorrencias
+    else:
+        armazenamento = ArmazenamentoColunar()
+        for ocorrencia in (ocorrencias.values() if isinstance(ocorrencias, dict) else ocorrencias):
+            armazenamento.adicionar(ocorrencia)
+
+    def coluna(valores, tipo):
+        return np.frombuffer(valores, dtype=tipo).copy() if len(valores) else np.empty(0, dtype=tipo)
+
+    return ColunasOcorrencias(
+        ids=coluna(armazenamento._ids, np.int64),
+        severidades=coluna(armazenamento._severidades, np.int8),
+        regioes=coluna(armazenamento._regioes, np.uint16),
+        status=coluna(armazenamento._status, np.uint8),
+        equipes=coluna(armazenamento._equipes, np.uint16),
+        data_registro=coluna(armazenamento._data_registro, np.int64),
+        data_atendimento=coluna(armazenamento._data_atendimento, np.int64),
+        data_resolucao=coluna(armazenamento._data_resolucao, np.int64),
+        nomes_regioes=list(armazenamento.regioes.valores),
+        nomes_status=list(armazenamento.status.valores),
+        tabela_equipes=list(armazenamento.equipes.valores),
+    )
+
+
+def tempos_ate_despacho(colunas: ColunasOcorrencias) -> "np.ndarray":
+    """
+    Minutos entre o registro e o início do atendimento, para as ocorrências já despachadas.
+
+    Returns:
+        np.ndarray[float64]: Um valor por ocorrência despachada
+    """
+    atendidas = colunas.data_atendimento != SEM_DATA
+    return (colunas.data_atendimento[atendidas] - colunas.data_registro[atendidas]) / MICROSSEGUNDOS_POR_MINUTO
+
+
+def tempos_ate_resolucao(colunas: ColunasOcorrencias) -> "np.ndarray":
+    """
+    Minutos entre o registro e a resolução, para as ocorrências resolvidas.
+
+    Returns:
+        np.ndarray[float64]: Um valor por ocorrência resolvida
+    """
+    resolvidas = colunas.data_resolucao != SEM_DATA
+    return (colunas.data_resolucao[resolvidas] - colunas.data_registro[resolvidas]) / MICROSSEGUNDOS_POR_MINUTO
+
+
+def percentis(valores, fracoes) -> list[float]:
+    """
+    Calcula percentis exatos pelo posto mais próximo (sempre valores observados).
+
+    Em vez de ordenar ou particionar o array inteiro, conta os valores por
+    minuto com np.bincount, localiza na soma acumulada o minuto que contém cada
+    posto e particiona só os valores daquele minuto. O custo é O(n) com
+    constantes pequenas, o que importa com milhões de registros.
+
+    Args:
+        valores (np.ndarray): Valores em minutos (não vazio)
+        fracoes (Iterable[float]): Frações desejadas, entre 0 e 1
+
+    Returns:
+        list[float]: Um percentil por fração
+    """
+    minutos = valores.astype(np.int64)  # Truncar preserva a ordem: serve como balde
+    minutos -= minutos.min()
+    acumulado = np.cumsum(np.bincount(minutos))
+    resultado = []
+    for fracao in fracoes:
+        posto = min(len(valores) - 1, int(fracao * len(valores)))
+        balde = int(np.searchsorted(acumulado, posto, side="right"))
+        anteriores = int(acumulado[balde - 1]) if balde else 0
+        no_balde = valores[minutos == balde]
+        resultado.append(float(np.partition(no_balde, posto - anteriores)[posto - anteriores]))
+    return resultado
+
+
+def resumir_tempos(minutos) -> dict:
+    """
+    Resume uma distribuição de tempos.
+
+    Args:
+        minutos (np.ndarray): Tempos em minutos
+
+    Returns:
+        dict: quantidade, media, p50, p90, p99 e maximo (em minutos; zeros se
+            vazio). Os percentis são pelo posto mais próximo (ver percentis)
+    """
+    if len(minutos) == 0:
+        return {"quantidade": 0, "media": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "maximo": 0.0}
+    p50, p90, p99 = percentis(minutos, (0.50, 0.90, 0.99))
+    return {
+        "quantidade": int(len(minutos)),
+        "media": float(minutos.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "maximo": float(minutos.max()),
+    }
+
+
+def contagens(colunas: ColunasOcorrencias) -> "np.ndarray":
+    """
+    Conta as ocorrências por região × severidade × status em uma única passada.
+
+    Os três códigos são combinados em um índice linear e contados com
+    np.bincount; o resultado é remodelado como um cubo.
+
+    Returns:
+        np.ndarray[int64]: Cubo [região, severidade - 1, status], indexado por
+            colunas.nomes_regioes e colunas.nomes_status
+    """
+    total_regioes = max(len(colunas.nomes_regioes), 1)
+    total_status = max(len(colunas.nomes_status), len(STATUS_CONHECIDOS))
+    indice = (
+        colunas.regioes.astype(np.int64) * (5 * total_status)
+        + (colunas.severidades.astype(np.int64) - 1) * total_status
+        + colunas.status
+    )
+    contagem = np.bincount(indice, minlength=total_regioes * 5 * total_status)
+    return contagem.reshape(total_regioes, 5, total_status)
+
+
+def contagens_por_nome(colunas: ColunasOcorrencias) -> dict[tuple[str, int, str], int]:
+    """Retorna as contagens não nulas de `contagens` como {(regiao, severidade, status): total}."""
+    cubo = contagens(colunas)
+    return {
+        (colunas.nomes_regioes[regiao], int(severidade) + 1, colunas.nomes_status[status]): int(cubo[regiao, severidade, status])
+        for regiao, severidade, status in zip(*np.nonzero(cubo))
+    }
+
+
+def produtividade_equipes(colunas: ColunasOcorrencias) -> dict[str, dict]:
+    """
+    Calcula, por equipe, o total de atendimentos, de resoluções e o tempo médio de combate.
+
+    Returns:
+        dict[str, dict]: Para cada equipe com atendimentos: atendimentos,
+            resolvidas e minutos_medios_atendimento (do início do atendimento à resolução)
+    """
+    total = len(colunas.tabela_equipes)
+    atendimentos = np.bincount(colunas.equipes, minlength=total)
+    # Sem indexação booleana (que copia cada coluna): as linhas não resolvidas
+    # entram com duração zero e a contagem sai de uma chave equipe*2 + resolvida
+    resolvidas = colunas.data_resolucao != SEM_DATA
+    resolvidas &= colunas.data_atendimento != SEM_DATA
+    chave = colunas.equipes.astype(np.int64) * 2
+    chave += resolvidas
+    quantidade = np.bincount(chave, minlength=2 * total)[1::2]
+    duracao = colunas.data_resolucao - colunas.data_atendimento
+    duracao *= resolvidas
+    duracao = np.bincount(colunas.equipes, weights=duracao, minlength=total) / MICROSSEGUNDOS_POR_MINUTO
+    resultado = {}
+    for codigo in np.nonzero(atendimentos)[0]:
+        equipe = colunas.tabela_equipes[codigo]
+        if equipe is None:
+            continue
+        resultado[equipe.nome] = {
+            "atendimentos": int(atendimentos[codigo]),
+            "resolvidas": int(quantidade[codigo]),
+            "minutos_medios_atendimento": float(duracao[codigo] / quantidade[codigo]) if quantidade[codigo] else 0.0,
+        }
+    return resultado
+
+
+def taxas_janela_movel(colunas: ColunasOcorrencias, janela: timedelta = timedelta(hours=1),
+                       passo: timedelta = timedelta(minutes=5)) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Calcula a taxa de novas ocorrências (por hora) em uma janela móvel.
+
+    Os registros são contados em intervalos de largura `passo` com np.bincount;
+    a soma móvel sobre `janela` sai da diferença de somas acumuladas, em O(n).
+
+    Args:
+        colunas (ColunasOcorrencias): Ocorrências exportadas
+        janela (timedelta): Largura da janela móvel
+        passo (timedelta): Resolução da série (deve dividir a janela)
+
+    Returns:
+        tuple[np.ndarray[datetime64[us]], np.ndarray[float64]]: Fim de cada
+            janela e a taxa de ocorrências por hora naquela janela
+    """
+    if len(colunas) == 0:
+        return np.empty(0, dtype="datetime64[us]"), np.empty(0)
+    passo_us = passo // timedelta(microseconds=1)
+    largura = max(1, janela // passo)
+    inicio = int(colunas.data_registro.min())
+    intervalos = np.bincount((colunas.data_registro - inicio) // passo_us)
+    acumulado = np.concatenate(([0], np.cumsum(intervalos)))
+    soma_movel = acumulado[1:] - acumulado[np.maximum(np.arange(1, len(acumulado)) - largura, 0)]
+    taxas = soma_movel * (MICROSSEGUNDOS_POR_HORA / (largura * passo_us))
+    fins = (inicio + np.arange(1, len(taxas) + 1, dtype=np.int64) * passo_us).astype("datetime64[us]")
+    return fins, taxas
+
+
+def relatorio(ocorrencias) -> dict:
+    """
+    Calcula todos os indicadores de uma vez.
+
+    Args:
+        ocorrencias: Fonte aceita por exportar (ex.: central.ocorrencias)
+
+    Returns:
+        dict: total, tempo_ate_despacho, tempo_ate_resolucao (ver resumir_tempos),
+            contagens (ver contagens_por_nome), equipes (ver produtividade_equipes)
+            e taxa_maxima_por_hora (pico da janela móvel de 1 hora)
+    """
+    colunas = exportar(ocorrencias)
+    _, taxas = taxas_janela_movel(colunas)
+    return {
+        "total": len(colunas),
+        "tempo_ate_despacho": resumir_tempos(tempos_ate_despacho(colunas)),
+        "tempo_ate_resolucao": resumir_tempos(tempos_ate_resolucao(colunas)),
+        "contagens": contagens_por_nome(colunas),
+        "equipes": produtividade_equipes(colunas),
+        "taxa_maxima_por_hora": float(taxas.max()) if len(taxas) else 0.0,
+    }
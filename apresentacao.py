@@ -0,0 +1,189 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Apresentação
+
+Este módulo concentra a formatação de ocorrências e de páginas de resultados,
+para o console e para JSON. As consultas (CentralAtendimento.iterar_ocorrencias,
+paginar_ocorrencias, Historico.paginar) só devolvem dados; quem os exibe
+escolhe aqui o formato.
+"""
+
+from typing import Iterable
+
+from paginacao import Pagina
+
+
+def ocorrencia_para_json(ocorrencia) -> dict:
+    """
+    Converte uma ocorrência em um dicionário serializável em JSON.
+
+    Args:
+        ocorrencia (Ocorrencia): Ocorrência a converter
+
+    Returns:
+        dict: Campos da ocorrência, com datas em ISO 8601 e a equipe pelo nome
+    """
+    equipe = ocorrencia.equipe_atendimento
+    return {
+        "id": ocorrencia.id,
+        "regiao": ocorrencia.regiao,
+        "severidade": ocorrencia.severidade,
+        "descricao": ocorrencia.descricao,
+        "status": ocorrencia.status,
+        "data_registro": ocorrencia.data_registro.isoformat(),
+        "data_atendimento": ocorrencia.data_atendimento.isoformat() if ocorrencia.data_atendimento else None,
+        "data_resolucao": ocorrencia.data_resolucao.isoformat() if ocorrencia.data_resolucao else None,
+        "equipe": equipe.nome if equipe is not None else None,
+        "latitude": ocorrencia.latitude,
+        "longitude": ocorrencia.longitude,
+    }
+
+
+def equipe_para_json(equipe) -> dict:
+    """
+    Converte uma equipe em um dicionário serializável em JSON.
+
+    Returns:
+        dict: nome, regiao_base, coordenadas da base e atendimentos_ativos
+    """
+    return {
+        "nome": equipe.nome,
+        "regiao_base": equipe.regiao_base,
+        "latitude": equipe.latitude,
+        "longitude": equipe.longitude,
+        "atendimentos_ativos": equipe.atendimentos_ativos,
+    }
+
+
+def evento_para_json(evento) -> dict:
+    """
+    Converte um evento do barramento (ver BarramentoEventos) em um dicionário serializável em JSON.
+
+    Returns:
+        dict: {"seq": ..., "tipo": ..., "dados": estado da entidade após a mudança}
+    """
+    return {"seq": evento.seq, "tipo": evento.tipo, "dados": evento.dados}
+
+
+def pagina_para_json(pagina: Pagina) -> dict:
+    """
+    Converte uma página de ocorrências em um dicionário serializável em JSON.
+
+    Returns:
+        dict: {"ocorrencias": [...], "cursor": cursor da próxima página ou None}
+    """
+    return {"ocorrencias": [ocorrencia_para_json(ocorrencia) for ocorrencia in pagina], "cursor": pagina.cursor}
+
+
+def exibir_ocorrencias(ocorrencias: Iterable, titulo: str, mensagem_vazio: str, detalhada=False) -> int:
+    """
+    Exibe ocorrências no console à medida que são produzidas (sem copiá-las).
+
+    Args:
+        ocorrencias (Iterable[Ocorrencia]): Ocorrências a exibir (ex.: uma página ou um gerador)
+        titulo (str): Cabeçalho exibido antes da primeira ocorrência
+        mensagem_vazio (str): Mensagem exibida se não houver ocorrências
+        detalhada (bool): Se True, exibe a representação completa (__str__);
+            senão, o resumo de cada ocorrência
+
+    Returns:
+        int: Número de ocorrências exibidas
+    """
+    exibidas = 0
+    for ocorrencia in ocorrencias:
+        if not exibidas:
+            print("\n" + "="*50)
+            print(titulo)
+            print("="*50)
+        if detalhada:
+            print(ocorrencia.__str__())
+        else:
+            ocorrencia.exibir_resumo()
+        exibidas += 1
+    if not exibidas:
+        print("\n" + "="*50)
+        print(mensagem_vazio)
+        print("="*50)
+    return exibidas
+
+
+def exibir_pagina(pagina: Pagina, titulo: str, mensagem_vazio: str, detalhada=False):
+    """
+    Exibe uma página de ocorrências no console e indica se há mais páginas.
+
+    Args:
+        pagina (Pagina): Página a exibir
+        titulo (str): Cabeçalho da página
+        mensagem_vazio (str): Mensagem exibida se a página estiver vazia
+        detalhada (bool): Se True, exibe a representação completa de cada ocorrência
+    """
+    exibir_ocorrencias(pagina, titulo, mensagem_vazio, detalhada)
+    if not pagina.ultima:
+        print(f"➡️  Há mais resultados depois da ocorrência #{pagina.itens[-1].id}")
+
+
+def relatorio_turno_para_json(relatorio: dict) -> dict:
+    """Converte um relatório de turno (CentralAtendimento.relatorio_turno) para JSON."""
+    return {
+        **relatorio,
+        "inicio": relatorio["inicio"].isoformat(),
+        "fim": relatorio["fim"].isoformat(),
+        "registradas_por_severidade": {str(severidade): total for severidade, total
+                                       in relatorio["registradas_por_severidade"].items()},
+    }
+
+
+def exibir_relatorio_turno(relatorio: dict):
+    """
+    Exibe um relatório de turno no console.
+
+    Args:
+        relatorio (dict): Resultado de CentralAtendimento.relatorio_turno
+    """
+    print("\n" + "="*50)
+    print(f"🕒 RELATÓRIO DO TURNO: {relatorio['inicio'].strftime('%d/%m/%Y %H:%M')} "
+          f"- {relatorio['fim'].strftime('%d/%m/%Y %H:%M')}")
+    print("="*50)
+    print(f"📥 Registradas: {relatorio['registradas']}")
+    print(f"🚒 Atendidas: {relatorio['atendidas']} "
+          f"(média de {relatorio['minutos_medios_ate_atendimento']:.1f} min desde o registro)")
+    print(f"✅ Resolvidas: {relatorio['resolvidas']} "
+          f"(média de {relatorio['minutos_medios_ate_resolucao']:.1f} min desde o registro)")
+    print("-"*50)
+    print("⚠️ Registradas por severidade: " + ", ".join(
+        f"{severidade}: {total}" for severidade, total in relatorio["registradas_por_severidade"].items()))
+    for regiao, total in sorted(relatorio["registradas_por_regiao"].items()):
+        print(f"📍 {regiao}: {total}")
+    print("="*50)
+
+
+def exibir_resumo_roteiro(resumo, central, maximo_erros=10):
+    """
+    Exibe o resumo da execução de um roteiro no console.
+
+    Args:
+        resumo (ResumoRoteiro): Resultado de executar_roteiro
+        central (CentralAtendimento): Central em que o roteiro foi executado
+        maximo_erros (int): Erros listados individualmente
+    """
+    total = resumo.total
+    print("\n" + "="*50)
+    print("📊 RESUMO DO ROTEIRO")
+    print("="*50)
+    print(f"⏱️ {total:,} operações em {resumo.segundos:.3f} s "
+          f"({total / resumo.segundos if resumo.segundos else 0:,.0f} operações/s)")
+    print(f"\n{'operação':>22} | {'quantidade':>10} | {'erros':>6} | {'ms':>9} | {'µs/op':>8}")
+    print("-"*67)
+    for operacao, (quantidade, erros, nanossegundos) in sorted(resumo.operacoes.items()):
+        print(f"{operacao:>22} | {quantidade:>10,} | {erros:>6,} | {nanossegundos / 1e6:>9.1f} | "
+              f"{nanossegundos / 1e3 / quantidade:>8.1f}")
+    if resumo.erros:
+        print(f"\n❌ {len(resumo.erros):,} operações com erro:")
+        for linha, motivo in resumo.erros[:maximo_erros]:
+            print(f"   Linha {linha}: {motivo}")
+        if len(resumo.erros) > maximo_erros:
+            print(f"   ... e mais {len(resumo.erros) - maximo_erros:,}")
+    print("-"*50)
+    print(f"📋 Ocorrências: {len(central.ocorrencias):,} "
+          f"({central.fila_prioridade.estatisticas()['pendentes']:,} pendentes)")
+    print(f"👥 Equipes: {len(central.equipes):,} ({central.despacho.equipes_livres():,} livres)")
+    print("="*50)
@@ -0,0 +1,372 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Armazenamento Colunar
+
+Este módulo implementa um armazenamento compacto de ocorrências em colunas
+(arrays tipados), usado opcionalmente pela CentralAtendimento no lugar do
+dicionário de objetos. As ocorrências são entregues como visões leves sob demanda.
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from itertools import compress
+from math import isnan, nan
+from typing import TYPE_CHECKING
+
+from ocorrencia import Ocorrencia
+
+if TYPE_CHECKING:
+    from equipe import Equipe
+
+EPOCA = datetime(1970, 1, 1)
+MICROSSEGUNDO = timedelta(microseconds=1)
+SEM_DATA = -1  # Marcador de data ausente nas colunas de timestamps
+SEM_COORDENADA = nan  # Marcador de coordenada ausente nas colunas de latitude e longitude
+STATUS_CONHECIDOS = ("pendente", "em_atendimento", "resolvida")
+
+
+def para_epoca(data: datetime | None) -> int:
+    """
+    Converte uma data em microssegundos desde a época (sem perda de precisão).
+
+    Args:
+        data (datetime | None): Data a ser convertida
+
+    Returns:
+        int: Microssegundos desde 1970-01-01, ou SEM_DATA se a data for None
+    """
+    if data is None:
+        return SEM_DATA
+    return (data - EPOCA) // MICROSSEGUNDO
+
+
+def de_epoca(microssegundos: int) -> datetime | None:
+    """
+    Converte microssegundos desde a época de volta em datetime.
+
+    Args:
+        microssegundos (int): Valor armazenado na coluna
+
+    Returns:
+        datetime | None: Data correspondente, ou None se for SEM_DATA
+    """
+    if microssegundos == SEM_DATA:
+        return None
+    return EPOCA + timedelta(microseconds=microssegundos)
+
+
+class TabelaInternada:
+    """
+    Tabela de valores internados: cada valor distinto recebe um código inteiro.
+
+    Atributos:
+        valores (list): Valor correspondente a cada código
+        _codigos (dict): Mapeamento de valor para código
+    """
+
+    def __init__(self, valores=()):
+        """Inicializa a tabela com os valores iniciais, na ordem dada."""
+        self.valores = []
+        self._codigos = {}
+        for valor in valores:
+            self.codigo(valor)
+
+    def codigo(self, valor) -> int:
+        """Retorna o código do valor, criando um novo se necessário."""
+        codigo = self._codigos.get(valor)
+        if codigo is None:
+            codigo = len(self.valores)
+            self._codigos[valor] = codigo
+            self.valores.append(valor)
+        return codigo
+
+
+class ArmazenamentoColunar:
+    """
+    Armazenamento de ocorrências em colunas tipadas.
+
+    Cada ocorrência ocupa uma linha; os campos ficam em arrays paralelos:
+    IDs e timestamps como inteiros de 64 bits (microssegundos desde a época),
+    severidade e status em um byte, região e equipe como códigos internados,
+    coordenadas como float de 64 bits (NaN quando ausentes).
+    Só a descrição permanece como objeto str.
+
+    A busca por ID usa busca binária na coluna de IDs, que é crescente quando as
+    ocorrências são registradas na ordem de criação. Se um ID chegar fora de
+    ordem, a coluna deixa de estar ordenada e o armazenamento passa a manter um
+    dicionário ID -> linha para todas as linhas.
+
+    A interface imita a de dict[int, Ocorrencia] para leitura (get, in, len,
+    values, items), de forma que a CentralAtendimento possa usar qualquer um dos dois.
+
+    Atributos:
+        _ids (array): IDs das ocorrências
+        _severidades (array): Severidades (1-5)
+        _regioes (array): Códigos de região em `regioes`
+        _status (array): Códigos de status em `status`
+        _equipes (array): Códigos de equipe em `equipes` (0 = sem equipe)
+        _data_registro, _data_atendimento, _data_resolucao (array): Timestamps em µs
+        _latitudes, _longitudes (array): Coordenadas em graus (SEM_COORDENADA se ausentes)
+        _descricoes (list[str]): Descrições
+        regioes, status, equipes (TabelaInternada): Tabelas de valores internados
+        observador (Callable | None): Observador de mudanças de status comum a todas as linhas
+    """
+
+    def __init__(self):
+        """Inicializa um armazenamento vazio."""
+        self._ids = array("q")
+        self._severidades = array("b")
+        self._regioes = array("H")
+        self._status = array("B")
+        self._equipes = array("H")
+        self._data_registro = array("q")
+        self._data_atendimento = array("q")
+        self._data_resolucao = array("q")
+        self._latitudes = array("d")
+        self._longitudes = array("d")
+        self._descricoes: list[str] = []
+        self._linhas_por_id: dict[int, int] | None = None  # Criado só se um ID chegar fora de ordem
+        self.regioes = TabelaInternada()
+        self.status = TabelaInternada(STATUS_CONHECIDOS)
+        self.equipes = TabelaInternada([None])
+        self.observador = None
+
+    def adicionar(self, ocorrencia: Ocorrencia) -> "OcorrenciaColunar":
+        """
+        Copia uma ocorrência para as colunas e retorna a visão correspondente.
+
+        Args:
+            ocorrencia (Ocorrencia): Ocorrência a ser armazenada
+
+        Returns:
+            OcorrenciaColunar: Visão da ocorrência armazenada
+
+        Raises:
+            ValueError: Se já existir uma ocorrência com o mesmo ID
+        """
+        if ocorrencia.id in self:
+            raise ValueError(f"Ocorrência #{ocorrencia.id} já armazenada")
+        linha = len(self._ids)
+        if self._linhas_por_id is None and self._ids and ocorrencia.id < self._ids[-1]:
+            self._linhas_por_id = {id_ocorrencia: i for i, id_ocorrencia in enumerate(self._ids)}
+        if self._linhas_por_id is not None:
+            self._linhas_por_id[ocorrencia.id] = linha
+        self._ids.append(ocorrencia.id)
+        self._severidades.append(ocorrencia.severidade)
+        self._regioes.append(self.regioes.codigo(ocorrencia.regiao))
+        self._status.append(self.status.codigo(ocorrencia.status))
+        self._equipes.append(self.equipes.codigo(ocorrencia.equipe_atendimento))
+        self._data_registro.append(para_epoca(ocorrencia.data_registro))
+        self._data_atendimento.append(para_epoca(ocorrencia.data_atendimento))
+        self._data_resolucao.append(para_epoca(ocorrencia.data_resolucao))
+        if ocorrencia.latitude is None:
+            self._latitudes.append(SEM_COORDENADA)
+            self._longitudes.append(SEM_COORDENADA)
+        else:
+            self._latitudes.append(ocorrencia.latitude)
+            self._longitudes.append(ocorrencia.longitude)
+        self._descricoes.append(ocorrencia.descricao)
+        return OcorrenciaColunar(self, linha)
+
+    def remover(self, ids) -> array:
+        """
+        Remove as linhas de vários IDs de uma vez, compactando as colunas.
+
+        As linhas seguintes às removidas mudam de número, então visões
+        existentes ficam inválidas: quem as guarda deve atualizar o `_linha` de
+        cada uma pelo mapa retornado (a CentralAtendimento faz isso para as
+        visões da fila e dos históricos das equipes).
+
+        Args:
+            ids (Iterable[int]): IDs a remover (IDs não armazenados são ignorados)
+
+        Returns:
+            array: Nova linha de cada linha anterior (-1 para as removidas)
+        """
+        manter = bytearray(b"\x01") * len(self._ids)
+        for id_ocorrencia in ids:
+            linha = self.linha(id_ocorrencia)
+            if linha >= 0:
+                manter[linha] = 0
+        for nome in ("_ids", "_severidades", "_regioes", "_status", "_equipes", "_data_registro",
+                     "_data_atendimento", "_data_resolucao", "_latitudes", "_longitudes"):
+            coluna = getattr(self, nome)
+            setattr(self, nome, array(coluna.typecode, compress(coluna, manter)))
+        self._descricoes = list(compress(self._descricoes, manter))
+        mapa = array("q", [-1]) * len(manter)
+        nova = 0
+        for linha, mantida in enumerate(manter):
+            if mantida:
+                mapa[linha] = nova
+                nova += 1
+        if self._linhas_por_id is not None:
+            self._linhas_por_id = {id_ocorrencia: i for i, id_ocorrencia in enumerate(self._ids)}
+        return mapa
+
+    def linha(self, id_ocorrencia: int) -> int:
+        """
+        Localiza a linha de uma ocorrência pelo ID.
+
+        Args:
+            id_ocorrencia (int): ID da ocorrência
+
+        Returns:
+            int: Índice da linha, ou -1 se o ID não estiver armazenado
+        """
+        if self._linhas_por_id is not None:
+            return self._linhas_por_id.get(id_ocorrencia, -1)
+        ids = self._ids
+        posicao = bisect_left(ids, id_ocorrencia)
+        if posicao < len(ids) and ids[posicao] == id_ocorrencia:
+            return posicao
+        return -1
+
+    def get(self, id_ocorrencia, padrao=None):
+        """Retorna a visão da ocorrência com o ID dado, ou `padrao` se não existir."""
+        linha = self.linha(id_ocorrencia)
+        if linha < 0:
+            return padrao
+        return OcorrenciaColunar(self, linha)
+
+    def __getitem__(self, id_ocorrencia) -> "OcorrenciaColunar":
+        linha = self.linha(id_ocorrencia)
+        if linha < 0:
+            raise KeyError(id_ocorrencia)
+        return OcorrenciaColunar(self, linha)
+
+    def __contains__(self, id_ocorrencia) -> bool:
+        return self.linha(id_ocorrencia) >= 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def keys(self):
+        """Itera sobre os IDs armazenados, em ordem de armazenamento."""
+        return iter(self._ids)
+
+    def values(self):
+        """Itera sobre visões de todas as ocorrências, em ordem de armazenamento."""
+        return (OcorrenciaColunar(self, linha) for linha in range(len(self._ids)))
+
+    def items(self):
+        """Itera sobre pares (ID, visão), em ordem de armazenamento."""
+        return ((id_ocorrencia, OcorrenciaColunar(self, linha)) for linha, id_ocorrencia in enumerate(self._ids))
+
+
+def _coluna_data(nome):
+    """Cria uma propriedade de data ligada a uma coluna de timestamps."""
+    def ler(self):
+        return de_epoca(getattr(self._armazenamento, nome)[self._linha])
+
+    def escrever(self, valor):
+        getattr(self._armazenamento, nome)[self._linha] = para_epoca(valor)
+
+    return property(ler, escrever)
+
+
+def _coluna_coordenada(nome):
+    """Cria uma propriedade de coordenada ligada a uma coluna de floats."""
+    def ler(self):
+        valor = getattr(self._armazenamento, nome)[self._linha]
+        return None if isnan(valor) else valor
+
+    def escrever(self, valor):
+        getattr(self._armazenamento, nome)[self._linha] = SEM_COORDENADA if valor is None else valor
+
+    return property(ler, escrever)
+
+
+class OcorrenciaColunar(Ocorrencia):
+    """
+    Visão leve de uma linha do ArmazenamentoColunar.
+
+    Guarda apenas a referência ao armazenamento e o número da linha; leituras e
+    escritas de atributos são feitas diretamente nas colunas, de modo que todos os
+    métodos de Ocorrencia (atribuir_equipe, atualizar_status, exibir_resumo, ...)
+    funcionam sem alterações. Duas visões da mesma linha são iguais.
+    """
+
+    __slots__ = ("_armazenamento", "_linha")
+
+    def __init__(self, armazenamento: ArmazenamentoColunar, linha: int):
+        """
+        Cria uma visão para uma linha do armazenamento (não gera novo ID).
+
+        Args:
+            armazenamento (ArmazenamentoColunar): Armazenamento de origem
+            linha (int): Índice da linha
+        """
+        self._armazenamento = armazenamento
+        self._linha = linha
+
+    @property
+    def id(self):
+        return self._armazenamento._ids[self._linha]
+
+    @property
+    def severidade(self):
+        return self._armazenamento._severidades[self._linha]
+
+    @severidade.setter
+    def severidade(self, valor):
+        self._armazenamento._severidades[self._linha] = valor
+
+    @property
+    def regiao(self):
+        armazenamento = self._armazenamento
+        return armazenamento.regioes.valores[armazenamento._regioes[self._linha]]
+
+    @regiao.setter
+    def regiao(self, valor):
+        self._armazenamento._regioes[self._linha] = self._armazenamento.regioes.codigo(valor)
+
+    @property
+    def descricao(self):
+        return self._armazenamento._descricoes[self._linha]
+
+    @descricao.setter
+    def descricao(self, valor):
+        self._armazenamento._descricoes[self._linha] = valor
+
+    @property
+    def status(self):
+        armazenamento = self._armazenamento
+        return armazenamento.status.valores[armazenamento._status[self._linha]]
+
+    @status.setter
+    def status(self, valor):
+        self._armazenamento._status[self._linha] = self._armazenamento.status.codigo(valor)
+
+    @property
+    def equipe_atendimento(self) -> "Equipe | None":
+        armazenamento = self._armazenamento
+        return armazenamento.equipes.valores[armazenamento._equipes[self._linha]]
+
+    @equipe_atendimento.setter
+    def equipe_atendimento(self, valor):
+        self._armazenamento._equipes[self._linha] = self._armazenamento.equipes.codigo(valor)
+
+    @property
+    def _observador(self):
+        return self._armazenamento.observador
+
+    @_observador.setter
+    def _observador(self, valor):
+        self._armazenamento.observador = valor
+
+    data_registro = _coluna_data("_data_registro")
+    data_atendimento = _coluna_data("_data_atendimento")
+    data_resolucao = _coluna_data("_data_resolucao")
+    latitude = _coluna_coordenada("_latitudes")
+    longitude = _coluna_coordenada("_longitudes")
+
+    def __eq__(self, outra):
+        if isinstance(outra, OcorrenciaColunar):
+            return self._armazenamento is outra._armazenamento and self._linha == outra._linha
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._armazenamento), self._linha))
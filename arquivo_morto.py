@@ -0,0 +1,365 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Arquivo Morto
+
+Este módulo implementa o arquivo morto das ocorrências resolvidas: um arquivo
+colunar somente-anexação, mapeado em memória (mmap), para onde a
+CentralAtendimento move as resolvidas antigas, que só são lidas em auditorias.
+A busca por ID usa um índice de deslocamentos em O(1), e os campos são lidos
+diretamente das páginas mapeadas, sem copiar os blocos.
+"""
+
+import marshal
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from math import isnan
+
+from armazenamento_colunar import SEM_COORDENADA, para_epoca, de_epoca
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+ARQUIVO_MORTO = "arquivo_morto.col"  # Nome do arquivo no diretório da persistência
+MAGICO = b"ARQM"
+# (mágico, linhas, crc32 do corpo, bytes da tabela de nomes, bytes das descrições) de cada bloco
+CABECALHO_BLOCO = struct.Struct("<4sIIIQ")
+# Colunas do corpo de um bloco, na ordem em que são gravadas. Do maior para o menor
+# tipo, de modo que cada coluna começa alinhada ao tamanho dos seus itens.
+COLUNAS = (
+    ("ids", "q"),
+    ("data_registro", "q"),
+    ("data_atendimento", "q"),
+    ("data_resolucao", "q"),
+    ("latitudes", "d"),
+    ("longitudes", "d"),
+    ("fim_descricoes", "I"),  # Posição seguinte ao fim de cada descrição nos textos do bloco
+    ("regioes", "H"),  # Códigos na tabela de nomes do bloco
+    ("equipes", "H"),  # Códigos na tabela de nomes do bloco (0 = sem equipe)
+    ("severidades", "b"),
+)
+ALINHAMENTO = 8  # Cada bloco começa em um múltiplo de 8 bytes
+BITS_LINHA = 32  # Uma posição do índice é (bloco << BITS_LINHA) | linha
+MASCARA_LINHA = (1 << BITS_LINHA) - 1
+SEM_POSICAO = -1
+
+
+class _Bloco:
+    """
+    Colunas de um bloco do arquivo, como memoryviews tipadas sobre o mapeamento.
+
+    Atributos:
+        deslocamento (int): Posição do cabeçalho do bloco no arquivo
+        total (int): Linhas do bloco
+        nomes (list[str | None]): Tabela de regiões e equipes do bloco (nomes[0] = None)
+        textos (memoryview): Descrições em UTF-8, uma após a outra
+        ids, data_registro, ..., severidades (memoryview): As COLUNAS do bloco
+    """
+
+    __slots__ = ("deslocamento", "total", "nomes", "textos") + tuple(nome for nome, _ in COLUNAS)
+
+    def __init__(self, mapa: memoryview, deslocamento: int, total: int, nomes: list, inicio_textos: int,
+                 tamanho_textos: int):
+        self.deslocamento = deslocamento
+        self.total = total
+        self.nomes = nomes
+        posicao = deslocamento + CABECALHO_BLOCO.size
+        for nome, tipo in COLUNAS:
+            tamanho = total * array(tipo).itemsize
+            setattr(self, nome, mapa[posicao:posicao + tamanho].cast(tipo))
+            posicao += tamanho
+        self.textos = mapa[inicio_textos:inicio_textos + tamanho_textos]
+
+    def descricao(self, linha: int) -> str:
+        """Decodifica a descrição de uma linha."""
+        inicio = self.fim_descricoes[linha - 1] if linha else 0
+        return str(self.textos[inicio:self.fim_descricoes[linha]], "utf-8")
+
+
+def _tamanho_colunas(total: int) -> int:
+    """Bytes ocupados pelas COLUNAS de um bloco com `total` linhas."""
+    return sum(total * array(tipo).itemsize for _, tipo in COLUNAS)
+
+
+class ArquivoMorto:
+    """
+    Arquivo colunar somente-anexação de ocorrências resolvidas.
+
+    Cada chamada de anexar grava um bloco: um cabeçalho com o número de linhas
+    e o CRC32 do corpo, seguido das colunas (IDs, datas em µs desde a época,
+    coordenadas, severidade, códigos de região e equipe), de uma pequena tabela
+    com os nomes de regiões e equipes do bloco e das descrições em UTF-8. O
+    arquivo inteiro é mapeado em memória, e cada coluna é uma memoryview tipada
+    sobre o mapeamento: ler um campo não copia o bloco, e só as páginas lidas
+    são trazidas do disco.
+
+    O índice de deslocamentos é um array endereçado pelo próprio ID (os IDs são
+    sequenciais), com a posição (bloco, linha) de cada ocorrência arquivada:
+    localizar um ID custa O(1), e o índice ocupa 8 bytes por ID até o maior
+    arquivado. Ele é refeito a partir da coluna de IDs ao abrir o arquivo.
+    Se um ID for anexado mais de uma vez (ex.: queda entre gravar o bloco e
+    registrar o arquivamento no diário), vale o registro mais recente.
+
+    Um bloco incompleto ou corrompido no fim do arquivo (queda durante a
+    gravação) é descartado ao abrir.
+
+    Atributos:
+        caminho (str): Caminho do arquivo
+        equipes (dict[str, Equipe]): Equipes pelo nome, para as visões arquivadas
+            (nomes desconhecidos recebem uma Equipe sem base)
+        _blocos (list[_Bloco]): Blocos do arquivo, na ordem de gravação
+        _posicoes (array): Posição (bloco << BITS_LINHA | linha) de cada ID, ou SEM_POSICAO
+    """
+
+    def __init__(self, caminho):
+        """
+        Abre (ou cria) o arquivo morto e refaz o índice de deslocamentos.
+
+        Args:
+            caminho (str): Caminho do arquivo
+        """
+        self.caminho = caminho
+        self.equipes: dict[str, Equipe] = {}
+        self._arquivo = open(caminho, "a+b")
+        self._mapa: mmap.mmap | None = None
+        self._blocos: list[_Bloco] = []
+        self._posicoes = array("q")
+        self._total = 0
+        self._carregar()
+
+    def _carregar(self):
+        """Lê os cabeçalhos dos blocos, descarta um final incompleto e indexa os IDs."""
+        tamanho = os.fstat(self._arquivo.fileno()).st_size
+        if tamanho == 0:
+            return
+        dados = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            deslocamentos = []
+            posicao = 0
+            while posicao + CABECALHO_BLOCO.size <= tamanho:
+                magico, total, crc, tamanho_nomes, tamanho_textos = CABECALHO_BLOCO.unpack_from(dados, posicao)
+                inicio = posicao + CABECALHO_BLOCO.size
+                fim = inicio + _tamanho_colunas(total) + tamanho_nomes + tamanho_textos
+                if magico != MAGICO or fim > tamanho or zlib.crc32(dados[inicio:fim]) != crc:
+                    break
+                deslocamentos.append(posicao)
+                posicao = fim + -fim % ALINHAMENTO
+        finally:
+            dados.close()
+        if posicao < tamanho:
+            self._arquivo.truncate(posicao)
+        self._mapear(deslocamentos)
+        for indice, bloco in enumerate(self._blocos):
+            self._indexar(indice, bloco.ids)
+
+    def _mapear(self, deslocamentos):
+        """(Re)mapeia o arquivo inteiro e recria as colunas de todos os blocos sobre o novo mapeamento."""
+        self._blocos = []
+        self._mapa = None  # O mapeamento anterior é desfeito quando a última coluna dele é liberada
+        if not deslocamentos:
+            return
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        mapa = memoryview(self._mapa)
+        for deslocamento in deslocamentos:
+            _, total, _, tamanho_nomes, tamanho_textos = CABECALHO_BLOCO.unpack_from(mapa, deslocamento)
+            inicio_nomes = deslocamento + CABECALHO_BLOCO.size + _tamanho_colunas(total)
+            nomes = marshal.loads(mapa[inicio_nomes:inicio_nomes + tamanho_nomes])
+            self._blocos.append(
+                _Bloco(mapa, deslocamento, total, nomes, inicio_nomes + tamanho_nomes, tamanho_textos)
+            )
+
+    def _indexar(self, indice_bloco: int, ids):
+        """Aponta o índice de deslocamentos para as linhas de um bloco."""
+        posicoes = self._posicoes
+        if ids and max(ids) >= len(posicoes):
+            posicoes.extend(array("q", [SEM_POSICAO]) * (max(ids) + 1 - len(posicoes)))
+        base = indice_bloco << BITS_LINHA
+        for linha, id_ocorrencia in enumerate(ids):
+            if posicoes[id_ocorrencia] == SEM_POSICAO:
+                self._total += 1
+            posicoes[id_ocorrencia] = base | linha
+
+    def anexar(self, ocorrencias) -> list["OcorrenciaArquivada"]:
+        """
+        Grava um bloco com as ocorrências e o sincroniza com o disco (fsync).
+
+        Args:
+            ocorrencias (list[Ocorrencia]): Ocorrências resolvidas a arquivar
+
+        Returns:
+            list[OcorrenciaArquivada]: Visões das ocorrências arquivadas, na mesma ordem
+
+        Raises:
+            ValueError: Se alguma ocorrência não estiver resolvida
+        """
+        if not ocorrencias:
+            return []
+        colunas = {nome: array(tipo) for nome, tipo in COLUNAS}
+        codigos: dict[str | None, int] = {None: 0}
+        textos = bytearray()
+        for ocorrencia in ocorrencias:
+            if ocorrencia.status != "resolvida":
+                raise ValueError(f"Ocorrência #{ocorrencia.id} não está resolvida")
+            colunas["ids"].append(ocorrencia.id)
+            colunas["data_registro"].append(para_epoca(ocorrencia.data_registro))
+            colunas["data_atendimento"].append(para_epoca(ocorrencia.data_atendimento))
+            colunas["data_resolucao"].append(para_epoca(ocorrencia.data_resolucao))
+            latitude = ocorrencia.latitude
+            colunas["latitudes"].append(SEM_COORDENADA if latitude is None else latitude)
+            colunas["longitudes"].append(SEM_COORDENADA if latitude is None else ocorrencia.longitude)
+            textos += ocorrencia.descricao.encode("utf-8")
+            colunas["fim_descricoes"].append(len(textos))
+            colunas["regioes"].append(codigos.setdefault(ocorrencia.regiao, len(codigos)))
+            equipe = ocorrencia.equipe_atendimento
+            colunas["equipes"].append(codigos.setdefault(equipe.nome, len(codigos)) if equipe is not None else 0)
+            colunas["severidades"].append(ocorrencia.severidade)
+        nomes = marshal.dumps(list(codigos))
+        corpo = b"".join(coluna.tobytes() for coluna in colunas.values()) + nomes + textos
+        cabecalho = CABECALHO_BLOCO.pack(MAGICO, len(ocorrencias), zlib.crc32(corpo), len(nomes), len(textos))
+        self._arquivo.seek(0, os.SEEK_END)
+        deslocamento = self._arquivo.tell()
+        self._arquivo.write(cabecalho + corpo + bytes(-(len(cabecalho) + len(corpo)) % ALINHAMENTO))
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+        self._mapear([bloco.deslocamento for bloco in self._blocos] + [deslocamento])
+        indice = len(self._blocos) - 1
+        self._indexar(indice, colunas["ids"])
+        return [OcorrenciaArquivada(self, indice, linha) for linha in range(len(ocorrencias))]
+
+    def get(self, id_ocorrencia, padrao=None):
+        """Retorna a visão da ocorrência arquivada com o ID dado, ou `padrao` se não existir."""
+        posicoes = self._posicoes
+        if 0 <= id_ocorrencia < len(posicoes):
+            posicao = posicoes[id_ocorrencia]
+            if posicao != SEM_POSICAO:
+                return OcorrenciaArquivada(self, posicao >> BITS_LINHA, posicao & MASCARA_LINHA)
+        return padrao
+
+    def __getitem__(self, id_ocorrencia) -> "OcorrenciaArquivada":
+        ocorrencia = self.get(id_ocorrencia)
+        if ocorrencia is None:
+            raise KeyError(id_ocorrencia)
+        return ocorrencia
+
+    def __contains__(self, id_ocorrencia) -> bool:
+        return 0 <= id_ocorrencia < len(self._posicoes) and self._posicoes[id_ocorrencia] != SEM_POSICAO
+
+    def __len__(self) -> int:
+        return self._total
+
+    def values(self):
+        """Itera sobre visões de todas as ocorrências arquivadas, em ordem de gravação."""
+        posicoes = self._posicoes
+        for indice, bloco in enumerate(self._blocos):
+            base = indice << BITS_LINHA
+            for linha, id_ocorrencia in enumerate(bloco.ids):
+                if posicoes[id_ocorrencia] == base | linha:  # Ignora registros substituídos por um mais recente
+                    yield OcorrenciaArquivada(self, indice, linha)
+
+    def tamanho_em_disco(self) -> int:
+        """Bytes ocupados pelo arquivo."""
+        return os.fstat(self._arquivo.fileno()).st_size
+
+    def equipe(self, nome: str) -> Equipe:
+        """Retorna a equipe com o nome dado (ver atributo equipes)."""
+        equipe = self.equipes.get(nome)
+        if equipe is None:
+            equipe = self.equipes[nome] = Equipe(nome)
+        return equipe
+
+    def fechar(self):
+        """Desfaz o mapeamento e fecha o arquivo (as visões deixam de poder ser lidas)."""
+        self._blocos = []
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._arquivo.close()
+
+
+def _coluna(nome):
+    """Cria uma propriedade somente-leitura ligada a uma coluna do bloco."""
+    def ler(self):
+        return getattr(self._arquivo._blocos[self._bloco], nome)[self._linha]
+
+    return property(ler)
+
+
+def _coluna_data(nome):
+    """Cria uma propriedade de data somente-leitura ligada a uma coluna de timestamps do bloco."""
+    def ler(self):
+        return de_epoca(getattr(self._arquivo._blocos[self._bloco], nome)[self._linha])
+
+    return property(ler)
+
+
+def _coluna_coordenada(nome):
+    """Cria uma propriedade de coordenada somente-leitura ligada a uma coluna de floats do bloco."""
+    def ler(self):
+        valor = getattr(self._arquivo._blocos[self._bloco], nome)[self._linha]
+        return None if isnan(valor) else valor
+
+    return property(ler)
+
+
+class OcorrenciaArquivada:
+    """
+    Visão somente-leitura de uma linha do ArquivoMorto.
+
+    Guarda apenas o arquivo, o bloco e a linha; os campos são lidos das colunas
+    mapeadas a cada acesso, com os mesmos nomes dos atributos de Ocorrencia.
+    Não herda de Ocorrencia para não carregar os slots dela: cada visão ocupa
+    56 bytes, o que importa porque os históricos das equipes guardam uma por
+    ocorrência arquivada. Os métodos de exibição são os de Ocorrencia; alterar
+    um campo levanta AttributeError, pois uma ocorrência arquivada não muda mais.
+    """
+
+    __slots__ = ("_arquivo", "_bloco", "_linha")
+
+    def __init__(self, arquivo: ArquivoMorto, bloco: int, linha: int):
+        """
+        Cria uma visão para uma linha do arquivo morto.
+
+        Args:
+            arquivo (ArquivoMorto): Arquivo de origem
+            bloco (int): Índice do bloco
+            linha (int): Linha dentro do bloco
+        """
+        self._arquivo = arquivo
+        self._bloco = bloco
+        self._linha = linha
+
+    id = _coluna("ids")
+    severidade = _coluna("severidades")
+    data_registro = _coluna_data("data_registro")
+    data_atendimento = _coluna_data("data_atendimento")
+    data_resolucao = _coluna_data("data_resolucao")
+    latitude = _coluna_coordenada("latitudes")
+    longitude = _coluna_coordenada("longitudes")
+    status = property(lambda self: "resolvida")
+    _observador = property(lambda self: None)
+
+    @property
+    def regiao(self):
+        bloco = self._arquivo._blocos[self._bloco]
+        return bloco.nomes[bloco.regioes[self._linha]]
+
+    @property
+    def descricao(self):
+        return self._arquivo._blocos[self._bloco].descricao(self._linha)
+
+    @property
+    def equipe_atendimento(self) -> Equipe | None:
+        bloco = self._arquivo._blocos[self._bloco]
+        nome = bloco.nomes[bloco.equipes[self._linha]]
+        return self._arquivo.equipe(nome) if nome is not None else None
+
+    exibir_resumo = Ocorrencia.exibir_resumo
+    __str__ = Ocorrencia.__str__
+
+    def __eq__(self, outra):
+        if isinstance(outra, OcorrenciaArquivada):
+            return self._arquivo is outra._arquivo and self.id == outra.id
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._arquivo), self.id))
@@ -0,0 +1,343 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Barramento de Eventos
+
+Este módulo implementa a captura de mudanças (CDC) da central: cada escrita em
+uma ocorrência ou equipe publica um evento numerado em ordem, e painéis e postos
+regionais assinam o fluxo (com asyncio) em vez de consultar a central
+repetidamente. Uma assinatura pode ser retomada a partir do último número de
+sequência recebido.
+"""
+
+import asyncio
+import threading
+
+RETENCAO_EVENTOS = 65_536  # Eventos recentes mantidos para assinaturas atrasadas e retomadas
+
+
+class AssinaturaAtrasada(ValueError):
+    """
+    A assinatura ficou para trás além da retenção do barramento (ou pediu uma sequência inexistente).
+
+    Os eventos seguintes ao cursor não estão mais disponíveis: o assinante deve
+    reler o estado (ex.: listar_ocorrencias) e assinar de novo a partir da
+    sequência atual.
+
+    Atributos:
+        cursor (int): Último evento recebido pela assinatura
+    """
+
+    def __init__(self, mensagem: str, cursor: int):
+        super().__init__(mensagem)
+        self.cursor = cursor
+
+
+class Evento:
+    """
+    Uma mudança em uma ocorrência ou equipe.
+
+    Os dados são a imagem da entidade depois da mudança (ver
+    ocorrencia_para_json e equipe_para_json), de modo que o último evento de
+    uma chave basta para conhecer o estado atual da entidade.
+
+    Atributos:
+        seq (int): Número de sequência (crescente, sem lacunas, a partir de 1)
+        tipo (str): "registrada", "atribuida", "resolvida", "status", "severidade" ou "equipe"
+        chave (tuple): Entidade alterada: ("ocorrencia", id) ou ("equipe", nome)
+        dados (dict): Estado da entidade após a mudança
+    """
+
+    __slots__ = ("seq", "tipo", "chave", "dados")
+
+    def __init__(self, seq: int, tipo: str, chave: tuple, dados: dict):
+        self.seq = seq
+        self.tipo = tipo
+        self.chave = chave
+        self.dados = dados
+
+    def __repr__(self) -> str:
+        return f"Evento(seq={self.seq}, tipo={self.tipo!r}, chave={self.chave!r})"
+
+
+def coalescer(eventos: list[Evento]) -> list[Evento]:
+    """
+    Mantém só o último evento de cada entidade, na ordem de sequência.
+
+    Args:
+        eventos (list[Evento]): Eventos em ordem de sequência
+
+    Returns:
+        list[Evento]: O evento mais recente de cada chave, em ordem de sequência
+    """
+    vistas = set()
+    ultimos = []
+    for evento in reversed(eventos):
+        if evento.chave not in vistas:
+            vistas.add(evento.chave)
+            ultimos.append(evento)
+    ultimos.reverse()
+    return ultimos
+
+
+class Assinatura:
+    """
+    Leitor de um barramento a partir de um cursor.
+
+    Cada leitura devolve de uma vez todos os eventos publicados depois do
+    cursor (até `maximo`), então um assinante lento recebe uma rajada inteira
+    em um único lote, em vez de acordar a cada evento. Com `coalescer`, o lote
+    mantém só o último evento de cada ocorrência ou equipe.
+
+    Uso:
+        async for lote in barramento.assinar(desde=ultimo_seq):
+            for evento in lote: ...
+
+    Atributos:
+        cursor (int): Sequência do último evento entregue (0 = nenhum)
+        coalescer (bool): Se True, cada lote traz só o último evento de cada entidade
+        maximo (int | None): Máximo de eventos lidos por lote (None = todos os disponíveis)
+        entregues (int): Eventos entregues
+        coalescidos (int): Eventos omitidos por coalescência
+        ativa (bool): False depois de cancelar
+    """
+
+    def __init__(self, barramento: "BarramentoEventos", cursor: int, coalescer=False, maximo=None):
+        self._barramento = barramento
+        self.cursor = cursor
+        self.coalescer = coalescer
+        self.maximo = maximo
+        self.entregues = 0
+        self.coalescidos = 0
+        self.ativa = True
+
+    @property
+    def atraso(self) -> int:
+        """Eventos publicados ainda não lidos pela assinatura."""
+        return self._barramento.seq - self.cursor
+
+    def pendentes(self) -> list[Evento]:
+        """
+        Lê os eventos já publicados depois do cursor, sem esperar.
+
+        Returns:
+            list[Evento]: O lote (vazio se não houver eventos novos)
+
+        Raises:
+            AssinaturaAtrasada: Se eventos seguintes ao cursor já foram descartados
+        """
+        lote = self._barramento._ler(self.cursor, self.maximo)
+        if not lote:
+            return lote
+        self.cursor = lote[-1].seq
+        if self.coalescer:
+            lidos = len(lote)
+            lote = coalescer(lote)
+            self.coalescidos += lidos - len(lote)
+        self.entregues += len(lote)
+        return lote
+
+    async def proximos(self) -> list[Evento]:
+        """
+        Espera até haver eventos depois do cursor e os devolve em um lote.
+
+        Returns:
+            list[Evento]: O lote, com pelo menos um evento
+
+        Raises:
+            AssinaturaAtrasada: Se eventos seguintes ao cursor já foram descartados
+        """
+        while True:
+            lote = self.pendentes()
+            if lote:
+                return lote
+            await self._barramento._aguardar(self.cursor)
+
+    def cancelar(self):
+        """Encerra a assinatura (a iteração assíncrona termina)."""
+        self.ativa = False
+        with self._barramento._trava:
+            self._barramento._assinaturas.discard(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> list[Evento]:
+        if not self.ativa:
+            raise StopAsyncIteration
+        return await self.proximos()
+
+
+class BarramentoEventos:
+    """
+    Fluxo ordenado de eventos da central, com distribuição para muitos assinantes.
+
+    Os eventos ficam em um único registro compartilhado, e cada assinatura
+    guarda só o seu cursor: publicar custa O(1) independentemente do número de
+    assinantes, e cada assinante copia apenas o seu lote ao ler. Assinantes
+    que esperam (Assinatura.proximos) são acordados uma vez por rajada, não a
+    cada evento.
+
+    Contrapressão: quem publica é a central, que nunca espera pelos
+    assinantes. O registro é limitado: são mantidos pelo menos os `retencao`
+    eventos mais recentes, e uma assinatura que fica para trás além disso
+    recebe AssinaturaAtrasada na próxima leitura e deve reler o estado. Até lá,
+    um assinante lento só acumula atraso, que é entregue (e, se pedido,
+    coalescido) no próximo lote.
+
+    Pode ser publicado de qualquer thread (ex.: CentralConcorrente); os
+    assinantes esperam no laço asyncio em que chamaram proximos.
+
+    Atributos:
+        retencao (int): Mínimo de eventos recentes mantidos
+        seq (int): Sequência do último evento publicado
+        publicados (int): Eventos publicados
+        atrasadas (int): Leituras recusadas por atraso além da retenção
+        _eventos (list[Evento]): Eventos retidos, do mais antigo ao mais recente
+        _primeiro (int): Sequência de _eventos[0]
+        _esperas (list[asyncio.Future]): Assinantes esperando o próximo evento
+    """
+
+    def __init__(self, retencao=RETENCAO_EVENTOS):
+        """
+        Inicializa um barramento vazio.
+
+        Args:
+            retencao (int): Mínimo de eventos recentes mantidos para assinaturas atrasadas
+
+        Raises:
+            ValueError: Se a retenção não for positiva
+        """
+        if retencao < 1:
+            raise ValueError("A retenção do barramento deve ser positiva")
+        self.retencao = retencao
+        self.seq = 0
+        self.publicados = 0
+        self.atrasadas = 0
+        self._eventos: list[Evento] = []
+        self._primeiro = 1
+        self._assinaturas: set[Assinatura] = set()
+        self._esperas: list[asyncio.Future] = []
+        self._laco: asyncio.AbstractEventLoop | None = None
+        self._thread_laco: int | None = None
+        self._trava = threading.Lock()
+
+    def publicar(self, tipo: str, chave: tuple, dados: dict) -> int:
+        """
+        Publica um evento e acorda os assinantes em espera.
+
+        Args:
+            tipo (str): Tipo do evento (ver Evento)
+            chave (tuple): Entidade alterada
+            dados (dict): Estado da entidade após a mudança
+
+        Returns:
+            int: Sequência do evento
+        """
+        with self._trava:
+            self.seq += 1
+            self._eventos.append(Evento(self.seq, tipo, chave, dados))
+            self.publicados += 1
+            if len(self._eventos) >= 2 * self.retencao:
+                # Descarta em blocos: o custo de mover a lista fica O(1) amortizado por evento
+                descartados = len(self._eventos) - self.retencao
+                del self._eventos[:descartados]
+                self._primeiro += descartados
+            esperas = self._esperas
+            if esperas:
+                self._esperas = []
+        if esperas:
+            if threading.get_ident() == self._thread_laco:
+                _acordar(esperas)
+            else:
+                self._laco.call_soon_threadsafe(_acordar, esperas)
+        return self.seq
+
+    def assinar(self, desde=None, coalescer=False, maximo=None) -> Assinatura:
+        """
+        Cria uma assinatura a partir de uma sequência.
+
+        Args:
+            desde (int | None): Última sequência já recebida (retomada); None começa
+                pelos próximos eventos, e 0 pelo evento mais antigo publicado
+            coalescer (bool): Se True, cada lote traz só o último evento de cada entidade
+            maximo (int | None): Máximo de eventos lidos por lote
+
+        Returns:
+            Assinatura: A assinatura
+
+        Raises:
+            AssinaturaAtrasada: Se os eventos seguintes a `desde` já foram descartados
+                ou se `desde` ainda não foi publicada (ex.: o barramento foi reiniciado)
+            ValueError: Se `desde` não for um inteiro não negativo ou o máximo por
+                lote não for um inteiro positivo
+        """
+        if desde is not None and (type(desde) is not int or desde < 0):
+            raise ValueError(f"A sequência inicial deve ser um inteiro não negativo: {desde!r}")
+        if maximo is not None and (type(maximo) is not int or maximo < 1):
+            raise ValueError(f"O máximo de eventos por lote deve ser um inteiro positivo: {maximo!r}")
+        with self._trava:
+            cursor = self.seq if desde is None else desde
+            self._verificar_cursor(cursor)
+            assinatura = Assinatura(self, cursor, coalescer, maximo)
+            self._assinaturas.add(assinatura)
+        return assinatura
+
+    def _verificar_cursor(self, cursor: int):
+        """Recusa um cursor cujos eventos seguintes não estão retidos (chamado com a trava)."""
+        if cursor > self.seq:
+            raise AssinaturaAtrasada(f"Sequência {cursor} ainda não publicada (última: {self.seq})", cursor)
+        if cursor < self._primeiro - 1:
+            self.atrasadas += 1
+            raise AssinaturaAtrasada(
+                f"Eventos após a sequência {cursor} já foram descartados (mais antigo retido: {self._primeiro})",
+                cursor,
+            )
+
+    def _ler(self, cursor: int, maximo: int | None) -> list[Evento]:
+        """Copia os eventos retidos depois do cursor (até `maximo`)."""
+        with self._trava:
+            if cursor >= self.seq:
+                return []
+            self._verificar_cursor(cursor)
+            inicio = cursor + 1 - self._primeiro
+            fim = inicio + maximo if maximo is not None else None
+            return self._eventos[inicio:fim]
+
+    async def _aguardar(self, cursor: int):
+        """Espera até haver um evento depois do cursor."""
+        laco = asyncio.get_running_loop()
+        with self._trava:
+            if self.seq > cursor:
+                return
+            if self._laco is not laco:
+                self._laco = laco
+                self._thread_laco = threading.get_ident()
+            espera = laco.create_future()
+            self._esperas.append(espera)
+        await espera
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna o estado do barramento.
+
+        Returns:
+            dict: seq, retidos, assinaturas, aguardando, publicados, atrasadas e
+                maior_atraso (eventos não lidos pela assinatura mais atrasada)
+        """
+        with self._trava:
+            seq = self.seq
+            return {
+                "seq": seq,
+                "retidos": len(self._eventos),
+                "assinaturas": len(self._assinaturas),
+                "aguardando": len(self._esperas),
+                "publicados": self.publicados,
+                "atrasadas": self.atrasadas,
+                "maior_atraso": max((seq - assinatura.cursor for assinatura in self._assinaturas), default=0),
+            }
+
+
+def _acordar(esperas: list[asyncio.Future]):
+    """Acorda os assinantes em espera (os cancelados são ignorados)."""
+    for espera in esperas:
+        if not espera.done():
+            espera.set_result(None)
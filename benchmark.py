@@ -0,0 +1,325 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Suíte de Benchmarks
+
+Executa cargas sintéticas com semente fixa sobre todas as operações principais
+da CentralAtendimento e emite os resultados em JSON: operações por segundo,
+percentis de latência e pico de memória (RSS) para cada tamanho de central.
+
+Cada tamanho roda em um processo próprio, para que o pico de RSS de um tamanho
+não contamine o do próximo. Os resultados podem ser comparados com uma linha de
+base salva (benchmark_linha_base.json): a comparação aponta quedas de vazão
+acima da tolerância e, independentemente da máquina, perdas de escalabilidade
+(ex.: uma operação que passa a custar O(n) por chamada, como a antiga ordenação
+a cada inserção).
+
+Uso:
+    python benchmark.py [--tamanhos 1000,10000,100000] [--semente 42] [--saida resultados.json]
+                        [--repeticoes 3] [--linha-base benchmark_linha_base.json]
+                        [--tolerancia 0.3] [--salvar-linha-base]
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from array import array
+
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+ARQUIVO_LINHA_BASE = "benchmark_linha_base.json"
+AMOSTRAS_LATENCIA = 100_000  # Máximo de latências guardadas por operação
+CONSULTAS_SEVERIDADE = 50
+TOTAL_EQUIPES = 20
+QUEDA_ESCALABILIDADE = 0.5  # Escalabilidade abaixo da metade da linha de base indica mudança de complexidade
+
+
+@contextlib.contextmanager
+def sem_coletor():
+    """Pausa o coletor de ciclos durante um trecho medido (suas varreduras não são custo da operação)."""
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+class Medidor:
+    """
+    Cronometra as chamadas de uma operação e resume a vazão e a latência.
+
+    Todas as chamadas entram no tempo total; apenas uma amostra regular das
+    latências é guardada, para que 10^7 chamadas não custem 10^7 floats.
+
+    Atributos:
+        operacoes (int): Chamadas cronometradas
+        segundos (float): Tempo total das chamadas
+        _passo (int): Guarda a latência de uma chamada a cada `_passo`
+        _latencias (array): Latências amostradas, em nanossegundos
+    """
+
+    def __init__(self, previstas: int):
+        """
+        Args:
+            previstas (int): Número aproximado de chamadas (define a taxa de amostragem)
+        """
+        self.operacoes = 0
+        self.segundos = 0.0
+        self._passo = max(1, previstas // AMOSTRAS_LATENCIA)
+        self._latencias = array("q")
+
+    def medir(self, funcao, argumentos):
+        """
+        Chama `funcao(*args)` para cada tupla de argumentos, cronometrando cada chamada.
+
+        Returns:
+            list: Retornos das chamadas
+        """
+        relogio = time.perf_counter_ns
+        latencias = self._latencias
+        passo = self._passo
+        retornos = []
+        with sem_coletor():
+            for args in argumentos:
+                inicio = relogio()
+                retornos.append(funcao(*args))
+                decorrido = relogio() - inicio
+                if self.operacoes % passo == 0:
+                    latencias.append(decorrido)
+                self.operacoes += 1
+                self.segundos += decorrido / 1e9
+        return retornos
+
+    def resumo(self) -> dict:
+        """Retorna operações, ops/s e latências p50/p90/p99 em microssegundos."""
+        latencias = sorted(self._latencias)
+
+        def percentil(fracao):
+            if not latencias:
+                return 0.0
+            return latencias[min(len(latencias) - 1, int(fracao * len(latencias)))] / 1e3
+
+        return {
+            "operacoes": self.operacoes,
+            "ops_por_segundo": self.operacoes / self.segundos if self.segundos else 0.0,
+            "p50_us": percentil(0.50),
+            "p90_us": percentil(0.90),
+            "p99_us": percentil(0.99),
+        }
+
+
+def executar_tamanho(tamanho: int, semente: int) -> dict:
+    """
+    Executa a carga completa para uma central com `tamanho` ocorrências.
+
+    Sequência: registrar todas, buscar por ID, buscar por severidade, atender e
+    atribuir metade, concluir as atendidas e listar o histórico de cada equipe.
+
+    Args:
+        tamanho (int): Número de ocorrências
+        semente (int): Semente da carga sintética
+
+    Returns:
+        dict: Resumo de cada operação e o pico de RSS do processo em MB
+    """
+    aleatorio = random.Random(semente)
+    central = CentralAtendimento()
+    equipes = [Equipe(f"Equipe {i}", REGIOES[i % len(REGIOES)]) for i in range(TOTAL_EQUIPES)]
+    for equipe in equipes:
+        central.adicionar_equipe(equipe)
+    ocorrencias = [
+        (Ocorrencia(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), "benchmark"),)
+        for _ in range(tamanho)
+    ]
+    ids = [ocorrencia.id for (ocorrencia,) in ocorrencias]
+    resultados = {}
+
+    medidor = Medidor(tamanho)
+    medidor.medir(central.registrar_ocorrencia, ocorrencias)
+    resultados["registrar_ocorrencia"] = medidor.resumo()
+    del ocorrencias
+
+    medidor = Medidor(tamanho)
+    medidor.medir(central.buscar_ocorrencia, [(aleatorio.choice(ids),) for _ in range(tamanho)])
+    resultados["buscar_ocorrencia"] = medidor.resumo()
+
+    medidor = Medidor(CONSULTAS_SEVERIDADE)
+    medidor.medir(central.buscar_por_severidade, [(aleatorio.randint(1, 5),) for _ in range(CONSULTAS_SEVERIDADE)])
+    resultados["buscar_por_severidade"] = medidor.resumo()
+
+    medidor = Medidor(tamanho // 2)
+    atendidas = medidor.medir(central.atender_proxima_ocorrencia, [()] * (tamanho // 2))
+    resultados["atender_proxima_ocorrencia"] = medidor.resumo()
+    for indice, ocorrencia in enumerate(atendidas):
+        central.atribuir_equipe(ocorrencia, equipes[indice % TOTAL_EQUIPES])
+
+    # As operações que imprimem no console escrevem em os.devnull: mede-se a
+    # formatação das mensagens, não o terminal
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        medidor = Medidor(len(atendidas))
+        medidor.medir(central.concluir_ocorrencia, [(ocorrencia.id,) for ocorrencia in atendidas])
+        resultados["concluir_ocorrencia"] = medidor.resumo()
+
+        medidor = Medidor(TOTAL_EQUIPES)
+        medidor.medir(Equipe.listar_historico, [(equipe,) for equipe in equipes])
+        resultados["listar_historico"] = medidor.resumo()
+
+    # ru_maxrss é dado em KB no Linux e em bytes no macOS
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    resultados["pico_rss_mb"] = pico / (1 << 20 if sys.platform == "darwin" else 1 << 10)
+    return resultados
+
+
+def executar(tamanhos: list[int], semente: int, repeticoes: int = 3) -> dict:
+    """
+    Executa a suíte para cada tamanho, cada um em processos separados.
+
+    Cada tamanho é executado `repeticoes` vezes com a mesma semente; para cada
+    operação fica a repetição mediana (por ops/s), menos sensível que a média ou
+    o melhor caso a ruído externo (outros processos, frequência da CPU).
+
+    Returns:
+        dict: Metadados da execução e resultados por tamanho
+    """
+    resultados = {}
+    for tamanho in tamanhos:
+        execucoes = [
+            json.loads(subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--tamanho-interno", str(tamanho), "--semente", str(semente)],
+                check=True, capture_output=True, text=True,
+            ).stdout)
+            for _ in range(repeticoes)
+        ]
+        mediana = {}
+        for operacao, medida in execucoes[0].items():
+            if isinstance(medida, dict):
+                ordenadas = sorted((execucao[operacao] for execucao in execucoes), key=lambda m: m["ops_por_segundo"])
+                mediana[operacao] = ordenadas[len(ordenadas) // 2]
+            else:
+                mediana[operacao] = max(execucao[operacao] for execucao in execucoes)
+        resultados[str(tamanho)] = mediana
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semente": semente,
+        "repeticoes": repeticoes,
+        "resultados": resultados,
+    }
+
+
+def escalabilidade(resultados: dict, operacao: str) -> float | None:
+    """
+    Razão entre as ops/s do maior e do menor tamanho medidos.
+
+    Uma operação O(1) ou O(log n) por chamada fica perto de 1; uma que passa a
+    custar O(n) cai proporcionalmente ao crescimento da central. A razão não
+    depende da velocidade da máquina.
+    """
+    tamanhos = sorted(resultados, key=int)
+    if len(tamanhos) < 2:
+        return None
+    menor = resultados[tamanhos[0]][operacao]["ops_por_segundo"]
+    maior = resultados[tamanhos[-1]][operacao]["ops_por_segundo"]
+    return maior / menor if menor else None
+
+
+def comparar(atual: dict, linha_base: dict, tolerancia: float) -> list[str]:
+    """
+    Compara uma execução com a linha de base.
+
+    A vazão absoluta só é comparável na mesma máquina; a escalabilidade (ver
+    escalabilidade) é comparada sempre e acusa a troca de uma operação O(1) ou
+    O(log n) por uma O(n).
+
+    Args:
+        atual (dict): Resultado de executar
+        linha_base (dict): Resultado salvo anteriormente
+        tolerancia (float): Queda relativa de vazão aceita (0.3 = até 30% mais lento)
+
+    Returns:
+        list[str]: Descrição de cada regressão encontrada (vazia se não houver)
+    """
+    regressoes = []
+    base, resultados = linha_base["resultados"], atual["resultados"]
+    comuns = sorted(set(base) & set(resultados), key=int)
+    for tamanho in comuns:
+        for operacao, medida in resultados[tamanho].items():
+            if not isinstance(medida, dict) or operacao not in base[tamanho]:
+                continue
+            referencia = base[tamanho][operacao]["ops_por_segundo"]
+            if referencia and medida["ops_por_segundo"] < referencia * (1 - tolerancia):
+                regressoes.append(
+                    f"{operacao} (n={tamanho}): {medida['ops_por_segundo']:,.0f} ops/s, "
+                    f"linha de base {referencia:,.0f} ops/s"
+                )
+    if len(comuns) >= 2:
+        recorte_base = {tamanho: base[tamanho] for tamanho in comuns}
+        recorte_atual = {tamanho: resultados[tamanho] for tamanho in comuns}
+        for operacao in recorte_atual[comuns[0]]:
+            if not isinstance(recorte_atual[comuns[0]][operacao], dict) or operacao not in recorte_base[comuns[0]]:
+                continue
+            escala_base = escalabilidade(recorte_base, operacao)
+            escala_atual = escalabilidade(recorte_atual, operacao)
+            if escala_base and escala_atual is not None and escala_atual < escala_base * QUEDA_ESCALABILIDADE:
+                regressoes.append(
+                    f"{operacao}: escalabilidade n={comuns[0]}→{comuns[-1]} caiu de "
+                    f"{escala_base:.2f} para {escala_atual:.2f}"
+                )
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suíte de benchmarks da central de atendimento")
+    parser.add_argument("--tamanhos", default="1000,10000,100000",
+                        help="tamanhos da central separados por vírgula (até 10^7)")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--repeticoes", type=int, default=3, help="execuções por tamanho (fica a mediana)")
+    parser.add_argument("--saida", default=None, help="arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument("--linha-base", default=ARQUIVO_LINHA_BASE)
+    parser.add_argument("--tolerancia", type=float, default=0.3)
+    parser.add_argument("--salvar-linha-base", action="store_true", help="grava o resultado como nova linha de base")
+    parser.add_argument("--tamanho-interno", type=int, default=None, help=argparse.SUPPRESS)
+    argumentos = parser.parse_args()
+
+    if argumentos.tamanho_interno is not None:
+        print(json.dumps(executar_tamanho(argumentos.tamanho_interno, argumentos.semente)))
+        return
+
+    tamanhos = [int(float(tamanho)) for tamanho in argumentos.tamanhos.split(",")]
+    atual = executar(tamanhos, argumentos.semente, argumentos.repeticoes)
+    texto = json.dumps(atual, indent=2, ensure_ascii=False)
+    if argumentos.saida:
+        with open(argumentos.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto + "\n")
+    else:
+        print(texto)
+
+    if argumentos.salvar_linha_base:
+        with open(argumentos.linha_base, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto + "\n")
+        print(f"💾 Linha de base gravada em {argumentos.linha_base}", file=sys.stderr)
+        return
+    if not os.path.exists(argumentos.linha_base):
+        return
+    with open(argumentos.linha_base, encoding="utf-8") as arquivo:
+        regressoes = comparar(atual, json.load(arquivo), argumentos.tolerancia)
+    if regressoes:
+        print("❌ Regressões em relação à linha de base:", file=sys.stderr)
+        for regressao in regressoes:
+            print(f"  - {regressao}", file=sys.stderr)
+        sys.exit(1)
+    print("✅ Sem regressões em relação à linha de base", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark da Análise
+
+Mede os indicadores de analise.py sobre milhões de ocorrências. As colunas são
+geradas diretamente com NumPy (um ano de registros, com despachos e resoluções
+sorteados), e a exportação é medida à parte, a partir de um ArmazenamentoColunar real.
+
+Uso:
+    python benchmark_analise.py [ocorrencias] [ocorrencias_exportacao]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import analise
+from armazenamento_colunar import SEM_DATA, STATUS_CONHECIDOS, ArmazenamentoColunar
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+TOTAL_EQUIPES = 50
+ANO_US = 365 * 86_400_000_000
+INICIO_US = 1_704_067_200_000_000  # 2024-01-01
+
+
+def colunas_sinteticas(total: int, semente=42) -> analise.ColunasOcorrencias:
+    """Gera `total` ocorrências sintéticas já em colunas."""
+    gerador = np.random.default_rng(semente)
+    registro = np.sort(INICIO_US + gerador.integers(0, ANO_US, total))
+    status = gerador.choice(3, total, p=[0.1, 0.2, 0.7]).astype(np.uint8)
+    despachadas = status > 0
+    atendimento = np.where(despachadas, registro + gerador.exponential(30 * 60e6, total).astype(np.int64), SEM_DATA)
+    resolucao = np.where(status == 2, atendimento + gerador.exponential(120 * 60e6, total).astype(np.int64), SEM_DATA)
+    equipes = np.where(despachadas, gerador.integers(1, TOTAL_EQUIPES + 1, total), 0).astype(np.uint16)
+    return analise.ColunasOcorrencias(
+        ids=np.arange(1, total + 1, dtype=np.int64),
+        severidades=gerador.integers(1, 6, total).astype(np.int8),
+        regioes=gerador.integers(0, len(REGIOES), total).astype(np.uint16),
+        status=status,
+        equipes=equipes,
+        data_registro=registro,
+        data_atendimento=atendimento,
+        data_resolucao=resolucao,
+        nomes_regioes=list(REGIOES),
+        nomes_status=list(STATUS_CONHECIDOS),
+        tabela_equipes=[None] + [Equipe(f"Equipe {i}") for i in range(1, TOTAL_EQUIPES + 1)],
+    )
+
+
+def cronometrar(nome: str, funcao, *args):
+    """Executa a função, imprime o tempo e devolve o resultado."""
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    print(f"{nome:<28} {1e3 * (time.perf_counter() - inicio):>9.1f} ms")
+    return resultado
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    total_exportacao = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+    colunas = colunas_sinteticas(total)
+    print(f"📊 {total:,} ocorrências sintéticas\n")
+    inicio = time.perf_counter()
+    cronometrar("tempo até despacho", lambda: analise.resumir_tempos(analise.tempos_ate_despacho(colunas)))
+    cronometrar("tempo até resolução", lambda: analise.resumir_tempos(analise.tempos_ate_resolucao(colunas)))
+    cronometrar("região × severidade × status", analise.contagens_por_nome, colunas)
+    cronometrar("produtividade das equipes", analise.produtividade_equipes, colunas)
+    cronometrar("taxa em janela móvel (1h)", analise.taxas_janela_movel, colunas)
+    print(f"{'total dos indicadores':<28} {1e3 * (time.perf_counter() - inicio):>9.1f} ms\n")
+
+    armazenamento = ArmazenamentoColunar()
+    for indice in range(total_exportacao):
+        armazenamento.adicionar(Ocorrencia(REGIOES[indice % len(REGIOES)], indice % 5 + 1, "benchmark"))
+    cronometrar(f"exportar ({total_exportacao:,} linhas)", analise.exportar, armazenamento)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark do Arquivo Morto
+
+Simula uma temporada com relógio simulado (registro, despacho e conclusão em
+ciclos de uma hora) e compara a memória retida pela central sem e com o arquivo
+morto, que recebe as ocorrências resolvidas há mais de um dia. Em seguida mede
+a latência de buscar_ocorrencia para IDs em memória e arquivados e o tempo de
+uma consulta por período que atravessa a temporada inteira.
+
+Uso:
+    python benchmark_arquivo_morto.py [ocorrencias]
+"""
+
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+from relogio import RelogioSimulado, definir_relogio
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+EQUIPES = 100
+POR_HORA = 500  # Ocorrências registradas a cada hora simulada
+IDADE_ARQUIVAMENTO = timedelta(days=1)
+INICIO = datetime(2024, 1, 1)  # Início da temporada simulada
+AMOSTRA_BUSCAS = 20_000
+
+
+def temporada(total: int, diretorio: str | None, semente: int = 42) -> tuple[CentralAtendimento, float]:
+    """
+    Executa a temporada em uma central nova.
+
+    Args:
+        total (int): Ocorrências registradas
+        diretorio (str | None): Diretório do arquivo morto, ou None para não arquivar
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        tuple[CentralAtendimento, float]: A central e os bytes retidos por ocorrência
+    """
+    aleatorio = random.Random(semente)
+    Ocorrencia.definir_sequencia_ids(1, 1)  # Os mesmos IDs nas duas temporadas
+    relogio = RelogioSimulado(INICIO)
+    anterior = definir_relogio(relogio)
+    try:
+        gc.collect()
+        tracemalloc.start()
+        central = CentralAtendimento()
+        if diretorio is not None:
+            central.ativar_arquivo(os.path.join(diretorio, "arquivo_morto.col"), IDADE_ARQUIVAMENTO)
+        for i in range(EQUIPES):
+            central.adicionar_equipe(Equipe(f"Equipe {i}", REGIOES[i % len(REGIOES)]))
+        registradas = 0
+        while registradas < total:
+            for _ in range(min(POR_HORA, total - registradas)):
+                central.registrar_ocorrencia(
+                    Ocorrencia(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), f"Foco {registradas}")
+                )
+                registradas += 1
+            relogio.avancar(1800)
+            while pares := central.despachar():
+                for ocorrencia, _ in pares:
+                    central.concluir(ocorrencia.id)
+            relogio.avancar(1800)
+        del pares
+        gc.collect()
+        retidos, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        definir_relogio(anterior)
+    return central, retidos / total
+
+
+def latencia_busca(central: CentralAtendimento, ids: list[int]) -> float:
+    """Latência média (µs) de buscar_ocorrencia, lendo um campo de cada ocorrência encontrada."""
+    inicio = time.perf_counter()
+    for id_ocorrencia in ids:
+        central.buscar_ocorrencia(id_ocorrencia).severidade
+    return (time.perf_counter() - inicio) / len(ids) * 1e6
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"📊 Temporada de {total:,} ocorrências, arquivamento após {IDADE_ARQUIVAMENTO}\n")
+    with tempfile.TemporaryDirectory() as diretorio:
+        sem_arquivo, bytes_sem = temporada(total, None)
+        com_arquivo, bytes_com = temporada(total, diretorio)
+        arquivo = com_arquivo.arquivo
+        print(f"{'cenário':>12} | {'em memória':>10} | {'bytes/ocorrência':>17}")
+        print("-" * 47)
+        print(f"{'sem arquivo':>12} | {len(sem_arquivo.ocorrencias):>10,} | {bytes_sem:>17.1f}")
+        print(f"{'com arquivo':>12} | {len(com_arquivo.ocorrencias):>10,} | {bytes_com:>17.1f}  ({bytes_com / bytes_sem:.0%})")
+        print(f"\nArquivadas: {len(arquivo):,} ({arquivo.tamanho_em_disco() / max(len(arquivo), 1):.1f} bytes/ocorrência em disco)")
+
+        aleatorio = random.Random(7)
+        em_memoria = aleatorio.choices(list(com_arquivo.ocorrencias), k=AMOSTRA_BUSCAS)
+        arquivadas = aleatorio.choices([ocorrencia.id for ocorrencia in arquivo.values()], k=AMOSTRA_BUSCAS)
+        print(f"\n{'busca por ID':>24} | {'µs/busca':>9}")
+        print("-" * 37)
+        print(f"{'sem arquivo':>24} | {latencia_busca(sem_arquivo, arquivadas):>9.2f}")
+        print(f"{'com arquivo, em memória':>24} | {latencia_busca(com_arquivo, em_memoria):>9.2f}")
+        print(f"{'com arquivo, arquivada':>24} | {latencia_busca(com_arquivo, arquivadas):>9.2f}")
+
+        print(f"\n{'resolvidas na temporada':>24} | {'ms':>9}")
+        print("-" * 37)
+        for nome, central in (("sem arquivo", sem_arquivo), ("com arquivo", com_arquivo)):
+            inicio = time.perf_counter()
+            periodo = central.iterar_ocorrencias(desde=INICIO, ate=datetime.max, campo_data="data_resolucao")
+            resolvidas = sum(1 for _ in periodo)
+            print(f"{nome:>24} | {(time.perf_counter() - inicio) * 1000:>9.1f}  ({resolvidas:,} resolvidas)")
+        arquivo.fechar()
+
+
+if __name__ == "__main__":
+    main()
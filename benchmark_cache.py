@@ -0,0 +1,91 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark do Cache de Consultas
+
+Simula painéis que consultam a central várias vezes entre duas escritas: cada
+rodada registra uma ocorrência (e despacha a cada dez) e em seguida faz
+`leituras` consultas do painel (buscar_por_severidade de cada severidade, a
+busca por região e a primeira página da listagem). Compara as leituras por
+segundo sem e com o cache e informa a taxa de acerto.
+
+Uso:
+    python benchmark_cache.py [ocorrencias] [leituras_por_escrita]
+"""
+
+import random
+import sys
+import time
+
+from cache_consultas import CacheConsultas
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+EQUIPES = 50
+RODADAS = 200  # Escritas intercaladas com as leituras do painel
+
+
+def consultas_painel(central: CentralAtendimento) -> list:
+    """Consultas feitas por um painel a cada atualização."""
+    return [
+        *(lambda severidade=severidade: central.buscar_por_severidade(severidade) for severidade in range(1, 6)),
+        *(lambda regiao=regiao: central.buscar_ocorrencias(regiao=regiao, status="pendente") for regiao in REGIOES),
+        lambda: central.paginar_ocorrencias(50),
+    ]
+
+
+def medir(total: int, leituras: int, com_cache: bool, semente: int = 42) -> tuple[float, CentralAtendimento]:
+    """
+    Preenche uma central e mede as leituras do painel intercaladas com escritas.
+
+    Args:
+        total (int): Ocorrências registradas antes da medição
+        leituras (int): Atualizações do painel entre duas escritas
+        com_cache (bool): Se True, ativa o cache de consultas
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        tuple[float, CentralAtendimento]: Consultas por segundo e a central
+    """
+    aleatorio = random.Random(semente)
+    central = CentralAtendimento()
+    if com_cache:
+        central.ativar_cache(CacheConsultas())
+    for i in range(EQUIPES):
+        central.adicionar_equipe(Equipe(f"Equipe {i}", REGIOES[i % len(REGIOES)]))
+    central.registrar_lote(
+        Ocorrencia(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), f"Foco {i}") for i in range(total)
+    )
+    painel = consultas_painel(central)
+    consultas = 0
+    gasto = 0.0
+    for rodada in range(RODADAS):
+        central.registrar_ocorrencia(Ocorrencia(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), "Novo foco"))
+        if rodada % 10 == 0:
+            central.despachar()
+        inicio = time.perf_counter()
+        for _ in range(leituras):
+            for consulta in painel:
+                consulta()
+        gasto += time.perf_counter() - inicio
+        consultas += leituras * len(painel)
+    return consultas / gasto, central
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    leituras = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    print(f"📊 Central com {total:,} ocorrências, {leituras} atualizações do painel por escrita\n")
+    sem_cache, _ = medir(total, leituras, False)
+    com_cache, central = medir(total, leituras, True)
+    estatisticas = central.cache.estatisticas()
+    print(f"{'cenário':>10} | {'consultas/s':>12}")
+    print("-" * 26)
+    print(f"{'sem cache':>10} | {sem_cache:>12,.0f}")
+    print(f"{'com cache':>10} | {com_cache:>12,.0f}  ({com_cache / sem_cache:.1f}x)")
+    print(f"\nAcertos: {estatisticas['acertos']:,}  Faltas: {estatisticas['faltas']:,}  "
+          f"Taxa de acerto: {estatisticas['taxa_acerto']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
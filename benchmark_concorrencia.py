@@ -0,0 +1,158 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark de Concorrência
+
+Teste de estresse da CentralConcorrente: N threads produtoras registram
+ocorrências (uma a uma e em lotes) enquanto M threads despachantes retiram,
+atribuem e concluem ocorrências. Metade dos despachantes usa uma equipe própria
+(atender_e_atribuir) e a outra metade o despacho automático (despachar).
+
+Ao final verifica que nenhum ID foi repetido e que cada ocorrência foi entregue
+a exatamente uma equipe, e reporta a vazão.
+
+Uso:
+    python benchmark_concorrencia.py [produtores] [despachantes] [ocorrencias]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import threading
+import time
+
+from central_concorrente import CentralConcorrente
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+TAMANHO_LOTE = 100
+
+
+def produzir(central, quantidade, semente, registradas):
+    """Registra `quantidade` ocorrências, alternando registros individuais e lotes."""
+    aleatorio = random.Random(semente)
+    ids = []
+    enviadas = 0
+    while enviadas < quantidade:
+        if aleatorio.random() < 0.5:
+            ocorrencia = central.registrar_ocorrencia(
+                Ocorrencia(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), "estresse")
+            )
+            ids.append(ocorrencia.id)
+            enviadas += 1
+        else:
+            tamanho = min(TAMANHO_LOTE, quantidade - enviadas)
+            resultado = central.registrar_lote(
+                [(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), "estresse") for _ in range(tamanho)]
+            )
+            ids.extend(ocorrencia.id for ocorrencia in resultado.aceitas)
+            enviadas += tamanho
+    registradas.append(ids)
+
+
+def despachar(central, equipe, producao_terminada, entregas):
+    """
+    Retira e conclui ocorrências até a produção terminar e a fila esvaziar.
+
+    Com `equipe`, usa atender_e_atribuir; sem ela, usa o despacho automático.
+    """
+    pares = []
+    while True:
+        if equipe is not None:
+            ocorrencia = central.atender_e_atribuir(equipe)
+            lote = [(ocorrencia, equipe)] if ocorrencia is not None else []
+        else:
+            lote = central.despachar(limite=8)
+        if not lote:
+            with central.trava:
+                if producao_terminada.is_set() and central.fila_prioridade.esta_vazia():
+                    break
+            time.sleep(0)  # Cede a vez às produtoras
+            continue
+        for ocorrencia, equipe_atendimento in lote:
+            pares.append((ocorrencia.id, equipe_atendimento))
+            central.concluir_ocorrencia(ocorrencia.id)
+    entregas.append(pares)
+
+
+def executar(produtores=4, despachantes=4, ocorrencias=100_000, semente=42):
+    """
+    Executa o teste de estresse e verifica a entrega única.
+
+    Returns:
+        dict: Tempo total, vazão e contagens verificadas
+
+    Raises:
+        AssertionError: Se algum ID se repetir ou alguma ocorrência for entregue
+            a mais de uma equipe (ou a nenhuma)
+    """
+    central = CentralConcorrente()
+    for i in range(despachantes * 4):
+        central.adicionar_equipe(Equipe(f"Equipe {i}", REGIOES[i % len(REGIOES)]))
+    proprias = [Equipe(f"Posto {i}", REGIOES[i % len(REGIOES)]) for i in range(despachantes // 2)]
+    for equipe in proprias:
+        central.adicionar_equipe(equipe)
+    # As equipes próprias são usadas por um único despachante, fora do despacho automático
+    for equipe in proprias:
+        central.despacho.ocupar(equipe)
+
+    producao_terminada = threading.Event()
+    registradas, entregas = [], []
+    por_produtor = ocorrencias // produtores
+    threads_produtoras = [
+        threading.Thread(target=produzir, args=(central, por_produtor, semente + i, registradas))
+        for i in range(produtores)
+    ]
+    threads_despachantes = [
+        threading.Thread(
+            target=despachar,
+            args=(central, proprias[i] if i < len(proprias) else None, producao_terminada, entregas),
+        )
+        for i in range(despachantes)
+    ]
+
+    inicio = time.perf_counter()
+    # A saída da conclusão no console é descartada: o objetivo é medir a central
+    with contextlib.redirect_stdout(io.StringIO()):
+        for thread in threads_despachantes + threads_produtoras:
+            thread.start()
+        for thread in threads_produtoras:
+            thread.join()
+        producao_terminada.set()
+        for thread in threads_despachantes:
+            thread.join()
+    decorrido = time.perf_counter() - inicio
+
+    ids_registrados = [id_ocorrencia for ids in registradas for id_ocorrencia in ids]
+    assert len(ids_registrados) == len(set(ids_registrados)), "IDs repetidos entre produtoras"
+    pares = [par for lote in entregas for par in lote]
+    ids_entregues = [id_ocorrencia for id_ocorrencia, _ in pares]
+    assert len(ids_entregues) == len(set(ids_entregues)), "Ocorrência entregue a mais de uma equipe"
+    assert set(ids_entregues) == set(ids_registrados), "Ocorrência registrada sem entrega"
+    for id_ocorrencia, equipe in pares:
+        ocorrencia = central.buscar_ocorrencia(id_ocorrencia)
+        assert ocorrencia.equipe_atendimento is equipe and ocorrencia.status == "resolvida"
+
+    return {
+        "segundos": decorrido,
+        "registradas": len(ids_registrados),
+        "entregues": len(ids_entregues),
+        "operacoes_por_segundo": (len(ids_registrados) + 2 * len(ids_entregues)) / decorrido,
+    }
+
+
+def main():
+    produtores = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    despachantes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    ocorrencias = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+    print(f"{'produtores':>10} | {'despachantes':>12} | {'ocorrências':>11} | {'s':>6} | {'ops/s':>9}")
+    print("-" * 62)
+    for n, m in ((1, 1), (produtores, despachantes)):
+        resultado = executar(n, m, ocorrencias)
+        print(f"{n:>10} | {m:>12} | {resultado['entregues']:>11} | "
+              f"{resultado['segundos']:>6.2f} | {resultado['operacoes_por_segundo']:>9.0f}")
+    print("Entrega única verificada: nenhum ID repetido, cada ocorrência atendida por exatamente uma equipe")
+
+
+if __name__ == "__main__":
+    main()
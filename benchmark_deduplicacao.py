@@ -0,0 +1,131 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark de Deduplicação
+
+Gera relatos sintéticos de focos de queimada em que cada foco é relatado
+várias vezes, com as variações de quem digita às pressas (maiúsculas, acentos,
+pontuação, palavras omitidas, trocadas de ordem ou acrescentadas), e os registra
+em uma central com a deduplicação ativada. Como a origem de cada relato é
+conhecida, mede a precisão (relatos incorporados ao foco certo) e a revocação
+(duplicatas reconhecidas), a redução da fila e a latência de cada verificação.
+
+Uso:
+    python benchmark_deduplicacao.py [focos] [relatos_por_foco]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from central_atendimento import CentralAtendimento
+from ocorrencia import Ocorrencia
+from relogio import RelogioSimulado, definir_relogio
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+LOCAIS = ["Fazenda", "Sítio", "Chácara", "Reserva", "Parque", "Assentamento", "Mata", "Serra", "Vale", "Córrego"]
+NOMES = ["Santa Rita", "Boa Vista", "São José", "Três Irmãos", "Bela Vista", "Águas Claras", "Santo Antônio",
+         "Palmeiras", "Ipê Amarelo", "Buriti", "Jatobá", "Aroeira", "Cedro", "Pequi", "Angico", "Baru"]
+REFERENCIAS = ["perto da BR-{n}", "km {n} da rodovia", "atrás da escola {n}", "próximo ao posto {n}", "lote {n}"]
+COMPLEMENTOS = ["fumaça preta", "fogo alto", "chamas no pasto", "vento forte", "moradores assustados", "urgente"]
+
+
+def descrever_foco(aleatorio: random.Random) -> str:
+    """Sorteia a descrição canônica de um foco."""
+    referencia = aleatorio.choice(REFERENCIAS).format(n=aleatorio.randint(1, 400))
+    return f"Incêndio na {aleatorio.choice(LOCAIS)} {aleatorio.choice(NOMES)}, {referencia}"
+
+
+def variar(descricao: str, aleatorio: random.Random) -> str:
+    """Produz um relato do mesmo foco com variações de digitação."""
+    palavras = descricao.replace(",", "").split()
+    if len(palavras) > 4 and aleatorio.random() < 0.4:
+        del palavras[aleatorio.randrange(len(palavras))]
+    if aleatorio.random() < 0.3:
+        i = aleatorio.randrange(len(palavras) - 1)
+        palavras[i], palavras[i + 1] = palavras[i + 1], palavras[i]
+    if aleatorio.random() < 0.4:
+        palavras.append(aleatorio.choice(COMPLEMENTOS))
+    texto = " ".join(palavras)
+    if aleatorio.random() < 0.5:
+        texto = texto.lower()
+    if aleatorio.random() < 0.3:
+        texto = texto.replace("ê", "e").replace("í", "i").replace("ã", "a").replace("á", "a")
+    if aleatorio.random() < 0.3:
+        texto += "!!"
+    return texto
+
+
+def gerar_relatos(focos: int, relatos_por_foco: int, semente: int = 42):
+    """
+    Gera relatos em ordem cronológica: cada foco é relatado ao longo de uma hora.
+
+    Returns:
+        list[tuple[datetime, int, str, int, str]]: (instante, foco, região, severidade, descrição)
+    """
+    aleatorio = random.Random(semente)
+    inicio = datetime(2024, 8, 1)
+    relatos = []
+    for foco in range(focos):
+        descricao = descrever_foco(aleatorio)
+        regiao = aleatorio.choice(REGIOES)
+        surgimento = inicio + timedelta(seconds=aleatorio.uniform(0, 7 * 24 * 3600))
+        for relato in range(aleatorio.randint(1, 2 * relatos_por_foco - 1)):
+            texto = descricao if relato == 0 else variar(descricao, aleatorio)
+            relatos.append((
+                surgimento + timedelta(minutes=aleatorio.uniform(0, 60)),
+                foco, regiao, aleatorio.randint(1, 5), texto,
+            ))
+    relatos.sort()
+    return relatos
+
+
+def medir(focos: int, relatos_por_foco: int) -> dict:
+    """Registra os relatos com a deduplicação ativada e compara com a origem conhecida."""
+    relatos = gerar_relatos(focos, relatos_por_foco)
+    relogio = RelogioSimulado(relatos[0][0])
+    definir_relogio(relogio)
+    central = CentralAtendimento()
+    deduplicador = central.ativar_deduplicacao()
+    foco_da_ocorrencia: dict[int, int] = {}
+    corretas = erradas = 0
+    inicio = time.perf_counter()
+    for instante, foco, regiao, severidade, descricao in relatos:
+        relogio.avancar((instante - relogio.agora()).total_seconds())
+        relato = Ocorrencia(regiao, severidade, descricao)
+        ocorrencia = central.registrar_ocorrencia(relato)
+        if ocorrencia.id == relato.id:
+            foco_da_ocorrencia[ocorrencia.id] = foco
+        elif foco_da_ocorrencia[ocorrencia.id] == foco:
+            corretas += 1
+        else:
+            erradas += 1
+    decorrido = time.perf_counter() - inicio
+    duplicatas_reais = len(relatos) - focos
+    estatisticas = deduplicador.estatisticas()
+    return {
+        "relatos": len(relatos),
+        "focos": focos,
+        "ocorrencias_na_fila": len(central.fila_prioridade),
+        "precisao": corretas / (corretas + erradas) if corretas + erradas else 1.0,
+        "revocacao": corretas / duplicatas_reais if duplicatas_reais else 1.0,
+        "relatos_por_segundo": len(relatos) / decorrido,
+        **estatisticas,
+    }
+
+
+def main():
+    focos = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    relatos_por_foco = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    resultado = medir(focos, relatos_por_foco)
+    print(f"📊 {resultado['relatos']:,} relatos de {resultado['focos']:,} focos\n")
+    print(f"Ocorrências na fila:     {resultado['ocorrencias_na_fila']:,} (sem deduplicação: {resultado['relatos']:,})")
+    print(f"Taxa de duplicatas:      {resultado['taxa_duplicatas']:.1%}")
+    print(f"Precisão:                {resultado['precisao']:.2%}")
+    print(f"Revocação:               {resultado['revocacao']:.2%}")
+    print(f"Latência da verificação: p50 {resultado['latencia_p50_us']:.1f} µs, "
+          f"p99 {resultado['latencia_p99_us']:.1f} µs, máx {resultado['latencia_maxima_us']:.1f} µs")
+    print(f"Vazão de registro:       {resultado['relatos_por_segundo']:,.0f} relatos/s")
+
+
+if __name__ == "__main__":
+    main()
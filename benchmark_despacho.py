@@ -0,0 +1,79 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark de Despacho
+
+Mede o tempo de um ciclo de CentralAtendimento.despachar com centenas de
+equipes e milhares de ocorrências pendentes distribuídas em várias regiões.
+
+Uso:
+    python benchmark_despacho.py [equipes] [pendentes]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+
+
+def medir(total_equipes=500, pendentes=5_000, regioes=20, ciclos=20, semente=42):
+    """
+    Executa ciclos de despacho e conclusão, medindo o tempo de cada despacho.
+
+    Args:
+        total_equipes (int): Número de equipes
+        pendentes (int): Ocorrências pendentes mantidas na fila a cada ciclo
+        regioes (int): Número de regiões
+        ciclos (int): Número de ciclos de despacho
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        list[tuple[int, float]]: (despachos, milissegundos) de cada ciclo
+    """
+    aleatorio = random.Random(semente)
+    nomes_regioes = [f"Regiao {i}" for i in range(regioes)]
+    central = CentralAtendimento()
+    for i in range(total_equipes):
+        central.adicionar_equipe(Equipe(f"Equipe {i}", aleatorio.choice(nomes_regioes)))
+    for origem in nomes_regioes:
+        for destino in nomes_regioes:
+            if origem != destino:
+                central.despacho.definir_custo(origem, destino, aleatorio.uniform(1, 10))
+
+    resultados = []
+    em_atendimento = []
+    for _ in range(ciclos):
+        faltantes = pendentes - len(central.fila_prioridade)
+        central.registrar_lote(
+            (aleatorio.choice(nomes_regioes), aleatorio.randint(1, 5), "benchmark")
+            for _ in range(faltantes)
+        )
+        inicio = time.perf_counter()
+        despachos = central.despachar()
+        decorrido = time.perf_counter() - inicio
+        resultados.append((len(despachos), decorrido * 1e3))
+
+        em_atendimento.extend(ocorrencia.id for ocorrencia, _ in despachos)
+        aleatorio.shuffle(em_atendimento)
+        concluidas, em_atendimento = em_atendimento[: len(em_atendimento) // 2], em_atendimento[len(em_atendimento) // 2:]
+        # A saída no console da conclusão é descartada: o objetivo é medir o despacho
+        with contextlib.redirect_stdout(io.StringIO()):
+            for id_ocorrencia in concluidas:
+                central.concluir_ocorrencia(id_ocorrencia)
+    return resultados
+
+
+def main():
+    total_equipes = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    pendentes = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    resultados = medir(total_equipes, pendentes)
+    print(f"{'ciclo':>6} | {'despachos':>10} | {'ms':>8}")
+    print("-" * 30)
+    for ciclo, (despachos, ms) in enumerate(resultados, 1):
+        print(f"{ciclo:>6} | {despachos:>10} | {ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark Espacial
+
+Mede a latência das operações geográficas com 10 mil equipes e 100 mil focos
+ativos espalhados pelo território (concentrados em alguns polos, como em uma
+temporada de queimadas): registro de um relato com agrupamento em incidente,
+busca das equipes livres mais próximas, busca dos focos mais próximos, escolha
+da equipe no despacho e consulta de um incidente. Cada operação deve ficar
+abaixo de 1 ms.
+
+Uso:
+    python benchmark_espacial.py [equipes] [focos] [consultas]
+"""
+
+import random
+import sys
+import time
+
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+# Retângulo aproximado do território (latitude, longitude)
+LATITUDES = (-33.0, 4.0)
+LONGITUDES = (-73.0, -35.0)
+POLOS = 40  # Centros onde os focos se concentram
+LIMITE_MS = 1.0
+
+
+def ponto_aleatorio(aleatorio: random.Random, polos=None) -> tuple[float, float]:
+    """Sorteia um ponto no território, ou perto de um dos polos (desvio de ~0,5°)."""
+    if polos:
+        latitude, longitude = aleatorio.choice(polos)
+        return (
+            min(max(aleatorio.gauss(latitude, 0.5), LATITUDES[0]), LATITUDES[1]),
+            min(max(aleatorio.gauss(longitude, 0.5), LONGITUDES[0]), LONGITUDES[1]),
+        )
+    return aleatorio.uniform(*LATITUDES), aleatorio.uniform(*LONGITUDES)
+
+
+def percentis(amostras: list[float]) -> tuple[float, float, float]:
+    """Retorna (p50, p99, máximo) das amostras, em milissegundos."""
+    ordenadas = sorted(amostras)
+    return (
+        ordenadas[len(ordenadas) // 2] * 1e3,
+        ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * 0.99))] * 1e3,
+        ordenadas[-1] * 1e3,
+    )
+
+
+def medir(total_equipes=10_000, total_focos=100_000, consultas=2_000, semente=42) -> dict[str, list[float]]:
+    """
+    Monta a central e mede cada operação `consultas` vezes.
+
+    Returns:
+        dict[str, list[float]]: Tempos (s) de cada operação
+    """
+    aleatorio = random.Random(semente)
+    polos = [ponto_aleatorio(aleatorio) for _ in range(POLOS)]
+    central = CentralAtendimento()
+    for i in range(total_equipes):
+        latitude, longitude = ponto_aleatorio(aleatorio)
+        central.adicionar_equipe(Equipe(f"Equipe {i}", latitude=latitude, longitude=longitude))
+    central.registrar_lote(
+        ("Território", aleatorio.randint(1, 5), "foco", *ponto_aleatorio(aleatorio, polos))
+        for _ in range(total_focos)
+    )
+
+    tempos: dict[str, list[float]] = {
+        "registrar + agrupar": [], "equipes_proximas (k=5)": [], "focos_proximos (k=10)": [],
+        "escolher_equipe": [], "incidente": [],
+    }
+    relogio = time.perf_counter
+    for _ in range(consultas):
+        latitude, longitude = ponto_aleatorio(aleatorio, polos)
+        ocorrencia = Ocorrencia("Território", 3, "relato", latitude, longitude)
+        inicio = relogio()
+        central.registrar_ocorrencia(ocorrencia)
+        tempos["registrar + agrupar"].append(relogio() - inicio)
+
+        inicio = relogio()
+        central.equipes_proximas(latitude, longitude, 5)
+        tempos["equipes_proximas (k=5)"].append(relogio() - inicio)
+
+        inicio = relogio()
+        central.focos_proximos(latitude, longitude, 10)
+        tempos["focos_proximos (k=10)"].append(relogio() - inicio)
+
+        inicio = relogio()
+        central.despacho.escolher_equipe(ocorrencia.regiao, latitude, longitude)
+        tempos["escolher_equipe"].append(relogio() - inicio)
+
+        inicio = relogio()
+        central.incidente(ocorrencia.id)
+        tempos["incidente"].append(relogio() - inicio)
+    return tempos
+
+
+def main():
+    total_equipes = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    total_focos = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    consultas = int(sys.argv[3]) if len(sys.argv) > 3 else 2_000
+    print(f"📊 {total_equipes:,} equipes, {total_focos:,} focos ativos, {consultas:,} consultas\n")
+    tempos = medir(total_equipes, total_focos, consultas)
+    print(f"{'operação':<24} | {'p50 ms':>8} | {'p99 ms':>8} | {'máx ms':>8}")
+    print("-" * 58)
+    acima = []
+    for operacao, amostras in tempos.items():
+        p50, p99, maximo = percentis(amostras)
+        print(f"{operacao:<24} | {p50:>8.3f} | {p99:>8.3f} | {maximo:>8.3f}")
+        if p99 > LIMITE_MS:
+            acima.append(operacao)
+    if acima:
+        print(f"\n⚠️  p99 acima de {LIMITE_MS} ms: {', '.join(acima)}")
+    else:
+        print(f"\n✅ Todas as operações com p99 abaixo de {LIMITE_MS} ms")
+
+
+if __name__ == "__main__":
+    main()
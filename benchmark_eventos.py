@@ -0,0 +1,152 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark do Barramento de Eventos
+
+Uma central recebe registros, despachos e conclusões a uma taxa fixa de
+eventos por segundo enquanto muitos assinantes acompanham o barramento com
+asyncio, no mesmo laço. A maioria dos assinantes lê cada lote assim que é
+acordada; uma parte simula painéis lentos, que demoram a processar cada lote e
+assinam com coalescência. Mede a taxa de publicação alcançada, as entregas por
+segundo, o atraso entre a publicação e a leitura e quanto a coalescência
+reduziu o trabalho dos assinantes lentos.
+
+Uso:
+    python benchmark_eventos.py [assinantes] [eventos_por_segundo] [segundos]
+"""
+
+import asyncio
+import bisect
+import random
+import sys
+import time
+
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+EQUIPES = 200
+INTERVALO = 0.01  # Segundos entre duas rajadas de publicação
+FRACAO_LENTOS = 0.1  # Assinantes que demoram a processar cada lote
+ESPERA_LENTOS = 0.25  # Segundos que um assinante lento leva por lote
+
+
+class Relogio:
+    """Instante de publicação de cada rajada, para medir o atraso das entregas."""
+
+    def __init__(self):
+        self.ultimas_seq: list[int] = []  # Última sequência de cada rajada
+        self.instantes: list[float] = []
+
+    def marcar(self, seq: int):
+        self.ultimas_seq.append(seq)
+        self.instantes.append(time.perf_counter())
+
+    def publicado_em(self, seq: int) -> float:
+        return self.instantes[bisect.bisect_left(self.ultimas_seq, seq)]
+
+
+async def produtor(central: CentralAtendimento, taxa: int, duracao: float, relogio: Relogio):
+    """Gera eventos na central até a taxa pedida, uma rajada a cada INTERVALO."""
+    aleatorio = random.Random(42)
+    barramento = central.eventos
+    em_atendimento: list[int] = []
+    inicio = time.perf_counter()
+    while (decorrido := time.perf_counter() - inicio) < duracao:
+        alvo = int(taxa * decorrido)
+        while barramento.seq < alvo:
+            sorteio = aleatorio.random()
+            if sorteio < 0.5 or not em_atendimento:
+                central.registrar_ocorrencia(
+                    Ocorrencia(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), "Foco")
+                )
+                if sorteio < 0.1:
+                    em_atendimento.extend(ocorrencia.id for ocorrencia, _ in central.despachar())
+            else:
+                central.concluir(em_atendimento.pop(aleatorio.randrange(len(em_atendimento))))
+        relogio.marcar(barramento.seq)
+        await asyncio.sleep(INTERVALO)
+
+
+async def assinante(assinatura, relogio: Relogio, lento: bool, atrasos: list[float]):
+    """Lê os lotes da assinatura, anotando o atraso do evento mais antigo de cada lote."""
+    estado = {}
+    async for lote in assinatura:
+        atrasos.append(time.perf_counter() - relogio.publicado_em(lote[0].seq))
+        if lento:
+            for evento in lote:
+                estado[evento.chave] = evento.dados
+            await asyncio.sleep(ESPERA_LENTOS)
+
+
+def percentil(valores: list[float], fracao: float) -> float:
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(fracao * len(valores)))] if valores else 0.0
+
+
+async def executar(assinantes: int, taxa: int, duracao: float):
+    """
+    Executa a carga e imprime os resultados.
+
+    Args:
+        assinantes (int): Número de assinaturas (FRACAO_LENTOS delas lentas, com coalescência)
+        taxa (int): Eventos publicados por segundo
+        duracao (float): Segundos de publicação
+    """
+    central = CentralAtendimento()
+    barramento = central.ativar_eventos()
+    for i in range(EQUIPES):
+        central.adicionar_equipe(Equipe(f"Equipe {i}", REGIOES[i % len(REGIOES)]))
+    relogio = Relogio()
+    lentos = int(assinantes * FRACAO_LENTOS)
+    assinaturas = [barramento.assinar(coalescer=i < lentos) for i in range(assinantes)]
+    atrasos_rapidos: list[float] = []
+    atrasos_lentos: list[float] = []
+    tarefas = [
+        asyncio.create_task(assinante(
+            assinatura, relogio, i < lentos, atrasos_lentos if i < lentos else atrasos_rapidos
+        ))
+        for i, assinatura in enumerate(assinaturas)
+    ]
+    primeiro = barramento.seq
+    inicio = time.perf_counter()
+    await produtor(central, taxa, duracao, relogio)
+    await asyncio.sleep(ESPERA_LENTOS * 2)  # Deixa os assinantes lentos alcançarem o fim
+    decorrido = time.perf_counter() - inicio
+    for assinatura in assinaturas:
+        assinatura.cancelar()
+    for tarefa in tarefas:
+        tarefa.cancel()
+    await asyncio.gather(*tarefas, return_exceptions=True)
+
+    publicados = barramento.seq - primeiro
+    rapidas, lentas = assinaturas[lentos:], assinaturas[:lentos]
+    entregues = sum(assinatura.entregues for assinatura in assinaturas)
+    print(f"Eventos publicados: {publicados:,} ({publicados / duracao:,.0f}/s; pedido: {taxa:,}/s)")
+    print(f"Entregas: {entregues:,} ({entregues / decorrido:,.0f}/s)")
+    print(f"Assinaturas atrasadas além da retenção: {barramento.atrasadas}\n")
+    print(f"{'assinantes':>17} | {'quantidade':>10} | {'lotes':>8} | {'eventos/lote':>12} | {'atraso p50':>10} | {'atraso p99':>10}")
+    print("-" * 83)
+    for nome, grupo, atrasos in (("rápidos", rapidas, atrasos_rapidos), ("lentos (coalesc.)", lentas, atrasos_lentos)):
+        if not grupo:
+            continue
+        lidos = sum(assinatura.entregues + assinatura.coalescidos for assinatura in grupo)
+        print(
+            f"{nome:>17} | {len(grupo):>10,} | {len(atrasos):>8,} | {lidos / max(len(atrasos), 1):>12.1f} | "
+            f"{percentil(atrasos, 0.5) * 1000:>8.1f}ms | {percentil(atrasos, 0.99) * 1000:>8.1f}ms"
+        )
+    if lentas:
+        coalescidos = sum(assinatura.coalescidos for assinatura in lentas)
+        lidos = coalescidos + sum(assinatura.entregues for assinatura in lentas)
+        print(f"\nCoalescência nos lentos: {coalescidos:,} de {lidos:,} eventos omitidos ({coalescidos / max(lidos, 1):.0%})")
+
+
+def main():
+    assinantes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    taxa = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    duracao = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+    print(f"📊 {assinantes:,} assinantes, {taxa:,} eventos/s durante {duracao:.0f} s\n")
+    asyncio.run(executar(assinantes, taxa, duracao))
+
+
+if __name__ == "__main__":
+    main()
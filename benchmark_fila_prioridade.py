@@ -0,0 +1,82 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark da Fila de Prioridade
+
+Mede o custo de FilaPrioridade.atualizar (escalonamento de severidade), de
+remover (cancelamento por ID) e de remover_proxima com filas de tamanhos
+crescentes. A cada ciclo, várias prioridades mudam, algumas ocorrências são
+canceladas e uma é atendida; com o heap indexado todas as operações devem
+crescer apenas de forma logarítmica com o tamanho da fila.
+
+Uso:
+    python benchmark_fila_prioridade.py
+"""
+
+import random
+import time
+
+from fila_prioridade import FilaPrioridade
+from ocorrencia import Ocorrencia
+from politica_prioridade import PoliticaEnvelhecimento
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+
+
+def medir(tamanho, ciclos=2_000, alteracoes_por_ciclo=50, cancelamentos_por_ciclo=5, semente=42):
+    """
+    Mede µs por atualização, cancelamento e remoção em uma fila com `tamanho` ocorrências.
+
+    Args:
+        tamanho (int): Número de ocorrências pendentes na fila
+        ciclos (int): Número de ciclos medidos
+        alteracoes_por_ciclo (int): Prioridades alteradas em cada ciclo
+        cancelamentos_por_ciclo (int): Ocorrências canceladas (e registradas de novo) em cada ciclo
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        tuple[float, float, float]: (µs por atualização, µs por cancelamento, µs por remoção)
+    """
+    aleatorio = random.Random(semente)
+    fila = FilaPrioridade(PoliticaEnvelhecimento())
+    ocorrencias = [
+        Ocorrencia(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), "benchmark")
+        for _ in range(tamanho + ciclos)
+    ]
+    fila.adicionar_lote(ocorrencias)
+
+    tempo_atualizacao = tempo_cancelamento = tempo_remocao = 0.0
+    for _ in range(ciclos):
+        alteradas = aleatorio.sample(ocorrencias, alteracoes_por_ciclo)
+        canceladas = [ocorrencia.id for ocorrencia in aleatorio.sample(ocorrencias, cancelamentos_por_ciclo)]
+        inicio = time.perf_counter()
+        for ocorrencia in alteradas:
+            ocorrencia.severidade = aleatorio.randint(1, 5)
+            fila.atualizar(ocorrencia)
+        meio = time.perf_counter()
+        removidas = [fila.remover(id_ocorrencia) for id_ocorrencia in canceladas]
+        fim_cancelamento = time.perf_counter()
+        fila.remover_proxima()
+        fim = time.perf_counter()
+        tempo_atualizacao += meio - inicio
+        tempo_cancelamento += fim_cancelamento - meio
+        tempo_remocao += fim - fim_cancelamento
+        for ocorrencia in removidas:
+            if ocorrencia is not None:
+                fila.adicionar(ocorrencia)
+
+    return (
+        tempo_atualizacao / (ciclos * alteracoes_por_ciclo) * 1e6,
+        tempo_cancelamento / (ciclos * cancelamentos_por_ciclo) * 1e6,
+        tempo_remocao / ciclos * 1e6,
+    )
+
+
+def main():
+    print(f"{'tamanho':>10} | {'µs/atualização':>15} | {'µs/cancelamento':>16} | {'µs/remoção':>11}")
+    print("-" * 61)
+    for tamanho in (10_000, 100_000, 1_000_000):
+        atualizacao, cancelamento, remocao = medir(tamanho)
+        print(f"{tamanho:>10} | {atualizacao:>15.2f} | {cancelamento:>16.2f} | {remocao:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark do Histórico em Camadas
+
+Registra milhões de atendimentos nos históricos de um conjunto de equipes com
+memória limitada (ver Historico) e amostra a memória residente (RSS) do
+processo ao longo da execução: com os registros antigos descarregados em
+disco, a RSS deve ficar estável em vez de crescer com cada despacho. Também é
+amostrado o número de blocos alocados pelo Python (sys.getallocatedblocks),
+que conta os objetos vivos sem a fragmentação do alocador que a RSS inclui.
+
+Uso:
+    python benchmark_historico.py [despachos] [equipes] [capacidade]
+"""
+
+import gc
+import os
+import resource
+import sys
+import time
+from datetime import datetime, timedelta
+
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+AMOSTRAS = 10  # Medições de RSS ao longo da execução
+
+
+def rss_mib() -> float:
+    """Retorna a memória residente atual do processo em MiB (pico, se /proc não existir)."""
+    try:
+        with open("/proc/self/statm") as arquivo:
+            paginas = int(arquivo.read().split()[1])
+        return paginas * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def executar(despachos: int, total_equipes: int, capacidade: int | None) -> list[tuple[int, float, int]]:
+    """
+    Registra `despachos` atendimentos distribuídos entre as equipes.
+
+    Cada ocorrência só é referenciada pelo histórico da equipe, como em uma
+    central cujo armazenamento já a arquivou.
+
+    Returns:
+        list[tuple[int, float, int]]: Amostras (despachos feitos, RSS em MiB, blocos alocados)
+    """
+    equipes = [Equipe(f"Equipe {i}", REGIOES[i % len(REGIOES)], capacidade) for i in range(total_equipes)]
+    inicio = datetime(2024, 1, 1)
+    intervalo = max(1, despachos // AMOSTRAS)
+    amostras = [(0, rss_mib(), sys.getallocatedblocks())]
+    for i in range(despachos):
+        equipe = equipes[i % total_equipes]
+        data = inicio + timedelta(seconds=i)
+        ocorrencia = Ocorrencia.restaurar(
+            i + 1, equipe.regiao_base, i % 5 + 1, f"Foco {i}", "resolvida", data, data, data, equipe,
+        )
+        equipe.adicionar_ocorrencia_registrada(ocorrencia)
+        if (i + 1) % intervalo == 0:
+            amostras.append((i + 1, rss_mib(), sys.getallocatedblocks()))
+    for equipe in equipes:
+        mais_antiga = equipe.historico_ocorrencias_registradas.intervalo(0, 1)
+        assert not mais_antiga or mais_antiga[0].descricao.startswith("Foco"), "Histórico em disco corrompido"
+        equipe.historico_ocorrencias_registradas.fechar()
+    return amostras
+
+
+def main():
+    despachos = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    total_equipes = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    capacidade = int(sys.argv[3]) if len(sys.argv) > 3 else 10_000
+    gc.collect()
+
+    print(f"📊 {despachos:,} despachos para {total_equipes} equipes, "
+          f"até {capacidade:,} ocorrências em memória por equipe\n")
+    print(f"{'despachos':>12} | {'RSS (MiB)':>10} | {'blocos Python':>13}")
+    print("-" * 42)
+    inicio = time.perf_counter()
+    amostras = executar(despachos, total_equipes, capacidade)
+    decorrido = time.perf_counter() - inicio
+    for feitos, rss, blocos in amostras:
+        print(f"{feitos:>12,} | {rss:>10.1f} | {blocos:>13,}")
+
+    # A RSS inicial inclui o enchimento das camadas quentes; a estabilidade é
+    # medida entre a primeira amostra com todas as camadas cheias e a última
+    cheia = next((rss for feitos, rss, _ in amostras if feitos >= total_equipes * capacidade), amostras[-1][1])
+    print(f"\n{decorrido:.1f}s ({despachos / decorrido:,.0f} despachos/s); "
+          f"RSS após encher as camadas quentes: {cheia:.1f} MiB → {amostras[-1][1]:.1f} MiB no final")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark do Índice de Severidade
+
+Mede o custo por inserção de CentralAtendimento.registrar_ocorrencia à medida
+que a central cresce, até 1 milhão de ocorrências. Com o índice por baldes o
+custo por inserção deve permanecer constante (sem crescimento com n).
+
+Uso:
+    python benchmark_indice_severidade.py [total]
+"""
+
+import gc
+import random
+import sys
+import time
+
+from central_atendimento import CentralAtendimento
+from ocorrencia import Ocorrencia
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+
+
+def medir(total=1_000_000, janela=10_000, semente=42):
+    """
+    Registra `total` ocorrências e mede o custo médio por inserção em cada janela.
+
+    Args:
+        total (int): Número total de ocorrências a registrar
+        janela (int): Tamanho de cada janela de medição
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        list[tuple[int, float]]: Pares (ocorrências registradas, µs por inserção na janela)
+    """
+    aleatorio = random.Random(semente)
+    central = CentralAtendimento()
+    resultados = []
+    registradas = 0
+    while registradas < total:
+        tamanho = min(janela, total - registradas)
+        lote = [
+            Ocorrencia(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), "benchmark")
+            for _ in range(tamanho)
+        ]
+        # O coletor de ciclos é pausado para que suas varreduras (proporcionais ao
+        # número de objetos vivos) não sejam confundidas com o custo da inserção
+        gc.disable()
+        inicio = time.perf_counter()
+        for ocorrencia in lote:
+            central.registrar_ocorrencia(ocorrencia)
+        decorrido = time.perf_counter() - inicio
+        gc.enable()
+        registradas += tamanho
+        resultados.append((registradas, decorrido / tamanho * 1e6))
+    return resultados
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    resultados = medir(total)
+    print(f"{'ocorrências':>12} | {'µs/inserção':>12}")
+    print("-" * 27)
+    marcos = {10 ** k for k in range(3, 8)} | {total}
+    for registradas, custo in resultados:
+        if registradas in marcos or registradas % (total // 10 or 1) == 0:
+            print(f"{registradas:>12} | {custo:>12.3f}")
+    primeira, ultima = resultados[0][1], resultados[-1][1]
+    print("-" * 27)
+    print(f"Razão custo final/inicial: {ultima / primeira:.2f}")
+
+
+if __name__ == "__main__":
+    main()
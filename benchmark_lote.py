@@ -0,0 +1,69 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark de Importação em Lote
+
+Mede o tempo de CentralAtendimento.registrar_lote para lotes de tuplas e de
+JSONL em memória, com uma fração de linhas inválidas para exercitar as rejeições.
+
+Uso:
+    python benchmark_lote.py [total]
+"""
+
+import io
+import json
+import random
+import sys
+import time
+
+from central_atendimento import CentralAtendimento
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+
+
+def gerar_registros(total, semente=42, taxa_invalidos=0.001):
+    """
+    Gera registros sintéticos de focos de calor.
+
+    Args:
+        total (int): Número de registros
+        semente (int): Semente do gerador aleatório
+        taxa_invalidos (float): Fração de registros com severidade inválida
+
+    Returns:
+        list[tuple]: Registros (regiao, severidade, descricao)
+    """
+    aleatorio = random.Random(semente)
+    return [
+        (
+            aleatorio.choice(REGIOES),
+            0 if aleatorio.random() < taxa_invalidos else aleatorio.randint(1, 5),
+            f"Foco de calor {i}",
+        )
+        for i in range(total)
+    ]
+
+
+def cronometrar(fonte):
+    """Registra a fonte em uma central nova e retorna (segundos, resultado)."""
+    central = CentralAtendimento()
+    inicio = time.perf_counter()
+    resultado = central.registrar_lote(fonte)
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    registros = gerar_registros(total)
+
+    segundos, resultado = cronometrar(registros)
+    print(f"Tuplas: {total} linhas em {segundos:.2f}s ({total / segundos:,.0f} linhas/s) - {resultado}")
+
+    jsonl = io.StringIO("".join(
+        json.dumps({"regiao": regiao, "severidade": severidade, "descricao": descricao}) + "\n"
+        for regiao, severidade, descricao in registros
+    ))
+    segundos, resultado = cronometrar(jsonl)
+    print(f"JSONL:  {total} linhas em {segundos:.2f}s ({total / segundos:,.0f} linhas/s) - {resultado}")
+
+
+if __name__ == "__main__":
+    main()
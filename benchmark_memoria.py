@@ -0,0 +1,101 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark de Memória
+
+Compara os bytes por ocorrência retidos pela CentralAtendimento em três cenários:
+- legado: Ocorrencia com __dict__ por instância (como antes de __slots__)
+- slots: Ocorrencia com __slots__ em um dicionário de objetos
+- colunar: ArmazenamentoColunar com visões sob demanda
+
+As ocorrências são registradas e atendidas (a fila fica vazia), simulando o
+histórico de uma temporada mantido em CentralAtendimento.ocorrencias.
+
+Uso:
+    python benchmark_memoria.py [total]
+"""
+
+import gc
+import random
+import sys
+import tracemalloc
+
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+from relogio import agora
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+
+
+class OcorrenciaLegada:
+    """
+    Réplica da Ocorrencia com __dict__ por instância, para comparação.
+
+    Tem os mesmos atributos da Ocorrencia atual (inclusive coordenadas e
+    observador), para que a central a trate como uma ocorrência comum.
+    """
+
+    _id_counter = 10 ** 12
+
+    def __init__(self, regiao, severidade, descricao, latitude=None, longitude=None):
+        self.id = OcorrenciaLegada._id_counter
+        OcorrenciaLegada._id_counter += 1
+        self.regiao = regiao
+        self.severidade = severidade
+        self.descricao = descricao
+        self.status = "pendente"
+        self.data_registro = agora()
+        self.data_atendimento = None
+        self.data_resolucao = None
+        self.equipe_atendimento = None
+        self.latitude = latitude
+        self.longitude = longitude
+        self._observador = None
+
+    atribuir_equipe = Ocorrencia.atribuir_equipe
+    atualizar_status = Ocorrencia.atualizar_status
+
+
+def medir(cenario, total, semente=42):
+    """
+    Mede os bytes por ocorrência retidos pela central em um cenário.
+
+    Args:
+        cenario (str): "legado", "slots" ou "colunar"
+        total (int): Número de ocorrências
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        float: Bytes retidos por ocorrência
+    """
+    aleatorio = random.Random(semente)
+    classe = OcorrenciaLegada if cenario == "legado" else Ocorrencia
+    equipes = [Equipe(f"Equipe {i}") for i in range(10)]
+
+    gc.collect()
+    tracemalloc.start()
+    central = CentralAtendimento(armazenamento_colunar=cenario == "colunar")
+    for i in range(total):
+        central.registrar_ocorrencia(classe(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), f"Foco {i}"))
+    while (ocorrencia := central.atender_proxima_ocorrencia()) is not None:
+        ocorrencia.atribuir_equipe(equipes[ocorrencia.id % len(equipes)])
+        ocorrencia.atualizar_status("resolvida")
+    del ocorrencia
+    gc.collect()
+    retidos, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retidos / total
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{'cenário':>10} | {'bytes/ocorrência':>17}")
+    print("-" * 30)
+    base = None
+    for cenario in ("legado", "slots", "colunar"):
+        bytes_por_ocorrencia = medir(cenario, total)
+        base = base or bytes_por_ocorrencia
+        print(f"{cenario:>10} | {bytes_por_ocorrencia:>17.1f}  ({bytes_por_ocorrencia / base:.0%})")
+
+
+if __name__ == "__main__":
+    main()
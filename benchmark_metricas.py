@@ -0,0 +1,98 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark de Métricas
+
+Mede o custo das métricas na vazão da central: o mesmo ciclo de trabalho
+(registro individual, despacho, conclusão, buscas e histórico das equipes) é
+executado sem métricas, com métricas e no modo de perfil, alternadamente e
+várias vezes, e a vazão de cada configuração é a da melhor repetição, em tempo
+de CPU do processo (menos sujeito a interferência de outros processos que o
+tempo de parede). O custo das métricas deve ficar abaixo de 2% da vazão.
+
+Uso:
+    python benchmark_metricas.py [ocorrencias] [repeticoes]
+"""
+
+import gc
+import random
+import sys
+import time
+
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+EQUIPES = 200
+LIMITE_CUSTO = 0.02
+
+
+def ciclo(total: int, configuracao: str, semente: int = 42) -> float:
+    """
+    Executa o ciclo de trabalho em uma central nova.
+
+    Args:
+        total (int): Ocorrências registradas (e despachadas e concluídas)
+        configuracao (str): "sem métricas", "com métricas" ou "perfil"
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        float: Segundos de CPU gastos no ciclo
+    """
+    aleatorio = random.Random(semente)
+    central = CentralAtendimento()
+    if configuracao != "sem métricas":
+        metricas = central.ativar_metricas()
+        metricas.perfilar(configuracao == "perfil")
+    for i in range(EQUIPES):
+        central.adicionar_equipe(Equipe(f"Equipe {i}", REGIOES[i % len(REGIOES)]))
+    relatos = [
+        Ocorrencia(aleatorio.choice(REGIOES), aleatorio.randint(1, 5), f"Foco {i}")
+        for i in range(total)
+    ]
+    gc.collect()
+    inicio = time.process_time()
+    for ocorrencia in relatos:
+        central.registrar_ocorrencia(ocorrencia)
+    despachadas = []
+    while True:
+        pares = central.despachar()
+        if not pares:
+            break
+        despachadas.extend(pares)
+        for ocorrencia, _ in pares:
+            central.concluir(ocorrencia.id)
+        for regiao in REGIOES:
+            central.paginar_ocorrencias(20, regiao=regiao, status="pendente", severidade_minima=5)
+    return time.process_time() - inicio
+
+
+def medir(total: int, repeticoes: int) -> dict[str, float]:
+    """
+    Alterna as configurações e retorna a vazão (ocorrências/s) da melhor repetição de cada uma.
+    """
+    configuracoes = ("sem métricas", "com métricas", "perfil")
+    melhores = dict.fromkeys(configuracoes, float("inf"))
+    for _ in range(repeticoes):
+        for configuracao in configuracoes:
+            melhores[configuracao] = min(melhores[configuracao], ciclo(total, configuracao))
+    return {configuracao: total / segundos for configuracao, segundos in melhores.items()}
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    print(f"📊 Ciclo registrar/despachar/concluir/buscar com {total:,} ocorrências, melhor de {repeticoes}\n")
+    vazoes = medir(total, repeticoes)
+    base = vazoes["sem métricas"]
+    for configuracao, vazao in vazoes.items():
+        custo = 1 - vazao / base
+        print(f"{configuracao:<14} | {vazao:>12,.0f} ocorrências/s | custo {custo:>6.2%}")
+    custo = 1 - vazoes["com métricas"] / base
+    if custo > LIMITE_CUSTO:
+        print(f"\n⚠️  Custo das métricas acima de {LIMITE_CUSTO:.0%}")
+        sys.exit(1)
+    print(f"\n✅ Custo das métricas abaixo de {LIMITE_CUSTO:.0%}")
+
+
+if __name__ == "__main__":
+    main()
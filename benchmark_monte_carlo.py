@@ -0,0 +1,60 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark do Monte Carlo
+
+Mede a escalabilidade do executor de cenários (monte_carlo.py) com o número de
+processos: executa a mesma grade de cenários com 1, 2, 4, ... processos (até o
+número de núcleos), reporta o tempo, o speedup e a eficiência, e confere que os
+resultados são idênticos em todas as execuções (sementes por replicação).
+
+Uso:
+    python benchmark_monte_carlo.py [replicacoes] [dias] [max_processos]
+"""
+
+import os
+import pickle
+import sys
+import time
+
+from monte_carlo import cenarios_dimensionamento, executar_cenarios, executar_replicacao
+
+
+def contagens_processos(maximo: int) -> list[int]:
+    """Retorna 1, 2, 4, ... até `maximo` (incluindo `maximo`)."""
+    contagens = []
+    processos = 1
+    while processos < maximo:
+        contagens.append(processos)
+        processos *= 2
+    contagens.append(maximo)
+    return contagens
+
+
+def main():
+    replicacoes = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    dias = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    maximo = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    cenarios = cenarios_dimensionamento(dias)
+
+    _, _, resumo = executar_replicacao((0, cenarios[0], 0, 42))
+    print(f"Resumo devolvido por replicação: {len(pickle.dumps(resumo))} bytes serializados")
+    print(f"{len(cenarios)} cenários × {replicacoes} replicações de {dias:g} dias; {os.cpu_count()} núcleos\n")
+    print(f"{'processos':>9} | {'segundos':>8} | {'speedup':>7} | {'eficiência':>10}")
+    print("-" * 45)
+
+    referencia = None
+    tempo_serial = None
+    for processos in contagens_processos(maximo):
+        inicio = time.perf_counter()
+        resultados = executar_cenarios(cenarios, replicacoes, processos=processos)
+        decorrido = time.perf_counter() - inicio
+        if referencia is None:
+            referencia, tempo_serial = resultados, decorrido
+        elif resultados != referencia:
+            raise AssertionError(f"Resultados com {processos} processos diferem da execução serial")
+        speedup = tempo_serial / decorrido
+        print(f"{processos:>9} | {decorrido:>8.2f} | {speedup:>6.2f}x | {speedup / processos:>10.0%}")
+    print("\nResultados idênticos em todas as execuções.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Benchmark de Particionamento
+
+Mede a vazão da CentralParticionada com 1, 2, 4, ... partições: blocos de
+requisições "registrar" (como os que o servidor recebe de clientes com
+pipelining), seguidos de ciclos de despacho e conclusão, com as ocorrências
+espalhadas por várias regiões. Cada partição é um processo, então o ganho com
+mais partições depende de haver núcleos livres (os disponíveis são mostrados).
+
+Uso:
+    python benchmark_particionamento.py [ocorrencias] [max_particoes]
+"""
+
+import os
+import random
+import sys
+import time
+
+from particionamento import CentralParticionada
+
+REGIOES = [f"Região {i}" for i in range(16)]
+TAMANHO_BLOCO = 2_000  # Requisições por bloco enviado ao roteador
+EQUIPES_POR_REGIAO = 20
+
+
+def gerar_blocos(total: int, semente: int = 42) -> list[list[dict]]:
+    """Gera blocos de requisições "registrar" com regiões e severidades aleatórias."""
+    aleatorio = random.Random(semente)
+    requisicoes = [
+        {"op": "registrar", "regiao": aleatorio.choice(REGIOES), "severidade": aleatorio.randint(1, 5),
+         "descricao": f"Foco {i}"}
+        for i in range(total)
+    ]
+    return [requisicoes[inicio:inicio + TAMANHO_BLOCO] for inicio in range(0, total, TAMANHO_BLOCO)]
+
+
+def medir(particoes: int, blocos: list[list[dict]]) -> tuple[float, float]:
+    """
+    Registra os blocos e depois despacha e conclui até esvaziar as filas.
+
+    Returns:
+        tuple[float, float]: Vazão do registro e do ciclo despacho/conclusão (ocorrências/s)
+    """
+    with CentralParticionada(particoes) as central:
+        central.executar([
+            {"op": "adicionar_equipe", "nome": f"{regiao} - {i}", "regiao_base": regiao}
+            for regiao in REGIOES for i in range(EQUIPES_POR_REGIAO)
+        ])
+        total = sum(len(bloco) for bloco in blocos)
+        inicio = time.perf_counter()
+        for bloco in blocos:
+            central.executar(bloco)
+        registro = total / (time.perf_counter() - inicio)
+
+        inicio = time.perf_counter()
+        concluidas = 0
+        while True:
+            pares = central.executar_uma("despachar")
+            if not pares:
+                break
+            respostas = central.executar([{"op": "concluir", "ocorrencia": par["ocorrencia"]} for par in pares])
+            concluidas += sum(resposta["ok"] for resposta in respostas)
+        ciclo = concluidas / (time.perf_counter() - inicio)
+    return registro, ciclo
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    maximo = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    print(f"📊 {total:,} ocorrências em {len(REGIOES)} regiões, {os.cpu_count()} núcleos disponíveis\n")
+    blocos = gerar_blocos(total)
+    print(f"{'partições':>9} | {'registro (oc/s)':>16} | {'ganho':>6} | {'despacho+conclusão (oc/s)':>26} | {'ganho':>6}")
+    print("-" * 77)
+    base = None
+    particoes = 1
+    while particoes <= maximo:
+        registro, ciclo = medir(particoes, blocos)
+        if base is None:
+            base = (registro, ciclo)
+        print(f"{particoes:>9} | {registro:>16,.0f} | {registro / base[0]:>5.2f}x | {ciclo:>26,.0f} | {ciclo / base[1]:>5.2f}x")
+        particoes *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Cache de Consultas
+
+Este módulo implementa um cache LRU de resultados de consultas da central,
+invalidado por versão: a CentralAtendimento incrementa um contador a cada
+escrita (registro, mudança de status, atribuição de equipe, severidade), e cada
+resultado guarda a versão em que foi calculado.
+"""
+
+from collections import OrderedDict
+from typing import Callable
+
+CAPACIDADE_CACHE = 256  # Resultados mantidos quando o chamador não informa a capacidade
+
+
+class CacheConsultas:
+    """
+    Cache LRU de resultados de consultas, com invalidação por versão.
+
+    A chave é a consulta com seus parâmetros (ex.: ("severidade", 4)). Um
+    resultado só é devolvido se foi calculado na versão atual da central; com
+    qualquer escrita no meio, a consulta é refeita e o resultado substitui o
+    antigo. Assim, leituras repetidas entre duas escritas custam O(1), e nenhum
+    resultado desatualizado é devolvido. Quando o cache passa da capacidade, o
+    resultado usado há mais tempo é descartado.
+
+    Os resultados são compartilhados entre as leituras: quem os recebe não deve
+    alterá-los.
+
+    Atributos:
+        capacidade (int): Máximo de resultados guardados
+        acertos (int): Leituras respondidas pelo cache
+        faltas (int): Leituras que precisaram refazer a consulta
+        descartados (int): Resultados removidos por falta de espaço
+        _entradas (OrderedDict[tuple, tuple[int, object]]): (versão, resultado) por chave,
+            do usado há mais tempo ao mais recente
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_CACHE):
+        """
+        Inicializa um cache vazio.
+
+        Args:
+            capacidade (int): Máximo de resultados guardados
+
+        Raises:
+            ValueError: Se a capacidade não for positiva
+        """
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser positiva")
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.faltas = 0
+        self.descartados = 0
+        self._entradas: OrderedDict[tuple, tuple[int, object]] = OrderedDict()
+
+    def obter(self, chave: tuple, versao: int, calcular: Callable, *argumentos):
+        """
+        Retorna o resultado da consulta, do cache se ainda valer para a versão.
+
+        Args:
+            chave (tuple): Consulta e parâmetros
+            versao (int): Versão atual dos dados
+            calcular (Callable): Refaz a consulta em caso de falta
+            *argumentos: Argumentos de `calcular`
+
+        Returns:
+            object: O resultado da consulta
+        """
+        entradas = self._entradas
+        entrada = entradas.get(chave)
+        if entrada is not None and entrada[0] == versao:
+            entradas.move_to_end(chave)
+            self.acertos += 1
+            return entrada[1]
+        self.faltas += 1
+        resultado = calcular(*argumentos)
+        entradas[chave] = (versao, resultado)
+        entradas.move_to_end(chave)
+        if len(entradas) > self.capacidade:
+            entradas.popitem(last=False)
+            self.descartados += 1
+        return resultado
+
+    def limpar(self):
+        """Descarta todos os resultados (os contadores são mantidos)."""
+        self._entradas.clear()
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna o uso do cache.
+
+        Returns:
+            dict: entradas, capacidade, acertos, faltas, descartados e
+                taxa_acerto (acertos / leituras)
+        """
+        leituras = self.acertos + self.faltas
+        return {
+            "entradas": len(self._entradas),
+            "capacidade": self.capacidade,
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "descartados": self.descartados,
+            "taxa_acerto": self.acertos / leituras if leituras else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entradas)
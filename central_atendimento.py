@@ -5,28 +5,100 @@ Este módulo implementa a classe CentralAtendimento, que é o núcleo do sistema
 Gerencia todas as operações relacionadas a ocorrências, equipes e priorização de atendimentos.
 """
 
+import gc
+import os
+from datetime import timedelta
+from time import perf_counter_ns
+from typing import Iterator
+
 from ocorrencia import Ocorrencia
 from equipe import Equipe
-from fila_prioridade import FilaPrioridade
+from filas_regionais import FilasRegionais
+from indice_severidade import IndiceSeveridade
+from indice_composto import IndiceComposto
+from indice_temporal import IndiceTemporal
+from indice_espacial import RAIO_INCIDENTE_KM, AgrupamentoIncidentes, GradeEspacial
+from importacao import ResultadoLote, ler_registros, normalizar_registro
+from armazenamento_colunar import ArmazenamentoColunar, OcorrenciaColunar
+from arquivo_morto import ARQUIVO_MORTO, ArquivoMorto
+from despacho import MotorDespacho
+from deduplicacao import Deduplicador
+from cache_consultas import CacheConsultas
+from barramento_eventos import BarramentoEventos
+from metricas import Metricas
+from paginacao import LIMITE_PAGINA, Pagina, filtro_ocorrencias, paginar
+from apresentacao import equipe_para_json, exibir_ocorrencias, ocorrencia_para_json
+from relogio import agora
+
+# Data que atualizar_status preenche quando a ocorrência entra em cada status
+CAMPO_DATA_POR_STATUS = {"em_atendimento": "data_atendimento", "resolvida": "data_resolucao"}
+# Tipo do evento publicado quando a ocorrência entra em cada status (os demais publicam "status")
+TIPO_EVENTO_POR_STATUS = {"em_atendimento": "atribuida", "resolvida": "resolvida"}
+MILISSEGUNDO = timedelta(milliseconds=1)  # Unidade dos histogramas de espera das métricas
+LOTE_ARQUIVAMENTO = 4096  # Conclusões entre dois arquivamentos automáticos (ver ativar_arquivo)
 
 class CentralAtendimento:
     """
     Classe principal que gerencia todo o sistema de atendimento a queimadas.
     
     Atributos:
-        ocorrencias (dict): Dicionário que mapeia IDs para ocorrências (busca O(1))
-        fila_prioridade (FilaPrioridade): Heap para gerenciar prioridade de atendimentos
+        ocorrencias (dict | ArmazenamentoColunar): Mapeamento de IDs para ocorrências
+        fila_prioridade (FilasRegionais): Heaps por região para gerenciar prioridade de atendimentos
         equipes (list): Lista de equipes disponíveis
+        despacho (MotorDespacho): Motor de despacho automático (equipes livres por região)
         regioes (set): Conjunto de regiões atendidas
-        ocorrencias_por_severidade (list): Lista ordenada para busca binária por severidade
+        ocorrencias_por_severidade (IndiceSeveridade): Índice incremental de IDs por severidade
+        indice_composto (IndiceComposto): Índice de IDs por (região, status, severidade)
+        indice_temporal (IndiceTemporal): Índice de IDs por data de registro, atendimento e resolução
+        focos_ativos (GradeEspacial[int]): IDs das ocorrências com coordenadas ainda não resolvidas
+        incidentes (AgrupamentoIncidentes): Relatos próximos agrupados no mesmo incidente
+        raio_incidente_km (float): Distância até um foco ativo para um relato entrar no incidente dele
+        deduplicador (Deduplicador | None): Detecção de relatos duplicados, se ativada (ver ativar_deduplicacao)
+        metricas (Metricas | None): Contadores, medidores e latências, se ativadas (ver ativar_metricas)
+        arquivo (ArquivoMorto | None): Arquivo das resolvidas antigas, se ativado (ver ativar_arquivo)
+        cache (CacheConsultas | None): Cache de resultados de consultas, se ativado (ver ativar_cache)
+        versao (int): Contador de escritas (registro, status, atribuição, severidade), que invalida o cache
+        eventos (BarramentoEventos | None): Fluxo de mudanças para assinantes, se ativado (ver ativar_eventos)
+        idade_arquivamento (timedelta | None): Tempo desde a resolução para o arquivamento automático
+        persistencia (Persistencia | None): Diário de eventos e snapshots em disco, se ativado
     """
     
-    def __init__(self):
-        """Inicializa a central de atendimento com estruturas de dados vazias."""
-        self.ocorrencias: dict[int, Ocorrencia] = {}  # Dicionário para busca rápida por ID para opção 4: "Buscar detalhes de ocorrência"
-        self.fila_prioridade = FilaPrioridade()  # Fila de prioridade para ocorrências
+    def __init__(self, armazenamento_colunar=False, politica=None):
+        """
+        Inicializa a central de atendimento com estruturas de dados vazias.
+        
+        Args:
+            armazenamento_colunar (bool): Se True, guarda as ocorrências em colunas
+                compactas (ArmazenamentoColunar) em vez de um dicionário de objetos
+            politica (PoliticaPrioridade | None): Política de prioridade da fila
+                (padrão: severidade e depois tempo de espera)
+        """
+        self.armazenamento_colunar = armazenamento_colunar
+        if armazenamento_colunar:
+            self.ocorrencias: dict[int, Ocorrencia] | ArmazenamentoColunar = ArmazenamentoColunar()
+        else:
+            self.ocorrencias = {}  # Dicionário para busca rápida por ID para opção 4: "Buscar detalhes de ocorrência"
+        self.fila_prioridade = FilasRegionais(politica)  # Uma fila de prioridade por região
         self.equipes: list[Equipe] = []  # Lista de equipes disponíveis
-        self.ocorrencias_por_severidade = []  # Lista ordenada para busca binária e opção 5: "Buscar lista de ocorrências por grau de severidade" 
+        self.despacho = MotorDespacho()  # Equipes livres por região para despacho automático
+        self.ocorrencias_por_severidade = IndiceSeveridade()  # Baldes por severidade para opção 5: "Buscar lista de ocorrências por grau de severidade"
+        self.regioes: set[str] = set()  # Regiões com ocorrências ou equipes
+        self.indice_composto = IndiceComposto()  # Consultas por região/status/severidade sem varredura
+        self.indice_temporal = IndiceTemporal()  # Consultas por intervalo de datas sem varredura
+        self.focos_ativos: GradeEspacial[int] = GradeEspacial()  # Consultas por proximidade
+        self.incidentes = AgrupamentoIncidentes()
+        self.raio_incidente_km = RAIO_INCIDENTE_KM
+        self.deduplicador: Deduplicador | None = None  # Definido por ativar_deduplicacao
+        self.metricas: Metricas | None = None  # Definidas por ativar_metricas
+        self.arquivo: ArquivoMorto | None = None  # Definido por ativar_arquivo
+        self.idade_arquivamento: timedelta | None = None
+        self._conclusoes_sem_arquivar = 0
+        self._arquivamento_ate: tuple | None = None  # Último par (data_resolucao, ID) já examinado
+        self.cache: CacheConsultas | None = None  # Definido por ativar_cache
+        self.versao = 0
+        self.eventos: BarramentoEventos | None = None  # Definido por ativar_eventos
+        self._observador_status = self._ao_mudar_status  # Método ligado criado uma única vez
+        self.persistencia = None  # Definida por Persistencia.abrir
         
     def adicionar_equipe(self, equipe):
         """
@@ -36,33 +108,524 @@ class CentralAtendimento:
             equipe (Equipe): Equipe a ser adicionada
         """
         self.equipes.append(equipe)
+        self.despacho.registrar_equipe(equipe)
+        if equipe.regiao_base is not None:
+            self.regioes.add(equipe.regiao_base)
+        if self.arquivo is not None:
+            self.arquivo.equipes[equipe.nome] = equipe
+        if self.persistencia is not None:
+            self.persistencia.registrar_equipe(equipe)
+        if self.eventos is not None:
+            self._publicar_equipe(equipe)
         
     def registrar_ocorrencia(self, ocorrencia):
         """
         Registra uma nova ocorrência no sistema.
         
+        Com a deduplicação ativada, um relato duplicado de uma ocorrência ativa
+        não é registrado: é incorporado à ocorrência original, cuja severidade
+        sobe se o relato for mais grave, e a fila continua com uma única entrada.
+        
         Args:
             ocorrencia (Ocorrencia): Ocorrência a ser registrada
+            
+        Returns:
+            Ocorrencia: A ocorrência registrada (a visão colunar, se o armazenamento colunar estiver ativo),
+                ou a ocorrência original se o relato for duplicado
         """
-        # Adiciona ao dicionário para busca rápida por ID
-        self.ocorrencias[ocorrencia.id] = ocorrencia
+        metricas = self.metricas
+        inicio = 0
+        if metricas is not None and not ocorrencia.id & metricas.mascara:
+            inicio = perf_counter_ns()
+        if self.deduplicador is not None:
+            id_original = self.deduplicador.verificar(ocorrencia)
+            if id_original is not None:
+                original = self._incorporar_duplicata(id_original, ocorrencia)
+                if inicio:
+                    metricas.registro.concluir(inicio)
+                return original
+
+        # Adiciona ao dicionário (ou às colunas) para busca rápida por ID
+        ocorrencia = self._armazenar(ocorrencia)
         
         # Adiciona à fila de prioridade para atendimento
         self.fila_prioridade.adicionar(ocorrencia)
         
-        # Adiciona à lista ordenada para busca binária por severidade
-        self.ocorrencias_por_severidade.append(ocorrencia)
-        self.ocorrencias_por_severidade.sort(key=lambda x: x.severidade)
+        # Adiciona ao índice de severidade (O(1) amortizado, sem reordenar)
+        self.ocorrencias_por_severidade.adicionar(ocorrencia.id, ocorrencia.severidade)
+        
+        # Adiciona ao índice composto e passa a acompanhar as mudanças de status
+        self.regioes.add(ocorrencia.regiao)
+        self.indice_composto.adicionar(ocorrencia.id, ocorrencia.regiao, ocorrencia.status, ocorrencia.severidade)
+        self.indice_temporal.adicionar_ocorrencia(ocorrencia)
+        if ocorrencia.latitude is not None:
+            self._localizar(ocorrencia)
+        ocorrencia._observador = self._observador_status
+        self.versao += 1
+        if self.persistencia is not None:
+            self.persistencia.registrar_ocorrencias((ocorrencia,))
+        if self.eventos is not None:
+            self._publicar_ocorrencia("registrada", ocorrencia)
+        if inicio:
+            metricas.registro.concluir(inicio)
+        return ocorrencia
+        
+    def registrar_lote(self, fonte) -> ResultadoLote:
+        """
+        Registra um lote de ocorrências em uma única passada.
+        
+        Cada registro é validado individualmente; registros inválidos são
+        reportados no resultado em vez de interromper a importação. As
+        ocorrências válidas entram no dicionário de IDs, e a fila de prioridade
+        e o índice de severidade são atualizados uma única vez para o lote todo.
+        Com a deduplicação ativada, relatos duplicados (inclusive de outro
+        relato do mesmo lote) são incorporados às ocorrências originais.
+        
+        Args:
+            fonte: Iterável de tuplas (regiao, severidade, descricao), dicionários
+                com essas chaves, ou stream de texto CSV/JSONL
+                
+        Returns:
+            ResultadoLote: Ocorrências aceitas (as originais, para os relatos
+                duplicados) e linhas rejeitadas com o motivo
+        """
+        metricas = self.metricas
+        inicio = metricas.lote.iniciar() if metricas is not None else 0
+        resultado = self._ler_lote(fonte)
+        self._incorporar_lote(resultado)
+        if metricas is not None:
+            metricas.contador("ocorrencias_em_lote").incrementar(len(resultado.aceitas))
+            metricas.contador("registros_rejeitados").incrementar(len(resultado.rejeicoes))
+            if inicio:
+                metricas.lote.concluir(inicio)
+        return resultado
+
+    def _ler_lote(self, fonte) -> ResultadoLote:
+        """
+        Valida os registros de um lote e cria as ocorrências, sem tocar no estado da central.
+        
+        Returns:
+            ResultadoLote: Ocorrências criadas e linhas rejeitadas com o motivo
+        """
+        resultado = ResultadoLote()
+        aceitas = resultado.aceitas
+        # Ocorrências não formam ciclos de referência; pausar o coletor de ciclos
+        # evita varreduras repetidas de todo o heap de objetos durante lotes grandes
+        coletor_ativo = gc.isenabled()
+        gc.disable()
+        try:
+            for linha, registro in ler_registros(fonte):
+                try:
+                    ocorrencia = Ocorrencia(*normalizar_registro(registro))
+                except (ValueError, TypeError) as erro:
+                    resultado.rejeitar(linha, str(erro))
+                    continue
+                aceitas.append(ocorrencia)
+        finally:
+            if coletor_ativo:
+                gc.enable()
+        return resultado
+
+    def _incorporar_lote(self, resultado: ResultadoLote):
+        """
+        Indexa as ocorrências aceitas de um lote e grava o lote no diário de eventos.
+        
+        As aceitas do resultado são substituídas pelas ocorrências armazenadas
+        (visões, no armazenamento colunar); as posições de relatos duplicados
+        recebem a ocorrência original e são listadas em resultado.duplicadas.
+        """
+        ocorrencias = resultado.aceitas
+        originais: dict[int, int] = {}  # Posição do relato duplicado -> ID da ocorrência original
+        if self.deduplicador is not None:
+            novas = []
+            novas_por_id = {}
+            for posicao, ocorrencia in enumerate(ocorrencias):
+                id_original = self.deduplicador.verificar(ocorrencia)
+                if id_original is None:
+                    novas.append(ocorrencia)
+                    novas_por_id[ocorrencia.id] = ocorrencia
+                    continue
+                originais[posicao] = id_original
+                original = novas_por_id.get(id_original)
+                if original is None:
+                    self._incorporar_duplicata(id_original, ocorrencia)
+                elif ocorrencia.severidade > original.severidade:
+                    original.severidade = ocorrencia.severidade  # Ainda não registrada: basta alterar
+            ocorrencias = novas
+        armazenadas = self._indexar_lote(ocorrencias)
+        if self.persistencia is not None:
+            self.persistencia.registrar_ocorrencias(armazenadas)
+        if self.eventos is not None:
+            for ocorrencia in armazenadas:
+                self._publicar_ocorrencia("registrada", ocorrencia)
+        if originais:
+            proximas = iter(armazenadas)
+            armazenadas = [
+                self.ocorrencias[originais[posicao]] if posicao in originais else next(proximas)
+                for posicao in range(len(resultado.aceitas))
+            ]
+            resultado.duplicadas.extend(originais)
+        resultado.aceitas[:] = armazenadas
+
+    def _incorporar_duplicata(self, id_original, relato) -> Ocorrencia:
+        """Incorpora um relato duplicado à ocorrência original, elevando a severidade se preciso."""
+        original = self.ocorrencias[id_original]
+        if relato.severidade > original.severidade:
+            self.escalar_severidade(id_original, relato.severidade)
+        return original
+
+    def ativar_deduplicacao(self, deduplicador=None) -> Deduplicador:
+        """
+        Passa a detectar relatos duplicados em registrar_ocorrencia e registrar_lote.
+        
+        As ocorrências ativas registradas dentro da janela do deduplicador
+        (consultadas pelo índice temporal) entram no índice, para que novos
+        relatos delas também sejam reconhecidos.
+        
+        Args:
+            deduplicador (Deduplicador | None): Deduplicador configurado (padrão: Deduplicador())
+            
+        Returns:
+            Deduplicador: O deduplicador ativo (com as estatísticas de verificação)
+        """
+        if deduplicador is None:
+            deduplicador = Deduplicador()
+        ocorrencias = self.ocorrencias
+        for id_ocorrencia in self.indice_temporal.consultar("data_registro", agora() - deduplicador.janela):
+            ocorrencia = ocorrencias.get(id_ocorrencia)  # Ausente se já estiver no arquivo morto
+            if ocorrencia is not None and ocorrencia.status != "resolvida":
+                deduplicador.indexar(ocorrencia)
+        self.deduplicador = deduplicador
+        return deduplicador
+
+    def ativar_metricas(self, metricas=None) -> Metricas:
+        """
+        Passa a medir as operações da central.
+        
+        Registro, lote, despacho, conclusão, buscas e histórico das equipes
+        cronometram uma amostra de suas chamadas, e o tempo na fila e até a
+        resolução de uma amostra das ocorrências entram em histogramas (ver
+        Metricas). A profundidade das filas (com o total de ocorrências
+        inseridas, atendidas e canceladas), a ocupação das equipes e os focos
+        ativos são medidores calculados só quando as métricas são lidas.
+        
+        Args:
+            metricas (Metricas | None): Registro de métricas configurado (padrão: Metricas())
+            
+        Returns:
+            Metricas: As métricas ativas (ver Metricas.instantaneo e Metricas.perfilar)
+        """
+        if metricas is None:
+            metricas = Metricas()
+        metricas.medidor("ocorrencias", lambda: len(self.ocorrencias))
+        metricas.medidor("fila", self.fila_prioridade.estatisticas)
+        metricas.medidor("equipes", lambda: len(self.equipes))
+        metricas.medidor("equipes_livres", self.despacho.equipes_livres)
+        metricas.medidor("ocupacao_equipes", self._ocupacao_equipes)
+        metricas.medidor("focos_ativos", lambda: len(self.focos_ativos))
+        metricas.medidor("arquivadas", lambda: len(self.arquivo) if self.arquivo is not None else 0)
+        metricas.medidor("cache", lambda: self.cache.estatisticas() if self.cache is not None else None)
+        metricas.medidor("eventos", lambda: self.eventos.estatisticas() if self.eventos is not None else None)
+        metricas.medidor(
+            "deduplicacao",
+            lambda: self.deduplicador.estatisticas() if self.deduplicador is not None else None,
+        )
+        self.metricas = metricas
+        return metricas
+
+    def _ocupacao_equipes(self) -> float:
+        """Fração das equipes que não estão livres para despacho."""
+        if not self.equipes:
+            return 0.0
+        return 1 - self.despacho.equipes_livres() / len(self.equipes)
+
+    def ativar_cache(self, cache=None) -> CacheConsultas:
+        """
+        Passa a guardar os resultados de buscar_por_severidade, buscar_ocorrencias e paginar_ocorrencias.
+        
+        Cada resultado vale para a versão da central em que foi calculado:
+        registro, mudança de status, atribuição de equipe, alteração de
+        severidade e arquivamento incrementam `versao`, e a próxima leitura
+        refaz a consulta. Leituras repetidas entre duas escritas (ex.: painéis
+        consultando várias vezes por segundo) custam O(1).
+        
+        Args:
+            cache (CacheConsultas | None): Cache configurado (padrão: CacheConsultas())
+            
+        Returns:
+            CacheConsultas: O cache ativo (com acertos e faltas em estatisticas())
+        """
+        if cache is None:
+            cache = CacheConsultas()
+        self.cache = cache
+        return cache
+
+    def ativar_eventos(self, barramento=None) -> BarramentoEventos:
+        """
+        Passa a publicar as mudanças de ocorrências e equipes em um barramento de eventos.
+        
+        Registro ("registrada"), atribuição de equipe ("atribuida"), conclusão
+        ("resolvida"), outras mudanças de status ("status") e de severidade
+        ("severidade") publicam o estado da ocorrência após a mudança; cadastro
+        de equipe e mudanças no número de atendimentos ativos publicam o estado
+        da equipe ("equipe"). Assinantes acompanham a central por
+        BarramentoEventos.assinar, sem consultá-la.
+        
+        Args:
+            barramento (BarramentoEventos | None): Barramento configurado (padrão: BarramentoEventos())
+            
+        Returns:
+            BarramentoEventos: O barramento ativo
+        """
+        if barramento is None:
+            barramento = BarramentoEventos()
+        self.eventos = barramento
+        return barramento
+
+    def _publicar_ocorrencia(self, tipo, ocorrencia, **extras):
+        """Publica o estado atual de uma ocorrência no barramento de eventos."""
+        dados = ocorrencia_para_json(ocorrencia)
+        dados.update(extras)
+        self.eventos.publicar(tipo, ("ocorrencia", ocorrencia.id), dados)
+
+    def _publicar_equipe(self, equipe):
+        """Publica o estado atual de uma equipe no barramento de eventos."""
+        self.eventos.publicar("equipe", ("equipe", equipe.nome), equipe_para_json(equipe))
+
+    def ativar_arquivo(self, arquivo=None, idade=None) -> ArquivoMorto:
+        """
+        Passa a mover as ocorrências resolvidas antigas para um arquivo morto.
+        
+        Com `idade`, as resolvidas há mais tempo que ela são arquivadas
+        automaticamente a cada LOTE_ARQUIVAMENTO conclusões; sem ela, só por
+        arquivar_resolvidas. As buscas por ID, severidade, região/status e
+        período continuam encontrando as arquivadas (ver arquivar_resolvidas).
+        
+        Se o arquivo já tiver ocorrências que não estão na central (ex.: na
+        recuperação), seus IDs entram nos índices e nos incidentes, e suas
+        visões nos históricos das equipes, em ordem de atendimento.
+        
+        Args:
+            arquivo (ArquivoMorto | str | None): Arquivo morto ou seu caminho; None mantém
+                o arquivo já ativo ou, com persistência, usa ARQUIVO_MORTO no diretório dela
+            idade (timedelta | None): Tempo desde a resolução para o arquivamento automático
+            
+        Returns:
+            ArquivoMorto: O arquivo morto ativo
+            
+        Raises:
+            ValueError: Se nenhum arquivo for informado e não houver um ativo nem persistência
+        """
+        self.idade_arquivamento = idade
+        if arquivo is None:
+            if self.arquivo is not None:
+                return self.arquivo
+            if self.persistencia is None:
+                raise ValueError("Informe o arquivo morto (não há persistência para definir o caminho)")
+            arquivo = os.path.join(self.persistencia.diretorio, ARQUIVO_MORTO)
+        if not isinstance(arquivo, ArquivoMorto):
+            arquivo = ArquivoMorto(arquivo)
+        arquivo.equipes.update((equipe.nome, equipe) for equipe in self.equipes)
+        self.arquivo = arquivo
+        self._arquivamento_ate = None
+        arquivadas = [ocorrencia for ocorrencia in arquivo.values() if ocorrencia.id not in self.ocorrencias]
+        if not arquivadas:
+            return arquivo
+        self.ocorrencias_por_severidade.adicionar_lote(
+            (ocorrencia.id, ocorrencia.severidade) for ocorrencia in arquivadas
+        )
+        self.indice_composto.adicionar_lote(arquivadas)
+        self.indice_temporal.adicionar_lote(arquivadas)
+        self.versao += 1
+        for ocorrencia in sorted(arquivadas, key=lambda ocorrencia: ocorrencia.id):
+            self.regioes.add(ocorrencia.regiao)
+            if ocorrencia.latitude is not None:
+                self._localizar(ocorrencia)
+                self.focos_ativos.remover(ocorrencia.id)
+        atendidas = sorted(
+            (ocorrencia for ocorrencia in arquivadas if ocorrencia.data_atendimento is not None),
+            key=lambda ocorrencia: (ocorrencia.data_atendimento, ocorrencia.id),
+        )
+        for ocorrencia in atendidas:
+            equipe = ocorrencia.equipe_atendimento
+            if equipe is not None:
+                equipe.adicionar_ocorrencia_registrada(ocorrencia)
+        return arquivo
+
+    def arquivar_resolvidas(self, idade=None) -> int:
+        """
+        Move para o arquivo morto as ocorrências resolvidas há mais de `idade`.
+        
+        As candidatas vêm do índice temporal de data_resolucao, a partir de
+        onde o arquivamento anterior parou. Elas são gravadas em um único bloco
+        do arquivo e saem do armazenamento; nos históricos das equipes em
+        memória, dão lugar a visões do arquivo, que ocupam só três referências.
+        Os índices de severidade, composto e temporal guardam apenas IDs e
+        continuam com os das arquivadas, que as consultas leem do arquivo.
+        Com persistência, o arquivamento é gravado no diário, e a recuperação
+        não traz as arquivadas de volta para a memória.
+        
+        No armazenamento colunar, as colunas são compactadas e as visões da
+        fila e dos históricos são atualizadas; outras visões obtidas antes do
+        arquivamento ficam inválidas.
+        
+        Args:
+            idade (timedelta | None): Tempo mínimo desde a resolução (padrão: o de ativar_arquivo)
+            
+        Returns:
+            int: Número de ocorrências arquivadas
+            
+        Raises:
+            ValueError: Se o arquivo morto não estiver ativo ou nenhuma idade for informada
+        """
+        if self.arquivo is None:
+            raise ValueError("Arquivo morto não ativado (ver ativar_arquivo)")
+        if idade is None:
+            idade = self.idade_arquivamento
+        if idade is None:
+            raise ValueError("Informe a idade mínima das ocorrências resolvidas a arquivar")
+        self._conclusoes_sem_arquivar = 0
+        ocorrencias = self.ocorrencias
+        selecionadas = []
+        ultima = None
+        for id_ocorrencia in self.indice_temporal.consultar(
+                "data_resolucao", None, agora() - idade, self._arquivamento_ate):
+            ultima = id_ocorrencia
+            ocorrencia = ocorrencias.get(id_ocorrencia)
+            if ocorrencia is not None and ocorrencia.status == "resolvida":
+                selecionadas.append(ocorrencia)
+        if ultima is not None:
+            self._arquivamento_ate = (self._obter(ultima).data_resolucao, ultima)
+        if not selecionadas:
+            return 0
+        selecionadas.sort(key=lambda ocorrencia: ocorrencia.id)
+        visoes = dict(zip((ocorrencia.id for ocorrencia in selecionadas), self.arquivo.anexar(selecionadas)))
+        equipes = self.equipes if self.armazenamento_colunar else {
+            ocorrencia.equipe_atendimento for ocorrencia in selecionadas if ocorrencia.equipe_atendimento is not None
+        }
+        for equipe in equipes:
+            equipe.historico_ocorrencias_registradas.substituir(
+                lambda ocorrencia: visoes.get(ocorrencia.id, ocorrencia)
+            )
+        if self.armazenamento_colunar:
+            self._realocar_visoes(ocorrencias.remover(visoes))
+        else:
+            for id_ocorrencia in visoes:
+                del ocorrencias[id_ocorrencia]
+        self.versao += 1  # Resultados guardados no cache ainda apontam para as ocorrências em memória
+        if self.persistencia is not None:
+            self.persistencia.registrar_arquivamento(self.arquivo.caminho, visoes)
+        if self.metricas is not None:
+            self.metricas.contador("ocorrencias_arquivadas").incrementar(len(visoes))
+        return len(visoes)
+
+    def _realocar_visoes(self, mapa):
+        """Atualiza a linha das visões colunares da fila e dos históricos após compactar as colunas."""
+        for ocorrencia in self.fila_prioridade.ocorrencias():
+            ocorrencia._linha = mapa[ocorrencia._linha]
+        for equipe in self.equipes:
+            for ocorrencia in equipe.historico_ocorrencias_registradas._registros:
+                if isinstance(ocorrencia, OcorrenciaColunar):
+                    ocorrencia._linha = mapa[ocorrencia._linha]
+
+    def restaurar_ocorrencias(self, ocorrencias):
+        """
+        Recoloca na central ocorrências já existentes (ex.: recuperadas do disco).
+        
+        Diferente de registrar_lote, preserva status, datas e equipes: apenas as
+        pendentes entram na fila, o histórico de cada equipe é refeito em ordem de
+        atendimento e equipes com ocorrências em atendimento ficam ocupadas.
+        Os incidentes são refeitos pelas coordenadas, em ordem de ID.
+        Nada é gravado no diário de eventos.
+        
+        Args:
+            ocorrencias (Iterable[Ocorrencia]): Ocorrências a restaurar, com equipes
+                que já pertencem a esta central
+        """
+        ocorrencias = self._indexar_lote(ocorrencias)
+        atendidas = sorted(
+            (ocorrencia for ocorrencia in ocorrencias if ocorrencia.equipe_atendimento is not None),
+            key=lambda ocorrencia: (ocorrencia.data_atendimento or ocorrencia.data_registro, ocorrencia.id),
+        )
+        for ocorrencia in atendidas:
+            equipe = ocorrencia.equipe_atendimento
+            equipe.adicionar_ocorrencia_registrada(ocorrencia)
+            if ocorrencia.status == "em_atendimento":
+                equipe.atendimentos_ativos += 1
+                self.despacho.ocupar(equipe)
+
+    def _indexar_lote(self, ocorrencias) -> list[Ocorrencia]:
+        """
+        Guarda um lote de ocorrências e atualiza todos os índices de uma vez.
+        
+        Apenas as ocorrências pendentes entram na fila de prioridade. O lote é
+        conferido antes de qualquer alteração: ou todas as ocorrências são
+        indexadas, ou nenhuma.
         
+        Returns:
+            list[Ocorrencia]: As ocorrências armazenadas (visões, no armazenamento colunar)
+            
+        Raises:
+            ValueError: Se alguma ocorrência não tiver uma região de texto (nada é indexado)
+        """
+        ocorrencias = list(ocorrencias)
+        for ocorrencia in ocorrencias:
+            if type(ocorrencia.regiao) is not str:
+                raise ValueError(f"Região inválida na ocorrência {ocorrencia.id}: {ocorrencia.regiao!r}")
+        if self.armazenamento_colunar:
+            ocorrencias = [self.ocorrencias.adicionar(ocorrencia) for ocorrencia in ocorrencias]
+        else:
+            self.ocorrencias.update((ocorrencia.id, ocorrencia) for ocorrencia in ocorrencias)
+        self.fila_prioridade.adicionar_lote(
+            ocorrencia for ocorrencia in ocorrencias if ocorrencia.status == "pendente"
+        )
+        self.ocorrencias_por_severidade.adicionar_lote(
+            (ocorrencia.id, ocorrencia.severidade) for ocorrencia in ocorrencias
+        )
+        self.indice_composto.adicionar_lote(ocorrencias)
+        self.indice_temporal.adicionar_lote(ocorrencias)
+        self.versao += 1
+        for ocorrencia in ocorrencias:
+            self.regioes.add(ocorrencia.regiao)
+            ocorrencia._observador = self._observador_status
+            if ocorrencia.latitude is not None:
+                self._localizar(ocorrencia)
+                if ocorrencia.status == "resolvida":
+                    self.focos_ativos.remover(ocorrencia.id)
+        return ocorrencias
+
+    def _localizar(self, ocorrencia):
+        """Agrupa uma ocorrência com coordenadas aos focos ativos próximos e a indexa como foco ativo."""
+        latitude, longitude = ocorrencia.latitude, ocorrencia.longitude
+        vizinhos = self.focos_ativos.no_raio(latitude, longitude, self.raio_incidente_km)
+        self.incidentes.adicionar(ocorrencia.id, [id_vizinho for _, id_vizinho in vizinhos])
+        self.focos_ativos.adicionar(ocorrencia.id, latitude, longitude)
+        
+    def _armazenar(self, ocorrencia):
+        """
+        Guarda a ocorrência no armazenamento da central.
+        
+        Returns:
+            Ocorrencia: A própria ocorrência, ou sua visão colunar quando o
+                armazenamento colunar está ativo
+        """
+        if self.armazenamento_colunar:
+            return self.ocorrencias.adicionar(ocorrencia)
+        self.ocorrencias[ocorrencia.id] = ocorrencia
+        return ocorrencia
+
     def buscar_por_severidade(self, severidade) -> list[Ocorrencia] | list:
         """
-        Busca ocorrências por severidade usando busca binária.
+        Busca ocorrências por severidade usando o índice de severidade.
         
         Args:
             severidade (int): Nível de severidade a ser buscado
             
+        Com o cache ativado, repetir a busca sem escritas no meio custa O(1),
+        e a lista devolvida é compartilhada entre as buscas (não deve ser alterada).
+        
         Returns:
-            list[Ocorrencia]: Lista de ocorrências com a severidade especificada
+            list[Ocorrencia]: Lista de ocorrências com a severidade especificada, em ordem de registro
 
         Raises:
             ValueError: Se a severidade não estiver entre 1 e 5
@@ -70,37 +633,61 @@ class CentralAtendimento:
         if not isinstance(severidade, int) or not 1 <= severidade <= 5:
             raise ValueError("Severidade deve ser um número inteiro entre 1 e 5")
             
-        if not self.ocorrencias_por_severidade:
-            return []
-            
-        # Implementação da busca binária
-        inicio = 0
-        fim = len(self.ocorrencias_por_severidade) - 1
-        primeiro_indice = -1
-        
-        # Encontra o primeiro índice com a severidade desejada
-        while inicio <= fim:
-            meio = (inicio + fim) // 2
-            if self.ocorrencias_por_severidade[meio].severidade == severidade:
-                primeiro_indice = meio
-                fim = meio - 1
-            elif self.ocorrencias_por_severidade[meio].severidade < severidade:
-                inicio = meio + 1
-            else:
-                fim = meio - 1
-                
-        if primeiro_indice == -1:
-            return []
+        metricas = self.metricas
+        inicio = metricas.busca.iniciar() if metricas is not None else 0
+        if self.cache is not None:
+            encontradas = self.cache.obter(
+                ("severidade", severidade), self.versao, self._coletar_por_severidade, severidade
+            )
+        else:
+            encontradas = self._coletar_por_severidade(severidade)
+        if inicio:
+            metricas.busca.concluir(inicio)
+        return encontradas
+
+    def _coletar_por_severidade(self, severidade) -> list[Ocorrencia]:
+        """Lê as ocorrências do balde de uma severidade do índice."""
+        obter = self._leitor()
+        return [obter(id_ocorrencia) for id_ocorrencia in self.ocorrencias_por_severidade.ids(severidade)]
+
+    def escalar_severidade(self, id_ocorrencia, nova_severidade) -> bool:
+        """
+        Altera a severidade de uma ocorrência (ex.: escalonamento informado em campo).
+        
+        O índice de severidade é atualizado e, se a ocorrência ainda estiver
+        pendente na fila, sua prioridade é recalculada em O(log n).
+        
+        Args:
+            id_ocorrencia (int): ID da ocorrência
+            nova_severidade (int): Nova severidade (1-5)
             
-        # Coleta todas as ocorrências com a mesma severidade
-        resultado = []
-        i = primeiro_indice
-        while i < len(self.ocorrencias_por_severidade) and self.ocorrencias_por_severidade[i].severidade == severidade:
-            resultado.append(self.ocorrencias_por_severidade[i])
-            i += 1
+        Returns:
+            bool: True se a ocorrência existe e foi atualizada, False caso contrário
             
-        return resultado
-        
+        Raises:
+            ValueError: Se a severidade não estiver entre 1 e 5
+        """
+        if not isinstance(nova_severidade, int) or not 1 <= nova_severidade <= 5:
+            raise ValueError("Severidade deve ser um número inteiro entre 1 e 5")
+        ocorrencia = self.ocorrencias.get(id_ocorrencia)
+        if ocorrencia is None:
+            return False
+        if self.ocorrencias_por_severidade.remover(id_ocorrencia, ocorrencia.severidade):
+            self.ocorrencias_por_severidade.adicionar(id_ocorrencia, nova_severidade)
+        self.indice_composto.mover(
+            id_ocorrencia,
+            (ocorrencia.regiao, ocorrencia.status, ocorrencia.severidade),
+            (ocorrencia.regiao, ocorrencia.status, nova_severidade),
+        )
+        ocorrencia.severidade = nova_severidade
+        self.versao += 1
+        self.fila_prioridade.atualizar(ocorrencia)
+        if self.persistencia is not None:
+            self.persistencia.registrar_severidade(ocorrencia)
+        if self.eventos is not None:
+            self._publicar_ocorrencia("severidade", ocorrencia)
+        return True
+
     def listar_ocorrencias_por_severidade(self, severidade):
         """
         Lista todas as ocorrências de uma determinada severidade.
@@ -120,43 +707,395 @@ class CentralAtendimento:
         for ocorrencia in ocorrencias:
             ocorrencia.exibir_resumo()
 
-    def atender_proxima_ocorrencia(self) -> Ocorrencia | None:
+    def buscar_ocorrencias(self, regiao=None, status=None, severidade_minima=1, severidade_maxima=5) -> list[Ocorrencia]:
+        """
+        Busca ocorrências por região, status e faixa de severidade usando o índice composto.
+        
+        Exemplo: buscar_ocorrencias("Norte", "pendente", severidade_minima=4)
+        retorna as pendentes com severidade >= 4 no Norte sem percorrer todas as ocorrências.
+        
+        Args:
+            regiao (str | None): Região, ou None para todas
+            status (str | None): Status, ou None para todos
+            severidade_minima (int): Severidade mínima (inclusive)
+            severidade_maxima (int): Severidade máxima (inclusive)
+            
+        Returns:
+            list[Ocorrencia]: Ocorrências encontradas, em ordem de registro (compartilhada
+                entre as buscas quando vem do cache)
+        """
+        metricas = self.metricas
+        inicio = metricas.busca.iniciar() if metricas is not None else 0
+        if self.cache is not None:
+            encontradas = self.cache.obter(
+                ("busca", regiao, status, severidade_minima, severidade_maxima), self.versao,
+                self._coletar_ocorrencias, regiao, status, severidade_minima, severidade_maxima,
+            )
+        else:
+            encontradas = self._coletar_ocorrencias(regiao, status, severidade_minima, severidade_maxima)
+        if inicio:
+            metricas.busca.concluir(inicio)
+        return encontradas
+
+    def _coletar_ocorrencias(self, regiao, status, severidade_minima, severidade_maxima) -> list[Ocorrencia]:
+        """Lê as ocorrências selecionadas pelo índice composto."""
+        ids = self.indice_composto.consultar(regiao, status, severidade_minima, severidade_maxima)
+        obter = self._leitor()
+        return [obter(id_ocorrencia) for id_ocorrencia in ids]
+
+    def iterar_ocorrencias(self, regiao=None, status=None, severidade_minima=1, severidade_maxima=5,
+                           desde=None, ate=None, apos=None, campo_data="data_registro") -> Iterator[Ocorrencia]:
+        """
+        Itera sob demanda sobre as ocorrências que satisfazem os filtros.
+        
+        Sem período, região, status e severidade são resolvidos pelo índice
+        composto e as ocorrências saem em ordem de ID. Com período, as
+        candidatas vêm do índice temporal do campo de data escolhido, em ordem
+        cronológica desse campo, e os demais filtros são testados em cada uma.
+        Nada é copiado: o gerador avança apenas o quanto o chamador consumir.
+        
+        Args:
+            regiao (str | None): Região, ou None para todas
+            status (str | None): Status, ou None para todos
+            severidade_minima (int): Severidade mínima (inclusive)
+            severidade_maxima (int): Severidade máxima (inclusive)
+            desde (datetime | None): Início do período (inclusive)
+            ate (datetime | None): Fim do período (exclusive)
+            apos (int | None): Retoma a consulta logo depois da ocorrência com este ID
+                (sem período, o ID não precisa mais existir; com período, a ocorrência
+                deve existir e ter a data do campo escolhido)
+            campo_data (str): Data filtrada pelo período: "data_registro",
+                "data_atendimento" ou "data_resolucao"
+            
+        Returns:
+            Iterator[Ocorrencia]: Ocorrências em ordem de ID, ou cronológica se houver período
+            
+        Raises:
+            ValueError: Se o cursor não for um ID ou não puder ser retomado
+        """
+        if apos is not None and type(apos) is not int:
+            raise ValueError(f"Cursor inválido: {apos!r}")
+        obter = self._leitor()
+        if desde is None and ate is None:
+            for id_ocorrencia in self.indice_composto.consultar(
+                    regiao, status, severidade_minima, severidade_maxima, apos):
+                yield obter(id_ocorrencia)
+            return
+        retomada = None
+        if apos is not None:
+            try:
+                data = getattr(obter(apos), campo_data)
+            except KeyError:
+                data = None
+            if data is None:
+                raise ValueError(f"Cursor inválido: {apos!r} (ocorrência inexistente ou sem {campo_data})")
+            retomada = (data, apos)
+        filtro = filtro_ocorrencias(regiao, status, severidade_minima, severidade_maxima)
+        for id_ocorrencia in self.indice_temporal.consultar(campo_data, desde, ate, retomada):
+            ocorrencia = obter(id_ocorrencia)
+            if filtro is None or filtro(ocorrencia):
+                yield ocorrencia
+
+    def paginar_ocorrencias(self, limite=LIMITE_PAGINA, cursor=None, regiao=None, status=None,
+                            severidade_minima=1, severidade_maxima=5, desde=None, ate=None,
+                            campo_data="data_registro") -> Pagina[Ocorrencia]:
+        """
+        Retorna uma página de ocorrências filtradas (na ordem de iterar_ocorrencias).
+        
+        O cursor é o ID da última ocorrência da página: a próxima página retoma
+        a consulta logo depois dele por busca binária, de modo que o custo de
+        uma página não depende de quantas ocorrências existem antes dela.
+        
+        Exemplo:
+            pagina = central.paginar_ocorrencias(50, status="pendente")
+            while not pagina.ultima:
+                pagina = central.paginar_ocorrencias(50, pagina.cursor, status="pendente")
+        
+        Args:
+            limite (int): Número máximo de ocorrências na página
+            cursor (int | None): Cursor da página anterior, ou None para a primeira página
+            demais: Filtros de iterar_ocorrencias
+            
+        Returns:
+            Pagina[Ocorrencia]: A página de ocorrências (compartilhada entre as consultas
+                quando vem do cache)
+                
+        Raises:
+            ValueError: Se o cursor for inválido (ver iterar_ocorrencias)
+        """
+        metricas = self.metricas
+        inicio = metricas.busca.iniciar() if metricas is not None else 0
+        parametros = (limite, cursor, regiao, status, severidade_minima, severidade_maxima, desde, ate, campo_data)
+        if self.cache is not None:
+            pagina = self.cache.obter(("pagina", *parametros), self.versao, self._montar_pagina, *parametros)
+        else:
+            pagina = self._montar_pagina(*parametros)
+        if inicio:
+            metricas.busca.concluir(inicio)
+        return pagina
+
+    def _montar_pagina(self, limite, cursor, regiao, status, severidade_minima, severidade_maxima,
+                       desde, ate, campo_data) -> Pagina[Ocorrencia]:
+        """Monta uma página de iterar_ocorrencias a partir do cursor."""
+        ocorrencias = self.iterar_ocorrencias(
+            regiao, status, severidade_minima, severidade_maxima, desde, ate, cursor, campo_data
+        )
+        return paginar(((ocorrencia.id, ocorrencia) for ocorrencia in ocorrencias), limite)
+
+    def relatorio_turno(self, inicio, fim) -> dict:
+        """
+        Resume a atividade de um turno a partir do índice temporal, em O(log n + k).
+        
+        Args:
+            inicio (datetime): Início do turno (inclusive)
+            fim (datetime): Fim do turno (exclusive)
+            
+        Returns:
+            dict: inicio, fim, registradas, atendidas e resolvidas no turno;
+                registradas_por_severidade e registradas_por_regiao; e
+                minutos_medios_ate_atendimento e minutos_medios_ate_resolucao
+                (desde o registro, das atendidas e resolvidas no turno)
+        """
+        obter = self._leitor()
+        por_severidade = dict.fromkeys(range(1, 6), 0)
+        por_regiao: dict[str, int] = {}
+        registradas = 0
+        for id_ocorrencia in self.indice_temporal.consultar("data_registro", inicio, fim):
+            ocorrencia = obter(id_ocorrencia)
+            por_severidade[ocorrencia.severidade] += 1
+            por_regiao[ocorrencia.regiao] = por_regiao.get(ocorrencia.regiao, 0) + 1
+            registradas += 1
+        atendidas, minutos_atendimento = self._tempos_no_turno("data_atendimento", inicio, fim)
+        resolvidas, minutos_resolucao = self._tempos_no_turno("data_resolucao", inicio, fim)
+        return {
+            "inicio": inicio,
+            "fim": fim,
+            "registradas": registradas,
+            "atendidas": atendidas,
+            "resolvidas": resolvidas,
+            "registradas_por_severidade": por_severidade,
+            "registradas_por_regiao": por_regiao,
+            "minutos_medios_ate_atendimento": minutos_atendimento,
+            "minutos_medios_ate_resolucao": minutos_resolucao,
+        }
+
+    def _tempos_no_turno(self, campo, inicio, fim) -> tuple[int, float]:
+        """Conta as ocorrências com `campo` no turno e a média de minutos desde o registro."""
+        obter = self._leitor()
+        total = 0
+        segundos = 0.0
+        for id_ocorrencia in self.indice_temporal.consultar(campo, inicio, fim):
+            ocorrencia = obter(id_ocorrencia)
+            segundos += (getattr(ocorrencia, campo) - ocorrencia.data_registro).total_seconds()
+            total += 1
+        return total, segundos / 60 / total if total else 0.0
+
+    def equipes_proximas(self, latitude, longitude, k=5, raio_km=None) -> list[tuple[float, Equipe]]:
+        """
+        Retorna as k equipes livres com coordenadas mais próximas de uma posição.
+        
+        Args:
+            latitude (float): Latitude da posição (ex.: de um foco)
+            longitude (float): Longitude da posição
+            k (int): Número máximo de equipes
+            raio_km (float | None): Distância máxima, ou None para sem limite
+            
+        Returns:
+            list[tuple[float, Equipe]]: Pares (distância em km, equipe), da mais próxima à mais distante
+        """
+        return self.despacho.equipes_proximas(latitude, longitude, k, raio_km)
+
+    def focos_proximos(self, latitude, longitude, k=10, raio_km=None) -> list[tuple[float, Ocorrencia]]:
+        """
+        Retorna as k ocorrências ativas (não resolvidas) com coordenadas mais próximas de uma posição.
+        
+        Args:
+            latitude (float): Latitude da posição
+            longitude (float): Longitude da posição
+            k (int): Número máximo de ocorrências
+            raio_km (float | None): Distância máxima, ou None para sem limite
+            
+        Returns:
+            list[tuple[float, Ocorrencia]]: Pares (distância em km, ocorrência), da mais próxima à mais distante
+        """
+        ocorrencias = self.ocorrencias
+        return [
+            (distancia, ocorrencias[id_ocorrencia])
+            for distancia, id_ocorrencia in self.focos_ativos.proximos(latitude, longitude, k, raio_km)
+        ]
+
+    def incidente(self, id_ocorrencia) -> list[Ocorrencia]:
+        """
+        Retorna os relatos agrupados no mesmo incidente de uma ocorrência.
+        
+        Uma ocorrência registrada a até raio_incidente_km de um foco ativo entra
+        no incidente dele (ver AgrupamentoIncidentes); ocorrências sem coordenadas
+        formam um incidente sozinhas.
+        
+        Args:
+            id_ocorrencia (int): ID de qualquer relato do incidente
+            
+        Returns:
+            list[Ocorrencia]: Relatos do incidente em ordem de ID, ou lista vazia se o ID não existir
+        """
+        ocorrencia = self.buscar_ocorrencia(id_ocorrencia)
+        if ocorrencia is None:
+            return []
+        if id_ocorrencia not in self.incidentes:
+            return [ocorrencia]
+        obter = self._leitor()
+        return [obter(id_membro) for id_membro in self.incidentes.membros(id_ocorrencia)]
+
+    def _ao_mudar_status(self, ocorrencia, status_anterior):
+        """
+        Mantém os índices da central quando uma ocorrência registrada muda de status.
+        
+        Args:
+            ocorrencia (Ocorrencia): Ocorrência alterada (já com o novo status)
+            status_anterior (str): Status antes da mudança
+        """
+        self.versao += 1  # A atribuição de equipe também passa por aqui (pendente -> em_atendimento)
+        self.indice_composto.mover(
+            ocorrencia.id,
+            (ocorrencia.regiao, status_anterior, ocorrencia.severidade),
+            (ocorrencia.regiao, ocorrencia.status, ocorrencia.severidade),
+        )
+        # atualizar_status já preencheu a data do novo status (um par já indexado é ignorado)
+        campo_data = CAMPO_DATA_POR_STATUS.get(ocorrencia.status)
+        if campo_data is not None:
+            data = getattr(ocorrencia, campo_data)
+            self.indice_temporal.adicionar(campo_data, data, ocorrencia.id)
+            metricas = self.metricas
+            if metricas is not None and not ocorrencia.id & metricas.mascara:
+                self._medir_espera(campo_data, data - ocorrencia.data_registro)
+        if ocorrencia.status == "resolvida":
+            self.focos_ativos.remover(ocorrencia.id)
+            if self.deduplicador is not None:
+                self.deduplicador.remover(ocorrencia.id)
+        if self.persistencia is not None:
+            self.persistencia.registrar_status(ocorrencia)
+        if self.eventos is not None:
+            self._publicar_ocorrencia(
+                TIPO_EVENTO_POR_STATUS.get(ocorrencia.status, "status"), ocorrencia, status_anterior=status_anterior
+            )
+
+    def _medir_espera(self, campo_data, espera):
+        """Registra o tempo na fila (atendimento) ou até a resolução nos histogramas das métricas."""
+        histograma = (
+            self.metricas.tempo_na_fila if campo_data == "data_atendimento" else self.metricas.tempo_ate_resolucao
+        )
+        histograma.registrar(espera // MILISSEGUNDO)
+
+    def atender_proxima_ocorrencia(self, regiao=None) -> Ocorrencia | None:
         """
         Atende a próxima ocorrência com maior prioridade.
         
+        Sem região, a próxima ocorrência global é escolhida comparando os topos
+        das filas de todas as regiões (intercalação k-way).
+        
+        Args:
+            regiao (str | None): Região do posto de comando, ou None para a próxima global
+        
         Returns:
             Ocorrencia | None: A próxima ocorrência a ser atendida ou None se não houver ocorrências
         """
-        if self.fila_prioridade.esta_vazia():
-            return None
+        return self.fila_prioridade.remover_proxima(regiao)
+    
+    def atribuir_equipe(self, ocorrencia, equipe) -> bool:
+        """
+        Atribui uma equipe a uma ocorrência, registrando-a no histórico da equipe.
+        
+        A equipe deixa de estar livre para o despacho automático até que suas
+        ocorrências sejam concluídas.
+        
+        Args:
+            ocorrencia (Ocorrencia): Ocorrência a ser atendida
+            equipe (Equipe): Equipe responsável
+            
+        Returns:
+            bool: True se a atribuição foi feita, False se a ocorrência já tinha equipe
+        """
+        if not ocorrencia.atribuir_equipe(equipe):
+            return False
+        equipe.atendimentos_ativos += 1
+        self.despacho.ocupar(equipe)
+        if self.eventos is not None:
+            self._publicar_equipe(equipe)
+        metricas = self.metricas
+        inicio = 0
+        if metricas is not None and not ocorrencia.id & metricas.mascara:
+            inicio = perf_counter_ns()
+        equipe.adicionar_ocorrencia_registrada(ocorrencia)
+        if inicio:
+            metricas.historico.concluir(inicio)
+        return True
+
+    def despachar(self, limite=None) -> list[tuple[Ocorrencia, Equipe]]:
+        """
+        Despacha automaticamente as ocorrências pendentes para as equipes livres.
+        
+        As ocorrências são atendidas em ordem de prioridade; cada uma recebe uma
+        equipe livre da mesma região ou, na falta dela, da região com menor custo
+        de deslocamento (ver MotorDespacho).
+        
+        Args:
+            limite (int | None): Número máximo de despachos neste ciclo
+            
+        Returns:
+            list[tuple[Ocorrencia, Equipe]]: Pares (ocorrência, equipe) despachados
+        """
+        metricas = self.metricas
+        inicio = metricas.despacho.iniciar() if metricas is not None else 0
+        pares = self.despacho.despachar(self.fila_prioridade, limite)
+        for ocorrencia, equipe in pares:
+            self.atribuir_equipe(ocorrencia, equipe)
+        if inicio:
+            metricas.despacho.concluir(inicio)
+        return pares
 
-        ocorrencia = self.fila_prioridade.remover_proxima()
+    def atender_e_atribuir(self, equipe, regiao=None) -> Ocorrencia | None:
+        """
+        Retira a próxima ocorrência da fila e a atribui à equipe em um único passo.
+        
+        Args:
+            equipe (Equipe): Equipe que vai atender
+            regiao (str | None): Região do posto de comando, ou None para a próxima global
+            
+        Returns:
+            Ocorrencia | None: A ocorrência atribuída ou None se não houver pendentes
+        """
+        ocorrencia = self.atender_proxima_ocorrencia(regiao)
+        if ocorrencia is not None:
+            self.atribuir_equipe(ocorrencia, equipe)
         return ocorrencia
-    
+
     def listar_completamente_ocorrencias_registradas(self):
-        """Lista o histórico de todas as ocorrências registradas no sistema."""
-        if not self.ocorrencias:
-            print("\n" + "="*50)
-            print("ℹ️  Não há ocorrências registradas no sistema")
-            print("="*50)
-            return
-            
-        print("\n" + "="*50)
-        print("📋 TODAS AS OCORRÊNCIAS REGISTRADAS")
-        print("="*50)
-        for ocorrencia in self.ocorrencias.values():
-            print(ocorrencia.__str__())
+        """
+        Lista o histórico de todas as ocorrências registradas no sistema.
+        
+        As ocorrências são exibidas à medida que são lidas, sem cópia; para
+        navegar por páginas, use paginar_ocorrencias.
+        """
+        exibir_ocorrencias(
+            self.iterar_ocorrencias(),
+            "📋 TODAS AS OCORRÊNCIAS REGISTRADAS",
+            "ℹ️  Não há ocorrências registradas no sistema",
+            detalhada=True,
+        )
             
     def concluir_ocorrencia(self, id_ocorrencia):
         """
         Atualiza o status de uma ocorrência específica.
         
+        Se a ocorrência ainda estiver pendente (ex.: relato duplicado ou foco
+        extinto antes do despacho), ela é retirada da fila de prioridade em
+        O(log n) e nunca será entregue por atender_proxima_ocorrencia. Se estiver
+        em atendimento, a equipe responsável volta a ficar livre para despacho.
+        
         Args:
             id_ocorrencia (int): ID da ocorrência
         """
-        if id_ocorrencia in self.ocorrencias:
-            ocorrencia = self.ocorrencias[id_ocorrencia]
-            ocorrencia.atualizar_status("resolvida")
+        if self.concluir(id_ocorrencia):
             print("\n" + "="*50)
             print(f"✅ Ocorrência #{id_ocorrencia} concluída")
             print("="*50)
@@ -165,16 +1104,73 @@ class CentralAtendimento:
             print(f"❌ Ocorrência #{id_ocorrencia} não encontrada")
             print("="*50)
 
+    def concluir(self, id_ocorrencia) -> bool:
+        """
+        Marca uma ocorrência como resolvida, sem exibir mensagens.
+        
+        Returns:
+            bool: True se a ocorrência existe, False caso contrário
+        """
+        ocorrencia = self.ocorrencias.get(id_ocorrencia)
+        if ocorrencia is None:
+            return False
+        metricas = self.metricas
+        inicio = 0
+        if metricas is not None and not id_ocorrencia & metricas.mascara:
+            inicio = perf_counter_ns()
+        self.fila_prioridade.remover(id_ocorrencia)
+        equipe = ocorrencia.equipe_atendimento
+        liberada = equipe is not None and ocorrencia.status == "em_atendimento"
+        if liberada:
+            # Libera a equipe para o despacho automático
+            equipe.atendimentos_ativos -= 1
+            if equipe.disponivel:
+                self.despacho.liberar(equipe)
+        ocorrencia.atualizar_status("resolvida")
+        if liberada and self.eventos is not None:
+            self._publicar_equipe(equipe)
+        if inicio:
+            metricas.conclusao.concluir(inicio)
+        if self.idade_arquivamento is not None:
+            self._conclusoes_sem_arquivar += 1
+            if self._conclusoes_sem_arquivar >= LOTE_ARQUIVAMENTO:
+                self.arquivar_resolvidas()
+        return True
+
     def buscar_ocorrencia(self, id_ocorrencia):
         """
         Busca uma ocorrência pelo ID usando busca em dicionário O(1).
         
+        Uma ocorrência que não está em memória é procurada no arquivo morto,
+        também em O(1) (ver ArquivoMorto).
+        
         Args:
             id_ocorrencia (int): ID da ocorrência a ser buscada
             
         Returns:
             Ocorrencia | None: A ocorrência encontrada ou None se não existir
         """
-        return self.ocorrencias.get(id_ocorrencia)
+        ocorrencia = self.ocorrencias.get(id_ocorrencia)
+        if ocorrencia is None and self.arquivo is not None:
+            return self.arquivo.get(id_ocorrencia)
+        return ocorrencia
+
+    def _leitor(self):
+        """
+        Função ID -> ocorrência usada pelas consultas sobre os índices.
+        
+        Sem arquivo morto, é a leitura direta do armazenamento; com ele, os IDs
+        ausentes do armazenamento são lidos do arquivo.
+        """
+        if self.arquivo is None:
+            return self.ocorrencias.__getitem__
+        return self._obter
+
+    def _obter(self, id_ocorrencia):
+        """Lê uma ocorrência indexada, do armazenamento ou do arquivo morto."""
+        ocorrencia = self.ocorrencias.get(id_ocorrencia)
+        if ocorrencia is None:
+            return self.arquivo[id_ocorrencia]
+        return ocorrencia
 
 
@@ -0,0 +1,108 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Central Concorrente
+
+Este módulo implementa a CentralConcorrente, uma CentralAtendimento que pode ser
+usada ao mesmo tempo por vários operadores (threads) registrando e despachando
+ocorrências.
+"""
+
+import threading
+from functools import wraps
+
+from central_atendimento import CentralAtendimento
+from apresentacao import exibir_ocorrencias
+
+
+def _sincronizado(metodo):
+    """Envolve um método da central para que ele execute com a trava da central."""
+    @wraps(metodo)
+    def sincronizado(self, *args, **kwargs):
+        with self.trava:
+            return metodo(self, *args, **kwargs)
+    return sincronizado
+
+
+class CentralConcorrente(CentralAtendimento):
+    """
+    Central de atendimento segura para uso simultâneo por várias threads.
+
+    Filas, índices, armazenamento, motor de despacho e diário de eventos são
+    alterados juntos a cada operação, então todas as operações que leem ou
+    alteram esse estado executam sob uma única trava reentrante. O trabalho que
+    não depende do estado da central fica fora dela: a criação das ocorrências
+    (os IDs vêm do contador atômico de Ocorrencia), a validação dos lotes e a
+    exibição de mensagens.
+
+    Retirar uma ocorrência da fila e atribuí-la a uma equipe acontece dentro da
+    mesma seção crítica (atender_e_atribuir, despachar), de modo que cada
+    ocorrência é entregue a exatamente uma equipe, mesmo com vários despachantes.
+
+    Operações feitas diretamente nas estruturas internas (ex.: chamar
+    persistencia.salvar_snapshot) devem ser envolvidas em `with central.trava:`.
+    O mesmo vale para consumir os geradores de iterar_ocorrencias e
+    Historico.iterar; paginar_ocorrencias monta cada página sob a trava.
+
+    Atributos:
+        trava (threading.RLock): Trava que protege todo o estado da central
+    """
+
+    def __init__(self, armazenamento_colunar=False, politica=None):
+        """
+        Inicializa a central concorrente com estruturas de dados vazias.
+
+        Args:
+            armazenamento_colunar (bool): Repassado para CentralAtendimento
+            politica (PoliticaPrioridade | None): Repassada para CentralAtendimento
+        """
+        # Reentrante: mudanças de status disparam _ao_mudar_status dentro de outras operações
+        self.trava = threading.RLock()
+        super().__init__(armazenamento_colunar=armazenamento_colunar, politica=politica)
+
+    adicionar_equipe = _sincronizado(CentralAtendimento.adicionar_equipe)
+    registrar_ocorrencia = _sincronizado(CentralAtendimento.registrar_ocorrencia)
+    _incorporar_lote = _sincronizado(CentralAtendimento._incorporar_lote)
+    restaurar_ocorrencias = _sincronizado(CentralAtendimento.restaurar_ocorrencias)
+    buscar_por_severidade = _sincronizado(CentralAtendimento.buscar_por_severidade)
+    escalar_severidade = _sincronizado(CentralAtendimento.escalar_severidade)
+    buscar_ocorrencias = _sincronizado(CentralAtendimento.buscar_ocorrencias)
+    paginar_ocorrencias = _sincronizado(CentralAtendimento.paginar_ocorrencias)
+    relatorio_turno = _sincronizado(CentralAtendimento.relatorio_turno)
+    equipes_proximas = _sincronizado(CentralAtendimento.equipes_proximas)
+    focos_proximos = _sincronizado(CentralAtendimento.focos_proximos)
+    incidente = _sincronizado(CentralAtendimento.incidente)
+    ativar_deduplicacao = _sincronizado(CentralAtendimento.ativar_deduplicacao)
+    ativar_arquivo = _sincronizado(CentralAtendimento.ativar_arquivo)
+    ativar_cache = _sincronizado(CentralAtendimento.ativar_cache)
+    ativar_eventos = _sincronizado(CentralAtendimento.ativar_eventos)
+    arquivar_resolvidas = _sincronizado(CentralAtendimento.arquivar_resolvidas)
+    _ao_mudar_status = _sincronizado(CentralAtendimento._ao_mudar_status)
+    atender_proxima_ocorrencia = _sincronizado(CentralAtendimento.atender_proxima_ocorrencia)
+    atribuir_equipe = _sincronizado(CentralAtendimento.atribuir_equipe)
+    despachar = _sincronizado(CentralAtendimento.despachar)
+    atender_e_atribuir = _sincronizado(CentralAtendimento.atender_e_atribuir)
+    concluir = _sincronizado(CentralAtendimento.concluir)
+    buscar_ocorrencia = _sincronizado(CentralAtendimento.buscar_ocorrencia)
+
+    def ativar_metricas(self, metricas=None):
+        """Ativa as métricas (ver CentralAtendimento.ativar_metricas), lidas sob a trava da central."""
+        with self.trava:
+            metricas = super().ativar_metricas(metricas)
+            metricas.trava = self.trava
+        return metricas
+
+    def listar_completamente_ocorrencias_registradas(self):
+        """Lista todas as ocorrências registradas, uma página por vez sob a trava."""
+        exibir_ocorrencias(
+            self._todas_por_pagina(),
+            "📋 TODAS AS OCORRÊNCIAS REGISTRADAS",
+            "ℹ️  Não há ocorrências registradas no sistema",
+            detalhada=True,
+        )
+
+    def _todas_por_pagina(self):
+        """Itera sobre todas as ocorrências sem manter a trava durante a exibição."""
+        pagina = self.paginar_ocorrencias()
+        yield from pagina
+        while not pagina.ultima:
+            pagina = self.paginar_ocorrencias(cursor=pagina.cursor)
+            yield from pagina
@@ -0,0 +1,253 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Deduplicação de Relatos
+
+Este módulo detecta, no momento do registro, relatos repetidos de um mesmo
+foco: o mesmo incêndio costuma ser relatado dezenas de vezes, e cada relato
+viraria uma ocorrência com sua própria entrada na fila de prioridade. Um relato
+é duplicata de uma ocorrência ativa da mesma região, registrada dentro da
+janela de tempo, cuja descrição normalizada é suficientemente parecida.
+"""
+
+import re
+import time
+import unicodedata
+from array import array
+from collections import deque
+from datetime import timedelta
+
+from indice_espacial import distancia_km
+
+JANELA_PADRAO = timedelta(hours=2)  # Distância máxima no tempo entre um relato e a ocorrência original
+LIMIAR_SIMILARIDADE = 0.5  # Similaridade de Jaccard mínima entre os termos das descrições
+RAIO_DUPLICATA_KM = 5.0  # Se os dois relatos têm coordenadas, distância máxima entre eles
+BANDAS = 4  # Bandas da assinatura MinHash (cada banda é uma chave do índice)
+LINHAS_POR_BANDA = 2  # Valores da assinatura por banda
+AMOSTRAS_LATENCIA = 4096  # Últimas verificações usadas nos percentis de latência
+
+# Palavras sem valor para distinguir focos (já normalizadas: minúsculas e sem acentos)
+PALAVRAS_IGNORADAS = frozenset(
+    "a o as os ao aos de da do das dos e em na no nas nos num numa um uma uns umas "
+    "para pela pelo por com sem perto proximo proxima que se foi ha muito".split()
+)
+_PALAVRA = re.compile(r"[a-z0-9]+")
+_VAZIO = 1 << 64  # Valor de uma posição da assinatura sem nenhum termo
+
+
+def termos_descricao(descricao: str) -> frozenset[str]:
+    """
+    Normaliza uma descrição e retorna o conjunto de seus termos significativos.
+
+    A normalização ignora maiúsculas, acentos, pontuação e PALAVRAS_IGNORADAS,
+    de modo que "Incêndio na Fazenda Sta. Rita!" e "incendio fazenda sta rita"
+    têm os mesmos termos.
+
+    Args:
+        descricao (str): Descrição livre do relato
+
+    Returns:
+        frozenset[str]: Termos da descrição
+    """
+    texto = unicodedata.normalize("NFKD", descricao).encode("ascii", "ignore").decode("ascii").lower()
+    return frozenset(palavra for palavra in _PALAVRA.findall(texto) if palavra not in PALAVRAS_IGNORADAS)
+
+
+def _assinatura(termos: frozenset[str]) -> list[int]:
+    """
+    Calcula a assinatura MinHash de um conjunto de termos com uma única função de hash.
+
+    Cada termo cai em uma das BANDAS * LINHAS_POR_BANDA posições pelo seu hash,
+    e cada posição guarda o menor valor que recebeu (MinHash de uma permutação:
+    O(termos) em vez de O(termos * posições)). Em cada posição, dois conjuntos
+    têm o mesmo valor com probabilidade próxima da sua similaridade de Jaccard.
+    """
+    posicoes = BANDAS * LINHAS_POR_BANDA
+    assinatura = [_VAZIO] * posicoes
+    for termo in termos:
+        valor, posicao = divmod(hash(termo) & 0xFFFFFFFFFFFFFFFF, posicoes)
+        if valor < assinatura[posicao]:
+            assinatura[posicao] = valor
+    return assinatura
+
+
+class Deduplicador:
+    """
+    Detecta relatos duplicados usando um índice LSH (locality-sensitive hashing).
+
+    Cada ocorrência indexada contribui com uma chave por banda da sua assinatura
+    MinHash, prefixada pela região; um relato novo só é comparado com as
+    ocorrências que compartilham ao menos uma chave com ele (em geral nenhuma ou
+    poucas), e não com todas as ocorrências da janela. As candidatas são então
+    confirmadas pela similaridade de Jaccard exata dos termos, pela janela de
+    tempo e, se ambos tiverem coordenadas, pela distância.
+
+    Ocorrências saem do índice quando ficam mais antigas que a janela (em
+    relação ao relato mais recente) ou quando são resolvidas (ver remover).
+
+    Atributos:
+        janela (timedelta): Distância máxima no tempo entre um relato e a ocorrência original
+        limiar (float): Similaridade de Jaccard mínima
+        raio_km (float): Distância máxima entre relatos com coordenadas
+        verificacoes (int): Relatos verificados
+        duplicatas (int): Relatos identificados como duplicatas
+        incorporados (dict[int, list[int]]): IDs dos relatos incorporados a cada ocorrência original
+        _entradas (dict[int, tuple]): (chaves, termos, data_registro, latitude, longitude) por ID indexado
+        _baldes (dict[tuple, dict[int, None]]): IDs de cada chave do índice
+        _ordem (deque[tuple[datetime, int]]): IDs indexados em ordem de registro, para expirar a janela
+        _latencias (array): Duração (ns) das últimas verificações, em anel
+    """
+
+    def __init__(self, janela: timedelta = JANELA_PADRAO, limiar: float = LIMIAR_SIMILARIDADE,
+                 raio_km: float = RAIO_DUPLICATA_KM):
+        """
+        Inicializa um deduplicador vazio.
+
+        Args:
+            janela (timedelta): Distância máxima no tempo entre um relato e a ocorrência original
+            limiar (float): Similaridade de Jaccard mínima (0 a 1)
+            raio_km (float): Distância máxima entre relatos com coordenadas
+
+        Raises:
+            ValueError: Se o limiar não estiver entre 0 e 1
+        """
+        if not 0 < limiar <= 1:
+            raise ValueError("O limiar de similaridade deve estar entre 0 e 1")
+        self.janela = janela
+        self.limiar = limiar
+        self.raio_km = raio_km
+        self.verificacoes = 0
+        self.duplicatas = 0
+        self.incorporados: dict[int, list[int]] = {}
+        self._entradas: dict[int, tuple] = {}
+        self._baldes: dict[tuple, dict[int, None]] = {}
+        self._ordem: deque = deque()
+        self._latencias = array("q", bytes(8 * AMOSTRAS_LATENCIA))
+
+    def verificar(self, ocorrencia) -> int | None:
+        """
+        Procura a ocorrência original de um relato; se não houver, passa a indexar o relato.
+
+        Args:
+            ocorrencia (Ocorrencia): Relato recém-criado (ainda não registrado)
+
+        Returns:
+            int | None: ID da ocorrência original, ou None se o relato não for duplicata
+        """
+        inicio = time.perf_counter_ns()
+        data = ocorrencia.data_registro
+        self._expirar(data)
+        termos = termos_descricao(ocorrencia.descricao)
+        chaves = self._chaves(ocorrencia.regiao, termos)
+        original = self._melhor_candidata(ocorrencia, data, termos, chaves)
+        if original is None:
+            self._indexar(ocorrencia.id, chaves, termos, data, ocorrencia.latitude, ocorrencia.longitude)
+        else:
+            self.duplicatas += 1
+            self.incorporados.setdefault(original, []).append(ocorrencia.id)
+        self._latencias[self.verificacoes % AMOSTRAS_LATENCIA] = time.perf_counter_ns() - inicio
+        self.verificacoes += 1
+        return original
+
+    def indexar(self, ocorrencia):
+        """Indexa uma ocorrência existente sem verificá-la (ex.: ao ativar a deduplicação)."""
+        termos = termos_descricao(ocorrencia.descricao)
+        self._indexar(
+            ocorrencia.id, self._chaves(ocorrencia.regiao, termos), termos,
+            ocorrencia.data_registro, ocorrencia.latitude, ocorrencia.longitude,
+        )
+
+    def remover(self, id_ocorrencia: int) -> bool:
+        """
+        Retira uma ocorrência do índice (ex.: resolvida: novos relatos não são mais duplicatas dela).
+
+        Returns:
+            bool: True se a ocorrência estava indexada
+        """
+        entrada = self._entradas.pop(id_ocorrencia, None)
+        if entrada is None:
+            return False
+        for chave in entrada[0]:
+            balde = self._baldes[chave]
+            del balde[id_ocorrencia]
+            if not balde:
+                del self._baldes[chave]
+        return True
+
+    def estatisticas(self) -> dict:
+        """
+        Resume a taxa de duplicatas e a latência das verificações.
+
+        Returns:
+            dict: verificacoes, duplicatas, taxa_duplicatas (0 a 1), indexadas e
+                latencia_p50_us, latencia_p99_us e latencia_maxima_us das últimas
+                AMOSTRAS_LATENCIA verificações
+        """
+        amostras = sorted(self._latencias[:min(self.verificacoes, AMOSTRAS_LATENCIA)])
+
+        def percentil(fracao):
+            if not amostras:
+                return 0.0
+            return amostras[min(len(amostras) - 1, int(len(amostras) * fracao))] / 1000
+
+        return {
+            "verificacoes": self.verificacoes,
+            "duplicatas": self.duplicatas,
+            "taxa_duplicatas": self.duplicatas / self.verificacoes if self.verificacoes else 0.0,
+            "indexadas": len(self._entradas),
+            "latencia_p50_us": percentil(0.5),
+            "latencia_p99_us": percentil(0.99),
+            "latencia_maxima_us": amostras[-1] / 1000 if amostras else 0.0,
+        }
+
+    @staticmethod
+    def _chaves(regiao, termos: frozenset[str]) -> list[tuple]:
+        """Chaves do índice LSH: uma por banda não vazia da assinatura, prefixada pela região."""
+        assinatura = _assinatura(termos)
+        chaves = []
+        for banda in range(BANDAS):
+            valores = tuple(assinatura[banda * LINHAS_POR_BANDA:(banda + 1) * LINHAS_POR_BANDA])
+            if any(valor != _VAZIO for valor in valores):
+                chaves.append((regiao, banda, valores))
+        return chaves
+
+    def _melhor_candidata(self, ocorrencia, data, termos, chaves) -> int | None:
+        """Entre as ocorrências que compartilham uma chave, a mais parecida que satisfaz todos os critérios."""
+        baldes = self._baldes
+        candidatas = set()
+        for chave in chaves:
+            balde = baldes.get(chave)
+            if balde:
+                candidatas.update(balde)
+        melhor = None
+        melhor_similaridade = 0.0
+        for id_candidata in candidatas:
+            termos_candidata, data_candidata, latitude, longitude = self._entradas[id_candidata][1:]
+            comuns = len(termos & termos_candidata)
+            similaridade = comuns / (len(termos) + len(termos_candidata) - comuns)
+            if similaridade < self.limiar or abs(data - data_candidata) > self.janela:
+                continue
+            if (latitude is not None and ocorrencia.latitude is not None
+                    and distancia_km(latitude, longitude, ocorrencia.latitude, ocorrencia.longitude) > self.raio_km):
+                continue
+            if (similaridade > melhor_similaridade
+                    or (similaridade == melhor_similaridade and id_candidata < melhor)):
+                melhor, melhor_similaridade = id_candidata, similaridade
+        return melhor
+
+    def _indexar(self, id_ocorrencia, chaves, termos, data, latitude, longitude):
+        self._entradas[id_ocorrencia] = (chaves, termos, data, latitude, longitude)
+        for chave in chaves:
+            balde = self._baldes.get(chave)
+            if balde is None:
+                balde = self._baldes[chave] = {}
+            balde[id_ocorrencia] = None
+        self._ordem.append((data, id_ocorrencia))
+
+    def _expirar(self, agora):
+        """Retira do índice as ocorrências registradas antes do início da janela."""
+        ordem = self._ordem
+        limite = agora - self.janela
+        while ordem and ordem[0][0] < limite:
+            self.remover(ordem.popleft()[1])
+
+    def __len__(self) -> int:
+        return len(self._entradas)
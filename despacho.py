@@ -0,0 +1,217 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Motor de Despacho
+
+Este módulo implementa o despacho automático de equipes: acompanha quais
+equipes estão livres em cada região base e casa a fila de prioridade com as
+equipes livres em lotes, preferindo a equipe livre mais próxima quando as
+coordenadas são conhecidas (entre as regiões que podem atendê-la) e, senão,
+equipes da mesma região.
+"""
+
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from indice_espacial import GradeEspacial
+
+if TYPE_CHECKING:
+    from equipe import Equipe
+    from filas_regionais import FilasRegionais
+    from ocorrencia import Ocorrencia
+
+
+class MotorDespacho:
+    """
+    Motor de despacho automático de equipes.
+
+    As equipes livres ficam agrupadas por região base, em ordem de liberação
+    (a equipe livre há mais tempo é a primeira a ser usada). Para cada ocorrência,
+    na ordem da fila de prioridade, o motor escolhe uma equipe livre da mesma região;
+    se não houver, usa a região de menor custo de deslocamento que tenha equipe livre.
+
+    As equipes livres com coordenadas também ficam em um índice espacial: uma
+    ocorrência com coordenadas recebe a equipe livre localizada mais próxima
+    da mesma região ou, se a região não tiver equipe livre, a mais próxima entre
+    as regiões de custo finito (a distância substitui o custo entre elas). Uma
+    equipe livre da mesma região sem coordenadas tem preferência sobre equipes
+    de outras regiões, e sem equipe localizada permitida vale a regra por região.
+
+    Atributos:
+        custos (dict[tuple[str, str], float]): Custo de deslocamento (origem, destino)
+        custo_padrao (float): Custo para pares de regiões sem custo definido
+            (math.inf proíbe o deslocamento entre regiões não listadas)
+        _livres (dict[str, OrderedDict]): Equipes livres por região base
+        _ordem_por_destino (dict[str, list]): Cache das regiões de origem ordenadas por custo
+        _livres_localizadas (GradeEspacial[Equipe]): Equipes livres com coordenadas
+    """
+
+    def __init__(self, custos: dict[tuple[str, str], float] | None = None, custo_padrao: float = 1.0):
+        """
+        Inicializa o motor de despacho.
+
+        Args:
+            custos (dict[tuple[str, str], float] | None): Custos de deslocamento entre regiões,
+                indexados por (regiao_origem, regiao_destino)
+            custo_padrao (float): Custo para pares de regiões sem custo definido
+        """
+        self.custos = dict(custos or {})
+        self.custo_padrao = custo_padrao
+        self._livres: dict[str | None, OrderedDict] = {}
+        self._total_livres = 0
+        self._ordem_por_destino: dict[str | None, list] = {}
+        self._livres_localizadas: GradeEspacial["Equipe"] = GradeEspacial()
+
+    def definir_custo(self, origem: str, destino: str, custo: float):
+        """
+        Define o custo de deslocamento de uma equipe da região `origem` para `destino`.
+
+        Args:
+            origem (str): Região base da equipe
+            destino (str): Região da ocorrência
+            custo (float): Custo de deslocamento (math.inf proíbe o deslocamento)
+        """
+        self.custos[(origem, destino)] = custo
+        self._ordem_por_destino.clear()
+
+    def registrar_equipe(self, equipe: "Equipe"):
+        """
+        Passa a acompanhar uma equipe; se ela estiver disponível, entra no grupo de livres.
+
+        Args:
+            equipe (Equipe): Equipe a ser acompanhada
+        """
+        self._grupo(equipe.regiao_base)
+        if equipe.disponivel:
+            self.liberar(equipe)
+
+    def liberar(self, equipe: "Equipe"):
+        """Marca a equipe como livre para novos despachos."""
+        livres = self._grupo(equipe.regiao_base)
+        if equipe not in livres:
+            livres[equipe] = None
+            self._total_livres += 1
+            if equipe.latitude is not None:
+                self._livres_localizadas.adicionar(equipe, equipe.latitude, equipe.longitude)
+
+    def ocupar(self, equipe: "Equipe"):
+        """Retira a equipe do grupo de livres."""
+        livres = self._livres.get(equipe.regiao_base)
+        if livres is not None and livres.pop(equipe, False) is None:
+            self._total_livres -= 1
+            self._livres_localizadas.remover(equipe)
+
+    def equipes_livres(self) -> int:
+        """Retorna o número de equipes livres."""
+        return self._total_livres
+
+    def equipes_proximas(self, latitude: float, longitude: float, k: int = 5,
+                         raio_km: float | None = None) -> list[tuple[float, "Equipe"]]:
+        """
+        Retorna as k equipes livres com coordenadas mais próximas de uma posição.
+
+        Args:
+            latitude (float): Latitude da posição
+            longitude (float): Longitude da posição
+            k (int): Número máximo de equipes
+            raio_km (float | None): Distância máxima, ou None para sem limite
+
+        Returns:
+            list[tuple[float, Equipe]]: Pares (distância em km, equipe), da mais próxima à mais distante
+        """
+        return self._livres_localizadas.proximos(latitude, longitude, k, raio_km)
+
+    def escolher_equipe(self, regiao: str, latitude: float | None = None,
+                        longitude: float | None = None) -> "Equipe | None":
+        """
+        Escolhe (sem ocupar) a melhor equipe livre para uma ocorrência na região dada.
+
+        Args:
+            regiao (str): Região da ocorrência
+            latitude (float | None): Latitude da ocorrência, se conhecida
+            longitude (float | None): Longitude da ocorrência, se conhecida
+
+        Returns:
+            Equipe | None: A equipe escolhida ou None se nenhuma puder atender
+        """
+        livres = self._livres.get(regiao)
+        localizar = latitude is not None and self._livres_localizadas
+        if livres:
+            if localizar and any(equipe.latitude is not None for equipe in livres):
+                proximas = self._livres_localizadas.proximos(
+                    latitude, longitude, filtro=lambda equipe: equipe.regiao_base == regiao
+                )
+                if proximas:
+                    return proximas[0][1]
+            return next(iter(livres))
+        origens = self._origens_por_custo(regiao)
+        if localizar:
+            filtro = None
+            if origens and math.isinf(origens[-1][0]):
+                permitidas = {origem for custo, origem in origens if not math.isinf(custo)}
+                filtro = lambda equipe: equipe.regiao_base in permitidas
+            proximas = self._livres_localizadas.proximos(latitude, longitude, filtro=filtro)
+            if proximas:
+                return proximas[0][1]
+        for custo, origem in origens:
+            if math.isinf(custo):
+                break
+            livres = self._livres[origem]
+            if livres:
+                return next(iter(livres))
+        return None
+
+    def despachar(self, fila: "FilasRegionais", limite: int | None = None) -> list[tuple["Ocorrencia", "Equipe"]]:
+        """
+        Casa as ocorrências da fila com as equipes livres, em ordem de prioridade.
+
+        Cada ocorrência é consultada sem ser retirada e só sai da fila quando
+        recebe uma equipe. Se nenhuma equipe livre puder atender uma região
+        (todas as regiões com equipe livre têm custo infinito até ela), a região
+        é ignorada no resto do ciclo, pois as equipes só ficam ocupadas durante
+        ele; o ciclo termina quando nenhuma região pendente pode ser atendida.
+        Os totais de inseridas e atendidas da fila não são afetados.
+
+        Args:
+            fila (FilasRegionais): Fila de ocorrências pendentes
+            limite (int | None): Número máximo de despachos neste ciclo
+
+        Returns:
+            list[tuple[Ocorrencia, Equipe]]: Pares (ocorrência, equipe) escolhidos, já
+                retirados da fila e com as equipes ocupadas
+        """
+        pares = []
+        sem_equipe: set[str] = set()  # Regiões que nenhuma equipe livre pode atender
+        maximo = self._total_livres if limite is None else min(limite, self._total_livres)
+        while len(pares) < maximo:
+            ocorrencia = fila.espiar(excluidas=sem_equipe)
+            if ocorrencia is None:
+                break
+            equipe = self.escolher_equipe(ocorrencia.regiao, ocorrencia.latitude, ocorrencia.longitude)
+            if equipe is None:
+                sem_equipe.add(ocorrencia.regiao)
+                continue
+            fila.remover_proxima(ocorrencia.regiao)
+            self.ocupar(equipe)
+            pares.append((ocorrencia, equipe))
+        return pares
+
+    def _grupo(self, regiao: str | None) -> OrderedDict:
+        """Retorna o grupo de equipes livres da região, criando-o se necessário."""
+        livres = self._livres.get(regiao)
+        if livres is None:
+            livres = self._livres[regiao] = OrderedDict()
+            self._ordem_por_destino.clear()
+        return livres
+
+    def _origens_por_custo(self, destino: str) -> list[tuple[float, str]]:
+        """Retorna as regiões base (exceto o destino) ordenadas pelo custo até o destino."""
+        ordem = self._ordem_por_destino.get(destino)
+        if ordem is None:
+            ordem = sorted(
+                ((self.custos.get((origem, destino), self.custo_padrao), origem)
+                 for origem in self._livres
+                 if origem != destino),
+                key=lambda par: par[0],
+            )
+            self._ordem_por_destino[destino] = ordem
+        return ordem
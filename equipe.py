@@ -5,11 +5,11 @@ Este módulo implementa a classe Equipe, que representa uma equipe de atendiment
 responsável por responder às ocorrências de queimadas.
 """
 
-from typing import TYPE_CHECKING
 from historico import Historico
-
-if TYPE_CHECKING:
-    from ocorrencia import Ocorrencia
+from apresentacao import exibir_ocorrencias
+from armazenamento_colunar import para_epoca, de_epoca
+from ocorrencia import Ocorrencia
+from indice_espacial import validar_coordenadas
 
 class Equipe:
     """
@@ -17,20 +17,48 @@ class Equipe:
     
     Atributos:
         nome (str): Nome da equipe
+        regiao_base (str | None): Região onde a equipe está sediada
+        latitude (float | None): Latitude da base da equipe, se conhecida
+        longitude (float | None): Longitude da base da equipe, se conhecida
+        atendimentos_ativos (int): Número de ocorrências em atendimento pela equipe
         historico_ocorrencias_registradas (Historico): Histórico de ocorrências atendidas
     """
     
-    def __init__(self, nome):
+    def __init__(self, nome, regiao_base=None, capacidade_historico=None, diretorio_historico=None,
+                 latitude=None, longitude=None):
         """
         Inicializa uma nova equipe.
         
         Args:
             nome (str): Nome da equipe
+            regiao_base (str | None): Região onde a equipe está sediada
+            capacidade_historico (int | None): Máximo de ocorrências do histórico
+                mantidas em memória; as mais antigas vão para o disco (None = todas em memória)
+            diretorio_historico (str | None): Diretório dos segmentos do histórico em disco
+            latitude (float | None): Latitude da base (usada no despacho pela equipe mais próxima)
+            longitude (float | None): Longitude da base
+            
+        Raises:
+            ValueError: Se as coordenadas forem inválidas
         """
+        coordenadas = validar_coordenadas(latitude, longitude)
         self.nome = nome
-        self.historico_ocorrencias_registradas = Historico["Ocorrencia"]() 
+        self.regiao_base = regiao_base
+        self.latitude, self.longitude = coordenadas if coordenadas is not None else (None, None)
+        self.atendimentos_ativos = 0
+        self.historico_ocorrencias_registradas = Historico[Ocorrencia](
+            capacidade_historico,
+            diretorio=diretorio_historico,
+            codificar=_codificar_ocorrencia,
+            decodificar=self._decodificar_ocorrencia,
+        )
+
+    @property
+    def disponivel(self) -> bool:
+        """Indica se a equipe está livre (sem ocorrências em atendimento)."""
+        return self.atendimentos_ativos == 0
 
-    def adicionar_ocorrencia_registrada(self, ocorrencia: "Ocorrencia"):
+    def adicionar_ocorrencia_registrada(self, ocorrencia: Ocorrencia):
         """
         Adiciona uma ocorrência ao histórico de atendimentos da equipe.
         
@@ -39,18 +67,31 @@ class Equipe:
         """
         self.historico_ocorrencias_registradas.registrar(ocorrencia)
 
+    def _decodificar_ocorrencia(self, registro: tuple) -> Ocorrencia:
+        """Recria uma ocorrência do histórico em disco (ver _codificar_ocorrencia)."""
+        (id_ocorrencia, regiao, severidade, descricao, status,
+         registro_us, atendimento_us, resolucao_us, latitude, longitude) = registro
+        return Ocorrencia.restaurar(
+            id_ocorrencia, regiao, severidade, descricao, status,
+            de_epoca(registro_us), de_epoca(atendimento_us), de_epoca(resolucao_us), self, latitude, longitude,
+        )
+
     def listar_historico(self):
         """
         Lista o histórico de atendimentos da equipe, do mais recente para o mais antigo.
         Exibe uma mensagem se a equipe ainda não atendeu nenhuma ocorrência.
         """
-        if(self.historico_ocorrencias_registradas.esta_vazio() == False):
-            print("\n" + "="*50)
-            print(f"👥 HISTÓRICO DA EQUIPE: {self.nome}")
-            print("="*50)
-            for ocorrencia in self.historico_ocorrencias_registradas.listar():  
-                ocorrencia.exibir_resumo()
-        else:
-            print("\n" + "="*50)
-            print(f"ℹ️  A Equipe '{self.nome}' ainda não possui nenhuma ocorrência registrada")
-            print("="*50)
\ No newline at end of file
+        exibir_ocorrencias(
+            self.historico_ocorrencias_registradas.iterar(),
+            f"👥 HISTÓRICO DA EQUIPE: {self.nome}",
+            f"ℹ️  A Equipe '{self.nome}' ainda não possui nenhuma ocorrência registrada",
+        )
+
+
+def _codificar_ocorrencia(ocorrencia: Ocorrencia) -> tuple:
+    """Converte uma ocorrência do histórico em uma tupla compacta de tipos primitivos (a equipe fica implícita)."""
+    return (
+        ocorrencia.id, ocorrencia.regiao, ocorrencia.severidade, ocorrencia.descricao, ocorrencia.status,
+        para_epoca(ocorrencia.data_registro), para_epoca(ocorrencia.data_atendimento),
+        para_epoca(ocorrencia.data_resolucao), ocorrencia.latitude, ocorrencia.longitude,
+    )
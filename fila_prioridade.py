@@ -7,56 +7,275 @@ a ordem de atendimento das ocorrências baseada em severidade e tempo de espera.
 
 import heapq
 from ocorrencia import Ocorrencia
+from politica_prioridade import PoliticaPrioridade, PoliticaSeveridade
 
 class FilaPrioridade:
     """
-    Implementação de uma fila de prioridade usando heap para gerenciar ocorrências.
-    
-    A prioridade é calculada com base em dois fatores:
+    Implementação de uma fila de prioridade usando heap indexado para gerenciar ocorrências.
+
+    A prioridade é definida por uma política plugável (PoliticaPrioridade). A política
+    padrão considera dois fatores:
     1. Severidade da ocorrência (maior severidade = maior prioridade)
     2. Tempo de espera (ocorrências mais antigas têm prioridade)
-    
+
+    Além do heap, a fila mantém a posição de cada ocorrência no heap, o que permite
+    alterar a prioridade (ex.: escalonamento de severidade informado em campo) ou
+    remover uma ocorrência pelo ID em O(log n), sem reconstruir o heap.
+
     Atributos:
-        _fila (list): Lista que implementa o heap de prioridade
+        _fila (list): Lista que implementa o heap de entradas (chave, id, ocorrencia)
+        _posicoes (dict[int, int]): Posição no heap de cada ID de ocorrência
+        politica (PoliticaPrioridade): Política que calcula a chave de prioridade
     """
-    
-    def __init__(self):
-        """Inicializa uma fila de prioridade vazia."""
+
+    def __init__(self, politica: PoliticaPrioridade | None = None):
+        """
+        Inicializa uma fila de prioridade vazia.
+
+        Args:
+            politica (PoliticaPrioridade | None): Política de prioridade (padrão: PoliticaSeveridade)
+        """
         self._fila = []  # Heap para priorização de ocorrências
-        
+        self._posicoes: dict[int, int] = {}  # ID da ocorrência -> índice no heap
+        self.politica = politica or PoliticaSeveridade()
+        self._inseridas = 0  # Total de ocorrências que entraram na fila
+        self._atendidas = 0  # Total removido por remover_proxima
+        self._canceladas = 0  # Total removido por ID (remover)
+
     def adicionar(self, ocorrencia: Ocorrencia):
         """
         Adiciona uma ocorrência à fila de prioridade.
-        
-        A prioridade é calculada como uma tupla (-severidade, data_registro),
+
+        Com a política padrão, a prioridade é a tupla (-severidade, data_registro, id),
         onde o sinal negativo na severidade faz com que ocorrências mais severas
-        tenham maior prioridade.
-        
+        tenham maior prioridade. O ID desempata registros com o mesmo instante.
+
         Args:
             ocorrencia (Ocorrencia): Ocorrência a ser adicionada
+
+        Raises:
+            ValueError: Se a ocorrência já estiver na fila
+        """
+        id_ocorrencia = ocorrencia.id
+        if id_ocorrencia in self._posicoes:
+            raise ValueError(f"Ocorrência #{id_ocorrencia} já está na fila")
+        posicao = len(self._fila)
+        self._fila.append((self.politica.chave(ocorrencia), id_ocorrencia, ocorrencia))
+        self._posicoes[id_ocorrencia] = posicao
+        self._inseridas += 1
+        self._subir(posicao)
+
+    def adicionar_lote(self, ocorrencias):
         """
-        # Calcula prioridade baseada na severidade e tempo de espera
-        prioridade = (-ocorrencia.severidade, ocorrencia.data_registro)
-        heapq.heappush(self._fila, (prioridade, ocorrencia))
-        
+        Adiciona várias ocorrências de uma vez à fila de prioridade.
+
+        As entradas do lote são concatenadas ao heap existente, que é reconstruído
+        com heapq.heapify em O(n + k), mais barato que k inserções de O(log n).
+        Como as chaves nunca empatam (terminam no ID), a ordem do heap é a mesma do
+        heap indexado; as posições são recalculadas em uma única passada. Lotes
+        pequenos diante de um heap grande (k·log n < n) são inseridos um a um, para
+        que o custo não dependa do tamanho da fila.
+
+        Args:
+            ocorrencias (Iterable[Ocorrencia]): Ocorrências a serem adicionadas
+
+        Raises:
+            ValueError: Se o lote repetir uma ocorrência ou contiver uma que já está na fila
+        """
+        chave = self.politica.chave
+        novas = [(chave(ocorrencia), ocorrencia.id, ocorrencia) for ocorrencia in ocorrencias]
+        posicoes = self._posicoes
+        if len({entrada[1] for entrada in novas}) != len(novas) or any(entrada[1] in posicoes for entrada in novas):
+            raise ValueError("Lote contém ocorrências repetidas ou que já estão na fila")
+        fila = self._fila
+        self._inseridas += len(novas)
+        if len(novas) * len(fila).bit_length() < len(fila):
+            for entrada in novas:
+                posicoes[entrada[1]] = len(fila)
+                fila.append(entrada)
+                self._subir(len(fila) - 1)
+            return
+        fila.extend(novas)
+        heapq.heapify(fila)
+        self._posicoes = {entrada[1]: posicao for posicao, entrada in enumerate(fila)}
+
     def remover_proxima(self) -> Ocorrencia:
         """
         Remove e retorna a próxima ocorrência com maior prioridade.
-        
+
         Returns:
             Ocorrencia | None: A próxima ocorrência a ser atendida ou None se a fila estiver vazia
         """
         if not self._fila:
             return None
-        _, ocorrencia = heapq.heappop(self._fila)
-        return ocorrencia
-        
+        self._atendidas += 1
+        return self._remover_posicao(0)
+
+    def espiar(self) -> Ocorrencia | None:
+        """
+        Retorna a próxima ocorrência sem removê-la da fila.
+
+        Returns:
+            Ocorrencia | None: A ocorrência de maior prioridade ou None se a fila estiver vazia
+        """
+        return self._fila[0][2] if self._fila else None
+
+    def atualizar(self, ocorrencia: Ocorrencia) -> bool:
+        """
+        Recalcula a prioridade de uma ocorrência que já está na fila (decrease/increase-key).
+
+        Deve ser chamado depois de alterar um campo usado pela política, como a
+        severidade em um escalonamento informado em campo. Custo O(log n).
+
+        Args:
+            ocorrencia (Ocorrencia): Ocorrência com os dados já atualizados
+
+        Returns:
+            bool: True se a ocorrência estava na fila, False caso contrário
+        """
+        posicao = self._posicoes.get(ocorrencia.id)
+        if posicao is None:
+            return False
+        antiga = self._fila[posicao][0]
+        nova = self.politica.chave(ocorrencia)
+        self._fila[posicao] = (nova, ocorrencia.id, ocorrencia)
+        if nova < antiga:
+            self._subir(posicao)
+        else:
+            self._descer(posicao)
+        return True
+
+    def reavaliar(self, ocorrencias=None):
+        """
+        Recalcula a prioridade de várias ocorrências de uma vez.
+
+        Útil para políticas cuja ordem muda com o tempo, chamadas a cada ciclo.
+        Com uma lista de ocorrências, cada uma custa O(log n); sem argumentos,
+        todas as chaves são recalculadas e o heap é reconstruído em O(n).
+
+        Args:
+            ocorrencias (Iterable[Ocorrencia] | None): Ocorrências alteradas, ou None para todas
+        """
+        if ocorrencias is not None:
+            for ocorrencia in ocorrencias:
+                self.atualizar(ocorrencia)
+            return
+        chave = self.politica.chave
+        self._fila = [(chave(ocorrencia), id_ocorrencia, ocorrencia) for _, id_ocorrencia, ocorrencia in self._fila]
+        heapq.heapify(self._fila)
+        self._posicoes = {entrada[1]: posicao for posicao, entrada in enumerate(self._fila)}
+
+    def remover(self, id_ocorrencia: int) -> Ocorrencia | None:
+        """
+        Remove uma ocorrência da fila pelo ID em O(log n).
+
+        A remoção é imediata (a última entrada ocupa a posição liberada), então a
+        fila nunca guarda entradas obsoletas que poderiam ser entregues depois
+        por remover_proxima.
+
+        Args:
+            id_ocorrencia (int): ID da ocorrência
+
+        Returns:
+            Ocorrencia | None: A ocorrência removida ou None se não estava na fila
+        """
+        posicao = self._posicoes.get(id_ocorrencia)
+        if posicao is None:
+            return None
+        self._canceladas += 1
+        return self._remover_posicao(posicao)
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna estatísticas de uso da fila.
+
+        Como a remoção por ID é feita pelo mapa de posições, não existem lápides
+        (entradas marcadas como removidas aguardando compactação): o número de
+        entradas do heap é sempre igual ao de ocorrências pendentes.
+
+        Returns:
+            dict: pendentes, inseridas, atendidas, canceladas, entradas_obsoletas
+                (sempre 0) e taxa_cancelamento (canceladas / inseridas)
+        """
+        return {
+            "pendentes": len(self._fila),
+            "inseridas": self._inseridas,
+            "atendidas": self._atendidas,
+            "canceladas": self._canceladas,
+            "entradas_obsoletas": len(self._fila) - len(self._posicoes),
+            "taxa_cancelamento": self._canceladas / self._inseridas if self._inseridas else 0.0,
+        }
+
+    def ocorrencias(self):
+        """Itera sobre as ocorrências da fila, sem ordem definida e sem removê-las."""
+        return (ocorrencia for _, _, ocorrencia in self._fila)
+
     def esta_vazia(self) -> bool:
         """
         Verifica se a fila está vazia.
-        
+
         Returns:
             bool: True se a fila estiver vazia, False caso contrário
         """
         return len(self._fila) == 0
-        
\ No newline at end of file
+
+    def __len__(self) -> int:
+        """Retorna o número de ocorrências na fila."""
+        return len(self._fila)
+
+    def __contains__(self, id_ocorrencia) -> bool:
+        """Verifica se a ocorrência com o ID dado está na fila."""
+        return id_ocorrencia in self._posicoes
+
+    def _remover_posicao(self, posicao: int) -> Ocorrencia:
+        """Remove a entrada na posição dada, movendo a última entrada para o seu lugar."""
+        fila = self._fila
+        _, id_ocorrencia, ocorrencia = fila[posicao]
+        del self._posicoes[id_ocorrencia]
+        ultima = fila.pop()
+        if posicao < len(fila):
+            fila[posicao] = ultima
+            self._posicoes[ultima[1]] = posicao
+            if posicao > 0 and ultima < fila[(posicao - 1) >> 1]:
+                self._subir(posicao)
+            else:
+                self._descer(posicao)
+        return ocorrencia
+
+    def _subir(self, posicao: int):
+        """Move a entrada na posição dada em direção à raiz até restaurar o heap."""
+        fila = self._fila
+        posicoes = self._posicoes
+        entrada = fila[posicao]
+        while posicao > 0:
+            pai = (posicao - 1) >> 1
+            entrada_pai = fila[pai]
+            if entrada < entrada_pai:
+                fila[posicao] = entrada_pai
+                posicoes[entrada_pai[1]] = posicao
+                posicao = pai
+            else:
+                break
+        fila[posicao] = entrada
+        posicoes[entrada[1]] = posicao
+
+    def _descer(self, posicao: int):
+        """Move a entrada na posição dada em direção às folhas até restaurar o heap."""
+        fila = self._fila
+        posicoes = self._posicoes
+        tamanho = len(fila)
+        entrada = fila[posicao]
+        filho = 2 * posicao + 1
+        while filho < tamanho:
+            direito = filho + 1
+            if direito < tamanho and fila[direito] < fila[filho]:
+                filho = direito
+            if fila[filho] < entrada:
+                fila[posicao] = fila[filho]
+                posicoes[fila[posicao][1]] = posicao
+                posicao = filho
+                filho = 2 * posicao + 1
+            else:
+                break
+        fila[posicao] = entrada
+        posicoes[entrada[1]] = posicao
@@ -0,0 +1,165 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Filas Regionais
+
+Este módulo implementa uma fila de prioridade particionada por região: cada
+região tem sua própria FilaPrioridade, e a próxima ocorrência global é obtida
+por uma intercalação (k-way merge) dos topos das partições.
+"""
+
+from fila_prioridade import FilaPrioridade
+from ocorrencia import Ocorrencia
+from politica_prioridade import PoliticaPrioridade, PoliticaSeveridade
+
+
+class FilasRegionais:
+    """
+    Conjunto de filas de prioridade, uma por região.
+
+    Oferece a mesma interface de FilaPrioridade (adicionar, remover_proxima,
+    espiar, atualizar, remover, ...), de modo que pode substituí-la na central.
+    Operações de uma região tocam apenas o heap daquela região; a próxima
+    ocorrência global compara apenas os topos das k partições não vazias.
+
+    Atributos:
+        politica (PoliticaPrioridade): Política compartilhada por todas as partições
+        _particoes (dict[str, FilaPrioridade]): Fila de cada região
+    """
+
+    def __init__(self, politica: PoliticaPrioridade | None = None):
+        """
+        Inicializa o conjunto sem partições.
+
+        Args:
+            politica (PoliticaPrioridade | None): Política de prioridade (padrão: PoliticaSeveridade)
+        """
+        self.politica = politica or PoliticaSeveridade()
+        self._particoes: dict[str, FilaPrioridade] = {}
+
+    def fila(self, regiao: str) -> FilaPrioridade:
+        """
+        Retorna a fila de uma região, criando-a se necessário.
+
+        Args:
+            regiao (str): Nome da região
+
+        Returns:
+            FilaPrioridade: Fila de prioridade da região
+        """
+        particao = self._particoes.get(regiao)
+        if particao is None:
+            particao = self._particoes[regiao] = FilaPrioridade(self.politica)
+        return particao
+
+    def regioes(self) -> list[str]:
+        """Retorna as regiões que possuem partição."""
+        return list(self._particoes)
+
+    def adicionar(self, ocorrencia: Ocorrencia):
+        """Adiciona uma ocorrência à fila da sua região."""
+        self.fila(ocorrencia.regiao).adicionar(ocorrencia)
+
+    def adicionar_lote(self, ocorrencias):
+        """Adiciona várias ocorrências, agrupando-as por região antes de reconstruir cada heap."""
+        por_regiao: dict[str, list[Ocorrencia]] = {}
+        for ocorrencia in ocorrencias:
+            por_regiao.setdefault(ocorrencia.regiao, []).append(ocorrencia)
+        for regiao, lote in por_regiao.items():
+            self.fila(regiao).adicionar_lote(lote)
+
+    def _particao_do_topo(self, excluidas=None) -> FilaPrioridade | None:
+        """Intercalação k-way: retorna a partição cujo topo tem a menor chave (fora das regiões excluídas)."""
+        melhor = None
+        melhor_chave = None
+        for regiao, particao in self._particoes.items():
+            if particao._fila and not (excluidas and regiao in excluidas):
+                chave = particao._fila[0][0]
+                if melhor is None or chave < melhor_chave:
+                    melhor, melhor_chave = particao, chave
+        return melhor
+
+    def remover_proxima(self, regiao: str | None = None) -> Ocorrencia | None:
+        """
+        Remove e retorna a próxima ocorrência, global ou de uma região.
+
+        Args:
+            regiao (str | None): Região desejada, ou None para a próxima global
+
+        Returns:
+            Ocorrencia | None: A próxima ocorrência ou None se não houver pendentes
+        """
+        if regiao is not None:
+            particao = self._particoes.get(regiao)
+        else:
+            particao = self._particao_do_topo()
+        return particao.remover_proxima() if particao is not None else None
+
+    def espiar(self, regiao: str | None = None, excluidas=None) -> Ocorrencia | None:
+        """
+        Retorna a próxima ocorrência (global ou de uma região) sem removê-la.
+
+        Args:
+            regiao (str | None): Região desejada, ou None para a próxima global
+            excluidas (Container[str] | None): Regiões ignoradas na busca global
+
+        Returns:
+            Ocorrencia | None: A próxima ocorrência ou None se não houver pendentes
+        """
+        if regiao is not None:
+            particao = self._particoes.get(regiao)
+        else:
+            particao = self._particao_do_topo(excluidas)
+        return particao.espiar() if particao is not None else None
+
+    def atualizar(self, ocorrencia: Ocorrencia) -> bool:
+        """Recalcula a prioridade de uma ocorrência na fila da sua região."""
+        particao = self._particoes.get(ocorrencia.regiao)
+        return particao is not None and particao.atualizar(ocorrencia)
+
+    def reavaliar(self, ocorrencias=None):
+        """Recalcula prioridades das ocorrências dadas ou de todas as partições."""
+        if ocorrencias is not None:
+            for ocorrencia in ocorrencias:
+                self.atualizar(ocorrencia)
+            return
+        for particao in self._particoes.values():
+            particao.reavaliar()
+
+    def remover(self, id_ocorrencia: int) -> Ocorrencia | None:
+        """Remove uma ocorrência pelo ID, procurando-a nas partições."""
+        for particao in self._particoes.values():
+            if id_ocorrencia in particao:
+                return particao.remover(id_ocorrencia)
+        return None
+
+    def ocorrencias(self):
+        """Itera sobre as ocorrências de todas as partições, sem ordem definida e sem removê-las."""
+        for particao in self._particoes.values():
+            yield from particao.ocorrencias()
+
+    def esta_vazia(self) -> bool:
+        """Verifica se todas as partições estão vazias."""
+        return all(particao.esta_vazia() for particao in self._particoes.values())
+
+    def __len__(self) -> int:
+        return sum(len(particao) for particao in self._particoes.values())
+
+    def __contains__(self, id_ocorrencia) -> bool:
+        return any(id_ocorrencia in particao for particao in self._particoes.values())
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna as estatísticas agregadas das partições e o tamanho de cada uma.
+
+        Returns:
+            dict: Mesmas chaves de FilaPrioridade.estatisticas, mais "por_regiao"
+        """
+        total = {"pendentes": 0, "inseridas": 0, "atendidas": 0, "canceladas": 0, "entradas_obsoletas": 0}
+        por_regiao = {}
+        for regiao, particao in self._particoes.items():
+            estatisticas = particao.estatisticas()
+            for chave in total:
+                total[chave] += estatisticas[chave]
+            por_regiao[regiao] = estatisticas["pendentes"]
+        total["taxa_cancelamento"] = total["canceladas"] / total["inseridas"] if total["inseridas"] else 0.0
+        total["por_regiao"] = por_regiao
+        return total
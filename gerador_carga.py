@@ -0,0 +1,184 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Gerador de Carga
+
+Gera carga contra o servidor de rede (servidor.py) e mede a latência (p50/p99)
+e a vazão em requisições por segundo. Cada conexão mantém uma janela de
+requisições em voo (pipelining); a mistura de operações imita a sala de
+controle: muitos registros, algumas consultas, despachos e conclusões.
+
+Uso:
+    python gerador_carga.py [--host HOST] [--porta PORTA] [--iniciar-servidor]
+                            [--conexoes N] [--janela W] [--requisicoes R] [--lote L]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import deque
+
+from servidor import PORTA_PADRAO
+
+REGIOES = ["Norte", "Sul", "Leste", "Oeste", "Centro"]
+
+
+def percentil(valores_ordenados: list[float], fracao: float) -> float:
+    """Retorna o percentil (0 < fracao <= 1) de uma lista já ordenada."""
+    if not valores_ordenados:
+        return 0.0
+    indice = min(len(valores_ordenados) - 1, int(fracao * len(valores_ordenados)))
+    return valores_ordenados[indice]
+
+
+def gerar_requisicao(aleatorio: random.Random, conexao: int, lote: int, despachadas: deque) -> dict:
+    """
+    Sorteia a próxima requisição da mistura de operações.
+
+    Args:
+        aleatorio (random.Random): Gerador da conexão
+        conexao (int): Índice da conexão (escolhe a equipe própria)
+        lote (int): Se maior que 1, os registros são enviados em lotes desse tamanho
+        despachadas (deque): IDs já atendidos pela conexão, a concluir
+
+    Returns:
+        dict: Requisição sem o campo "id"
+    """
+    sorteio = aleatorio.random()
+    if sorteio < 0.70:
+        if lote > 1:
+            return {"op": "registrar_lote", "ocorrencias": [
+                [aleatorio.choice(REGIOES), aleatorio.randint(1, 5), "carga"] for _ in range(lote)
+            ]}
+        return {"op": "registrar", "regiao": aleatorio.choice(REGIOES),
+                "severidade": aleatorio.randint(1, 5), "descricao": "carga"}
+    if sorteio < 0.80:
+        return {"op": "atender", "equipe": f"Carga {conexao}"}
+    if sorteio < 0.90 and despachadas:
+        return {"op": "concluir", "ocorrencia": despachadas.popleft()}
+    if sorteio < 0.97:
+        return {"op": "buscar", "ocorrencia": aleatorio.randint(1, 1000)}
+    return {"op": "buscar_por_severidade", "severidade": aleatorio.randint(1, 5), "limite": 10}
+
+
+async def executar_conexao(host, porta, conexao, requisicoes, janela, lote, semente, latencias):
+    """
+    Envia `requisicoes` requisições por uma conexão, com até `janela` em voo.
+
+    As respostas chegam na ordem das requisições, então os instantes de envio
+    ficam em uma fila e cada resposta casa com o mais antigo.
+    """
+    aleatorio = random.Random(semente)
+    leitor, escritor = await asyncio.open_connection(host, porta, limit=1 << 24)
+    escritor.write(json.dumps({"id": 0, "op": "adicionar_equipe", "nome": f"Carga {conexao}"}).encode() + b"\n")
+    await leitor.readline()
+
+    em_voo = asyncio.Semaphore(janela)
+    envios: deque = deque()
+    despachadas: deque = deque()
+
+    async def enviar():
+        for numero in range(1, requisicoes + 1):
+            await em_voo.acquire()
+            requisicao = gerar_requisicao(aleatorio, conexao, lote, despachadas)
+            requisicao["id"] = numero
+            envios.append(time.perf_counter())
+            escritor.write(json.dumps(requisicao).encode() + b"\n")
+            await escritor.drain()
+
+    async def receber():
+        for _ in range(requisicoes):
+            resposta = json.loads(await leitor.readline())
+            latencias.append(time.perf_counter() - envios.popleft())
+            em_voo.release()
+            resultado = resposta.get("resultado")
+            if isinstance(resultado, dict) and resultado.get("status") == "em_atendimento":
+                despachadas.append(resultado["id"])
+
+    await asyncio.gather(enviar(), receber())
+    escritor.close()
+    await escritor.wait_closed()
+
+
+async def gerar_carga(host, porta, conexoes, requisicoes, janela, lote, semente=42) -> dict:
+    """
+    Executa a carga com várias conexões simultâneas.
+
+    Returns:
+        dict: Requisições, segundos, requisições por segundo e latências p50/p99 em ms
+    """
+    latencias: list[float] = []
+    por_conexao = requisicoes // conexoes
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        executar_conexao(host, porta, conexao, por_conexao, janela, lote, semente + conexao, latencias)
+        for conexao in range(conexoes)
+    ))
+    decorrido = time.perf_counter() - inicio
+    latencias.sort()
+    return {
+        "requisicoes": len(latencias),
+        "segundos": decorrido,
+        "requisicoes_por_segundo": len(latencias) / decorrido,
+        "p50_ms": percentil(latencias, 0.50) * 1e3,
+        "p99_ms": percentil(latencias, 0.99) * 1e3,
+    }
+
+
+def porta_livre() -> int:
+    """Retorna uma porta TCP livre na interface local."""
+    with socket.socket() as soquete:
+        soquete.bind(("127.0.0.1", 0))
+        return soquete.getsockname()[1]
+
+
+def iniciar_servidor(porta: int) -> subprocess.Popen:
+    """Inicia servidor.py em outro processo e espera até ele aceitar conexões."""
+    caminho = os.path.join(os.path.dirname(os.path.abspath(__file__)), "servidor.py")
+    processo = subprocess.Popen([sys.executable, caminho, "--porta", str(porta)], stdout=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", porta), timeout=0.1).close()
+            return processo
+        except OSError:
+            time.sleep(0.05)
+    processo.kill()
+    raise RuntimeError("O servidor não iniciou a tempo")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerador de carga para o servidor da central")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=None)
+    parser.add_argument("--iniciar-servidor", action="store_true", help="inicia um servidor local em outro processo")
+    parser.add_argument("--conexoes", type=int, default=8)
+    parser.add_argument("--janela", type=int, default=32, help="requisições em voo por conexão")
+    parser.add_argument("--requisicoes", type=int, default=100_000)
+    parser.add_argument("--lote", type=int, default=1, help="ocorrências por requisição de registro")
+    argumentos = parser.parse_args()
+
+    processo = None
+    porta = argumentos.porta
+    if argumentos.iniciar_servidor:
+        porta = porta or porta_livre()
+        processo = iniciar_servidor(porta)
+    try:
+        resultado = asyncio.run(gerar_carga(
+            argumentos.host, porta or PORTA_PADRAO, argumentos.conexoes, argumentos.requisicoes,
+            argumentos.janela, argumentos.lote,
+        ))
+    finally:
+        if processo is not None:
+            processo.terminate()
+            processo.wait()
+    print(f"Requisições: {resultado['requisicoes']} em {resultado['segundos']:.2f}s "
+          f"({resultado['requisicoes_por_segundo']:,.0f} req/s)")
+    print(f"Latência: p50 {resultado['p50_ms']:.2f} ms | p99 {resultado['p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,19 @@ Sistema de Gerenciamento de Ocorrências de Queimadas - Gerenciamento de Histór
 
 Este módulo implementa uma classe genérica para gerenciar histórico de eventos,
 utilizando uma estrutura de pilha para manter o registro cronológico.
+
+Opcionalmente, o histórico é limitado em memória e organizado em camadas: os
+registros recentes ficam em memória (camada quente) e os antigos são
+descarregados em segmentos compactos em um arquivo em disco (camada fria).
 """
 
-from typing import TypeVar, Generic, List
+import marshal
+import tempfile
+import zlib
+from array import array
+from typing import Callable, Iterator, TypeVar, Generic, List
+
+from paginacao import LIMITE_PAGINA, Pagina, paginar
 
 T = TypeVar('T')
 
@@ -16,38 +26,210 @@ class Historico(Generic[T]):
     Esta classe implementa uma estrutura de pilha para armazenar eventos
     em ordem cronológica, permitindo acesso ao histórico mais recente primeiro.
     
+    Com `capacidade`, no máximo esse número de registros fica em memória.
+    Quando a camada quente enche, os `tamanho_segmento` registros mais antigos
+    são codificados em tuplas de tipos primitivos, serializados (marshal),
+    comprimidos (zlib) e anexados como um segmento a um arquivo temporário
+    anônimo. Todos os segmentos têm o mesmo número de registros, então a posição
+    de um registro determina seu segmento; em memória fica só o deslocamento de
+    cada segmento no arquivo (8 bytes a cada `tamanho_segmento` registros).
+    
+    As posições dos registros são globais e estáveis (0 = o mais antigo), de
+    modo que iterar, paginar e intervalo atravessam as duas camadas de forma
+    transparente. Registros lidos da camada fria são recriados por
+    `decodificar`: são cópias do registro no momento em que foi descarregado.
+    
     Type Parameters:
         T: Tipo genérico dos itens a serem armazenados no histórico
     
     Atributos:
-        _registros (List[T]): Lista que implementa a pilha de registros
+        capacidade (int | None): Máximo de registros em memória (None = ilimitado, sem disco)
+        tamanho_segmento (int): Registros por segmento descarregado
+        _registros (List[T]): Camada quente: pilha dos registros mais recentes
+        _descarregados (int): Registros já movidos para o disco (posições 0 .. _descarregados-1)
+        _segmentos (array): Deslocamento de cada segmento no arquivo, mais o fim do último
     """
     
-    def __init__(self):
-        """Inicializa um histórico vazio."""
-        self._registros: List[T] = []  # Pilha para histórico
+    def __init__(self, capacidade=None, tamanho_segmento=None, diretorio=None,
+                 codificar: Callable[[T], tuple] | None = None, decodificar: Callable[[tuple], T] | None = None):
+        """
+        Inicializa um histórico vazio.
+        
+        Args:
+            capacidade (int | None): Máximo de registros mantidos em memória;
+                None mantém todos em memória
+            tamanho_segmento (int | None): Registros por segmento em disco
+                (padrão: metade da capacidade)
+            diretorio (str | None): Diretório do arquivo de segmentos (padrão: o temporário do sistema)
+            codificar (Callable[[T], tuple] | None): Converte um registro em dados
+                aceitos por marshal (padrão: o próprio registro)
+            decodificar (Callable[[tuple], T] | None): Operação inversa de `codificar`
+            
+        Raises:
+            ValueError: Se a capacidade ou o tamanho do segmento forem inválidos
+        """
+        if capacidade is not None and capacidade < 2:
+            raise ValueError("A capacidade do histórico deve ser pelo menos 2")
+        if tamanho_segmento is None:
+            tamanho_segmento = capacidade // 2 if capacidade is not None else 0
+        elif capacidade is None or not 1 <= tamanho_segmento <= capacidade:
+            raise ValueError("O tamanho do segmento deve estar entre 1 e a capacidade")
+        self.capacidade = capacidade
+        self.tamanho_segmento = tamanho_segmento
+        self._diretorio = diretorio
+        self._codificar = codificar
+        self._decodificar = decodificar
+        self._registros: List[T] = []  # Pilha para histórico (camada quente)
+        self._descarregados = 0
+        self._segmentos = array("q", [0])
+        self._arquivo = None  # Criado no primeiro descarregamento
+        self._segmento_lido: tuple[int, list] = (-1, [])  # Último segmento lido do disco
         
     def registrar(self, item: T):
         """
         Adiciona um item ao histórico (push na pilha).
         
+        Se a camada quente atingir a capacidade, seu segmento mais antigo é descarregado em disco.
+        
         Args:
             item (T): Item a ser registrado no histórico
         """
         self._registros.append(item)
+        if self.capacidade is not None and len(self._registros) >= self.capacidade:
+            self._descarregar()
+
+    def _descarregar(self):
+        """Move os `tamanho_segmento` registros mais antigos da memória para o disco."""
+        tamanho = self.tamanho_segmento
+        codificar = self._codificar
+        antigos = self._registros[:tamanho]
+        if codificar is not None:
+            antigos = [codificar(item) for item in antigos]
+        dados = zlib.compress(marshal.dumps(antigos), 1)
+        if self._arquivo is None:
+            self._arquivo = tempfile.TemporaryFile(prefix="historico-", suffix=".seg", dir=self._diretorio)
+        self._arquivo.seek(self._segmentos[-1])
+        self._arquivo.write(dados)
+        self._segmentos.append(self._segmentos[-1] + len(dados))
+        del self._registros[:tamanho]
+        self._descarregados += tamanho
+
+    def _ler_segmento(self, indice: int) -> list:
+        """Lê e decodifica um segmento do disco (o último lido fica em cache)."""
+        if self._segmento_lido[0] != indice:
+            self._arquivo.flush()
+            self._arquivo.seek(self._segmentos[indice])
+            dados = self._arquivo.read(self._segmentos[indice + 1] - self._segmentos[indice])
+            itens = marshal.loads(zlib.decompress(dados))
+            if self._decodificar is not None:
+                itens = [self._decodificar(item) for item in itens]
+            self._segmento_lido = (indice, itens)
+        return self._segmento_lido[1]
+
+    def _obter(self, posicao: int) -> T:
+        """Retorna o registro de uma posição global, de qualquer camada."""
+        if posicao >= self._descarregados:
+            return self._registros[posicao - self._descarregados]
+        indice, deslocamento = divmod(posicao, self.tamanho_segmento)
+        return self._ler_segmento(indice)[deslocamento]
         
     def listar(self):
         """
         Lista o histórico (do mais recente para o mais antigo) e retorna a lista.
         
+        Copia todos os registros, inclusive os do disco; para históricos
+        grandes, prefira iterar ou paginar.
+        
         Returns:
             List[T]: Lista dos registros em ordem cronológica reversa
         """
-        if not self._registros:
+        if self.esta_vazio():
             print("❌ Histórico vazio ❌")
             return []
                 
-        return list(reversed(self._registros))
+        return list(self.iterar())
+
+    def iterar(self, antes=None, filtro: Callable[[T], bool] | None = None) -> Iterator[T]:
+        """
+        Itera sobre o histórico do mais recente para o mais antigo, sem copiá-lo.
+        
+        Percorre a camada quente e depois os segmentos em disco, um de cada vez.
+        
+        Args:
+            antes (int | None): Começa pelo registro anterior a esta posição (cursor de paginar)
+            filtro (Callable[[T], bool] | None): Só os registros para os quais o filtro é verdadeiro
+            
+        Returns:
+            Iterator[T]: Registros em ordem cronológica reversa
+        """
+        for _, item in self._posicoes(antes, filtro):
+            yield item
+
+    def paginar(self, limite=LIMITE_PAGINA, cursor=None, filtro: Callable[[T], bool] | None = None) -> Pagina[T]:
+        """
+        Retorna uma página do histórico, do mais recente para o mais antigo.
+        
+        O cursor é a posição do último registro devolvido na pilha; como a pilha
+        só cresce, ele continua válido mesmo com novos registros, que aparecem
+        apenas em uma nova consulta sem cursor.
+        
+        Args:
+            limite (int): Número máximo de registros na página
+            cursor (int | None): Cursor da página anterior, ou None para a primeira página
+            filtro (Callable[[T], bool] | None): Só os registros para os quais o filtro é verdadeiro
+            
+        Returns:
+            Pagina[T]: A página de registros
+        """
+        return paginar(self._posicoes(cursor, filtro), limite)
+
+    def intervalo(self, inicio: int, fim: int) -> List[T]:
+        """
+        Retorna os registros das posições [inicio, fim), em ordem cronológica.
+        
+        Só os segmentos em disco que contêm o intervalo são lidos.
+        
+        Args:
+            inicio (int): Primeira posição (0 = registro mais antigo)
+            fim (int): Posição seguinte à última
+            
+        Returns:
+            List[T]: Registros do intervalo (limitado às posições existentes)
+        """
+        inicio = max(0, inicio)
+        fim = min(fim, len(self))
+        return [self._obter(posicao) for posicao in range(inicio, fim)]
+
+    def _posicoes(self, antes, filtro) -> Iterator[tuple[int, T]]:
+        """Itera sobre pares (posição, registro) do topo da pilha para a base."""
+        posicao = len(self) if antes is None else min(antes, len(self))
+        while posicao > 0:
+            posicao -= 1
+            item = self._obter(posicao)
+            if filtro is None or filtro(item):
+                yield posicao, item
+
+    def substituir(self, funcao: Callable[[T], T]):
+        """
+        Substitui cada registro da camada quente por `funcao(registro)`.
+
+        Usado para trocar registros por versões mais leves (ex.: ocorrências
+        movidas para o arquivo morto); as posições não mudam, e os registros em
+        disco, que já são cópias compactas, não são tocados.
+
+        Args:
+            funcao (Callable[[T], T]): Retorna o registro a manter no lugar do recebido
+        """
+        self._registros[:] = [funcao(item) for item in self._registros]
+
+    def fechar(self):
+        """Descarta o arquivo de segmentos (os registros em disco deixam de estar disponíveis)."""
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
+
+    def __len__(self) -> int:
+        return self._descarregados + len(self._registros)
                 
     def esta_vazio(self) -> bool:
         """
@@ -56,7 +238,4 @@ class Historico(Generic[T]):
         Returns:
             bool: True se o histórico estiver vazio, False caso contrário
         """
-        return len(self._registros) == 0
-        
-   
-        
\ No newline at end of file
+        return len(self) == 0
@@ -0,0 +1,158 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Importação em Lote
+
+Este módulo implementa a leitura e validação de lotes de ocorrências vindos de
+tuplas, dicionários ou arquivos CSV/JSONL (ex.: feeds de focos de calor por satélite).
+"""
+
+import csv
+import json
+from itertools import chain
+
+CAMPOS = ("regiao", "severidade", "descricao")
+CAMPOS_OPCIONAIS = ("latitude", "longitude")
+
+
+class ResultadoLote:
+    """
+    Resultado de uma importação em lote.
+
+    Atributos:
+        aceitas (list[Ocorrencia]): Ocorrências criadas e registradas
+        rejeicoes (list[tuple[int, str]]): Pares (número da linha, motivo) das linhas rejeitadas;
+            a linha é a do arquivo em fontes de texto e a posição do registro (a partir de 1) nas demais
+        duplicadas (list[int]): Posições em `aceitas` de relatos duplicados, incorporados
+            à ocorrência original (que é a que ocupa a posição)
+    """
+
+    def __init__(self):
+        """Inicializa um resultado vazio."""
+        self.aceitas = []
+        self.rejeicoes: list[tuple[int, str]] = []
+        self.duplicadas: list[int] = []
+
+    def rejeitar(self, linha: int, motivo: str):
+        """
+        Registra a rejeição de uma linha do lote.
+
+        Args:
+            linha (int): Número da linha no arquivo, ou posição do registro (a partir de 1)
+            motivo (str): Motivo da rejeição
+        """
+        self.rejeicoes.append((linha, motivo))
+
+    def __str__(self):
+        """Retorna um resumo da importação."""
+        duplicadas = f" ({len(self.duplicadas)} duplicadas)" if self.duplicadas else ""
+        return f"📥 Lote importado: {len(self.aceitas)} aceitas{duplicadas}, {len(self.rejeicoes)} rejeitadas"
+
+
+def ler_registros(fonte):
+    """
+    Converte a fonte do lote em uma sequência numerada de registros brutos.
+
+    Fontes de texto (objetos com `read`, como arquivos abertos) são lidas como
+    JSONL se a primeira linha não vazia começar com "{" e como CSV caso contrário.
+    CSV com cabeçalho contendo "severidade" é lido como dicionários; sem cabeçalho,
+    as colunas são interpretadas na ordem regiao, severidade, descricao e,
+    opcionalmente, latitude, longitude.
+    Em fontes de texto, cada registro é numerado pela sua linha no arquivo
+    (contando cabeçalho e linhas em branco); em qualquer outro iterável, pela
+    sua posição a partir de 1.
+
+    Args:
+        fonte: Iterável de tuplas/dicionários ou stream de texto CSV/JSONL
+
+    Returns:
+        Iterable[tuple[int, object]]: Pares (linha, registro bruto: tupla, lista,
+            dicionário ou linha JSON)
+    """
+    if not hasattr(fonte, "read"):
+        return enumerate(fonte, 1)
+
+    em_branco = 0  # Linhas em branco antes da primeira linha com conteúdo
+    primeira = ""
+    for primeira in fonte:
+        if primeira.strip():
+            break
+        em_branco += 1
+    if not primeira.strip():
+        return iter(())
+    linhas = chain([primeira], fonte)
+
+    if primeira.lstrip().startswith("{"):
+        return (
+            (numero, linha) for numero, linha in enumerate(linhas, em_branco + 1) if linha.strip()
+        )
+
+    leitor = csv.reader(linhas)
+    cabecalho = next(leitor)
+    if "severidade" in (coluna.strip().lower() for coluna in cabecalho):
+        nomes = [coluna.strip().lower() for coluna in cabecalho]
+        return ((em_branco + leitor.line_num, dict(zip(nomes, valores))) for valores in leitor if valores)
+    return chain(
+        [(em_branco + 1, cabecalho)],
+        ((em_branco + leitor.line_num, valores) for valores in leitor if valores),
+    )
+
+
+def _texto(valor, campo: str) -> str:
+    """Valida um campo de texto obrigatório (string não vazia), sem os espaços das pontas."""
+    if not isinstance(valor, str) or not valor.strip():
+        raise ValueError(f"{campo} deve ser um texto não vazio")
+    return valor.strip()
+
+
+def normalizar_registro(registro) -> tuple:
+    """
+    Converte um registro bruto na tupla de argumentos de Ocorrencia.
+
+    Latitude e longitude são opcionais: chaves "latitude" e "longitude" em
+    dicionários (vazias em CSV = ausentes) ou 4º e 5º campos de tuplas.
+
+    Args:
+        registro: Tupla/lista, dicionário ou linha JSON
+
+    Returns:
+        tuple: (regiao, severidade, descricao) ou (regiao, severidade, descricao,
+            latitude, longitude), com severidade convertida para int e região e
+            descrição sem os espaços das pontas
+
+    Raises:
+        ValueError: Se o registro estiver incompleto ou com formato inválido
+    """
+    if type(registro) is tuple and len(registro) == 3 and type(registro[1]) is int:
+        regiao, severidade, descricao = registro
+        return _texto(regiao, "Região"), severidade, _texto(descricao, "Descrição")
+
+    if isinstance(registro, str):
+        try:
+            registro = json.loads(registro)
+        except json.JSONDecodeError as erro:
+            raise ValueError(f"JSON inválido: {erro.msg}") from None
+
+    if isinstance(registro, dict):
+        try:
+            regiao, severidade, descricao = (registro[campo] for campo in CAMPOS)
+        except KeyError as erro:
+            raise ValueError(f"Campo obrigatório ausente: {erro.args[0]}") from None
+        coordenadas = tuple(registro.get(campo) for campo in CAMPOS_OPCIONAIS)
+    elif isinstance(registro, (tuple, list)):
+        if len(registro) not in (3, 5):
+            raise ValueError("Registro deve ter 3 campos (regiao, severidade, descricao) ou 5 (mais latitude, longitude)")
+        regiao, severidade, descricao = registro[:3]
+        coordenadas = tuple(registro[3:])
+    else:
+        raise ValueError(f"Formato de registro não suportado: {type(registro).__name__}")
+
+    regiao = _texto(regiao, "Região")
+    descricao = _texto(descricao, "Descrição")
+    if isinstance(severidade, str):
+        severidade = severidade.strip()
+        if not severidade.isdigit():
+            raise ValueError("Severidade deve ser um número inteiro entre 1 e 5")
+        severidade = int(severidade)
+    coordenadas = tuple(None if valor == "" else valor for valor in coordenadas)
+    if any(valor is not None for valor in coordenadas):
+        return regiao, severidade, descricao, *coordenadas
+    return regiao, severidade, descricao
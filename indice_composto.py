@@ -0,0 +1,135 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Índice Composto
+
+Este módulo implementa um índice de ocorrências por (região, status, severidade),
+que responde consultas como "pendentes com severidade >= 4 no Norte" sem
+percorrer todas as ocorrências.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from heapq import merge
+
+
+class IndiceComposto:
+    """
+    Índice composto região/status/severidade.
+
+    Cada combinação (regiao, status, severidade) tem um balde com os IDs em ordem
+    crescente (ordem de registro). Uma consulta seleciona os baldes compatíveis
+    com o filtro e intercala seus IDs, de modo que o custo é proporcional ao
+    número de resultados, e não ao total de ocorrências.
+
+    Atributos:
+        _baldes (dict[tuple[str, str, int], array]): IDs ordenados por combinação
+    """
+
+    def __init__(self):
+        """Inicializa um índice vazio."""
+        self._baldes: dict[tuple[str, str, int], array] = {}
+
+    def adicionar(self, id_ocorrencia: int, regiao: str, status: str, severidade: int):
+        """Adiciona o ID de uma ocorrência ao balde da sua combinação."""
+        balde = self._baldes.get((regiao, status, severidade))
+        if balde is None:
+            balde = self._baldes[(regiao, status, severidade)] = array("q")
+        if not balde or balde[-1] < id_ocorrencia:
+            balde.append(id_ocorrencia)
+        else:
+            insort(balde, id_ocorrencia)
+
+    def adicionar_lote(self, ocorrencias):
+        """
+        Adiciona várias ocorrências de uma vez.
+
+        Args:
+            ocorrencias (Iterable[Ocorrencia]): Ocorrências a indexar
+        """
+        grupos: dict[tuple[str, str, int], list[int]] = {}
+        for ocorrencia in ocorrencias:
+            grupos.setdefault((ocorrencia.regiao, ocorrencia.status, ocorrencia.severidade), []).append(ocorrencia.id)
+        for chave, ids in grupos.items():
+            ids.sort()
+            balde = self._baldes.get(chave)
+            if balde is None:
+                self._baldes[chave] = array("q", ids)
+            elif not balde or balde[-1] < ids[0]:
+                balde.extend(ids)
+            else:
+                for id_ocorrencia in ids:
+                    insort(balde, id_ocorrencia)
+
+    def remover(self, id_ocorrencia: int, regiao: str, status: str, severidade: int) -> bool:
+        """
+        Remove o ID de uma ocorrência do balde da combinação informada.
+
+        Returns:
+            bool: True se o ID foi removido, False se não estava no índice
+        """
+        balde = self._baldes.get((regiao, status, severidade))
+        if balde is None:
+            return False
+        posicao = bisect_left(balde, id_ocorrencia)
+        if posicao < len(balde) and balde[posicao] == id_ocorrencia:
+            del balde[posicao]
+            return True
+        return False
+
+    def mover(self, id_ocorrencia: int, antes: tuple[str, str, int], depois: tuple[str, str, int]):
+        """
+        Move um ID de uma combinação para outra (ex.: mudança de status).
+
+        Args:
+            id_ocorrencia (int): ID da ocorrência
+            antes (tuple[str, str, int]): (regiao, status, severidade) anteriores
+            depois (tuple[str, str, int]): (regiao, status, severidade) atuais
+        """
+        if antes != depois and self.remover(id_ocorrencia, *antes):
+            self.adicionar(id_ocorrencia, *depois)
+
+    def _baldes_compativeis(self, regiao, status, severidade_minima, severidade_maxima):
+        """Seleciona os baldes não vazios compatíveis com o filtro."""
+        return [
+            balde
+            for (regiao_balde, status_balde, severidade), balde in self._baldes.items()
+            if balde
+            and (regiao is None or regiao_balde == regiao)
+            and (status is None or status_balde == status)
+            and severidade_minima <= severidade <= severidade_maxima
+        ]
+
+    def consultar(self, regiao=None, status=None, severidade_minima=1, severidade_maxima=5, apos=None):
+        """
+        Itera sobre os IDs que satisfazem o filtro, em ordem de registro.
+
+        Com `apos`, cada balde é posicionado por busca binária logo depois desse
+        ID, sem percorrer os IDs anteriores: retomar uma consulta paginada custa
+        O(log n) por balde.
+
+        Args:
+            regiao (str | None): Região, ou None para todas
+            status (str | None): Status, ou None para todos
+            severidade_minima (int): Severidade mínima (inclusive)
+            severidade_maxima (int): Severidade máxima (inclusive)
+            apos (int | None): Só IDs maiores que este
+
+        Returns:
+            Iterator[int]: IDs em ordem crescente
+        """
+        baldes = self._baldes_compativeis(regiao, status, severidade_minima, severidade_maxima)
+        if apos is not None:
+            baldes = [_a_partir(balde, bisect_right(balde, apos)) for balde in baldes]
+        if len(baldes) == 1:
+            return iter(baldes[0])
+        return merge(*baldes)
+
+    def contar(self, regiao=None, status=None, severidade_minima=1, severidade_maxima=5) -> int:
+        """Conta os IDs que satisfazem o filtro sem percorrê-los."""
+        return sum(len(balde) for balde in self._baldes_compativeis(regiao, status, severidade_minima, severidade_maxima))
+
+
+def _a_partir(balde: array, posicao: int):
+    """Itera sobre o balde a partir de `posicao` sem copiá-lo (fatiar um array copia)."""
+    while posicao < len(balde):
+        yield balde[posicao]
+        posicao += 1
@@ -0,0 +1,373 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Índice Espacial
+
+Este módulo implementa a localização geográfica do sistema: um índice em grade
+de pontos (latitude, longitude) com consultas dos k mais próximos e por raio,
+usado para os focos ativos e as equipes livres, e o agrupamento de relatos
+próximos em um mesmo incidente.
+"""
+
+from heapq import heappush, heappushpop
+from math import asin, cos, floor, pi, radians, sin, sqrt
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+
+RAIO_TERRA_KM = 6371.0088  # Raio médio da Terra
+KM_POR_GRAU = radians(1) * RAIO_TERRA_KM  # Distância de um grau de latitude (~111,2 km)
+TAMANHO_CELULA = 0.1  # Lado das células da grade, em graus (~11 km de latitude)
+RAIO_INCIDENTE_KM = 1.0  # Relatos a até esta distância de um foco ativo são o mesmo incidente
+
+
+def validar_coordenadas(latitude, longitude) -> tuple[float, float] | None:
+    """
+    Valida um par de coordenadas opcionais.
+
+    Args:
+        latitude (float | None): Latitude em graus (-90 a 90)
+        longitude (float | None): Longitude em graus (-180 a 180)
+
+    Returns:
+        tuple[float, float] | None: As coordenadas como float, ou None se ambas forem None
+
+    Raises:
+        ValueError: Se apenas uma das coordenadas for informada ou se estiverem fora da faixa
+    """
+    if latitude is None and longitude is None:
+        return None
+    if latitude is None or longitude is None:
+        raise ValueError("Latitude e longitude devem ser informadas juntas")
+    try:
+        latitude, longitude = float(latitude), float(longitude)
+    except (TypeError, ValueError):
+        raise ValueError("Latitude e longitude devem ser números") from None
+    if not -90 <= latitude <= 90:
+        raise ValueError("Latitude deve estar entre -90 e 90")
+    if not -180 <= longitude <= 180:
+        raise ValueError("Longitude deve estar entre -180 e 180")
+    return latitude, longitude
+
+
+def _meio_haversine(distancia: float) -> float:
+    """Converte uma distância em km no termo `a` da fórmula de haversine (crescente com a distância)."""
+    return sin(min(distancia / (2 * RAIO_TERRA_KM), pi / 2)) ** 2
+
+
+def _distancia_de_haversine(a: float) -> float:
+    """Operação inversa de _meio_haversine."""
+    return 2 * RAIO_TERRA_KM * asin(sqrt(min(1.0, a)))
+
+
+def distancia_km(latitude1, longitude1, latitude2, longitude2) -> float:
+    """
+    Calcula a distância de grande círculo entre dois pontos (fórmula de haversine).
+
+    Returns:
+        float: Distância em quilômetros
+    """
+    phi1 = radians(latitude1)
+    phi2 = radians(latitude2)
+    a = sin((phi2 - phi1) / 2) ** 2 + cos(phi1) * cos(phi2) * sin(radians(longitude2 - longitude1) / 2) ** 2
+    return _distancia_de_haversine(a)
+
+
+class GradeEspacial(Generic[K]):
+    """
+    Índice espacial em grade uniforme de latitude e longitude.
+
+    Cada ponto fica na célula (floor(lat / tamanho), floor(lon / tamanho)); só
+    as células ocupadas existem no dicionário, então o índice ocupa memória
+    proporcional aos pontos e inserir, mover ou remover custa O(1). Cada ponto
+    guarda a latitude e a longitude em radianos e o cosseno da latitude, e as
+    consultas comparam o termo da fórmula de haversine (que cresce com a
+    distância) sem calcular arco-senos: só os resultados são convertidos em km.
+
+    A consulta dos k mais próximos percorre anéis de células em torno da célula
+    da consulta, do mais próximo para o mais distante, e para assim que a
+    k-ésima distância encontrada não supera a menor distância possível até o
+    próximo anel. Se o próximo anel tiver mais células que as ocupadas (pontos
+    esparsos), percorre diretamente as células ocupadas restantes: o custo
+    nunca passa de uma varredura de todos os pontos.
+
+    A grade não dá a volta no antimeridiano (longitude ±180), o que não afeta
+    regiões que não o atravessam.
+
+    Type Parameters:
+        K: Tipo das chaves dos pontos (ex.: ID da ocorrência ou a própria equipe)
+
+    Atributos:
+        tamanho_celula (float): Lado das células, em graus
+        _celulas (dict[tuple[int, int], dict[K, tuple[float, float, float]]]): Pontos
+            (latitude e longitude em radianos, cosseno da latitude) de cada célula ocupada
+        _celula_por_chave (dict[K, tuple[int, int]]): Célula de cada chave indexada
+    """
+
+    def __init__(self, tamanho_celula: float = TAMANHO_CELULA):
+        """
+        Inicializa uma grade vazia.
+
+        Args:
+            tamanho_celula (float): Lado das células, em graus
+
+        Raises:
+            ValueError: Se o tamanho da célula não for positivo
+        """
+        if tamanho_celula <= 0:
+            raise ValueError("O tamanho da célula deve ser positivo")
+        self.tamanho_celula = tamanho_celula
+        self._celulas: dict[tuple[int, int], dict[K, tuple[float, float, float]]] = {}
+        self._celula_por_chave: dict[K, tuple[int, int]] = {}
+
+    def _celula(self, latitude: float, longitude: float) -> tuple[int, int]:
+        return floor(latitude / self.tamanho_celula), floor(longitude / self.tamanho_celula)
+
+    def adicionar(self, chave: K, latitude: float, longitude: float):
+        """
+        Adiciona um ponto ao índice (ou o move, se a chave já estiver indexada).
+
+        Args:
+            chave (K): Chave do ponto
+            latitude (float): Latitude em graus
+            longitude (float): Longitude em graus
+        """
+        self.remover(chave)
+        celula = self._celula(latitude, longitude)
+        pontos = self._celulas.get(celula)
+        if pontos is None:
+            pontos = self._celulas[celula] = {}
+        phi = radians(latitude)
+        pontos[chave] = (phi, radians(longitude), cos(phi))
+        self._celula_por_chave[chave] = celula
+
+    def remover(self, chave: K) -> bool:
+        """
+        Remove um ponto do índice.
+
+        Returns:
+            bool: True se a chave estava indexada, False caso contrário
+        """
+        celula = self._celula_por_chave.pop(chave, None)
+        if celula is None:
+            return False
+        pontos = self._celulas[celula]
+        del pontos[chave]
+        if not pontos:
+            del self._celulas[celula]
+        return True
+
+    def proximos(self, latitude: float, longitude: float, k: int = 1,
+                 raio_km: float | None = None, filtro: Callable[[K], bool] | None = None) -> list[tuple[float, K]]:
+        """
+        Retorna os k pontos mais próximos de uma posição.
+
+        Args:
+            latitude (float): Latitude da consulta
+            longitude (float): Longitude da consulta
+            k (int): Número máximo de pontos
+            raio_km (float | None): Distância máxima, ou None para sem limite
+            filtro (Callable[[K], bool] | None): Se informado, só considera as chaves aceitas por ele
+
+        Returns:
+            list[tuple[float, K]]: Pares (distância em km, chave), do mais próximo ao mais distante
+
+        Raises:
+            ValueError: Se k não for positivo
+        """
+        if k < 1:
+            raise ValueError("k deve ser positivo")
+        celulas = self._celulas
+        linha, coluna = self._celula(latitude, longitude)
+        phi, lam = radians(latitude), radians(longitude)
+        cos_phi = cos(phi)
+        seno = sin
+        # Heap de máximo (termos negados) com os k melhores; o contador desempata sem comparar chaves
+        melhores: list[tuple[float, int, K]] = []
+        contador = 0
+        limite = _meio_haversine(raio_km) if raio_km is not None else 2.0  # a <= 1 sempre
+        anel = 0
+        while True:
+            # Anel maior que o número de células ocupadas: varre de uma vez as ocupadas que faltam
+            varrer_restantes = 8 * anel > len(celulas)
+            if varrer_restantes:
+                vizinhas = [
+                    celula for celula in celulas
+                    if max(abs(celula[0] - linha), abs(celula[1] - coluna)) >= anel
+                ]
+            else:
+                vizinhas = self._anel(linha, coluna, anel)
+            for celula in vizinhas:
+                pontos = celulas.get(celula)
+                if not pontos:
+                    continue
+                for chave, (phi_ponto, lam_ponto, cos_ponto) in pontos.items():
+                    a = seno((phi_ponto - phi) * 0.5) ** 2 + cos_phi * cos_ponto * seno((lam_ponto - lam) * 0.5) ** 2
+                    if a > limite or (filtro is not None and not filtro(chave)):
+                        continue
+                    contador += 1
+                    if len(melhores) < k:
+                        heappush(melhores, (-a, contador, chave))
+                    elif a < -melhores[0][0]:
+                        heappushpop(melhores, (-a, contador, chave))
+            if varrer_restantes:
+                break
+            minima = _meio_haversine(self._distancia_minima_apos_anel(latitude, anel))
+            if minima > limite or (len(melhores) == k and -melhores[0][0] <= minima):
+                break
+            anel += 1
+        melhores.sort(reverse=True)
+        return [(_distancia_de_haversine(-a), chave) for a, _, chave in melhores]
+
+    def no_raio(self, latitude: float, longitude: float, raio_km: float) -> list[tuple[float, K]]:
+        """
+        Retorna todos os pontos a até `raio_km` de uma posição.
+
+        Só as células que cobrem o retângulo de latitude e longitude em torno do
+        círculo são percorridas.
+
+        Returns:
+            list[tuple[float, K]]: Pares (distância em km, chave), do mais próximo ao mais distante
+        """
+        delta_latitude = raio_km / KM_POR_GRAU
+        latitude_extrema = min(90.0, abs(latitude) + delta_latitude)
+        cosseno = cos(radians(latitude_extrema))
+        delta_longitude = 180.0 if cosseno * KM_POR_GRAU * 180 <= raio_km else raio_km / (KM_POR_GRAU * cosseno)
+        linha_inicial, coluna_inicial = self._celula(latitude - delta_latitude, longitude - delta_longitude)
+        linha_final, coluna_final = self._celula(latitude + delta_latitude, longitude + delta_longitude)
+        celulas = self._celulas
+        if (linha_final - linha_inicial + 1) * (coluna_final - coluna_inicial + 1) > len(celulas):
+            candidatas = [
+                pontos for (linha, coluna), pontos in celulas.items()
+                if linha_inicial <= linha <= linha_final and coluna_inicial <= coluna <= coluna_final
+            ]
+        else:
+            candidatas = [
+                celulas[(linha, coluna)]
+                for linha in range(linha_inicial, linha_final + 1)
+                for coluna in range(coluna_inicial, coluna_final + 1)
+                if (linha, coluna) in celulas
+            ]
+        phi, lam = radians(latitude), radians(longitude)
+        cos_phi = cos(phi)
+        seno = sin
+        limite = _meio_haversine(raio_km)
+        encontrados = []
+        for pontos in candidatas:
+            for chave, (phi_ponto, lam_ponto, cos_ponto) in pontos.items():
+                a = seno((phi_ponto - phi) * 0.5) ** 2 + cos_phi * cos_ponto * seno((lam_ponto - lam) * 0.5) ** 2
+                if a <= limite:
+                    encontrados.append((a, chave))
+        encontrados.sort(key=lambda par: par[0])
+        return [(_distancia_de_haversine(a), chave) for a, chave in encontrados]
+
+    @staticmethod
+    def _anel(linha: int, coluna: int, anel: int) -> list[tuple[int, int]]:
+        """Células à distância (de Chebyshev) exatamente `anel` da célula dada."""
+        if anel == 0:
+            return [(linha, coluna)]
+        celulas = []
+        for deslocamento in range(-anel, anel + 1):
+            celulas.append((linha - anel, coluna + deslocamento))
+            celulas.append((linha + anel, coluna + deslocamento))
+        for deslocamento in range(-anel + 1, anel):
+            celulas.append((linha + deslocamento, coluna - anel))
+            celulas.append((linha + deslocamento, coluna + anel))
+        return celulas
+
+    def _distancia_minima_apos_anel(self, latitude: float, anel: int) -> float:
+        """
+        Limite inferior da distância de uma consulta até qualquer ponto além do anel dado.
+
+        Um ponto além do anel está a mais de `anel` células de distância em
+        latitude ou em longitude. Em latitude, a distância é pelo menos o arco
+        correspondente; em longitude, o arco encolhe com o cosseno das latitudes
+        envolvidas, limitadas à faixa de células do anel seguinte.
+        """
+        graus = anel * self.tamanho_celula
+        por_latitude = radians(graus) * RAIO_TERRA_KM
+        latitude_extrema = min(90.0, abs(latitude) + (anel + 1) * self.tamanho_celula)
+        fator = sqrt(max(0.0, cos(radians(latitude)) * cos(radians(latitude_extrema))))
+        por_longitude = 2 * RAIO_TERRA_KM * asin(min(1.0, fator * sin(radians(min(graus, 180.0)) / 2)))
+        return min(por_latitude, por_longitude)
+
+    def __contains__(self, chave) -> bool:
+        return chave in self._celula_por_chave
+
+    def __len__(self) -> int:
+        return len(self._celula_por_chave)
+
+
+class AgrupamentoIncidentes:
+    """
+    Agrupa relatos próximos de focos em incidentes (união-busca incremental).
+
+    Cada relato localizado entra no agrupamento com a lista dos focos ativos a
+    até RAIO_INCIDENTE_KM dele; os incidentes desses focos são unidos ao do
+    relato. O agrupamento é de ligação simples: dois relatos distantes fazem
+    parte do mesmo incidente se uma cadeia de relatos próximos os ligar, como
+    a frente de um incêndio que avança. Relatos de focos já resolvidos
+    continuam no seu incidente.
+
+    Atributos:
+        _pais (dict[int, int]): Pai de cada ID na floresta de união-busca
+        _membros (dict[int, list[int]]): IDs de cada incidente, pela raiz
+    """
+
+    def __init__(self):
+        """Inicializa um agrupamento vazio."""
+        self._pais: dict[int, int] = {}
+        self._membros: dict[int, list[int]] = {}
+
+    def adicionar(self, id_ocorrencia: int, vizinhos=()) -> int:
+        """
+        Adiciona um relato, unindo-o aos incidentes dos vizinhos.
+
+        Args:
+            id_ocorrencia (int): ID do relato
+            vizinhos (Iterable[int]): IDs de relatos próximos já agrupados
+
+        Returns:
+            int: Identificador do incidente (o ID do relato que o representa)
+        """
+        if id_ocorrencia not in self._pais:
+            self._pais[id_ocorrencia] = id_ocorrencia
+            self._membros[id_ocorrencia] = [id_ocorrencia]
+        raiz = self.incidente(id_ocorrencia)
+        for vizinho in vizinhos:
+            raiz = self._unir(raiz, self.incidente(vizinho))
+        return raiz
+
+    def incidente(self, id_ocorrencia: int) -> int:
+        """
+        Retorna o identificador do incidente de um relato.
+
+        Raises:
+            KeyError: Se o relato não foi agrupado
+        """
+        pais = self._pais
+        raiz = id_ocorrencia
+        while pais[raiz] != raiz:
+            raiz = pais[raiz]
+        while pais[id_ocorrencia] != raiz:  # Compressão de caminho
+            pais[id_ocorrencia], id_ocorrencia = raiz, pais[id_ocorrencia]
+        return raiz
+
+    def membros(self, id_ocorrencia: int) -> list[int]:
+        """Retorna os IDs dos relatos do incidente de um relato, em ordem de ID."""
+        return sorted(self._membros[self.incidente(id_ocorrencia)])
+
+    def _unir(self, raiz: int, outra: int) -> int:
+        """Une dois incidentes; o maior absorve o menor. Retorna a nova raiz."""
+        if raiz == outra:
+            return raiz
+        if len(self._membros[raiz]) < len(self._membros[outra]):
+            raiz, outra = outra, raiz
+        self._pais[outra] = raiz
+        self._membros[raiz].extend(self._membros.pop(outra))
+        return raiz
+
+    def __contains__(self, id_ocorrencia) -> bool:
+        return id_ocorrencia in self._pais
+
+    def __len__(self) -> int:
+        """Número de incidentes."""
+        return len(self._membros)
@@ -0,0 +1,103 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Índice de Severidade
+
+Este módulo implementa um índice incremental de ocorrências por severidade,
+usando um balde por nível (1-5) com os IDs mantidos em ordem de registro.
+"""
+
+from array import array
+from bisect import bisect_left, insort
+
+SEVERIDADE_MINIMA = 1
+SEVERIDADE_MAXIMA = 5
+
+
+class IndiceSeveridade:
+    """
+    Índice de ocorrências agrupadas por severidade.
+
+    Como a severidade é fixa entre 1 e 5, cada nível possui seu próprio balde
+    contendo os IDs das ocorrências em ordem crescente. Como os IDs são gerados
+    de forma monotônica, a ordem crescente é também a ordem de registro, e a
+    inserção normal é um simples append no fim do balde (O(1) amortizado).
+    Inserções fora de ordem e remoções usam busca binária no balde.
+
+    Atributos:
+        _baldes (dict[int, array]): Balde de IDs ordenados para cada severidade
+    """
+
+    def __init__(self):
+        """Inicializa o índice com um balde vazio para cada severidade."""
+        self._baldes: dict[int, array] = {
+            severidade: array("q")
+            for severidade in range(SEVERIDADE_MINIMA, SEVERIDADE_MAXIMA + 1)
+        }
+
+    def adicionar(self, id_ocorrencia: int, severidade: int):
+        """
+        Adiciona o ID de uma ocorrência ao balde da sua severidade.
+
+        Args:
+            id_ocorrencia (int): ID da ocorrência
+            severidade (int): Severidade da ocorrência (1-5)
+        """
+        balde = self._baldes[severidade]
+        if not balde or balde[-1] < id_ocorrencia:
+            balde.append(id_ocorrencia)
+        else:
+            insort(balde, id_ocorrencia)
+
+    def adicionar_lote(self, pares):
+        """
+        Adiciona vários IDs de uma vez ao índice.
+
+        Args:
+            pares (Iterable[tuple[int, int]]): Pares (id_ocorrencia, severidade)
+        """
+        novos: dict[int, list[int]] = {severidade: [] for severidade in self._baldes}
+        for id_ocorrencia, severidade in pares:
+            novos[severidade].append(id_ocorrencia)
+        for severidade, ids in novos.items():
+            if not ids:
+                continue
+            ids.sort()
+            balde = self._baldes[severidade]
+            if not balde or balde[-1] < ids[0]:
+                balde.extend(ids)
+            else:
+                for id_ocorrencia in ids:
+                    insort(balde, id_ocorrencia)
+
+    def remover(self, id_ocorrencia: int, severidade: int) -> bool:
+        """
+        Remove o ID de uma ocorrência do balde da sua severidade.
+
+        Args:
+            id_ocorrencia (int): ID da ocorrência
+            severidade (int): Severidade com que a ocorrência foi indexada
+
+        Returns:
+            bool: True se o ID foi removido, False se não estava no índice
+        """
+        balde = self._baldes[severidade]
+        posicao = bisect_left(balde, id_ocorrencia)
+        if posicao < len(balde) and balde[posicao] == id_ocorrencia:
+            del balde[posicao]
+            return True
+        return False
+
+    def ids(self, severidade: int) -> array:
+        """
+        Retorna os IDs de uma severidade, em ordem de registro.
+
+        Args:
+            severidade (int): Nível de severidade (1-5)
+
+        Returns:
+            array: IDs das ocorrências com a severidade especificada
+        """
+        return self._baldes[severidade]
+
+    def __len__(self) -> int:
+        """Retorna o total de ocorrências indexadas."""
+        return sum(len(balde) for balde in self._baldes.values())
@@ -0,0 +1,179 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Índice Temporal
+
+Este módulo implementa um índice de ocorrências pelos instantes de registro,
+de início do atendimento e de resolução, que responde consultas como "o que foi
+registrado entre 14:00 e 15:00" ou "o que foi resolvido ontem" em
+O(log n + k), sem percorrer todas as ocorrências.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+from armazenamento_colunar import EPOCA, MICROSSEGUNDO, para_epoca
+
+CAMPOS = ("data_registro", "data_atendimento", "data_resolucao")
+LIMITE_PENDENTES = 1024  # Entradas acumuladas por campo antes de convertê-las para o índice
+
+
+class IndiceTemporal:
+    """
+    Índice de IDs por instante, um para cada campo de data da ocorrência.
+
+    Cada campo tem dois arrays paralelos, ordenados por (instante, ID): os
+    instantes em microssegundos desde a época e os IDs correspondentes. Como os
+    eventos chegam em ordem cronológica, quase toda inserção é um append; uma
+    inserção fora de ordem (ex.: ocorrências restauradas) usa busca binária.
+    Uma consulta localiza as duas pontas do intervalo por busca binária e
+    percorre só os IDs entre elas.
+
+    Converter um datetime em microssegundos custa mais que o resto do registro
+    de uma ocorrência, então as entradas novas são acumuladas como recebidas e
+    convertidas em bloco quando chegam a LIMITE_PENDENTES ou antes de qualquer
+    consulta; o custo da consulta continua O(log n + k) amortizado.
+
+    Atributos:
+        _instantes (dict[str, array]): Instantes ordenados por campo
+        _ids (dict[str, array]): IDs na mesma ordem dos instantes
+        _pendentes (dict[str, tuple[list, list]]): Datas e IDs ainda não convertidos, por campo
+        _datas_registro, _ids_registro (list): As listas pendentes de data_registro,
+            referenciadas diretamente pelo caminho de cada registro
+    """
+
+    def __init__(self):
+        """Inicializa um índice vazio."""
+        self._instantes = {campo: array("q") for campo in CAMPOS}
+        self._ids = {campo: array("q") for campo in CAMPOS}
+        # Duas listas em vez de uma lista de tuplas: não cria objetos rastreados pelo coletor de lixo
+        self._pendentes: dict[str, tuple[list[datetime], list[int]]] = {campo: ([], []) for campo in CAMPOS}
+        self._datas_registro, self._ids_registro = self._pendentes["data_registro"]
+
+    def adicionar(self, campo: str, instante: datetime | None, id_ocorrencia: int):
+        """
+        Adiciona um ID ao índice de um campo (um par já indexado é ignorado).
+
+        Args:
+            campo (str): Um dos CAMPOS
+            instante (datetime | None): Valor do campo; None é ignorado
+            id_ocorrencia (int): ID da ocorrência
+        """
+        if instante is None:
+            return
+        datas, ids = self._pendentes[campo]
+        datas.append(instante)
+        ids.append(id_ocorrencia)
+        if len(ids) >= LIMITE_PENDENTES:
+            self._consolidar(campo)
+
+    def adicionar_ocorrencia(self, ocorrencia):
+        """Adiciona uma ocorrência ao índice de cada campo de data preenchido."""
+        # Chamado a cada registro (uma ocorrência nova só tem a data de registro): sem chamadas aninhadas
+        self._datas_registro.append(ocorrencia.data_registro)
+        ids = self._ids_registro
+        ids.append(ocorrencia.id)
+        if len(ids) >= LIMITE_PENDENTES:
+            self._consolidar("data_registro")
+        if ocorrencia.data_atendimento is not None:
+            self.adicionar("data_atendimento", ocorrencia.data_atendimento, ocorrencia.id)
+        if ocorrencia.data_resolucao is not None:
+            self.adicionar("data_resolucao", ocorrencia.data_resolucao, ocorrencia.id)
+
+    def adicionar_lote(self, ocorrencias):
+        """
+        Adiciona várias ocorrências de uma vez.
+
+        Args:
+            ocorrencias (Iterable[Ocorrencia]): Ocorrências a indexar
+        """
+        for ocorrencia in ocorrencias:
+            for campo in CAMPOS:
+                instante = getattr(ocorrencia, campo)
+                if instante is not None:
+                    datas, ids = self._pendentes[campo]
+                    datas.append(instante)
+                    ids.append(ocorrencia.id)
+        for campo in CAMPOS:
+            self._consolidar(campo)
+
+    def _consolidar(self, campo: str):
+        """
+        Converte as entradas pendentes de um campo e as incorpora aos arrays.
+
+        No caso comum, as pendentes já estão em ordem e começam depois do último
+        par indexado: os arrays são estendidos de uma vez. Senão, são
+        ordenadas e inseridas uma a uma por busca binária.
+        """
+        datas, ids_pendentes = self._pendentes[campo]
+        if not ids_pendentes:
+            return
+        # Relativo à primeira data: a diferença costuma ser pequena, e o inteiro pequeno é mais barato
+        primeira = datas[0]
+        base = (primeira - EPOCA) // MICROSSEGUNDO
+        microssegundos = [base + diferenca // MICROSSEGUNDO for diferenca in map(primeira.__rsub__, datas)]
+        novos_ids = list(ids_pendentes)
+        datas.clear()
+        ids_pendentes.clear()
+        instantes = self._instantes[campo]
+        ids = self._ids[campo]
+        if (microssegundos == sorted(microssegundos) and novos_ids == sorted(set(novos_ids))
+                and (not instantes or (instantes[-1], ids[-1]) < (microssegundos[0], novos_ids[0]))):
+            instantes.extend(microssegundos)
+            ids.extend(novos_ids)
+            return
+        for instante, id_ocorrencia in sorted(set(zip(microssegundos, novos_ids))):
+            posicao = self._posicao(campo, instante, id_ocorrencia)
+            if posicao < len(ids) and instantes[posicao] == instante and ids[posicao] == id_ocorrencia:
+                continue
+            instantes.insert(posicao, instante)
+            ids.insert(posicao, id_ocorrencia)
+
+    def _posicao(self, campo: str, microssegundos: int, id_ocorrencia: int) -> int:
+        """Primeira posição cujo par (instante, ID) não é menor que o informado."""
+        instantes = self._instantes[campo]
+        ids = self._ids[campo]
+        inicio = bisect_left(instantes, microssegundos)
+        fim = bisect_right(instantes, microssegundos, inicio)
+        return bisect_left(ids, id_ocorrencia, inicio, fim)
+
+    def _limites(self, campo: str, inicio: datetime | None, fim: datetime | None) -> tuple[int, int]:
+        """Posições [primeira, última+1) dos instantes em [inicio, fim)."""
+        if campo not in self._instantes:
+            raise ValueError(f"Campo de data desconhecido: {campo!r}")
+        self._consolidar(campo)
+        instantes = self._instantes[campo]
+        primeira = 0 if inicio is None else bisect_left(instantes, para_epoca(inicio))
+        ultima = len(instantes) if fim is None else bisect_left(instantes, para_epoca(fim))
+        return primeira, max(primeira, ultima)
+
+    def consultar(self, campo: str, inicio: datetime | None = None, fim: datetime | None = None,
+                  apos: tuple[datetime, int] | None = None):
+        """
+        Itera sobre os IDs cujo campo está no intervalo [inicio, fim), em ordem cronológica.
+
+        Args:
+            campo (str): Um dos CAMPOS
+            inicio (datetime | None): Início do intervalo (inclusive), ou None para sem limite
+            fim (datetime | None): Fim do intervalo (exclusive), ou None para sem limite
+            apos (tuple[datetime, int] | None): Só os pares (instante, ID) posteriores a este
+                (retomada de uma consulta paginada)
+
+        Returns:
+            Iterator[int]: IDs ordenados por (instante, ID)
+
+        Raises:
+            ValueError: Se o campo não for um dos CAMPOS
+        """
+        primeira, ultima = self._limites(campo, inicio, fim)
+        if apos is not None:
+            instante, id_ocorrencia = apos
+            primeira = max(primeira, self._posicao(campo, para_epoca(instante), id_ocorrencia + 1))
+        ids = self._ids[campo]
+        while primeira < min(ultima, len(ids)):
+            yield ids[primeira]
+            primeira += 1
+
+    def contar(self, campo: str, inicio: datetime | None = None, fim: datetime | None = None) -> int:
+        """Conta os IDs cujo campo está no intervalo [inicio, fim) sem percorrê-los."""
+        primeira, ultima = self._limites(campo, inicio, fim)
+        return ultima - primeira
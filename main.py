@@ -3,11 +3,31 @@ Sistema de Gerenciamento de Ocorrências de Queimadas - Interface Principal
 
 Este módulo implementa a interface de usuário do sistema, fornecendo um menu interativo
 para gerenciar ocorrências de queimadas, equipes e atendimentos.
+
+Com --roteiro, executa um roteiro de operações sem interação (ver roteiro.py) e
+exibe só o resumo com os tempos ao final, para reproduzir um dia de operações,
+testes de carga e simulados em segundos.
+
+Uso:
+    python main.py
+    python main.py --roteiro ARQUIVO [--dados DIRETORIO] [--deduplicar] [--inicio DATA] [--verboso]
 """
 
+import argparse
+import sys
+from datetime import datetime, timedelta
+
 from central_atendimento import CentralAtendimento
 from ocorrencia import Ocorrencia
 from equipe import Equipe
+from persistencia import Persistencia
+from apresentacao import exibir_pagina, exibir_relatorio_turno, exibir_resumo_roteiro
+from relogio import RelogioSimulado, agora, definir_relogio
+from indice_espacial import validar_coordenadas
+from roteiro import executar_roteiro
+
+DIRETORIO_DADOS = "dados"  # Diário de eventos e snapshot da central
+ITENS_POR_PAGINA = 20  # Ocorrências exibidas por vez na listagem completa
 
 
 def exibir_menu():
@@ -26,10 +46,35 @@ def exibir_menu():
     print("5. 📊 Buscar lista de ocorrências por grau de severidade")
     print("6. 📝 Listar todas as ocorrências registradas")
     print("7. 📈 Listar histórico de atendimentos de todas as equipes")
+    print("8. 🤖 Despachar automaticamente as equipes livres")
+    print("9. 🕒 Relatório do turno")
     print("0. ❌ Sair")
     print("\n" + "-"*50)
     return input("👉 Escolha uma opção: ")
 
+def ler_coordenadas(mensagem):
+    """
+    Lê coordenadas opcionais no formato "latitude, longitude".
+    
+    Args:
+        mensagem (str): Texto exibido ao usuário
+    
+    Returns:
+        tuple: (latitude, longitude), ou (None, None) se o usuário não informar
+    """
+    while True:
+        texto = input(mensagem).strip()
+        if not texto:
+            return None, None
+        partes = texto.split(",")
+        if len(partes) != 2:
+            print("\n❌ Informe as coordenadas como: latitude, longitude (ex.: -10.25, -48.32)")
+            continue
+        try:
+            return validar_coordenadas(*partes)
+        except ValueError as erro:
+            print(f"\n❌ Erro: {erro}")
+
 def gerenciar_equipes(central):
     """
     Gerencia o cadastro inicial de equipes no sistema.
@@ -51,7 +96,9 @@ def gerenciar_equipes(central):
         
         if opcao == "1":
             nome = input("\n📝 Nome da equipe: ")
-            equipe = Equipe(nome)
+            regiao_base = input("📍 Região base (Norte, Sul, Leste, Oeste, Centro): ") or None
+            latitude, longitude = ler_coordenadas("🧭 Coordenadas da base (latitude, longitude; Enter para pular): ")
+            equipe = Equipe(nome, regiao_base, latitude=latitude, longitude=longitude)
             central.adicionar_equipe(equipe)
             print(f"\n✅ Equipe '{nome}' adicionada com sucesso!")
         elif opcao == "2":
@@ -76,7 +123,8 @@ def selecionar_equipe(central):
     print("\n👥 EQUIPES DISPONÍVEIS:")
     print("-"*50)
     for i, equipe in enumerate(central.equipes, 0):
-        print(f"{i}. 👤 {equipe.nome}")
+        situacao = "🟢 livre" if equipe.disponivel else "🔴 ocupada"
+        print(f"{i}. 👤 {equipe.nome} ({situacao})")
     
     while True:
         try:
@@ -87,15 +135,70 @@ def selecionar_equipe(central):
         except ValueError:
             print("\n❌ Por favor, digite um número válido!")
 
+def executar_sem_interacao(argumentos):
+    """
+    Executa um roteiro de operações sem menus nem mensagens por operação e exibe o resumo.
+    
+    Args:
+        argumentos (argparse.Namespace): Opções da linha de comando (roteiro, dados,
+            deduplicar, inicio e verboso)
+    """
+    relogio = None
+    anterior = None
+    if argumentos.inicio is not None:
+        relogio = RelogioSimulado(datetime.fromisoformat(argumentos.inicio))
+        anterior = definir_relogio(relogio)
+    central = Persistencia.abrir(argumentos.dados) if argumentos.dados is not None else CentralAtendimento()
+    if argumentos.deduplicar:
+        central.ativar_deduplicacao()
+    arquivo = sys.stdin if argumentos.roteiro == "-" else open(argumentos.roteiro, encoding="utf-8")
+    try:
+        resumo = executar_roteiro(arquivo, central, argumentos.verboso, relogio)
+    finally:
+        if arquivo is not sys.stdin:
+            arquivo.close()
+        if central.persistencia is not None:
+            central.persistencia.salvar_snapshot()
+            central.persistencia.fechar()
+        if anterior is not None:
+            definir_relogio(anterior)
+    exibir_resumo_roteiro(resumo, central)
+
 def main():
     """
     Função principal que inicializa o sistema e gerencia o fluxo de execução.
     """
-    # Inicializa a central de atendimento
-    central = CentralAtendimento()
+    parser = argparse.ArgumentParser(description="Sistema de gerenciamento de ocorrências de queimadas")
+    parser.add_argument("--roteiro", default=None,
+                        help="executa este roteiro (JSONL ou comandos; - lê da entrada padrão) sem interação")
+    parser.add_argument("--dados", default=None, help="diretório de persistência do roteiro (padrão: só em memória)")
+    parser.add_argument("--deduplicar", action="store_true", help="incorpora relatos duplicados às ocorrências originais")
+    parser.add_argument("--inicio", default=None,
+                        help="data ISO 8601 de um relógio simulado para o roteiro (adiantado por \"avancar\")")
+    parser.add_argument("--verboso", action="store_true", help="exibe a resposta de cada operação do roteiro")
+    argumentos = parser.parse_args()
+    if argumentos.roteiro is None:
+        if argumentos.dados or argumentos.deduplicar or argumentos.inicio or argumentos.verboso:
+            parser.error("--dados, --deduplicar, --inicio e --verboso requerem --roteiro")
+    else:
+        if argumentos.inicio is not None:
+            try:
+                datetime.fromisoformat(argumentos.inicio)
+            except ValueError:
+                parser.error(f"--inicio inválido: {argumentos.inicio!r} (use ISO 8601, ex.: 2024-08-01T06:00)")
+        executar_sem_interacao(argumentos)
+        return
+
+    # Inicializa a central de atendimento, recuperando o estado salvo em disco
+    central: CentralAtendimento = Persistencia.abrir(DIRETORIO_DADOS)
+    if central.ocorrencias or central.equipes:
+        print(f"\n💾 Estado recuperado: {len(central.ocorrencias)} ocorrências, {len(central.equipes)} equipes")
+    # Relatos repetidos de um mesmo foco são incorporados à ocorrência original
+    central.ativar_deduplicacao()
 
-    # Realiza o cadastro inicial de equipes
-    gerenciar_equipes(central)
+    # Realiza o cadastro inicial de equipes (as recuperadas do disco já estão cadastradas)
+    if not central.equipes:
+        gerenciar_equipes(central)
     
     # Loop principal do sistema
     while True:
@@ -110,11 +213,22 @@ def main():
                 regiao = input("📍 Região (Norte, Sul, Leste, Oeste, Centro): ")
                 severidade = int(input("🔥 Nível de severidade (1-5), sendo 5 a maior grau de severiedade: "))
                 descricao = input("📋 Descrição: ")
+                latitude, longitude = ler_coordenadas("🧭 Coordenadas do foco (latitude, longitude; Enter para pular): ")
                 
-                ocorrencia = Ocorrencia(regiao, severidade, descricao)
-                central.registrar_ocorrencia(ocorrencia)
+                relato = Ocorrencia(regiao, severidade, descricao, latitude, longitude)
+                ocorrencia = central.registrar_ocorrencia(relato)
                 
+                if ocorrencia.id != relato.id:
+                    print(f"\n🔁 Relato duplicado: incorporado à ocorrência #{ocorrencia.id} "
+                          f"(severidade {ocorrencia.severidade})")
+                    continue
                 print("\n✅ Ocorrência registrada com sucesso!")
+                relatos = central.incidente(ocorrencia.id)
+                if len(relatos) > 1:
+                    print(f"🔗 Mesmo incidente de {len(relatos) - 1} relato(s) próximo(s)")
+                if latitude is not None:
+                    for distancia, equipe in central.equipes_proximas(latitude, longitude, 3):
+                        print(f"🚒 Equipe livre próxima: {equipe.nome} a {distancia:.1f} km")
             except ValueError:
                 print("\n❌ Erro: Severidade deve ser um número entre 1 e 5")
                 
@@ -123,8 +237,7 @@ def main():
             ocorrencia = central.atender_proxima_ocorrencia()
             if ocorrencia:
                 equipe = selecionar_equipe(central)
-                ocorrencia.atribuir_equipe(equipe)
-                equipe.adicionar_ocorrencia_registrada(ocorrencia)
+                central.atribuir_equipe(ocorrencia, equipe)
                 print(f"\n✅ Atendendo ocorrência #{ocorrencia.id} em {ocorrencia.regiao} com a equipe {ocorrencia.equipe_atendimento.nome}")
             else:
                 print("\nℹ️ Não há ocorrências pendentes!")
@@ -167,7 +280,13 @@ def main():
             print("\n" + "="*50)
             print("📝 TODAS AS OCORRÊNCIAS")
             print("="*50)
-            central.listar_completamente_ocorrencias_registradas()
+            pagina = central.paginar_ocorrencias(ITENS_POR_PAGINA)
+            exibir_pagina(pagina, "📋 OCORRÊNCIAS REGISTRADAS", "ℹ️  Não há ocorrências registradas no sistema",
+                          detalhada=True)
+            while not pagina.ultima and input("👉 Enter para a próxima página, 0 para voltar: ") != "0":
+                pagina = central.paginar_ocorrencias(ITENS_POR_PAGINA, pagina.cursor)
+                exibir_pagina(pagina, "📋 OCORRÊNCIAS REGISTRADAS", "ℹ️  Não há mais ocorrências",
+                              detalhada=True)
                     
         # Listar histórico de atendimentos de uma equipe
         elif opcao == "7":
@@ -177,11 +296,33 @@ def main():
             for equipe in central.equipes:
                 equipe.listar_historico()
 
+        # Despachar automaticamente as equipes livres
+        elif opcao == "8":
+            print("\n" + "="*50)
+            print("🤖 DESPACHO AUTOMÁTICO")
+            print("="*50)
+            despachos = central.despachar()
+            if not despachos:
+                print("\nℹ️ Não há ocorrências pendentes ou equipes livres!")
+            for ocorrencia, equipe in despachos:
+                print(f"✅ Ocorrência #{ocorrencia.id} em {ocorrencia.regiao} → equipe {equipe.nome}")
+
+        # Relatório do turno (últimas horas)
+        elif opcao == "9":
+            try:
+                horas = float(input("🕒 Duração do turno em horas (padrão 8): ") or 8)
+                fim = agora()
+                exibir_relatorio_turno(central.relatorio_turno(fim - timedelta(hours=horas), fim))
+            except ValueError:
+                print("\n❌ Erro: Duração deve ser um número de horas")
+
         # Sair do sistema
         elif opcao == "0":
             print("\n" + "="*50)
             print("👋 Encerrando o sistema...")
             print("="*50)
+            central.persistencia.salvar_snapshot()
+            central.persistencia.fechar()
             break
             
         else:
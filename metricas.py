@@ -0,0 +1,436 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Métricas
+
+Este módulo implementa a camada de métricas da central: contadores, medidores
+(lidos sob demanda, sem custo nos caminhos quentes) e histogramas de latência
+no estilo HDR, com baldes log-lineares de erro relativo limitado. Para que o
+custo fique abaixo de 2% da vazão, só uma a cada `amostragem` chamadas das
+operações da central (registro, despacho, conclusão, busca, histórico) é
+cronometrada; no modo de perfil, todas são cronometradas e guardadas.
+
+As métricas são lidas com Metricas.instantaneo() (a operação "metricas" do
+servidor) ou despejadas periodicamente em um arquivo JSON (iniciar_despejo).
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import deque
+
+BITS_PRECISAO = 7  # Baldes por potência de 2: 2**(BITS_PRECISAO-1) (erro relativo < 1%)
+AMOSTRAGEM_PADRAO = 64  # Uma a cada N chamadas de cada operação é cronometrada (potência de 2)
+CHAMADAS_PERFIL = 100_000  # Chamadas guardadas por operação no modo de perfil
+PERCENTIS = {"p50": 0.5, "p90": 0.9, "p99": 0.99, "p999": 0.999}  # Percentis de Histograma.resumo
+
+_LIMITE_LINEAR = 1 << BITS_PRECISAO
+
+
+def _indice_balde(valor: int) -> int:
+    """Balde de um valor: exato abaixo de 2**BITS_PRECISAO, log-linear acima."""
+    deslocamento = valor.bit_length() - BITS_PRECISAO
+    if deslocamento <= 0:
+        return valor
+    return (deslocamento << (BITS_PRECISAO - 1)) + (valor >> deslocamento)
+
+
+def _limite_balde(indice: int) -> tuple[int, int]:
+    """Menor valor e largura do balde (inverso de _indice_balde)."""
+    if indice < _LIMITE_LINEAR:
+        return indice, 1
+    deslocamento = (indice >> (BITS_PRECISAO - 1)) - 1
+    return (indice - (deslocamento << (BITS_PRECISAO - 1))) << deslocamento, 1 << deslocamento
+
+
+class Contador:
+    """
+    Contador monotônico.
+
+    Atributos:
+        valor (int): Total acumulado
+    """
+
+    __slots__ = ("valor",)
+
+    def __init__(self):
+        self.valor = 0
+
+    def incrementar(self, quantidade: int = 1):
+        self.valor += quantidade
+
+
+class Medidor:
+    """
+    Valor instantâneo, definido diretamente ou calculado por uma função no momento da leitura.
+
+    Medidores calculados (ex.: tamanho da fila) não custam nada nos caminhos
+    quentes: a função só é chamada quando as métricas são lidas.
+
+    Atributos:
+        funcao (Callable[[], float] | None): Função que calcula o valor, se houver
+    """
+
+    __slots__ = ("funcao", "_valor")
+
+    def __init__(self, funcao=None):
+        self.funcao = funcao
+        self._valor = 0
+
+    def definir(self, valor):
+        self._valor = valor
+
+    @property
+    def valor(self):
+        return self.funcao() if self.funcao is not None else self._valor
+
+
+class Histograma:
+    """
+    Histograma de inteiros não negativos com baldes log-lineares (estilo HDR).
+
+    Valores abaixo de 2**BITS_PRECISAO têm balde próprio; acima, cada potência
+    de 2 é dividida em 2**(BITS_PRECISAO-1) baldes de mesma largura, de modo que
+    o erro relativo dos percentis fica abaixo de 1% em qualquer escala. Registrar
+    um valor é O(1) e a memória cresce com o logaritmo do maior valor, não com
+    o número de amostras.
+
+    Atributos:
+        unidade (str): Unidade dos valores (ex.: "ns", "ms")
+        total (int): Valores registrados
+        soma (int): Soma dos valores
+        maximo (int): Maior valor registrado
+        _contagens (list[int]): Contagem por balde
+    """
+
+    __slots__ = ("unidade", "total", "soma", "maximo", "_contagens")
+
+    def __init__(self, unidade: str = "ns"):
+        self.unidade = unidade
+        self.total = 0
+        self.soma = 0
+        self.maximo = 0
+        self._contagens: list[int] = []
+
+    def registrar(self, valor: int):
+        """Registra um valor (negativos contam como 0)."""
+        if valor < 0:
+            valor = 0
+        indice = _indice_balde(valor)
+        contagens = self._contagens
+        if indice >= len(contagens):
+            contagens.extend([0] * (indice + 1 - len(contagens)))
+        contagens[indice] += 1
+        self.total += 1
+        self.soma += valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def percentil(self, fracao: float) -> float:
+        """
+        Valor abaixo do qual está a fração dada dos registros (ponto médio do balde).
+
+        Args:
+            fracao (float): Fração entre 0 e 1 (ex.: 0.99)
+
+        Returns:
+            float: Percentil, ou 0.0 se não houver registros
+        """
+        return self._percentis((fracao,))[0]
+
+    def resumo(self) -> dict:
+        """
+        Resume o histograma.
+
+        Returns:
+            dict: unidade, total, media, maximo e p50, p90, p99 e p999
+        """
+        resumo = {
+            "unidade": self.unidade,
+            "total": self.total,
+            "media": self.soma / self.total if self.total else 0.0,
+            "maximo": self.maximo,
+        }
+        resumo.update(zip(PERCENTIS, self._percentis(PERCENTIS.values())))
+        return resumo
+
+    def _percentis(self, fracoes) -> list[float]:
+        """Percentis em ordem crescente de fração, numa única passada pelos baldes."""
+        contagens = list(self._contagens)  # Cópia: pode ser lido por outra thread (despejo)
+        total = sum(contagens)
+        resultado = []
+        acumulado = 0
+        indice = 0
+        for fracao in fracoes:
+            if not total:
+                resultado.append(0.0)
+                continue
+            alvo = max(1, min(total, int(total * fracao + 0.5)))
+            while acumulado + contagens[indice] < alvo:
+                acumulado += contagens[indice]
+                indice += 1
+            inicio, largura = _limite_balde(indice)
+            resultado.append(min(inicio + (largura - 1) / 2, self.maximo))
+        return resultado
+
+    def zerar(self):
+        self.total = self.soma = self.maximo = 0
+        self._contagens = []
+
+
+class Operacao:
+    """
+    Métricas de uma operação: latência amostrada e, se contada, o total de chamadas.
+
+    Operações por chamada (ex.: uma busca) contam todas as chamadas e
+    cronometram uma a cada `amostragem` (uma chamada de método quando não
+    amostrada):
+
+        inicio = operacao.iniciar()
+        ...
+        if inicio:
+            operacao.concluir(inicio)
+
+    Operações por ocorrência (registro, conclusão, histórico), executadas
+    milhões de vezes, não pagam nem essa chamada: a central cronometra só as
+    ocorrências cujo ID é múltiplo da amostragem (id & Metricas.mascara == 0),
+    uma amostra determinística e sem viés de latência, e chama concluir. Os
+    totais delas vêm dos medidores da central (ex.: "fila").
+
+    Atributos:
+        contada (bool): Se as chamadas são contadas (operações por chamada)
+        chamadas (int): Chamadas da operação, se contada
+        latencia (Histograma): Latência (ns) das chamadas cronometradas
+        perfil (deque[int] | None): Latência de cada chamada, no modo de perfil
+        _mascara (int): amostragem - 1 (a chamada é cronometrada quando chamadas & _mascara == 0)
+    """
+
+    __slots__ = ("contada", "chamadas", "latencia", "perfil", "_mascara")
+
+    def __init__(self, amostragem: int = AMOSTRAGEM_PADRAO, contada: bool = True):
+        self.contada = contada
+        self.chamadas = 0
+        self.latencia = Histograma("ns")
+        self.perfil: deque | None = None
+        self._mascara = amostragem - 1
+
+    def iniciar(self) -> int:
+        """Conta a chamada; retorna o instante (ns) se ela deve ser cronometrada, ou 0."""
+        self.chamadas += 1
+        if self.chamadas & self._mascara:
+            return 0
+        return time.perf_counter_ns()
+
+    def concluir(self, inicio: int):
+        """Registra a latência de uma chamada cronometrada."""
+        duracao = time.perf_counter_ns() - inicio
+        self.latencia.registrar(duracao)
+        if self.perfil is not None:
+            self.perfil.append(duracao)
+
+    def resumo(self) -> dict:
+        """Chamadas (se contada), amostras e resumo da latência amostrada (ver Histograma.resumo)."""
+        resumo = {"amostras": self.latencia.total, "latencia": self.latencia.resumo()}
+        if self.contada:
+            resumo["chamadas"] = self.chamadas
+        return resumo
+
+
+class Metricas:
+    """
+    Registro de métricas de uma central.
+
+    As operações quentes ficam em atributos fixos (acesso mais rápido que por
+    nome); outras métricas são criadas por nome com contador, medidor,
+    histograma e operacao, que retornam a existente se o nome já foi usado.
+
+    Atributos:
+        registro, conclusao, historico (Operacao): Operações por ocorrência (amostradas pelo ID)
+        lote, despacho, busca (Operacao): Operações por chamada da central
+        tempo_na_fila (Histograma): Tempo (ms) entre o registro e o início do atendimento
+            (amostrado pelo ID, como as operações por ocorrência)
+        tempo_ate_resolucao (Histograma): Tempo (ms) entre o registro e a resolução (idem)
+        amostragem (int): Uma a cada N chamadas é cronometrada (1 no modo de perfil)
+        mascara (int): amostragem - 1 (a ocorrência é amostrada quando id & mascara == 0)
+        perfilando (bool): Se o modo de perfil está ativo
+        trava (AbstractContextManager): Protege a leitura das métricas (ver CentralConcorrente)
+    """
+
+    OPERACOES_POR_OCORRENCIA = ("registro", "conclusao", "historico")
+    OPERACOES = ("lote", "despacho", "busca")
+
+    def __init__(self, amostragem: int = AMOSTRAGEM_PADRAO):
+        """
+        Inicializa um registro de métricas vazio.
+
+        Args:
+            amostragem (int): Uma a cada N chamadas de cada operação é cronometrada
+
+        Raises:
+            ValueError: Se a amostragem não for uma potência de 2
+        """
+        if amostragem < 1 or amostragem & (amostragem - 1):
+            raise ValueError("A amostragem deve ser uma potência de 2")
+        self.amostragem = amostragem
+        self.mascara = amostragem - 1
+        self._amostragem_normal = amostragem
+        self.perfilando = False
+        self.trava = contextlib.nullcontext()
+        self.inicio = time.time()
+        self._contadores: dict[str, Contador] = {}
+        self._medidores: dict[str, Medidor] = {}
+        self._histogramas: dict[str, Histograma] = {}
+        self._operacoes: dict[str, Operacao] = {}
+        for nome in self.OPERACOES_POR_OCORRENCIA:
+            setattr(self, nome, self.operacao(nome, contada=False))
+        for nome in self.OPERACOES:
+            setattr(self, nome, self.operacao(nome))
+        self.tempo_na_fila = self.histograma("tempo_na_fila", "ms")
+        self.tempo_ate_resolucao = self.histograma("tempo_ate_resolucao", "ms")
+        self._despejo: threading.Thread | None = None
+        self._parar_despejo = threading.Event()
+
+    def contador(self, nome: str) -> Contador:
+        """Contador com o nome dado (criado na primeira vez)."""
+        contador = self._contadores.get(nome)
+        if contador is None:
+            contador = self._contadores[nome] = Contador()
+        return contador
+
+    def medidor(self, nome: str, funcao=None) -> Medidor:
+        """
+        Medidor com o nome dado (criado na primeira vez).
+
+        Args:
+            nome (str): Nome do medidor
+            funcao (Callable[[], float] | None): Se dada, passa a calcular o valor na leitura
+        """
+        medidor = self._medidores.get(nome)
+        if medidor is None:
+            medidor = self._medidores[nome] = Medidor()
+        if funcao is not None:
+            medidor.funcao = funcao
+        return medidor
+
+    def histograma(self, nome: str, unidade: str = "ns") -> Histograma:
+        """Histograma com o nome dado (criado na primeira vez)."""
+        histograma = self._histogramas.get(nome)
+        if histograma is None:
+            histograma = self._histogramas[nome] = Histograma(unidade)
+        return histograma
+
+    def operacao(self, nome: str, contada: bool = True) -> Operacao:
+        """Operação com o nome dado (criada na primeira vez, com a amostragem atual; ver Operacao)."""
+        operacao = self._operacoes.get(nome)
+        if operacao is None:
+            operacao = self._operacoes[nome] = Operacao(self.amostragem, contada)
+            if self.perfilando:
+                operacao.perfil = deque(maxlen=CHAMADAS_PERFIL)
+        return operacao
+
+    def perfilar(self, ativo: bool = True):
+        """
+        Liga ou desliga o modo de perfil.
+
+        No modo de perfil, todas as chamadas das operações são cronometradas e a
+        latência de cada uma é guardada (as últimas CHAMADAS_PERFIL por operação),
+        ao custo de duas leituras do relógio por chamada. Ao desligar, a
+        amostragem volta ao valor anterior e as chamadas guardadas são descartadas.
+
+        Args:
+            ativo (bool): True para ligar, False para desligar
+        """
+        if ativo == self.perfilando:
+            return
+        self.perfilando = ativo
+        if ativo:
+            self._amostragem_normal = self.amostragem
+            self.amostragem = 1
+        else:
+            self.amostragem = self._amostragem_normal
+        self.mascara = self.amostragem - 1
+        for operacao in self._operacoes.values():
+            operacao._mascara = self.amostragem - 1
+            operacao.perfil = deque(maxlen=CHAMADAS_PERFIL) if ativo else None
+
+    def perfil(self) -> dict[str, list[int]]:
+        """
+        Latência (ns) de cada chamada guardada no modo de perfil, por operação.
+
+        Returns:
+            dict[str, list[int]]: Durações em ordem de chamada (vazio fora do modo de perfil)
+        """
+        return {
+            nome: list(operacao.perfil)
+            for nome, operacao in self._operacoes.items()
+            if operacao.perfil
+        }
+
+    def instantaneo(self) -> dict:
+        """
+        Lê todas as métricas.
+
+        Returns:
+            dict: Objeto serializável em JSON com instante, tempo_ativo_s,
+                amostragem, perfilando, contadores, medidores, histogramas e operacoes
+        """
+        with self.trava:
+            return {
+                "instante": time.time(),
+                "tempo_ativo_s": time.time() - self.inicio,
+                "amostragem": self.amostragem,
+                "perfilando": self.perfilando,
+                "contadores": {nome: contador.valor for nome, contador in self._contadores.items()},
+                "medidores": {nome: medidor.valor for nome, medidor in self._medidores.items()},
+                "histogramas": {nome: histograma.resumo() for nome, histograma in self._histogramas.items()},
+                "operacoes": {
+                    nome: operacao.resumo() for nome, operacao in self._operacoes.items()
+                    if operacao.chamadas or operacao.latencia.total
+                },
+            }
+
+    def exportar_json(self, caminho: str):
+        """
+        Grava o instantâneo das métricas em um arquivo JSON.
+
+        O arquivo é escrito ao lado e renomeado, de modo que um leitor nunca vê
+        um arquivo pela metade.
+
+        Args:
+            caminho (str): Arquivo de destino
+        """
+        temporario = f"{caminho}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            json.dump(self.instantaneo(), arquivo, ensure_ascii=False, indent=2)
+        os.replace(temporario, caminho)
+
+    def iniciar_despejo(self, caminho: str, intervalo: float = 10.0):
+        """
+        Passa a gravar as métricas em um arquivo JSON a cada `intervalo` segundos.
+
+        Args:
+            caminho (str): Arquivo de destino (ver exportar_json)
+            intervalo (float): Segundos entre gravações
+
+        Raises:
+            RuntimeError: Se um despejo já estiver em andamento
+        """
+        if self._despejo is not None:
+            raise RuntimeError("O despejo periódico já está em andamento")
+        self._parar_despejo.clear()
+
+        def despejar():
+            while not self._parar_despejo.wait(intervalo):
+                self.exportar_json(caminho)
+            self.exportar_json(caminho)
+
+        self._despejo = threading.Thread(target=despejar, name="despejo-metricas", daemon=True)
+        self._despejo.start()
+
+    def parar_despejo(self):
+        """Interrompe o despejo periódico, gravando as métricas uma última vez."""
+        if self._despejo is None:
+            return
+        self._parar_despejo.set()
+        self._despejo.join()
+        self._despejo = None
@@ -0,0 +1,212 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Monte Carlo de Cenários
+
+Este módulo executa milhares de temporadas simuladas (ver simulador.py) para
+dimensionar equipes e comparar políticas de prioridade. As replicações são
+independentes e distribuídas entre processos (ProcessPoolExecutor); cada uma
+devolve apenas um pequeno array de métricas, e o executor agrega médias e
+intervalos de confiança por cenário.
+
+Uso:
+    python monte_carlo.py [replicacoes] [processos] [dias]
+"""
+
+import hashlib
+import math
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from politica_prioridade import PoliticaEnvelhecimento, PoliticaPrioridade, PoliticaSeveridade
+from simulador import ConfiguracaoSimulacao, Simulador
+
+# Métricas devolvidas por replicação, na ordem do array de resumo
+METRICAS = (
+    "ocorrencias",
+    "espera_media_min",
+    "espera_p90_min",
+    "espera_p99_min",
+    "espera_media_sev5_min",
+    "resposta_media_min",
+    "utilizacao",
+    "fila_media",
+    "fila_maxima",
+)
+
+# Valores críticos da distribuição t de Student (bicaudal, 95%) por graus de liberdade
+_T_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+
+class Cenario:
+    """
+    Um cenário a ser replicado: configuração da simulação e política de prioridade.
+
+    Atributos:
+        nome (str): Nome do cenário nos resultados
+        configuracao (ConfiguracaoSimulacao): Parâmetros da simulação
+        politica (PoliticaPrioridade): Política de prioridade da central
+    """
+
+    def __init__(self, nome: str, configuracao: ConfiguracaoSimulacao, politica: PoliticaPrioridade):
+        self.nome = nome
+        self.configuracao = configuracao
+        self.politica = politica
+
+
+def semente_replicacao(semente: int, replicacao: int) -> int:
+    """
+    Deriva a semente de uma replicação de forma determinística.
+
+    A semente depende só da semente base e do número da replicação (não do
+    cenário nem do processo que a executa): a replicação k de todos os
+    cenários enfrenta a mesma sequência de focos, o que reduz a variância das
+    comparações entre cenários, e os resultados não dependem do número de processos.
+
+    Args:
+        semente (int): Semente base da execução
+        replicacao (int): Número da replicação
+
+    Returns:
+        int: Semente de 64 bits da replicação
+    """
+    resumo = hashlib.blake2b(f"{semente}:{replicacao}".encode(), digest_size=8).digest()
+    return int.from_bytes(resumo, "big")
+
+
+def executar_replicacao(tarefa: tuple) -> tuple[int, int, array]:
+    """
+    Executa uma replicação de um cenário (no processo trabalhador).
+
+    Args:
+        tarefa (tuple): (índice do cenário, cenário, replicação, semente base)
+
+    Returns:
+        tuple[int, int, array]: (índice do cenário, replicação, métricas na ordem de METRICAS)
+    """
+    indice, cenario, replicacao, semente = tarefa
+    estatisticas = Simulador(cenario.configuracao, cenario.politica, semente_replicacao(semente, replicacao)).executar()
+    estatisticas["espera_media_sev5_min"] = estatisticas["espera_media_por_severidade"].get(5, 0.0)
+    return indice, replicacao, array("d", (float(estatisticas[metrica]) for metrica in METRICAS))
+
+
+def intervalo_confianca(valores) -> tuple[float, float]:
+    """
+    Calcula a média e a meia-largura do intervalo de confiança de 95%.
+
+    Args:
+        valores (Sequence[float]): Amostras independentes
+
+    Returns:
+        tuple[float, float]: (média, meia-largura); a meia-largura é 0 com menos de 2 amostras
+    """
+    n = len(valores)
+    if n == 0:
+        return 0.0, 0.0
+    media = math.fsum(valores) / n
+    if n < 2:
+        return media, 0.0
+    variancia = math.fsum((valor - media) ** 2 for valor in valores) / (n - 1)
+    critico = _T_95[n - 2] if n - 1 <= len(_T_95) else 1.96
+    return media, critico * math.sqrt(variancia / n)
+
+
+def executar_cenarios(cenarios: list[Cenario], replicacoes: int, semente=42, processos=None) -> dict[str, dict]:
+    """
+    Replica cada cenário e agrega as métricas com intervalos de confiança.
+
+    Args:
+        cenarios (list[Cenario]): Cenários a executar
+        replicacoes (int): Replicações por cenário
+        semente (int): Semente base (ver semente_replicacao)
+        processos (int | None): Processos trabalhadores; 1 executa no próprio
+            processo, None usa todos os núcleos
+
+    Returns:
+        dict[str, dict]: Para cada cenário, {métrica: (média, meia-largura IC95%)}
+            e "replicacoes"
+    """
+    tarefas = [
+        (indice, cenario, replicacao, semente)
+        for indice, cenario in enumerate(cenarios)
+        for replicacao in range(replicacoes)
+    ]
+    # Uma coluna por métrica e cenário, preenchida na posição da replicação:
+    # o resultado não depende da ordem em que os processos terminam
+    colunas = [[array("d", bytes(8 * replicacoes)) for _ in METRICAS] for _ in cenarios]
+
+    def preencher(resumos):
+        for indice, replicacao, resumo in resumos:
+            for coluna, valor in zip(colunas[indice], resumo):
+                coluna[replicacao] = valor
+
+    if processos == 1:
+        preencher(map(executar_replicacao, tarefas))
+    else:
+        processos = processos or os.cpu_count() or 1
+        # Lotes de tarefas por envio reduzem a comunicação entre processos
+        tamanho_lote = max(1, len(tarefas) // (processos * 4))
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            preencher(executor.map(executar_replicacao, tarefas, chunksize=tamanho_lote))
+
+    resultados = {}
+    for cenario, colunas_cenario in zip(cenarios, colunas):
+        agregado: dict = {metrica: intervalo_confianca(coluna) for metrica, coluna in zip(METRICAS, colunas_cenario)}
+        agregado["replicacoes"] = replicacoes
+        resultados[cenario.nome] = agregado
+    return resultados
+
+
+def cenarios_dimensionamento(dias=30.0, equipes=(2, 3, 4), politicas=None) -> list[Cenario]:
+    """
+    Monta a grade de cenários de dimensionamento: equipes por região × políticas.
+
+    Args:
+        dias (float): Duração de cada temporada simulada
+        equipes (Iterable[int]): Números de equipes por região a comparar
+        politicas (dict[str, PoliticaPrioridade] | None): Políticas por nome
+
+    Returns:
+        list[Cenario]: Um cenário para cada combinação
+    """
+    if politicas is None:
+        politicas = {"severidade": PoliticaSeveridade(), "envelhecimento 10min": PoliticaEnvelhecimento(600.0)}
+    cenarios = []
+    for por_regiao in equipes:
+        configuracao = ConfiguracaoSimulacao(dias=dias)
+        configuracao.equipes_por_regiao = {regiao: por_regiao for regiao in configuracao.pesos_regiao}
+        for nome, politica in politicas.items():
+            cenarios.append(Cenario(f"{por_regiao} equipes/região, {nome}", configuracao, politica))
+    return cenarios
+
+
+def main():
+    replicacoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    processos = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    dias = float(sys.argv[3]) if len(sys.argv) > 3 else 30.0
+    cenarios = cenarios_dimensionamento(dias)
+    inicio = time.perf_counter()
+    resultados = executar_cenarios(cenarios, replicacoes, processos=processos)
+    decorrido = time.perf_counter() - inicio
+
+    print("\n" + "="*100)
+    print(f"🎲 MONTE CARLO: {len(cenarios)} cenários × {replicacoes} replicações de {dias:g} dias "
+          f"em {decorrido:.1f}s ({processos or os.cpu_count()} processos)")
+    print("="*100)
+    print(f"{'cenário':<38} | {'espera média (min)':>18} | {'p90 (min)':>15} | {'sev 5 (min)':>13} | {'utilização':>13}")
+    print("-"*100)
+    for nome, r in resultados.items():
+        espera, p90, sev5, utilizacao = (r[m] for m in ("espera_media_min", "espera_p90_min",
+                                                        "espera_media_sev5_min", "utilizacao"))
+        print(f"{nome:<38} | {espera[0]:>9.1f} ± {espera[1]:<6.1f} | {p90[0]:>7.1f} ± {p90[1]:<5.1f} | "
+              f"{sev5[0]:>5.1f} ± {sev5[1]:<5.1f} | {utilizacao[0]:>6.1%} ± {utilizacao[1]:<4.1%}")
+    print("Intervalos de confiança de 95% (t de Student) sobre as replicações.")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,12 @@ Este módulo implementa a classe Ocorrencia, que representa uma ocorrência de q
 no sistema, contendo todas as informações relevantes sobre o incidente.
 """
 
-from datetime import datetime
+import threading
 from typing import TYPE_CHECKING
 
+from relogio import agora
+from indice_espacial import validar_coordenadas
+
 if TYPE_CHECKING:
     from equipe import Equipe
 
@@ -25,11 +28,23 @@ class Ocorrencia:
         data_atendimento (datetime): Data e hora do início do atendimento
         data_resolucao (datetime): Data e hora da resolução
         equipe_atendimento (Equipe): Equipe responsável pelo atendimento
+        latitude (float | None): Latitude do foco em graus, se conhecida
+        longitude (float | None): Longitude do foco em graus, se conhecida
+        _observador (Callable | None): Função chamada a cada mudança de status, com
+            (ocorrencia, status_anterior); usada pela central para manter seus índices
     """
     
+    __slots__ = (
+        "id", "regiao", "severidade", "descricao", "status",
+        "data_registro", "data_atendimento", "data_resolucao", "equipe_atendimento",
+        "latitude", "longitude", "_observador",
+    )  # Sem __dict__ por instância: reduz a memória de históricos com milhões de ocorrências
+
     _id_counter = 1  # Contador estático para gerar IDs únicos
+    _passo_id = 1  # Incremento do contador (> 1 quando várias partições geram IDs; ver definir_sequencia_ids)
+    _trava_id = threading.Lock()  # Torna a leitura e o incremento do contador atômicos entre threads
     
-    def __init__(self, regiao, severidade, descricao):
+    def __init__(self, regiao, severidade, descricao, latitude=None, longitude=None):
         """
         Inicializa uma nova ocorrência.
         
@@ -37,24 +52,106 @@ class Ocorrencia:
             regiao (str): Região da ocorrência
             severidade (int): Nível de severidade (1-5)
             descricao (str): Descrição da ocorrência
+            latitude (float | None): Latitude do foco (ex.: de um feed de satélite)
+            longitude (float | None): Longitude do foco
             
         Raises:
-            ValueError: Se a severidade não estiver entre 1 e 5
+            ValueError: Se a severidade não estiver entre 1 e 5 ou as coordenadas forem inválidas
         """
         if not isinstance(severidade, int) or not 1 <= severidade <= 5:
             raise ValueError("Severidade deve ser um número inteiro entre 1 e 5")
+        if latitude is not None or longitude is not None:
+            latitude, longitude = validar_coordenadas(latitude, longitude)
             
-        self.id = Ocorrencia._id_counter
-        Ocorrencia._id_counter += 1
+        with Ocorrencia._trava_id:
+            self.id = Ocorrencia._id_counter
+            Ocorrencia._id_counter += Ocorrencia._passo_id
         
         self.regiao = regiao
         self.severidade = severidade
         self.descricao = descricao
         self.status = "pendente"
-        self.data_registro = datetime.now()
+        self.data_registro = agora()
         self.data_atendimento = None
         self.data_resolucao = None
         self.equipe_atendimento: "Equipe | None" = None  # Referência à equipe que está atendendo
+        self.latitude = latitude
+        self.longitude = longitude
+        self._observador = None  # Definido pela central ao registrar a ocorrência
+        
+    @classmethod
+    def restaurar(cls, id_ocorrencia, regiao, severidade, descricao, status,
+                  data_registro, data_atendimento=None, data_resolucao=None, equipe=None,
+                  latitude=None, longitude=None):
+        """
+        Recria uma ocorrência já existente (ex.: lida do disco) sem gerar um novo ID.
+        
+        Args:
+            id_ocorrencia (int): ID original da ocorrência
+            regiao (str): Região da ocorrência
+            severidade (int): Nível de severidade (1-5)
+            descricao (str): Descrição da ocorrência
+            status (str): Status atual
+            data_registro (datetime): Data e hora do registro
+            data_atendimento (datetime | None): Data e hora do início do atendimento
+            data_resolucao (datetime | None): Data e hora da resolução
+            equipe (Equipe | None): Equipe responsável pelo atendimento
+            latitude (float | None): Latitude do foco
+            longitude (float | None): Longitude do foco
+            
+        Returns:
+            Ocorrencia: A ocorrência restaurada
+        """
+        ocorrencia = cls.__new__(cls)
+        ocorrencia.id = id_ocorrencia
+        ocorrencia.regiao = regiao
+        ocorrencia.severidade = severidade
+        ocorrencia.descricao = descricao
+        ocorrencia.status = status
+        ocorrencia.data_registro = data_registro
+        ocorrencia.data_atendimento = data_atendimento
+        ocorrencia.data_resolucao = data_resolucao
+        ocorrencia.equipe_atendimento = equipe
+        ocorrencia.latitude = latitude
+        ocorrencia.longitude = longitude
+        ocorrencia._observador = None
+        return ocorrencia
+
+    @classmethod
+    def definir_proximo_id(cls, proximo_id):
+        """
+        Avança o contador de IDs para que o próximo ID gerado seja pelo menos `proximo_id`.
+        
+        Args:
+            proximo_id (int): Menor valor aceitável para o próximo ID
+        """
+        with Ocorrencia._trava_id:
+            proximo_id = max(Ocorrencia._id_counter, proximo_id)
+            # Mantém a sequência de definir_sequencia_ids: o contador só assume valores da sua classe de resto
+            proximo_id += -(proximo_id - Ocorrencia._id_counter) % Ocorrencia._passo_id
+            Ocorrencia._id_counter = proximo_id
+
+    @classmethod
+    def definir_sequencia_ids(cls, primeiro_id, passo):
+        """
+        Faz o contador gerar os IDs primeiro_id, primeiro_id + passo, primeiro_id + 2*passo, ...
+        
+        Usado por processos que geram IDs em paralelo sem se coordenar: com
+        `passo` processos, o de índice i (a partir de 0) usa primeiro_id = i + 1,
+        e os IDs de todos são distintos (ver CentralParticionada).
+        
+        Args:
+            primeiro_id (int): Primeiro ID gerado
+            passo (int): Diferença entre IDs consecutivos
+            
+        Raises:
+            ValueError: Se o passo ou o primeiro ID não forem positivos
+        """
+        if passo < 1 or primeiro_id < 1:
+            raise ValueError("O primeiro ID e o passo devem ser positivos")
+        with Ocorrencia._trava_id:
+            Ocorrencia._id_counter = primeiro_id
+            Ocorrencia._passo_id = passo
         
     def atribuir_equipe(self, equipe: "Equipe") -> bool:
         """
@@ -80,11 +177,14 @@ class Ocorrencia:
         Args:
             novo_status (str): Novo status da ocorrência
         """
+        status_anterior = self.status
         self.status = novo_status
         if novo_status == "em_atendimento" and not self.data_atendimento:
-            self.data_atendimento = datetime.now()
+            self.data_atendimento = agora()
         elif novo_status == "resolvida" and not self.data_resolucao:
-            self.data_resolucao = datetime.now()
+            self.data_resolucao = agora()
+        if self._observador is not None and status_anterior != novo_status:
+            self._observador(self, status_anterior)
             
     def exibir_resumo(self):
         """Exibe um resumo conciso da ocorrência."""
@@ -117,12 +217,13 @@ class Ocorrencia:
         }.get(self.status, "❓")
         
         equipe_info = f"👥 Equipe atendendo: {self.equipe_atendimento.nome}" if self.equipe_atendimento else "❌ Sem equipe atribuída"
+        local_info = f" ({self.latitude:.5f}, {self.longitude:.5f})" if self.latitude is not None else ""
         
         return f"""
 {'='*50}
 🔥 OCORRÊNCIA #{self.id}
 {'='*50}
-📍 Região: {self.regiao}
+📍 Região: {self.regiao}{local_info}
 ⚠️ Severidade: {self.severidade}
 {status_emoji} Status: {self.status}
 {equipe_info}
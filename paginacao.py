@@ -0,0 +1,124 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Paginação
+
+Este módulo define a página de resultados das consultas paginadas por cursor
+(CentralAtendimento.paginar_ocorrencias e Historico.paginar) e o filtro de
+ocorrências comum a elas.
+
+As consultas produzem os resultados sob demanda (geradores), e uma página só
+consome o iterador até completar `limite` itens: o custo de uma página de 50
+não depende do total de registros. O cursor é um valor opaco para o chamador,
+devolvido em cada página e passado de volta para obter a seguinte.
+"""
+
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Generic, Iterator, TypeVar
+
+T = TypeVar('T')
+
+LIMITE_PAGINA = 50  # Itens por página quando o chamador não informa o limite
+
+
+class Pagina(Generic[T]):
+    """
+    Uma página de resultados de uma consulta paginada.
+
+    Atributos:
+        itens (list[T]): Itens da página, na ordem da consulta
+        cursor (object | None): Cursor para obter a próxima página, ou None se esta for a última
+    """
+
+    def __init__(self, itens: list[T], cursor=None):
+        self.itens = itens
+        self.cursor = cursor
+
+    @property
+    def ultima(self) -> bool:
+        """Indica se não há páginas depois desta."""
+        return self.cursor is None
+
+    def __len__(self) -> int:
+        return len(self.itens)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.itens)
+
+
+def paginar(pares: Iterator[tuple[object, T]], limite: int = LIMITE_PAGINA) -> Pagina[T]:
+    """
+    Monta uma página a partir de um iterador preguiçoso de pares (cursor, item).
+
+    Consome no máximo `limite` + 1 pares: o item excedente só indica que há
+    uma próxima página.
+
+    Args:
+        pares (Iterator[tuple[object, T]]): Pares na ordem da consulta; o cursor
+            de cada par é o que retoma a consulta logo depois daquele item
+        limite (int): Número máximo de itens na página
+
+    Returns:
+        Pagina[T]: A página, com o cursor do último item se houver mais resultados
+
+    Raises:
+        ValueError: Se o limite não for positivo
+    """
+    if limite < 1:
+        raise ValueError("O limite da página deve ser positivo")
+    itens = []
+    cursor = None
+    for cursor_item, item in islice(pares, limite + 1):
+        if len(itens) == limite:
+            return Pagina(itens, cursor)
+        itens.append(item)
+        cursor = cursor_item
+    return Pagina(itens)
+
+
+def filtro_ocorrencias(regiao=None, status=None, severidade_minima=1, severidade_maxima=5,
+                       desde: datetime | None = None, ate: datetime | None = None) -> Callable | None:
+    """
+    Cria um predicado que testa uma ocorrência contra os filtros informados.
+
+    Args:
+        regiao (str | None): Região, ou None para todas
+        status (str | None): Status, ou None para todos
+        severidade_minima (int): Severidade mínima (inclusive)
+        severidade_maxima (int): Severidade máxima (inclusive)
+        desde (datetime | None): Registradas a partir deste instante (inclusive)
+        ate (datetime | None): Registradas antes deste instante (exclusive)
+
+    Returns:
+        Callable[[Ocorrencia], bool] | None: O predicado, ou None se nenhum filtro restringe
+    """
+    if (regiao is None and status is None and severidade_minima <= 1 and severidade_maxima >= 5
+            and desde is None and ate is None):
+        return None
+    filtro_periodo = filtro_datas(desde, ate)
+
+    def filtro(ocorrencia) -> bool:
+        if regiao is not None and ocorrencia.regiao != regiao:
+            return False
+        if status is not None and ocorrencia.status != status:
+            return False
+        if not severidade_minima <= ocorrencia.severidade <= severidade_maxima:
+            return False
+        return filtro_periodo is None or filtro_periodo(ocorrencia)
+
+    return filtro
+
+
+def filtro_datas(desde: datetime | None = None, ate: datetime | None = None) -> Callable | None:
+    """
+    Cria um predicado que testa se uma ocorrência foi registrada no período [desde, ate).
+
+    Returns:
+        Callable[[Ocorrencia], bool] | None: O predicado, ou None se o período é ilimitado
+    """
+    if desde is None and ate is None:
+        return None
+    if ate is None:
+        return lambda ocorrencia: desde <= ocorrencia.data_registro
+    if desde is None:
+        return lambda ocorrencia: ocorrencia.data_registro < ate
+    return lambda ocorrencia: desde <= ocorrencia.data_registro < ate
@@ -0,0 +1,510 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Central Particionada
+
+Este módulo divide a central entre vários processos, um por grupo de regiões,
+para usar mais de um núcleo: cada partição é um processo com a sua própria
+CentralAtendimento (ocorrências, filas, índices e equipes das suas regiões),
+e um roteador na frente encaminha cada requisição do protocolo do servidor
+(ver servidor.py) à partição dona dela ou a todas, juntando as respostas.
+
+IDs globalmente únicos sem coordenação: com N partições, a partição i gera os
+IDs i+1, i+1+N, i+1+2N, ... (Ocorrencia.definir_sequencia_ids), de modo que a
+partição dona de um ID é (id - 1) % N.
+
+Uso:
+    python particionamento.py [--particoes N] [--grupos "Norte,Leste;Sul,Oeste"]
+                              [--host HOST] [--porta PORTA] [--dados DIRETORIO] [--deduplicar] [--metricas]
+"""
+
+import argparse
+import asyncio
+import heapq
+import multiprocessing
+import os
+import zlib
+
+from ocorrencia import Ocorrencia
+from persistencia import Persistencia
+from servidor import LIMITE_RESULTADOS, PORTA_PADRAO, ServidorCentral
+
+# Operações executadas por todas as partições, com as respostas combinadas
+OPERACOES_GLOBAIS = frozenset({
+    "despachar", "buscar_por_severidade", "listar", "relatorio_turno", "equipes_proximas",
+    "focos_proximos", "estatisticas", "metricas", "perfilar",
+})
+OPERACOES_POR_ID = frozenset({"concluir", "buscar", "incidente"})
+OPERACOES_POR_EQUIPE = frozenset({"atender", "historico_equipe"})
+# Operações que dependem do estado de um único processo e não são roteadas
+OPERACOES_NAO_PARTICIONADAS = frozenset({"assinar"})
+
+
+def _resposta_erro(requisicao: dict, erro: str) -> dict:
+    return {"id": requisicao.get("id"), "ok": False, "erro": erro}
+
+
+def _executar_particao(conexao, indice: int, total: int, dados: str | None, deduplicar: bool, metricas: bool):
+    """
+    Laço de uma partição (executado no processo filho).
+
+    Envia primeiro os nomes das equipes já cadastradas (ao reabrir uma central
+    persistida) e depois responde cada lista de requisições recebida com a
+    lista de respostas, até receber None ou a conexão ser fechada.
+    """
+    Ocorrencia.definir_sequencia_ids(indice + 1, total)
+    central = Persistencia.abrir(os.path.join(dados, f"particao-{indice}")) if dados is not None else None
+    servidor = ServidorCentral(central)
+    central = servidor.central
+    if deduplicar:
+        central.ativar_deduplicacao()
+    if metricas:
+        central.ativar_metricas()
+    conexao.send([equipe.nome for equipe in central.equipes])
+    try:
+        while True:
+            try:
+                requisicoes = conexao.recv()
+            except EOFError:
+                break
+            if requisicoes is None:
+                break
+            try:
+                respostas = servidor.executar(requisicoes)
+            except Exception as erro:  # Falha inesperada: a partição continua atendendo
+                respostas = [_resposta_erro(requisicao, f"Erro interno na partição {indice}: {erro}")
+                             for requisicao in requisicoes]
+            conexao.send(respostas)
+    finally:
+        if central.persistencia is not None:
+            central.persistencia.salvar_snapshot()
+            central.persistencia.fechar()
+        conexao.close()
+
+
+class CentralParticionada:
+    """
+    Roteador sobre N processos de partição, cada um com a sua CentralAtendimento.
+
+    Recebe as mesmas requisições do ServidorCentral e as encaminha:
+    - registrar e adicionar_equipe: à partição da região (da ocorrência ou da base da equipe);
+    - registrar_lote: dividido por região, com os resultados reunidos na ordem original;
+    - concluir, buscar e incidente: à partição dona do ID;
+    - atender e historico_equipe: à partição da equipe;
+    - despachar, buscas, listagens, relatórios e estatísticas: a todas as
+      partições, combinando as respostas (intercalação ordenada, somas).
+
+    Um bloco de requisições é dividido entre as partições e cada partição
+    executa a sua parte em ordem; as partes de partições diferentes são
+    executadas em paralelo. As regiões fora de `grupos` são distribuídas pelo
+    hash do nome. O despacho automático usa só as equipes da partição (uma
+    equipe não atende regiões de outra partição), e `limite` vale por partição.
+
+    Atributos:
+        total (int): Número de partições
+        particao_por_regiao (dict[str, int]): Partição de cada região dos grupos
+        _conexoes (list[Connection]): Conexão com cada partição
+        _processos (list[Process]): Processo de cada partição
+        _equipes (dict[str, int]): Partição de cada equipe cadastrada
+    """
+
+    def __init__(self, particoes: int | list[list[str]] = 2, dados: str | None = None,
+                 deduplicar: bool = False, metricas: bool = False):
+        """
+        Inicia os processos das partições.
+
+        Args:
+            particoes (int | list[list[str]]): Número de partições, ou os grupos de
+                regiões de cada partição (uma partição por grupo)
+            dados (str | None): Diretório de persistência; cada partição usa o
+                subdiretório particao-<i> (ver Persistencia); reabra com as mesmas partições
+            deduplicar (bool): Se True, cada partição ativa a deduplicação
+            metricas (bool): Se True, cada partição ativa as métricas
+
+        Raises:
+            ValueError: Se não houver pelo menos uma partição
+        """
+        grupos = [[]] * particoes if isinstance(particoes, int) else [list(grupo) for grupo in particoes]
+        if not grupos:
+            raise ValueError("É preciso pelo menos uma partição")
+        self.total = len(grupos)
+        self.particao_por_regiao = {regiao: indice for indice, grupo in enumerate(grupos) for regiao in grupo}
+        # spawn: um processo novo não herda threads nem travas do processo do roteador
+        contexto = multiprocessing.get_context("spawn")
+        self._conexoes = []
+        self._processos = []
+        for indice in range(self.total):
+            nossa, deles = contexto.Pipe()
+            processo = contexto.Process(
+                target=_executar_particao, args=(deles, indice, self.total, dados, deduplicar, metricas),
+                name=f"particao-{indice}", daemon=True,
+            )
+            processo.start()
+            deles.close()
+            self._conexoes.append(nossa)
+            self._processos.append(processo)
+        self._equipes: dict[str, int] = {}
+        for indice, conexao in enumerate(self._conexoes):
+            for nome in conexao.recv():
+                self._equipes[nome] = indice
+
+    def particao_da_regiao(self, regiao) -> int:
+        """Partição dona de uma região (pelo grupo ou, fora dos grupos, pelo hash do nome)."""
+        particao = self.particao_por_regiao.get(regiao)
+        if particao is not None:
+            return particao
+        if not isinstance(regiao, str):
+            return 0  # Requisição inválida: a partição 0 responde o erro
+        return zlib.crc32(regiao.encode()) % self.total
+
+    def particao_do_id(self, id_ocorrencia) -> int:
+        """Partição que gerou um ID (ver Ocorrencia.definir_sequencia_ids)."""
+        if not isinstance(id_ocorrencia, int) or id_ocorrencia < 1:
+            return 0
+        return (id_ocorrencia - 1) % self.total
+
+    def executar(self, requisicoes: list[dict]) -> list[dict]:
+        """
+        Executa um bloco de requisições nas partições e combina as respostas.
+
+        Args:
+            requisicoes (list[dict]): Requisições do protocolo do servidor
+
+        Returns:
+            list[dict]: Uma resposta por requisição, na mesma ordem
+        """
+        respostas: list[dict | None] = [None] * len(requisicoes)
+        blocos: list[list[dict]] = [[] for _ in range(self.total)]
+        destinos: list[list[tuple[int, int]]] = [[] for _ in requisicoes]  # (partição, posição no bloco)
+        combinar = {}  # posição -> função que combina as respostas das partições
+        for posicao, requisicao in enumerate(requisicoes):
+            roteamento = self._rotear(requisicao)
+            if isinstance(roteamento, str):
+                respostas[posicao] = _resposta_erro(requisicao, roteamento)
+                continue
+            partes, combinar[posicao] = roteamento
+            for particao, parte in partes:
+                destinos[posicao].append((particao, len(blocos[particao])))
+                blocos[particao].append(parte)
+        # Todas as partições recebem o seu bloco antes de o roteador esperar qualquer resposta
+        for particao, bloco in enumerate(blocos):
+            if bloco:
+                self._conexoes[particao].send(bloco)
+        respostas_por_particao = [
+            self._conexoes[particao].recv() if bloco else [] for particao, bloco in enumerate(blocos)
+        ]
+        for posicao, requisicao in enumerate(requisicoes):
+            if respostas[posicao] is not None:
+                continue
+            partes = [respostas_por_particao[particao][indice] for particao, indice in destinos[posicao]]
+            falhas = [parte for parte in partes if not parte["ok"]]
+            if falhas:
+                respostas[posicao] = {"id": requisicao.get("id"), "ok": False, "erro": falhas[0]["erro"]}
+                if requisicao.get("op") == "adicionar_equipe":
+                    self._equipes.pop(requisicao.get("nome"), None)  # Desfaz a reserva de _rotear
+                continue
+            resultado = combinar[posicao]([parte["resultado"] for parte in partes])
+            respostas[posicao] = {"id": requisicao.get("id"), "ok": True, "resultado": resultado}
+        return respostas
+
+    def executar_uma(self, op: str, **campos):
+        """
+        Executa uma única requisição e retorna o resultado.
+
+        Raises:
+            ValueError: Se a requisição falhar (com a mensagem de erro da partição)
+        """
+        resposta = self.executar([{"op": op, **campos}])[0]
+        if not resposta["ok"]:
+            raise ValueError(resposta["erro"])
+        return resposta["resultado"]
+
+    def fechar(self):
+        """Encerra as partições (cada uma salva o snapshot, se persistida) e espera os processos."""
+        for conexao in self._conexoes:
+            try:
+                conexao.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for processo in self._processos:
+            processo.join()
+        for conexao in self._conexoes:
+            conexao.close()
+        self._conexoes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def _rotear(self, requisicao: dict):
+        """
+        Decide quais partições executam uma requisição.
+
+        Returns:
+            tuple[list[tuple[int, dict]], Callable] | str: (partição, requisição) de
+                cada parte e a função que combina os resultados, ou a mensagem de
+                erro se a requisição for respondida pelo próprio roteador
+        """
+        op = requisicao.get("op")
+        unica = _primeira
+        if op == "registrar":
+            return [(self.particao_da_regiao(requisicao.get("regiao")), requisicao)], unica
+        if op == "registrar_lote":
+            return self._dividir_lote(requisicao)
+        if op == "adicionar_equipe":
+            nome = requisicao.get("nome")
+            if nome in self._equipes:
+                return f"Equipe já cadastrada: {nome!r}"
+            regiao = requisicao.get("regiao_base")
+            particao = self.particao_da_regiao(regiao if regiao is not None else nome)
+            if isinstance(nome, str):
+                self._equipes[nome] = particao  # Reservado já: o mesmo nome repetido no bloco é recusado
+            return [(particao, requisicao)], unica
+        if op in OPERACOES_POR_ID:
+            return [(self.particao_do_id(requisicao.get("ocorrencia")), requisicao)], unica
+        if op in OPERACOES_POR_EQUIPE:
+            if "equipe" not in requisicao:
+                return "Campo obrigatório ausente: 'equipe'"
+            particao = self._equipes.get(requisicao["equipe"])
+            if particao is None:
+                return f"Equipe não encontrada: {requisicao['equipe']!r}"
+            return [(particao, requisicao)], unica
+        if op == "listar":
+            return self._dividir_listagem(requisicao)
+        if op in OPERACOES_GLOBAIS:
+            return [(particao, requisicao) for particao in range(self.total)], self._combinador(op, requisicao)
+        if op in OPERACOES_NAO_PARTICIONADAS:
+            # Cada partição tem o seu barramento de eventos, em outro processo: não há fluxo único a transmitir
+            return f"Operação não suportada pela central particionada: {op!r}"
+        # Operação desconhecida: a partição 0 responde com o erro do protocolo
+        return [(0, requisicao)], unica
+
+    def _combinador(self, op: str, requisicao: dict):
+        """Função que combina as respostas das partições a uma operação global."""
+        if op == "despachar":
+            return lambda resultados: [par for resultado in resultados for par in resultado]
+        if op == "buscar_por_severidade":
+            limite = requisicao.get("limite", LIMITE_RESULTADOS)
+            return lambda resultados: _intercalar(
+                resultados, lambda ocorrencia: (ocorrencia["data_registro"], ocorrencia["id"]), limite
+            )
+        if op in ("equipes_proximas", "focos_proximos"):
+            limite = requisicao.get("k", 5 if op == "equipes_proximas" else 10)
+            return lambda resultados: _intercalar(resultados, lambda item: item["distancia_km"], limite)
+        if op == "relatorio_turno":
+            return _combinar_relatorios
+        if op == "estatisticas":
+            return _combinar_estatisticas
+        if op == "metricas":
+            return lambda resultados: {"particoes": resultados}
+        return _primeira
+
+    def _dividir_lote(self, requisicao: dict):
+        """Divide um registrar_lote por região e reúne os resultados na ordem do lote original."""
+        registros = requisicao.get("ocorrencias")
+        if not isinstance(registros, list):
+            return [(0, requisicao)], _primeira
+        posicoes_por_particao: dict[int, list[int]] = {}
+        for posicao, registro in enumerate(registros):
+            if isinstance(registro, dict):
+                regiao = registro.get("regiao")
+            elif isinstance(registro, (list, tuple)) and registro:
+                regiao = registro[0]
+            else:
+                regiao = None
+            posicoes_por_particao.setdefault(self.particao_da_regiao(regiao), []).append(posicao)
+        particoes = list(posicoes_por_particao)
+        partes = [
+            (particao, {**requisicao, "ocorrencias": [registros[posicao] for posicao in posicoes_por_particao[particao]]})
+            for particao in particoes
+        ]
+
+        def combinar(resultados):
+            id_por_posicao: dict[int, int] = {}
+            duplicadas: set[int] = set()
+            rejeicoes = []
+            for particao, resultado in zip(particoes, resultados):
+                posicoes = posicoes_por_particao[particao]
+                rejeitadas = set()
+                for linha, motivo in resultado["rejeicoes"]:
+                    rejeitadas.add(linha)
+                    rejeicoes.append((posicoes[linha - 1] + 1, motivo))
+                aceitas = [posicao for linha, posicao in enumerate(posicoes, 1) if linha not in rejeitadas]
+                duplicadas_particao = set(resultado["duplicadas"])
+                for indice, (posicao, id_ocorrencia) in enumerate(zip(aceitas, resultado["ids"])):
+                    id_por_posicao[posicao] = id_ocorrencia
+                    if indice in duplicadas_particao:
+                        duplicadas.add(posicao)
+            ordem = sorted(id_por_posicao)
+            return {
+                "ids": [id_por_posicao[posicao] for posicao in ordem],
+                "rejeicoes": sorted(rejeicoes),
+                "duplicadas": [indice for indice, posicao in enumerate(ordem) if posicao in duplicadas],
+            }
+
+        return partes, combinar
+
+    def _dividir_listagem(self, requisicao: dict):
+        """
+        Pede uma página a cada partição e intercala as páginas em uma só.
+
+        O cursor global é a lista dos cursores de cada partição: o ID da última
+        ocorrência da partição já entregue (null para começar do início, false
+        para uma partição esgotada), de modo que cada partição retoma a sua
+        própria consulta.
+        """
+        cursores = requisicao.get("cursor")
+        if cursores is None:
+            cursores = [None] * self.total
+        if not isinstance(cursores, list) or len(cursores) != self.total:
+            return "Cursor inválido para esta central particionada"
+        ativas = [particao for particao in range(self.total) if cursores[particao] is not False]
+        limite = requisicao.get("limite", LIMITE_RESULTADOS)
+        por_data = requisicao.get("desde") is not None or requisicao.get("ate") is not None
+        campo_data = requisicao.get("campo_data", "data_registro")
+        if por_data:
+            def chave(ocorrencia):
+                return ocorrencia[campo_data], ocorrencia["id"]
+        else:
+            def chave(ocorrencia):
+                return ocorrencia["id"]
+        partes = [(particao, {**requisicao, "cursor": cursores[particao]}) for particao in ativas]
+
+        def combinar(paginas):
+            fluxos = [
+                [(chave(ocorrencia), particao, ocorrencia) for ocorrencia in pagina["ocorrencias"]]
+                for particao, pagina in zip(ativas, paginas)
+            ]
+            intercaladas = list(heapq.merge(*fluxos, key=lambda item: item[0]))[:limite]
+            proximos = list(cursores)
+            entregues = dict.fromkeys(ativas, 0)
+            for _, particao, ocorrencia in intercaladas:
+                proximos[particao] = ocorrencia["id"]
+                entregues[particao] += 1
+            for particao, pagina in zip(ativas, paginas):
+                # Esgotada: a partição entregou a sua última página inteira
+                if pagina["cursor"] is None and entregues[particao] == len(pagina["ocorrencias"]):
+                    proximos[particao] = False
+            return {
+                "ocorrencias": [ocorrencia for _, _, ocorrencia in intercaladas],
+                "cursor": None if all(cursor is False for cursor in proximos) else proximos,
+            }
+
+        return partes, combinar
+
+
+def _primeira(resultados):
+    return resultados[0]
+
+
+def _intercalar(resultados, chave, limite=None) -> list:
+    """Intercala listas já ordenadas pela chave, truncando no limite."""
+    intercalados = list(heapq.merge(*resultados, key=chave))
+    return intercalados[:limite] if limite is not None else intercalados
+
+
+def _combinar_relatorios(relatorios: list[dict]) -> dict:
+    """Soma os relatórios de turno das partições (médias ponderadas pelas contagens)."""
+    combinado = dict(relatorios[0])
+    for campo in ("registradas", "atendidas", "resolvidas"):
+        combinado[campo] = sum(relatorio[campo] for relatorio in relatorios)
+    for campo, contagem in (("minutos_medios_ate_atendimento", "atendidas"),
+                            ("minutos_medios_ate_resolucao", "resolvidas")):
+        total = combinado[contagem]
+        combinado[campo] = (
+            sum(relatorio[campo] * relatorio[contagem] for relatorio in relatorios) / total if total else 0.0
+        )
+    for campo in ("registradas_por_severidade", "registradas_por_regiao"):
+        soma: dict[str, int] = {}
+        for relatorio in relatorios:
+            for chave, total in relatorio[campo].items():
+                soma[chave] = soma.get(chave, 0) + total
+        combinado[campo] = soma
+    return combinado
+
+
+def _combinar_estatisticas(estatisticas: list[dict]) -> dict:
+    """Soma as estatísticas das partições e guarda as de cada uma em "por_particao"."""
+    combinado: dict = {}
+    por_regiao: dict[str, int] = {}
+    for parte in estatisticas:
+        for chave, valor in parte.items():
+            if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+                combinado[chave] = combinado.get(chave, 0) + valor
+        por_regiao.update(parte.get("por_regiao", {}))
+    inseridas = combinado.get("inseridas", 0)
+    combinado["taxa_cancelamento"] = combinado.get("canceladas", 0) / inseridas if inseridas else 0.0
+    combinado["por_regiao"] = por_regiao
+    combinado["por_particao"] = estatisticas
+    return combinado
+
+
+class ServidorParticionado(ServidorCentral):
+    """
+    Servidor TCP de JSON por linha cuja central é uma CentralParticionada.
+
+    O protocolo é o mesmo do ServidorCentral; só o cursor de "listar" muda de
+    formato (ver CentralParticionada._dividir_listagem), e "assinar" é recusada.
+    """
+
+    def __init__(self, central: CentralParticionada, host="127.0.0.1", porta=PORTA_PADRAO):
+        """
+        Inicializa o servidor.
+
+        Args:
+            central (CentralParticionada): Roteador das partições
+            host (str): Endereço de escuta
+            porta (int): Porta de escuta
+        """
+        super().__init__(central, host, porta)
+
+    def executar(self, requisicoes: list[dict]) -> list[dict]:
+        return self.central.executar(requisicoes)
+
+
+async def servir(particoes, host="127.0.0.1", porta=PORTA_PADRAO, dados=None, deduplicar=False, metricas=False):
+    """
+    Executa o servidor particionado até ser interrompido.
+
+    Args:
+        particoes (int | list[list[str]]): Ver CentralParticionada
+        host (str): Endereço de escuta
+        porta (int): Porta de escuta
+        dados (str | None): Diretório de persistência das partições
+        deduplicar (bool): Se True, cada partição ativa a deduplicação
+        metricas (bool): Se True, cada partição ativa as métricas (operação "metricas")
+    """
+    with CentralParticionada(particoes, dados, deduplicar, metricas) as central:
+        servidor_particionado = ServidorParticionado(central, host, porta)
+        servidor = await servidor_particionado.iniciar()
+        print(f"🔥 Central com {central.total} partições escutando em "
+              f"{servidor_particionado.host}:{servidor_particionado.porta}", flush=True)
+        async with servidor:
+            await servidor.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de rede da central particionada por região")
+    parser.add_argument("--particoes", type=int, default=os.cpu_count() or 1, help="número de partições")
+    parser.add_argument("--grupos", default=None,
+                        help='regiões de cada partição, ex.: "Norte,Leste;Sul,Oeste,Centro" (substitui --particoes)')
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=PORTA_PADRAO)
+    parser.add_argument("--dados", default=None, help="diretório de persistência (opcional)")
+    parser.add_argument("--deduplicar", action="store_true", help="incorpora relatos duplicados às ocorrências originais")
+    parser.add_argument("--metricas", action="store_true", help="mede as operações de cada partição")
+    argumentos = parser.parse_args()
+    particoes = argumentos.particoes
+    if argumentos.grupos:
+        particoes = [[regiao.strip() for regiao in grupo.split(",") if regiao.strip()]
+                     for grupo in argumentos.grupos.split(";")]
+    try:
+        asyncio.run(servir(
+            particoes, argumentos.host, argumentos.porta, argumentos.dados, argumentos.deduplicar, argumentos.metricas,
+        ))
+    except KeyboardInterrupt:
+        print("👋 Encerrando o servidor...")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,469 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Persistência
+
+Este módulo implementa a durabilidade da CentralAtendimento: um diário de eventos
+somente-anexação (registro, atribuição, mudança de status) gravado em grupos com
+fsync, e snapshots binários compactos periódicos. Na inicialização, o snapshot
+é carregado e apenas a cauda do diário é reaplicada.
+"""
+
+import marshal
+import os
+import struct
+import time
+import zlib
+from array import array
+from math import isnan
+
+from armazenamento_colunar import SEM_COORDENADA, para_epoca, de_epoca
+from arquivo_morto import ArquivoMorto
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+
+ARQUIVO_DIARIO = "eventos.log"
+ARQUIVO_SNAPSHOT = "snapshot.bin"
+VERSAO_SNAPSHOT = 2
+VERSOES_SNAPSHOT_LIDAS = (1, 2)  # A versão 1 não tem coordenadas
+
+# Tipos de evento do diário (latitude e longitude podem faltar em diários antigos)
+EVENTO_EQUIPE = 0  # (tipo, seq, nome, regiao_base, latitude, longitude)
+EVENTO_REGISTRO = 1  # (tipo, seq, id, regiao, severidade, descricao, data_registro, latitude, longitude)
+EVENTO_STATUS = 2  # (tipo, seq, id, status, data_atendimento, data_resolucao, indice_equipe)
+EVENTO_SEVERIDADE = 3  # (tipo, seq, id, severidade)
+EVENTO_ARQUIVAMENTO = 4  # (tipo, seq, caminho do arquivo morto (ver _caminho_gravado), IDs arquivados como bytes de array("q"))
+
+CABECALHO = struct.Struct("<II")  # (tamanho, crc32) de cada registro do diário
+
+
+class DiarioEventos:
+    """
+    Diário de eventos somente-anexação com commit em grupo.
+
+    Os eventos são serializados (marshal) e acumulados em memória; o buffer é
+    gravado e sincronizado com fsync quando atinge `tamanho_grupo` eventos ou
+    quando se passaram `intervalo_sincronizacao` segundos desde a última
+    sincronização. Assim, o custo do fsync é dividido entre muitos eventos.
+    Eventos ainda no buffer são perdidos em uma queda; sincronizar() força a gravação.
+
+    Cada registro no arquivo é precedido por seu tamanho e CRC32, de modo que um
+    registro parcialmente gravado no fim do arquivo é detectado e descartado.
+
+    Atributos:
+        caminho (str): Caminho do arquivo do diário
+        tamanho_grupo (int): Eventos por grupo de gravação
+        intervalo_sincronizacao (float): Tempo máximo (s) entre sincronizações
+    """
+
+    def __init__(self, caminho, tamanho_grupo=1024, intervalo_sincronizacao=0.05, tamanho_valido=None):
+        """
+        Abre (ou cria) o diário para anexação.
+
+        Args:
+            caminho (str): Caminho do arquivo do diário
+            tamanho_grupo (int): Eventos por grupo de gravação
+            intervalo_sincronizacao (float): Tempo máximo (s) entre sincronizações
+            tamanho_valido (int | None): Bytes íntegros do diário, conforme a última leitura;
+                um registro incompleto após essa posição é removido antes de anexar
+        """
+        self.caminho = caminho
+        self.tamanho_grupo = tamanho_grupo
+        self.intervalo_sincronizacao = intervalo_sincronizacao
+        self._arquivo = open(caminho, "ab")
+        if tamanho_valido is not None and self._arquivo.tell() > tamanho_valido:
+            self._arquivo.truncate(tamanho_valido)
+        self._buffer = bytearray()
+        self._pendentes = 0
+        self._ultima_sincronizacao = time.monotonic()
+
+    def anexar(self, evento: tuple):
+        """
+        Anexa um evento ao diário.
+
+        Args:
+            evento (tuple): Evento composto apenas de tipos primitivos
+        """
+        dados = marshal.dumps(evento)
+        self._buffer += CABECALHO.pack(len(dados), zlib.crc32(dados))
+        self._buffer += dados
+        self._pendentes += 1
+        if (self._pendentes >= self.tamanho_grupo
+                or time.monotonic() - self._ultima_sincronizacao >= self.intervalo_sincronizacao):
+            self.sincronizar()
+
+    def sincronizar(self):
+        """Grava o buffer no arquivo e força a gravação em disco (fsync)."""
+        if self._buffer:
+            self._arquivo.write(self._buffer)
+            self._buffer.clear()
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+        self._pendentes = 0
+        self._ultima_sincronizacao = time.monotonic()
+
+    def truncar(self):
+        """Descarta todo o conteúdo do diário (após um snapshot que já o contém)."""
+        self._buffer.clear()
+        self._pendentes = 0
+        self._arquivo.truncate(0)
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+
+    def fechar(self):
+        """Sincroniza e fecha o diário."""
+        self.sincronizar()
+        self._arquivo.close()
+
+    @staticmethod
+    def ler(caminho):
+        """
+        Lê os eventos de um diário, parando no primeiro registro incompleto ou corrompido.
+
+        Args:
+            caminho (str): Caminho do arquivo do diário
+
+        Returns:
+            Iterator[tuple[tuple, int]]: Pares (evento, posição do fim do registro),
+                na ordem em que foram anexados
+        """
+        if not os.path.exists(caminho):
+            return
+        with open(caminho, "rb") as arquivo:
+            dados = arquivo.read()
+        posicao = 0
+        tamanho_cabecalho = CABECALHO.size
+        while posicao + tamanho_cabecalho <= len(dados):
+            tamanho, crc = CABECALHO.unpack_from(dados, posicao)
+            inicio = posicao + tamanho_cabecalho
+            registro = dados[inicio:inicio + tamanho]
+            if len(registro) < tamanho or zlib.crc32(registro) != crc:
+                return
+            posicao = inicio + tamanho
+            yield marshal.loads(registro), posicao
+
+
+class Persistencia:
+    """
+    Persistência de uma CentralAtendimento em um diretório.
+
+    Grava cada evento da central no DiarioEventos e, a cada `eventos_por_snapshot`
+    eventos, salva um snapshot completo e esvazia o diário. A recuperação
+    (Persistencia.abrir) carrega o snapshot, reaplica os eventos do diário com
+    número de sequência posterior ao do snapshot, restaura o contador de IDs e
+    reconstrói fila, índices e históricos das equipes.
+
+    Atributos:
+        diretorio (str): Diretório com o diário e o snapshot
+        diario (DiarioEventos): Diário de eventos
+        eventos_por_snapshot (int | None): Eventos entre snapshots automáticos (None desativa)
+        central (CentralAtendimento): Central persistida
+    """
+
+    def __init__(self, diretorio, central, sequencia=0, eventos_por_snapshot=1_000_000,
+                 tamanho_grupo=1024, intervalo_sincronizacao=0.05, tamanho_valido_diario=None):
+        """
+        Liga a persistência a uma central. Normalmente usada por Persistencia.abrir.
+
+        Args:
+            diretorio (str): Diretório com o diário e o snapshot
+            central (CentralAtendimento): Central persistida
+            sequencia (int): Último número de sequência já gravado
+            eventos_por_snapshot (int | None): Eventos entre snapshots automáticos
+            tamanho_grupo (int): Eventos por grupo de gravação do diário
+            intervalo_sincronizacao (float): Tempo máximo (s) entre sincronizações do diário
+            tamanho_valido_diario (int | None): Bytes íntegros do diário (ver DiarioEventos)
+        """
+        self.diretorio = diretorio
+        self.central = central
+        self.eventos_por_snapshot = eventos_por_snapshot
+        self._sequencia = sequencia
+        self._eventos_desde_snapshot = 0
+        self._indices_equipes = {equipe: indice for indice, equipe in enumerate(central.equipes)}
+        self.diario = DiarioEventos(
+            os.path.join(diretorio, ARQUIVO_DIARIO), tamanho_grupo, intervalo_sincronizacao, tamanho_valido_diario
+        )
+        central.persistencia = self
+
+    @classmethod
+    def abrir(cls, diretorio, armazenamento_colunar=False, politica=None,
+              classe_central=CentralAtendimento, **opcoes) -> CentralAtendimento:
+        """
+        Abre uma central persistida, recuperando o estado salvo no diretório.
+
+        Args:
+            diretorio (str): Diretório com o diário e o snapshot (criado se não existir)
+            armazenamento_colunar (bool): Repassado para CentralAtendimento
+            politica (PoliticaPrioridade | None): Repassada para CentralAtendimento
+            classe_central (type): Classe da central a criar (ex.: CentralConcorrente)
+            **opcoes: Opções de Persistencia (eventos_por_snapshot, tamanho_grupo, ...)
+
+        Returns:
+            CentralAtendimento: Central recuperada, com a persistência já ativa
+        """
+        os.makedirs(diretorio, exist_ok=True)
+        estado = _EstadoRecuperado.carregar(diretorio)
+        central = classe_central(armazenamento_colunar=armazenamento_colunar, politica=politica)
+        estado.aplicar(central)
+        cls(diretorio, central, sequencia=estado.sequencia, tamanho_valido_diario=estado.tamanho_diario, **opcoes)
+        return central
+
+    def registrar_equipe(self, equipe: Equipe):
+        """Grava a inclusão de uma equipe."""
+        self._indices_equipes[equipe] = len(self._indices_equipes)
+        self._anexar((
+            EVENTO_EQUIPE, self._proxima_sequencia(), equipe.nome, equipe.regiao_base,
+            equipe.latitude, equipe.longitude,
+        ))
+
+    def registrar_ocorrencias(self, ocorrencias):
+        """Grava o registro de novas ocorrências."""
+        for ocorrencia in ocorrencias:
+            self._anexar((
+                EVENTO_REGISTRO, self._proxima_sequencia(), ocorrencia.id, ocorrencia.regiao,
+                ocorrencia.severidade, ocorrencia.descricao, para_epoca(ocorrencia.data_registro),
+                ocorrencia.latitude, ocorrencia.longitude,
+            ))
+
+    def registrar_status(self, ocorrencia: Ocorrencia):
+        """Grava uma mudança de status (inclui a atribuição de equipe)."""
+        equipe = ocorrencia.equipe_atendimento
+        self._anexar((
+            EVENTO_STATUS, self._proxima_sequencia(), ocorrencia.id, ocorrencia.status,
+            para_epoca(ocorrencia.data_atendimento), para_epoca(ocorrencia.data_resolucao),
+            self._indices_equipes.get(equipe, -1) if equipe is not None else -1,
+        ))
+
+    def registrar_severidade(self, ocorrencia: Ocorrencia):
+        """Grava uma alteração de severidade."""
+        self._anexar((EVENTO_SEVERIDADE, self._proxima_sequencia(), ocorrencia.id, ocorrencia.severidade))
+
+    def registrar_arquivamento(self, caminho: str, ids):
+        """Grava a passagem de ocorrências resolvidas para o arquivo morto (já sincronizado)."""
+        self._anexar((
+            EVENTO_ARQUIVAMENTO, self._proxima_sequencia(), _caminho_gravado(self.diretorio, caminho),
+            array("q", ids).tobytes(),
+        ))
+
+    def salvar_snapshot(self):
+        """
+        Salva um snapshot completo da central e esvazia o diário.
+
+        O snapshot é gravado em um arquivo temporário, sincronizado e renomeado
+        atomicamente. Se houver uma queda antes do diário ser esvaziado, os
+        eventos já contidos no snapshot são ignorados pela sequência.
+        """
+        self.diario.sincronizar()
+        conteudo = _serializar_central(self.central, self._sequencia, self.diretorio)
+        caminho = os.path.join(self.diretorio, ARQUIVO_SNAPSHOT)
+        temporario = caminho + ".tmp"
+        with open(temporario, "wb") as arquivo:
+            marshal.dump(conteudo, arquivo)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, caminho)
+        self.diario.truncar()
+        self._eventos_desde_snapshot = 0
+
+    def fechar(self):
+        """Sincroniza e fecha o diário."""
+        self.diario.fechar()
+
+    def _proxima_sequencia(self) -> int:
+        self._sequencia += 1
+        return self._sequencia
+
+    def _anexar(self, evento: tuple):
+        self.diario.anexar(evento)
+        self._eventos_desde_snapshot += 1
+        if self.eventos_por_snapshot is not None and self._eventos_desde_snapshot >= self.eventos_por_snapshot:
+            self.salvar_snapshot()
+
+
+def _caminho_gravado(diretorio: str, caminho: str) -> str:
+    """
+    Caminho do arquivo morto como gravado no snapshot e no diário.
+
+    Relativo ao diretório de dados quando o arquivo está dentro dele (o
+    diretório pode ser movido inteiro) e absoluto caso contrário, para que a
+    recuperação não dependa do diretório de trabalho do processo.
+    """
+    absoluto = os.path.abspath(caminho)
+    try:
+        relativo = os.path.relpath(absoluto, os.path.abspath(diretorio))
+    except ValueError:  # Outra unidade de disco (Windows)
+        return absoluto
+    if relativo == os.pardir or relativo.startswith(os.pardir + os.sep):
+        return absoluto
+    return relativo
+
+
+def _caminho_lido(diretorio: str, caminho: str) -> str:
+    """Resolve um caminho gravado por _caminho_gravado (ou, em dados antigos, relativo ao diretório de trabalho)."""
+    resolvido = os.path.join(diretorio, caminho)
+    if not os.path.exists(resolvido) and os.path.exists(caminho):
+        return caminho
+    return resolvido
+
+
+def _serializar_central(central: CentralAtendimento, sequencia: int, diretorio: str) -> dict:
+    """Converte o estado da central em colunas de tipos primitivos para o snapshot."""
+    indices_equipes = {equipe: indice for indice, equipe in enumerate(central.equipes)}
+    ids, severidades, equipes = array("q"), array("b"), array("q")
+    datas_registro, datas_atendimento, datas_resolucao = array("q"), array("q"), array("q")
+    latitudes, longitudes = array("d"), array("d")
+    regioes, descricoes, status = [], [], []
+    for ocorrencia in central.ocorrencias.values():
+        ids.append(ocorrencia.id)
+        regioes.append(ocorrencia.regiao)
+        severidades.append(ocorrencia.severidade)
+        descricoes.append(ocorrencia.descricao)
+        status.append(ocorrencia.status)
+        datas_registro.append(para_epoca(ocorrencia.data_registro))
+        datas_atendimento.append(para_epoca(ocorrencia.data_atendimento))
+        datas_resolucao.append(para_epoca(ocorrencia.data_resolucao))
+        equipe = ocorrencia.equipe_atendimento
+        equipes.append(indices_equipes.get(equipe, -1) if equipe is not None else -1)
+        latitude = ocorrencia.latitude
+        latitudes.append(SEM_COORDENADA if latitude is None else latitude)
+        longitudes.append(SEM_COORDENADA if latitude is None else ocorrencia.longitude)
+    return {
+        "versao": VERSAO_SNAPSHOT,
+        "sequencia": sequencia,
+        "proximo_id": Ocorrencia._id_counter,
+        "arquivo_morto": _caminho_gravado(diretorio, central.arquivo.caminho) if central.arquivo is not None else None,
+        "equipes": [
+            (equipe.nome, equipe.regiao_base, equipe.latitude, equipe.longitude) for equipe in central.equipes
+        ],
+        "ids": ids.tobytes(),
+        "regioes": regioes,
+        "severidades": severidades.tobytes(),
+        "descricoes": descricoes,
+        "status": status,
+        "datas_registro": datas_registro.tobytes(),
+        "datas_atendimento": datas_atendimento.tobytes(),
+        "datas_resolucao": datas_resolucao.tobytes(),
+        "equipes_ocorrencias": equipes.tobytes(),
+        "latitudes": latitudes.tobytes(),
+        "longitudes": longitudes.tobytes(),
+    }
+
+
+def _equipes_ocorrencias(dados: bytes, total: int) -> array:
+    """Lê a coluna de equipes (array("q"); snapshots antigos usavam array("l"), de tamanho dependente da plataforma)."""
+    return array("q" if len(dados) == total * array("q").itemsize else "l", dados)
+
+
+def _coordenadas(dados: bytes | None, total: int) -> list[float | None]:
+    """Lê uma coluna de coordenadas do snapshot (NaN = ausente); snapshots antigos não a têm."""
+    if dados is None:
+        return [None] * total
+    return [None if isnan(valor) else valor for valor in array("d", dados)]
+
+
+class _EstadoRecuperado:
+    """
+    Estado intermediário da recuperação: equipes e ocorrências como listas de primitivos.
+
+    Cada ocorrência é uma lista [regiao, severidade, descricao, status, data_registro,
+    data_atendimento, data_resolucao, indice_equipe, latitude, longitude], com
+    datas em µs desde a época e coordenadas None quando ausentes.
+    """
+
+    def __init__(self):
+        self.sequencia = 0
+        self.tamanho_diario = 0
+        self.proximo_id = 1
+        self.arquivo_morto: str | None = None  # Caminho do arquivo morto da central, se houver
+        self.equipes: list[tuple[str, str | None, float | None, float | None]] = []
+        self.ocorrencias: dict[int, list] = {}
+
+    @classmethod
+    def carregar(cls, diretorio) -> "_EstadoRecuperado":
+        """Carrega o snapshot (se houver) e reaplica a cauda do diário."""
+        estado = cls()
+        caminho_snapshot = os.path.join(diretorio, ARQUIVO_SNAPSHOT)
+        if os.path.exists(caminho_snapshot):
+            with open(caminho_snapshot, "rb") as arquivo:
+                estado._carregar_snapshot(marshal.load(arquivo))
+        for evento, estado.tamanho_diario in DiarioEventos.ler(os.path.join(diretorio, ARQUIVO_DIARIO)):
+            if evento[1] > estado.sequencia:
+                estado._aplicar_evento(evento)
+        if estado.arquivo_morto is not None:
+            estado.arquivo_morto = _caminho_lido(diretorio, estado.arquivo_morto)
+        return estado
+
+    def _carregar_snapshot(self, conteudo: dict):
+        if conteudo["versao"] not in VERSOES_SNAPSHOT_LIDAS:
+            raise ValueError(f"Versão de snapshot não suportada: {conteudo['versao']}")
+        self.sequencia = conteudo["sequencia"]
+        self.proximo_id = conteudo["proximo_id"]
+        self.arquivo_morto = conteudo.get("arquivo_morto")
+        self.equipes = [(*equipe, None, None)[:4] for equipe in conteudo["equipes"]]
+        total = len(conteudo["ids"]) // array("q").itemsize
+        colunas = [
+            array("q", conteudo["ids"]),
+            conteudo["regioes"],
+            array("b", conteudo["severidades"]),
+            conteudo["descricoes"],
+            conteudo["status"],
+            array("q", conteudo["datas_registro"]),
+            array("q", conteudo["datas_atendimento"]),
+            array("q", conteudo["datas_resolucao"]),
+            _equipes_ocorrencias(conteudo["equipes_ocorrencias"], total),
+            _coordenadas(conteudo.get("latitudes"), total),
+            _coordenadas(conteudo.get("longitudes"), total),
+        ]
+        self.ocorrencias = {linha[0]: list(linha[1:]) for linha in zip(*colunas)}
+
+    def _aplicar_evento(self, evento: tuple):
+        tipo = evento[0]
+        self.sequencia = evento[1]
+        if tipo == EVENTO_REGISTRO:
+            _, _, id_ocorrencia, regiao, severidade, descricao, data_registro, *coordenadas = evento
+            latitude, longitude = coordenadas or (None, None)
+            self.ocorrencias[id_ocorrencia] = [
+                regiao, severidade, descricao, "pendente", data_registro, -1, -1, -1, latitude, longitude,
+            ]
+            self.proximo_id = max(self.proximo_id, id_ocorrencia + 1)
+        elif tipo == EVENTO_STATUS:
+            _, _, id_ocorrencia, status, data_atendimento, data_resolucao, indice_equipe = evento
+            registro = self.ocorrencias[id_ocorrencia]
+            registro[3:8] = [status, registro[4], data_atendimento, data_resolucao, indice_equipe]
+        elif tipo == EVENTO_SEVERIDADE:
+            _, _, id_ocorrencia, severidade = evento
+            self.ocorrencias[id_ocorrencia][1] = severidade
+        elif tipo == EVENTO_ARQUIVAMENTO:
+            _, _, self.arquivo_morto, ids = evento
+            for id_ocorrencia in array("q", ids):
+                self.ocorrencias.pop(id_ocorrencia, None)
+        elif tipo == EVENTO_EQUIPE:
+            _, _, nome, regiao_base, *coordenadas = evento
+            self.equipes.append((nome, regiao_base, *(coordenadas or (None, None))))
+
+    def aplicar(self, central: CentralAtendimento):
+        """
+        Reconstrói equipes, ocorrências, fila e índices na central (sem gravar eventos).
+
+        O arquivo morto, se houver, é ligado antes das ocorrências em memória,
+        para que os históricos das equipes comecem pelas arquivadas. Uma
+        ocorrência presente nos dois (queda entre gravar o bloco do arquivo e o
+        evento no diário) fica só no arquivo.
+        """
+        for nome, regiao_base, latitude, longitude in self.equipes:
+            central.adicionar_equipe(Equipe(nome, regiao_base, latitude=latitude, longitude=longitude))
+        if self.arquivo_morto is not None and os.path.exists(self.arquivo_morto):
+            arquivo = ArquivoMorto(self.arquivo_morto)
+            for id_ocorrencia in [id_ocorrencia for id_ocorrencia in self.ocorrencias if id_ocorrencia in arquivo]:
+                del self.ocorrencias[id_ocorrencia]
+            central.ativar_arquivo(arquivo)
+        equipes = central.equipes
+        central.restaurar_ocorrencias(
+            Ocorrencia.restaurar(
+                id_ocorrencia, regiao, severidade, descricao, status,
+                de_epoca(data_registro), de_epoca(data_atendimento), de_epoca(data_resolucao),
+                equipes[indice_equipe] if indice_equipe >= 0 else None, latitude, longitude,
+            )
+            for id_ocorrencia, (regiao, severidade, descricao, status, data_registro, data_atendimento,
+                                data_resolucao, indice_equipe, latitude, longitude) in sorted(self.ocorrencias.items())
+        )
+        Ocorrencia.definir_proximo_id(self.proximo_id)
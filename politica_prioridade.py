@@ -0,0 +1,83 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Políticas de Prioridade
+
+Este módulo implementa as políticas que definem a chave de ordenação das
+ocorrências na FilaPrioridade (menor chave = atendida primeiro).
+"""
+
+from abc import ABC, abstractmethod
+
+from ocorrencia import Ocorrencia
+
+
+class PoliticaPrioridade(ABC):
+    """
+    Política base de prioridade (abstrata: subclasses devem implementar chave).
+
+    Uma política transforma uma ocorrência em uma chave comparável; a fila atende
+    primeiro a menor chave. A chave deve terminar no ID da ocorrência, para que
+    nunca haja empate.
+
+    A chave só é recalculada quando a fila é avisada (FilaPrioridade.atualizar
+    ou FilaPrioridade.reavaliar). Por isso, políticas baseadas em tempo devem
+    preferir chaves cuja ordem relativa não mude enquanto as ocorrências esperam.
+    """
+
+    @abstractmethod
+    def chave(self, ocorrencia: Ocorrencia) -> tuple:
+        """
+        Calcula a chave de prioridade de uma ocorrência.
+
+        Args:
+            ocorrencia (Ocorrencia): Ocorrência a ser avaliada
+
+        Returns:
+            tuple: Chave de ordenação (menor = maior prioridade)
+        """
+
+
+class PoliticaSeveridade(PoliticaPrioridade):
+    """
+    Política padrão: maior severidade primeiro; em caso de empate, a mais antiga.
+    """
+
+    def chave(self, ocorrencia: Ocorrencia) -> tuple:
+        return (-ocorrencia.severidade, ocorrencia.data_registro, ocorrencia.id)
+
+
+class PoliticaEnvelhecimento(PoliticaPrioridade):
+    """
+    Política com envelhecimento: a prioridade cresce linearmente com a espera.
+
+    A prioridade no instante t é severidade + (t - data_registro) / segundos_por_nivel,
+    ou seja, cada `segundos_por_nivel` de espera vale um nível de severidade. Assim,
+    uma ocorrência de severidade 2 não fica esperando para sempre atrás de um fluxo
+    constante de ocorrências de severidade 3 ou mais.
+
+    Como todas as ocorrências na fila envelhecem à mesma taxa, a ordem entre elas
+    não depende de t: basta ordenar por data_registro / segundos_por_nivel - severidade.
+    Por isso nenhuma chave precisa ser recalculada a cada instante.
+
+    Atributos:
+        segundos_por_nivel (float): Tempo de espera equivalente a um nível de severidade
+    """
+
+    def __init__(self, segundos_por_nivel: float = 600.0):
+        """
+        Inicializa a política.
+
+        Args:
+            segundos_por_nivel (float): Tempo de espera equivalente a um nível de severidade
+
+        Raises:
+            ValueError: Se segundos_por_nivel não for positivo
+        """
+        if segundos_por_nivel <= 0:
+            raise ValueError("segundos_por_nivel deve ser positivo")
+        self.segundos_por_nivel = segundos_por_nivel
+
+    def chave(self, ocorrencia: Ocorrencia) -> tuple:
+        return (
+            ocorrencia.data_registro.timestamp() / self.segundos_por_nivel - ocorrencia.severidade,
+            ocorrencia.id,
+        )
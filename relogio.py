@@ -0,0 +1,82 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Relógio
+
+Este módulo define a fonte de tempo usada pelo sistema. Por padrão é o relógio
+do computador; um simulador pode trocá-lo por um RelogioSimulado para
+reproduzir ou acelerar o tempo (ex.: meses simulados em segundos).
+"""
+
+from datetime import datetime, timedelta
+
+
+class Relogio:
+    """Relógio real: devolve a data e hora atuais do sistema."""
+
+    def agora(self) -> datetime:
+        """
+        Retorna o instante atual.
+
+        Returns:
+            datetime: Data e hora atuais
+        """
+        return datetime.now()
+
+
+class RelogioSimulado(Relogio):
+    """
+    Relógio controlado manualmente, que só avança quando mandado.
+
+    Atributos:
+        instante (datetime): Instante simulado atual
+    """
+
+    def __init__(self, inicio: datetime | None = None):
+        """
+        Inicializa o relógio simulado.
+
+        Args:
+            inicio (datetime | None): Instante inicial (padrão: 01/01/2024 00:00)
+        """
+        self.instante = inicio if inicio is not None else datetime(2024, 1, 1)
+
+    def agora(self) -> datetime:
+        return self.instante
+
+    def avancar(self, segundos: float):
+        """Avança o relógio em `segundos`."""
+        self.instante += timedelta(seconds=segundos)
+
+    def avancar_para(self, instante: datetime):
+        """
+        Leva o relógio até `instante`.
+
+        Raises:
+            ValueError: Se `instante` for anterior ao instante atual
+        """
+        if instante < self.instante:
+            raise ValueError("O relógio simulado não pode voltar no tempo")
+        self.instante = instante
+
+
+_relogio: Relogio = Relogio()  # Relógio usado por agora()
+
+
+def agora() -> datetime:
+    """Retorna o instante atual segundo o relógio ativo."""
+    return _relogio.agora()
+
+
+def definir_relogio(relogio: Relogio) -> Relogio:
+    """
+    Troca o relógio ativo do sistema.
+
+    Args:
+        relogio (Relogio): Novo relógio (ex.: um RelogioSimulado)
+
+    Returns:
+        Relogio: O relógio anterior, para ser restaurado depois
+    """
+    global _relogio
+    anterior = _relogio
+    _relogio = relogio
+    return anterior
@@ -0,0 +1,255 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Execução de Roteiros
+
+Este módulo executa roteiros de operações contra uma CentralAtendimento, sem
+interação: reprodução de um dia de operações, testes de carga e simulados.
+
+Cada linha do roteiro é uma requisição JSON no mesmo formato do servidor (ver
+ServidorCentral) ou um comando de texto equivalente às opções do menu:
+
+    equipe NOME [REGIAO] [LATITUDE LONGITUDE]
+    registrar REGIAO SEVERIDADE DESCRICAO [LATITUDE LONGITUDE]
+    atender EQUIPE [REGIAO]
+    concluir ID
+    buscar ID
+    severidade SEVERIDADE
+    listar [LIMITE]
+    despachar [LIMITE]
+    relatorio [HORAS]
+    estatisticas
+    avancar SEGUNDOS
+
+Argumentos com espaços vão entre aspas ("Equipe Alfa"); linhas vazias e
+começadas por # são ignoradas. "avancar" (ou {"op": "avancar", "segundos": N})
+adianta o relógio simulado, quando o roteiro é executado com um.
+
+As requisições são executadas em blocos de operações consecutivas iguais (os
+registros de um bloco viram um único registrar_lote), sem exibir nada por
+operação; o resumo informa, por operação, quantas foram executadas, quantas
+falharam e o tempo gasto.
+"""
+
+import json
+import shlex
+import time
+from datetime import timedelta
+from typing import Iterable
+
+from central_atendimento import CentralAtendimento
+from relogio import RelogioSimulado, agora
+from servidor import ServidorCentral
+
+LOTE_ROTEIRO = 4096  # Máximo de operações consecutivas iguais executadas em um bloco
+
+
+def _coordenadas(argumentos: list[str]) -> dict:
+    """Latitude e longitude opcionais no fim dos argumentos de um comando."""
+    if not argumentos:
+        return {}
+    if len(argumentos) != 2:
+        raise ValueError("Informe as coordenadas como: LATITUDE LONGITUDE")
+    return {"latitude": float(argumentos[0]), "longitude": float(argumentos[1])}
+
+
+def _equipe(nome, regiao_base=None, *coordenadas):
+    return {"op": "adicionar_equipe", "nome": nome, "regiao_base": regiao_base, **_coordenadas(list(coordenadas))}
+
+
+def _registrar(regiao, severidade, descricao, *coordenadas):
+    return {
+        "op": "registrar", "regiao": regiao, "severidade": int(severidade), "descricao": descricao,
+        **_coordenadas(list(coordenadas)),
+    }
+
+
+def _atender(equipe, regiao=None):
+    return {"op": "atender", "equipe": equipe, "regiao": regiao}
+
+
+def _concluir(id_ocorrencia):
+    return {"op": "concluir", "ocorrencia": int(id_ocorrencia)}
+
+
+def _buscar(id_ocorrencia):
+    return {"op": "buscar", "ocorrencia": int(id_ocorrencia)}
+
+
+def _severidade(severidade):
+    return {"op": "buscar_por_severidade", "severidade": int(severidade)}
+
+
+def _listar(limite=None):
+    return {"op": "listar", **({"limite": int(limite)} if limite is not None else {})}
+
+
+def _despachar(limite=None):
+    return {"op": "despachar", "limite": int(limite) if limite is not None else None}
+
+
+def _relatorio(horas="8"):
+    fim = agora()
+    return {"op": "relatorio_turno", "desde": (fim - timedelta(hours=float(horas))).isoformat(), "ate": fim.isoformat()}
+
+
+def _estatisticas():
+    return {"op": "estatisticas"}
+
+
+def _avancar(segundos):
+    return {"op": "avancar", "segundos": float(segundos)}
+
+
+# Comandos de texto do roteiro e a requisição que cada um gera
+COMANDOS = {
+    "equipe": _equipe,
+    "registrar": _registrar,
+    "atender": _atender,
+    "concluir": _concluir,
+    "buscar": _buscar,
+    "severidade": _severidade,
+    "listar": _listar,
+    "despachar": _despachar,
+    "relatorio": _relatorio,
+    "estatisticas": _estatisticas,
+    "avancar": _avancar,
+}
+
+
+def ler_operacao(linha: str) -> dict | None:
+    """
+    Converte uma linha do roteiro em uma requisição.
+
+    Args:
+        linha (str): Requisição JSON ou comando de texto
+
+    Returns:
+        dict | None: A requisição, ou None para linhas vazias e comentários
+
+    Raises:
+        ValueError: Se a linha não for uma requisição ou um comando válido
+    """
+    linha = linha.strip()
+    if not linha or linha.startswith("#"):
+        return None
+    if linha.startswith("{"):
+        requisicao = json.loads(linha)
+        if not isinstance(requisicao, dict):
+            raise ValueError("a requisição deve ser um objeto JSON")
+        return requisicao
+    nome, *argumentos = shlex.split(linha)
+    comando = COMANDOS.get(nome)
+    if comando is None:
+        raise ValueError(f"Comando desconhecido: {nome!r}")
+    try:
+        return comando(*argumentos)
+    except TypeError:
+        raise ValueError(f"Número de argumentos inválido para {nome!r}") from None
+
+
+class ResumoRoteiro:
+    """
+    Resultado da execução de um roteiro.
+
+    Atributos:
+        operacoes (dict[str, list[int]]): [quantidade, erros, nanossegundos] por operação
+        erros (list[tuple[int, str]]): Pares (número da linha, motivo) das linhas que falharam
+        segundos (float): Duração total da execução
+    """
+
+    def __init__(self):
+        """Inicializa um resumo vazio."""
+        self.operacoes: dict[str, list[int]] = {}
+        self.erros: list[tuple[int, str]] = []
+        self.segundos = 0.0
+
+    def contabilizar(self, operacao: str, quantidade: int, erros: int, nanossegundos: int):
+        """Soma um bloco executado às estatísticas da operação."""
+        totais = self.operacoes.setdefault(operacao, [0, 0, 0])
+        totais[0] += quantidade
+        totais[1] += erros
+        totais[2] += nanossegundos
+
+    @property
+    def total(self) -> int:
+        """Número de operações executadas (inclusive as que falharam)."""
+        return sum(totais[0] for totais in self.operacoes.values())
+
+
+def executar_roteiro(linhas: Iterable[str], central: CentralAtendimento | None = None, verboso=False,
+                     relogio: RelogioSimulado | None = None) -> ResumoRoteiro:
+    """
+    Executa um roteiro de operações contra a central, o mais rápido possível.
+
+    Args:
+        linhas (Iterable[str]): Linhas do roteiro (ex.: um arquivo aberto), lidas sob demanda
+        central (CentralAtendimento | None): Central alvo (padrão: uma nova central)
+        verboso (bool): Se True, exibe a resposta de cada operação (como JSON, uma por linha)
+        relogio (RelogioSimulado | None): Relógio adiantado por "avancar" (deve ser o relógio em uso)
+
+    Returns:
+        ResumoRoteiro: Contagens, erros e tempos por operação
+    """
+    servidor = ServidorCentral(central)
+    resumo = ResumoRoteiro()
+    bloco: list[dict] = []
+    numeros: list[int] = []  # Linha de cada requisição do bloco
+
+    def executar_bloco():
+        if not bloco:
+            return
+        inicio = time.perf_counter_ns()
+        respostas = servidor.executar(bloco)
+        duracao = time.perf_counter_ns() - inicio
+        erros = 0
+        for numero, resposta in zip(numeros, respostas):
+            if not resposta["ok"]:
+                erros += 1
+                resumo.erros.append((numero, resposta["erro"]))
+            if verboso:
+                print(json.dumps({"linha": numero, **resposta}, ensure_ascii=False, default=str))
+        resumo.contabilizar(str(bloco[0].get("op")), len(bloco), erros, duracao)
+        bloco.clear()
+        numeros.clear()
+
+    inicio = time.perf_counter()
+    for numero, linha in enumerate(linhas, 1):
+        try:
+            requisicao = ler_operacao(linha)
+        except ValueError as erro:
+            resumo.erros.append((numero, str(erro)))
+            resumo.contabilizar("invalida", 1, 1, 0)
+            if verboso:
+                print(json.dumps({"linha": numero, "ok": False, "erro": str(erro)}, ensure_ascii=False))
+            continue
+        if requisicao is None:
+            continue
+        if requisicao.get("op") == "avancar":
+            executar_bloco()
+            _avancar_relogio(relogio, requisicao, numero, resumo)
+            continue
+        if bloco and (requisicao.get("op") != bloco[0].get("op") or len(bloco) >= LOTE_ROTEIRO):
+            executar_bloco()
+        requisicao.setdefault("id", numero)
+        bloco.append(requisicao)
+        numeros.append(numero)
+    executar_bloco()
+    resumo.segundos = time.perf_counter() - inicio
+    resumo.erros.sort()  # Erros de leitura são anotados antes dos do bloco em execução
+    return resumo
+
+
+def _avancar_relogio(relogio: RelogioSimulado | None, requisicao: dict, numero: int, resumo: ResumoRoteiro):
+    """Executa "avancar" no relógio simulado, contabilizando-o no resumo."""
+    motivo = None
+    if relogio is None:
+        motivo = "avancar requer um relógio simulado (ver --inicio)"
+    elif "segundos" not in requisicao:
+        motivo = "Campo obrigatório ausente: 'segundos'"
+    else:
+        try:
+            relogio.avancar(float(requisicao["segundos"]))
+        except (ValueError, TypeError) as erro:
+            motivo = str(erro)
+    if motivo is not None:
+        resumo.erros.append((numero, motivo))
+    resumo.contabilizar("avancar", 1, int(motivo is not None), 0)
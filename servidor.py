@@ -0,0 +1,547 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Servidor de Rede
+
+Este módulo implementa um servidor asyncio que expõe a CentralAtendimento por
+TCP, com um objeto JSON por linha, para que vários operadores usem a central ao
+mesmo tempo de terminais diferentes.
+
+Protocolo (uma requisição e uma resposta por linha, respostas na ordem das requisições):
+    -> {"id": 1, "op": "registrar", "regiao": "Norte", "severidade": 4, "descricao": "..."}
+    <- {"id": 1, "ok": true, "resultado": {"id": 17}}
+    <- {"id": 2, "ok": false, "erro": "Operação desconhecida: ..."}
+
+Operações: adicionar_equipe, registrar, registrar_lote, despachar, atender,
+concluir, buscar, buscar_por_severidade, listar, historico_equipe,
+relatorio_turno, equipes_proximas, focos_proximos, incidente, estatisticas,
+metricas, perfilar, assinar.
+
+Equipes e ocorrências aceitam "latitude" e "longitude" opcionais; as consultas
+por proximidade recebem "latitude", "longitude", "k" e "raio_km".
+
+Com --deduplicar, um relato duplicado de uma ocorrência ativa responde com o ID
+da ocorrência original e "duplicada": true (ver Deduplicador).
+
+Com --metricas, a operação "metricas" responde o instantâneo das métricas da
+central e de cada operação do servidor (ver Metricas); {"op": "perfilar",
+"ativo": true} liga o modo de perfil, e {"op": "metricas", "perfil": true}
+inclui a latência de cada chamada. Com --arquivo-metricas, o instantâneo também
+é gravado no arquivo a cada --intervalo-metricas segundos.
+
+Com --arquivar-apos (requer --dados), as ocorrências resolvidas há mais desses
+minutos vão para o arquivo morto (ver ArquivoMorto); buscas e listagens
+continuam encontrando-as, e "estatisticas" informa quantas estão arquivadas.
+
+Com --cache, os resultados de buscar_por_severidade e listar ficam em um cache
+LRU de até esse número de consultas, invalidado a cada escrita na central (ver
+CacheConsultas); "estatisticas" informa acertos e faltas.
+
+Com --eventos, {"op": "assinar", "desde": SEQ, "coalescer": true} transforma a
+conexão em um fluxo de eventos (ver BarramentoEventos): a resposta traz a
+sequência inicial, e cada mudança em ocorrências e equipes chega como uma
+linha {"seq": ..., "tipo": ..., "dados": ...}, sem consultas repetidas. Sem
+"desde", o fluxo começa pelos próximos eventos; com "desde", retoma depois
+dessa sequência. Um cliente que fica para trás além da retenção recebe
+{"ok": false, "erro": ..., "cursor": ...} e a conexão é encerrada (o cliente
+relê o estado e assina de novo).
+
+Listagens paginadas (listar, historico_equipe) aceitam "limite", "cursor" e os
+filtros "regiao", "status", "severidade_minima", "severidade_maxima", "desde" e
+"ate" (datas em ISO 8601; em listar, "campo_data" escolhe a data filtrada), e
+respondem {"ocorrencias": [...], "cursor": ...}; o cursor é repassado na
+requisição seguinte para obter a próxima página.
+
+Uso:
+    python servidor.py [--host HOST] [--porta PORTA] [--dados DIRETORIO] [--deduplicar]
+                       [--metricas] [--arquivo-metricas ARQUIVO] [--intervalo-metricas SEGUNDOS]
+                       [--arquivar-apos MINUTOS] [--cache CONSULTAS] [--eventos]
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+from apresentacao import evento_para_json, ocorrencia_para_json, pagina_para_json, relatorio_turno_para_json
+from barramento_eventos import AssinaturaAtrasada, Assinatura
+from cache_consultas import CacheConsultas
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from paginacao import filtro_ocorrencias
+from persistencia import Persistencia
+
+PORTA_PADRAO = 8765
+TAMANHO_LEITURA = 1 << 16
+LIMITE_RESULTADOS = 100  # Máximo padrão de ocorrências em respostas de listagem
+
+
+def _filtros(requisicao: dict) -> dict:
+    """Extrai os filtros de uma requisição de listagem, convertendo as datas ISO 8601."""
+    filtros = {
+        chave: requisicao[chave]
+        for chave in ("regiao", "status", "severidade_minima", "severidade_maxima")
+        if chave in requisicao
+    }
+    for chave in ("desde", "ate"):
+        if requisicao.get(chave) is not None:
+            filtros[chave] = datetime.fromisoformat(requisicao[chave])
+    return filtros
+
+
+class ServidorCentral:
+    """
+    Servidor TCP de JSON por linha sobre uma CentralAtendimento.
+
+    Todas as requisições são executadas na thread do laço de eventos, que é a
+    única a escrever na central; por isso uma CentralAtendimento comum basta.
+
+    Pipelining: o cliente pode enviar várias requisições sem esperar as
+    respostas. O servidor lê o que estiver disponível na conexão, executa as
+    requisições completas em ordem e devolve todas as respostas em uma única
+    escrita. Requisições "registrar" consecutivas em uma mesma leitura são
+    agrupadas em uma chamada a registrar_lote.
+
+    Atributos:
+        central (CentralAtendimento): Central atendida
+        host (str): Endereço de escuta
+        porta (int): Porta de escuta (0 escolhe uma porta livre)
+        _equipes_por_nome (dict[str, Equipe]): Equipes da central indexadas pelo nome
+        _assinatura (Assinatura | None): Assinatura criada pela última requisição "assinar",
+            ainda não transmitida pela conexão que a pediu
+    """
+
+    def __init__(self, central: CentralAtendimento | None = None, host="127.0.0.1", porta=PORTA_PADRAO):
+        """
+        Inicializa o servidor.
+
+        Args:
+            central (CentralAtendimento | None): Central atendida (padrão: uma nova central)
+            host (str): Endereço de escuta
+            porta (int): Porta de escuta
+        """
+        self.central = central if central is not None else CentralAtendimento()
+        self.host = host
+        self.porta = porta
+        self._equipes_por_nome: dict[str, Equipe] = {}
+        self._assinatura: Assinatura | None = None
+        self._operacoes = {
+            "adicionar_equipe": self._adicionar_equipe,
+            "registrar": self._registrar,
+            "registrar_lote": self._registrar_lote,
+            "despachar": self._despachar,
+            "atender": self._atender,
+            "concluir": self._concluir,
+            "buscar": self._buscar,
+            "buscar_por_severidade": self._buscar_por_severidade,
+            "listar": self._listar,
+            "historico_equipe": self._historico_equipe,
+            "relatorio_turno": self._relatorio_turno,
+            "equipes_proximas": self._equipes_proximas,
+            "focos_proximos": self._focos_proximos,
+            "incidente": self._incidente,
+            "estatisticas": self._estatisticas,
+            "metricas": self._metricas,
+            "perfilar": self._perfilar,
+            "assinar": self._assinar,
+        }
+
+    async def iniciar(self) -> asyncio.AbstractServer:
+        """
+        Começa a aceitar conexões.
+
+        Returns:
+            asyncio.AbstractServer: Servidor asyncio; `self.porta` passa a ter a porta real
+        """
+        servidor = await asyncio.start_server(self._atender_conexao, self.host, self.porta)
+        self.porta = servidor.sockets[0].getsockname()[1]
+        return servidor
+
+    async def _atender_conexao(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """Lê blocos da conexão, processa as linhas completas e responde em ordem."""
+        pendente = b""
+        try:
+            while True:
+                bloco = await leitor.read(TAMANHO_LEITURA)
+                if not bloco:
+                    break
+                linhas = (pendente + bloco).split(b"\n")
+                pendente = linhas.pop()
+                if not linhas:
+                    continue
+                respostas = self.processar(linhas)
+                escritor.write(b"".join(json.dumps(resposta, ensure_ascii=False).encode() + b"\n" for resposta in respostas))
+                await escritor.drain()
+                if self._assinatura is not None:
+                    # processar não cede o laço: a assinatura é desta conexão
+                    assinatura, self._assinatura = self._assinatura, None
+                    await self._transmitir(assinatura, leitor, escritor)
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def _transmitir(self, assinatura: Assinatura, leitor: asyncio.StreamReader,
+                          escritor: asyncio.StreamWriter):
+        """
+        Envia os eventos da assinatura até o cliente desconectar ou ficar atrasado demais.
+
+        Cada lote é escrito de uma vez e o próximo só é lido depois que o
+        cliente o consome (drain): um cliente lento recebe lotes maiores, e os
+        eventos acumulados ficam no barramento, não na memória da conexão.
+        Um erro inesperado na transmissão é enviado ao cliente como a última
+        linha, e a conexão é encerrada.
+        """
+        transmissao = asyncio.current_task()
+
+        async def aguardar_desconexao():
+            try:
+                while await leitor.read(TAMANHO_LEITURA):
+                    pass  # Requisições depois de assinar são ignoradas
+            except ConnectionError:
+                pass
+            transmissao.cancel()
+
+        vigia = asyncio.create_task(aguardar_desconexao())
+        try:
+            async for lote in assinatura:
+                escritor.write(b"".join(
+                    json.dumps(evento_para_json(evento), ensure_ascii=False).encode() + b"\n" for evento in lote
+                ))
+                await escritor.drain()
+        except AssinaturaAtrasada as erro:
+            escritor.write(json.dumps(
+                {"ok": False, "erro": str(erro), "cursor": erro.cursor}, ensure_ascii=False
+            ).encode() + b"\n")
+        except asyncio.CancelledError:
+            if not vigia.done():
+                raise
+        except ConnectionError:
+            pass
+        except Exception as erro:
+            escritor.write(json.dumps(
+                {"ok": False, "erro": f"Transmissão interrompida: {erro}"}, ensure_ascii=False
+            ).encode() + b"\n")
+        finally:
+            vigia.cancel()
+            assinatura.cancelar()
+
+    def processar(self, linhas) -> list[dict]:
+        """
+        Executa um bloco de requisições na ordem recebida.
+
+        Args:
+            linhas (list[bytes | str]): Requisições JSON, uma por linha
+
+        Returns:
+            list[dict]: Uma resposta por linha não vazia, na mesma ordem
+        """
+        respostas: list[dict] = []
+        requisicoes: list[dict] = []  # Requisições válidas ainda não executadas
+        for linha in linhas:
+            if not linha.strip():
+                continue
+            try:
+                requisicao = json.loads(linha)
+                if not isinstance(requisicao, dict):
+                    raise ValueError("a requisição deve ser um objeto JSON")
+            except ValueError as erro:
+                # Mantém a ordem: as requisições anteriores respondem antes do erro
+                respostas.extend(self.executar(requisicoes))
+                requisicoes = []
+                respostas.append({"id": None, "ok": False, "erro": f"JSON inválido: {erro}"})
+                continue
+            requisicoes.append(requisicao)
+        respostas.extend(self.executar(requisicoes))
+        return respostas
+
+    def executar(self, requisicoes: list[dict]) -> list[dict]:
+        """
+        Executa requisições já decodificadas, na ordem recebida.
+
+        Args:
+            requisicoes (list[dict]): Requisições (objetos JSON decodificados)
+
+        Returns:
+            list[dict]: Uma resposta por requisição, na mesma ordem
+        """
+        respostas: list[dict] = []
+        registros: list[tuple[dict, dict]] = []  # (requisição, resposta) de "registrar" ainda não executados
+        for requisicao in requisicoes:
+            resposta = {"id": requisicao.get("id")}
+            respostas.append(resposta)
+            if requisicao.get("op") == "registrar":
+                registros.append((requisicao, resposta))
+                continue
+            # Mantém a ordem: registros acumulados são executados antes da próxima operação
+            self._registrar_agrupados(registros)
+            registros = []
+            self._executar(requisicao, resposta)
+        self._registrar_agrupados(registros)
+        return respostas
+
+    def _executar(self, requisicao: dict, resposta: dict):
+        """Executa uma requisição e preenche a resposta com o resultado ou o erro."""
+        operacao = self._operacoes.get(requisicao.get("op"))
+        if operacao is None:
+            resposta.update(ok=False, erro=f"Operação desconhecida: {requisicao.get('op')!r}")
+            return
+        metricas = self.central.metricas
+        medicao = metricas.operacao(f"servidor.{requisicao['op']}") if metricas is not None else None
+        inicio = medicao.iniciar() if medicao is not None else 0
+        try:
+            resposta.update(ok=True, resultado=operacao(requisicao))
+        except KeyError as erro:
+            resposta.update(ok=False, erro=f"Campo obrigatório ausente: {erro.args[0]!r}")
+        except (ValueError, TypeError) as erro:
+            resposta.update(ok=False, erro=str(erro))
+        if inicio:
+            medicao.concluir(inicio)
+
+    def _registrar_agrupados(self, registros: list[tuple[dict, dict]]):
+        """
+        Registra várias requisições "registrar" com uma única chamada a registrar_lote.
+
+        Registros inválidos viram respostas de erro individuais; se o lote todo
+        falhar (nada é registrado), todas as respostas recebem o erro.
+        """
+        if not registros:
+            return
+        try:
+            resultado = self.central.registrar_lote(
+                {chave: requisicao.get(chave) for chave in ("regiao", "severidade", "descricao", "latitude", "longitude")}
+                for requisicao, _ in registros
+            )
+        except (ValueError, TypeError) as erro:
+            for _, resposta in registros:
+                resposta.update(ok=False, erro=str(erro))
+            return
+        rejeicoes = dict(resultado.rejeicoes)
+        duplicadas = set(resultado.duplicadas)
+        posicao = 0
+        for linha, (_, resposta) in enumerate(registros, 1):
+            if linha in rejeicoes:
+                resposta.update(ok=False, erro=rejeicoes[linha])
+                continue
+            resposta.update(ok=True, resultado={"id": resultado.aceitas[posicao].id})
+            if posicao in duplicadas:
+                resposta["resultado"]["duplicada"] = True
+            posicao += 1
+
+    def _equipe(self, nome: str) -> Equipe:
+        """Localiza uma equipe da central pelo nome (ValueError se não existir)."""
+        if len(self._equipes_por_nome) != len(self.central.equipes):
+            self._equipes_por_nome = {equipe.nome: equipe for equipe in self.central.equipes}
+        equipe = self._equipes_por_nome.get(nome)
+        if equipe is None:
+            raise ValueError(f"Equipe não encontrada: {nome!r}")
+        return equipe
+
+    def _adicionar_equipe(self, requisicao: dict):
+        nome = requisicao["nome"]
+        try:
+            self._equipe(nome)
+        except ValueError:
+            pass
+        else:
+            raise ValueError(f"Equipe já cadastrada: {nome!r}")
+        self.central.adicionar_equipe(Equipe(
+            nome, requisicao.get("regiao_base"),
+            latitude=requisicao.get("latitude"), longitude=requisicao.get("longitude"),
+        ))
+        return {"nome": nome}
+
+    def _registrar(self, requisicao: dict):
+        resposta: dict = {}
+        self._registrar_agrupados([(requisicao, resposta)])
+        if not resposta["ok"]:
+            raise ValueError(resposta["erro"])
+        return resposta["resultado"]
+
+    def _registrar_lote(self, requisicao: dict):
+        resultado = self.central.registrar_lote(requisicao["ocorrencias"])
+        return {
+            "ids": [ocorrencia.id for ocorrencia in resultado.aceitas],
+            "rejeicoes": resultado.rejeicoes,
+            "duplicadas": resultado.duplicadas,
+        }
+
+    def _despachar(self, requisicao: dict):
+        pares = self.central.despachar(requisicao.get("limite"))
+        return [{"ocorrencia": ocorrencia.id, "equipe": equipe.nome} for ocorrencia, equipe in pares]
+
+    def _atender(self, requisicao: dict):
+        ocorrencia = self.central.atender_e_atribuir(self._equipe(requisicao["equipe"]), requisicao.get("regiao"))
+        return ocorrencia_para_json(ocorrencia) if ocorrencia is not None else None
+
+    def _concluir(self, requisicao: dict):
+        return self.central.concluir(requisicao["ocorrencia"])
+
+    def _buscar(self, requisicao: dict):
+        ocorrencia = self.central.buscar_ocorrencia(requisicao["ocorrencia"])
+        return ocorrencia_para_json(ocorrencia) if ocorrencia is not None else None
+
+    def _buscar_por_severidade(self, requisicao: dict):
+        severidade = requisicao["severidade"]
+        if not isinstance(severidade, int) or not 1 <= severidade <= 5:
+            raise ValueError("Severidade deve ser um número inteiro entre 1 e 5")
+        limite = requisicao.get("limite", LIMITE_RESULTADOS)
+        ocorrencias = self.central.buscar_por_severidade(severidade)
+        return [ocorrencia_para_json(ocorrencia) for ocorrencia in ocorrencias[:limite]]
+
+    def _listar(self, requisicao: dict):
+        pagina = self.central.paginar_ocorrencias(
+            requisicao.get("limite", LIMITE_RESULTADOS), requisicao.get("cursor"),
+            campo_data=requisicao.get("campo_data", "data_registro"), **_filtros(requisicao),
+        )
+        return pagina_para_json(pagina)
+
+    def _historico_equipe(self, requisicao: dict):
+        historico = self._equipe(requisicao["equipe"]).historico_ocorrencias_registradas
+        pagina = historico.paginar(
+            requisicao.get("limite", LIMITE_RESULTADOS), requisicao.get("cursor"),
+            filtro_ocorrencias(**_filtros(requisicao)),
+        )
+        return pagina_para_json(pagina)
+
+    def _relatorio_turno(self, requisicao: dict):
+        relatorio = self.central.relatorio_turno(
+            datetime.fromisoformat(requisicao["desde"]), datetime.fromisoformat(requisicao["ate"])
+        )
+        return relatorio_turno_para_json(relatorio)
+
+    def _equipes_proximas(self, requisicao: dict):
+        pares = self.central.equipes_proximas(
+            requisicao["latitude"], requisicao["longitude"], requisicao.get("k", 5), requisicao.get("raio_km")
+        )
+        return [{"equipe": equipe.nome, "distancia_km": distancia} for distancia, equipe in pares]
+
+    def _focos_proximos(self, requisicao: dict):
+        pares = self.central.focos_proximos(
+            requisicao["latitude"], requisicao["longitude"], requisicao.get("k", 10), requisicao.get("raio_km")
+        )
+        return [{**ocorrencia_para_json(ocorrencia), "distancia_km": distancia} for distancia, ocorrencia in pares]
+
+    def _incidente(self, requisicao: dict):
+        return [ocorrencia_para_json(ocorrencia) for ocorrencia in self.central.incidente(requisicao["ocorrencia"])]
+
+    def _estatisticas(self, requisicao: dict):
+        estatisticas = self.central.fila_prioridade.estatisticas()
+        estatisticas["ocorrencias"] = len(self.central.ocorrencias)
+        estatisticas["equipes_livres"] = self.central.despacho.equipes_livres()
+        if self.central.arquivo is not None:
+            estatisticas["arquivadas"] = len(self.central.arquivo)
+        if self.central.deduplicador is not None:
+            estatisticas["deduplicacao"] = self.central.deduplicador.estatisticas()
+        if self.central.cache is not None:
+            estatisticas["cache"] = self.central.cache.estatisticas()
+        if self.central.eventos is not None:
+            estatisticas["eventos"] = self.central.eventos.estatisticas()
+        return estatisticas
+
+    def _assinar(self, requisicao: dict):
+        if self.central.eventos is None:
+            raise ValueError("Eventos não ativados (inicie o servidor com --eventos)")
+        if self._assinatura is not None:
+            self._assinatura.cancelar()  # Um segundo "assinar" no mesmo bloco substitui o primeiro
+        self._assinatura = self.central.eventos.assinar(
+            requisicao.get("desde"), bool(requisicao.get("coalescer")), requisicao.get("maximo")
+        )
+        return {"seq": self._assinatura.cursor}
+
+    def _metricas_ativas(self):
+        """Métricas da central (ValueError se não estiverem ativadas)."""
+        if self.central.metricas is None:
+            raise ValueError("Métricas não ativadas (inicie o servidor com --metricas)")
+        return self.central.metricas
+
+    def _metricas(self, requisicao: dict):
+        metricas = self._metricas_ativas()
+        instantaneo = metricas.instantaneo()
+        if requisicao.get("perfil"):
+            instantaneo["perfil"] = metricas.perfil()
+        return instantaneo
+
+    def _perfilar(self, requisicao: dict):
+        metricas = self._metricas_ativas()
+        metricas.perfilar(bool(requisicao.get("ativo", True)))
+        return {"perfilando": metricas.perfilando}
+
+
+async def servir(host="127.0.0.1", porta=PORTA_PADRAO, dados=None, deduplicar=False,
+                 metricas=False, arquivo_metricas=None, intervalo_metricas=10.0, arquivar_apos=None,
+                 cache=None, eventos=False):
+    """
+    Executa o servidor até ser interrompido.
+
+    Args:
+        host (str): Endereço de escuta
+        porta (int): Porta de escuta
+        dados (str | None): Diretório de persistência (ver Persistencia), ou None para manter só em memória
+        deduplicar (bool): Se True, incorpora relatos duplicados às ocorrências originais
+        metricas (bool): Se True, mede as operações da central e do servidor
+        arquivo_metricas (str | None): Se dado, grava as métricas neste arquivo JSON periodicamente
+            (implica metricas=True)
+        intervalo_metricas (float): Segundos entre gravações do arquivo de métricas
+        arquivar_apos (float | None): Minutos desde a resolução para mover as ocorrências
+            para o arquivo morto no diretório de persistência (requer `dados`)
+        cache (int | None): Se dado, guarda os resultados de até este número de consultas (ver CacheConsultas)
+        eventos (bool): Se True, publica as mudanças para a operação "assinar" (ver BarramentoEventos)
+    """
+    central = None
+    if dados is not None:
+        central = Persistencia.abrir(dados)
+    servidor_central = ServidorCentral(central, host, porta)
+    if deduplicar:
+        servidor_central.central.ativar_deduplicacao()
+    if arquivar_apos is not None:
+        servidor_central.central.ativar_arquivo(idade=timedelta(minutes=arquivar_apos))
+    if cache is not None:
+        servidor_central.central.ativar_cache(CacheConsultas(cache))
+    if eventos:
+        servidor_central.central.ativar_eventos()
+    if metricas or arquivo_metricas is not None:
+        servidor_central.central.ativar_metricas()
+        if arquivo_metricas is not None:
+            servidor_central.central.metricas.iniciar_despejo(arquivo_metricas, intervalo_metricas)
+    servidor = await servidor_central.iniciar()
+    print(f"🔥 Central escutando em {servidor_central.host}:{servidor_central.porta}", flush=True)
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        if servidor_central.central.metricas is not None:
+            servidor_central.central.metricas.parar_despejo()
+        if servidor_central.central.persistencia is not None:
+            servidor_central.central.persistencia.salvar_snapshot()
+            servidor_central.central.persistencia.fechar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de rede da central de atendimento")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=PORTA_PADRAO)
+    parser.add_argument("--dados", default=None, help="diretório de persistência (opcional)")
+    parser.add_argument("--deduplicar", action="store_true", help="incorpora relatos duplicados às ocorrências originais")
+    parser.add_argument("--metricas", action="store_true", help="mede as operações (operação \"metricas\")")
+    parser.add_argument("--arquivo-metricas", default=None, help="grava as métricas neste arquivo JSON periodicamente")
+    parser.add_argument("--intervalo-metricas", type=float, default=10.0, help="segundos entre gravações das métricas")
+    parser.add_argument("--arquivar-apos", type=float, default=None,
+                        help="minutos desde a resolução para mover ocorrências ao arquivo morto (requer --dados)")
+    parser.add_argument("--cache", type=int, default=None,
+                        help="guarda os resultados de até este número de consultas entre escritas")
+    parser.add_argument("--eventos", action="store_true", help="publica as mudanças para assinantes (operação \"assinar\")")
+    argumentos = parser.parse_args()
+    if argumentos.arquivar_apos is not None and argumentos.dados is None:
+        parser.error("--arquivar-apos requer --dados")
+    try:
+        asyncio.run(servir(
+            argumentos.host, argumentos.porta, argumentos.dados, argumentos.deduplicar,
+            argumentos.metricas, argumentos.arquivo_metricas, argumentos.intervalo_metricas,
+            argumentos.arquivar_apos, argumentos.cache, argumentos.eventos,
+        ))
+    except KeyboardInterrupt:
+        print("👋 Encerrando o servidor...")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Sistema de Gerenciamento de Ocorrências de Queimadas - Simulador de Eventos Discretos
+
+Este módulo simula a operação da central ao longo de dias ou meses em poucos
+segundos: focos de incêndio chegam segundo um processo de Poisson, a central
+os prioriza e despacha, e as equipes se deslocam, combatem o foco e voltam à
+base. O tempo é controlado por um RelogioSimulado, de modo que as datas das
+ocorrências seguem o tempo simulado.
+
+Ao final são calculados o tempo de espera na fila, o tempo de resposta e a
+utilização das equipes, permitindo comparar políticas de prioridade.
+
+Uso:
+    python simulador.py [dias] [chegadas_por_hora] [semente]
+"""
+
+import heapq
+import random
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta
+
+from central_atendimento import CentralAtendimento
+from equipe import Equipe
+from ocorrencia import Ocorrencia
+from politica_prioridade import PoliticaEnvelhecimento, PoliticaPrioridade, PoliticaSeveridade
+from relogio import RelogioSimulado, definir_relogio
+
+# Tipos de evento (ordem de desempate entre eventos no mesmo instante)
+EVENTO_RETORNO = 0  # Equipe volta à base e fica livre
+EVENTO_CONCLUSAO = 1  # Equipe termina o combate ao foco
+EVENTO_NO_LOCAL = 2  # Equipe chega ao local do foco
+EVENTO_CHEGADA = 3  # Novo foco é reportado à central
+
+
+class ConfiguracaoSimulacao:
+    """
+    Parâmetros de uma simulação.
+
+    Atributos:
+        dias (float): Duração do período de chegadas, em dias simulados
+        chegadas_por_hora (float): Taxa média de novos focos (processo de Poisson)
+        pesos_severidade (dict[int, float]): Peso relativo de cada severidade (1-5)
+        pesos_regiao (dict[str, float]): Peso relativo de cada região
+        equipes_por_regiao (dict[str, int]): Número de equipes sediadas em cada região
+        minutos_servico (dict[int, float]): Tempo médio de combate por severidade (exponencial)
+        minutos_deslocamento_local (float): Deslocamento dentro da própria região
+        minutos_por_custo (float): Minutos por unidade de custo entre regiões (ver MotorDespacho)
+        custos (dict[tuple[str, str], float]): Custos de deslocamento entre regiões
+        inicio (datetime): Instante simulado inicial
+    """
+
+    def __init__(self, dias=90.0, chegadas_por_hora=4.0, pesos_severidade=None, pesos_regiao=None,
+                 equipes_por_regiao=None, minutos_servico=None, minutos_deslocamento_local=15.0,
+                 minutos_por_custo=30.0, custos=None, inicio=None):
+        self.dias = dias
+        self.chegadas_por_hora = chegadas_por_hora
+        self.pesos_severidade = pesos_severidade or {1: 0.30, 2: 0.25, 3: 0.20, 4: 0.15, 5: 0.10}
+        self.pesos_regiao = pesos_regiao or {"Norte": 0.30, "Sul": 0.15, "Leste": 0.20, "Oeste": 0.20, "Centro": 0.15}
+        self.equipes_por_regiao = equipes_por_regiao or {regiao: 3 for regiao in self.pesos_regiao}
+        self.minutos_servico = minutos_servico or {1: 30.0, 2: 60.0, 3: 120.0, 4: 240.0, 5: 480.0}
+        self.minutos_deslocamento_local = minutos_deslocamento_local
+        self.minutos_por_custo = minutos_por_custo
+        self.custos = custos or {}
+        self.inicio = inicio or datetime(2024, 1, 1)
+
+
+def percentil(valores_ordenados, fracao: float) -> float:
+    """Retorna o percentil (0 < fracao <= 1) de uma sequência já ordenada."""
+    if not valores_ordenados:
+        return 0.0
+    return valores_ordenados[min(len(valores_ordenados) - 1, int(fracao * len(valores_ordenados)))]
+
+
+class Simulador:
+    """
+    Motor de simulação de eventos discretos sobre uma CentralAtendimento.
+
+    Os eventos ficam em um heap ordenado por (instante, tipo, sequência). A cada
+    evento o relógio simulado avança até o instante do evento e, em seguida, a
+    central despacha as ocorrências pendentes para as equipes livres.
+
+    As chegadas e os tempos de combate vêm de um gerador com a semente dada e
+    são sorteados na chegada de cada foco, de modo que políticas diferentes
+    enfrentam exatamente a mesma sequência de focos.
+
+    Atributos:
+        configuracao (ConfiguracaoSimulacao): Parâmetros da simulação
+        central (CentralAtendimento): Central simulada
+        relogio (RelogioSimulado): Relógio do tempo simulado
+        _eventos (list): Heap de (segundos, tipo, sequência, ocorrência, equipe)
+        _servico (dict[int, float]): Minutos de combate sorteados para cada ocorrência
+    """
+
+    def __init__(self, configuracao: ConfiguracaoSimulacao, politica: PoliticaPrioridade | None = None, semente=42):
+        """
+        Prepara a central, as equipes e o relógio simulado.
+
+        Args:
+            configuracao (ConfiguracaoSimulacao): Parâmetros da simulação
+            politica (PoliticaPrioridade | None): Política de prioridade da central
+            semente (int): Semente das chegadas e dos tempos de combate
+        """
+        self.configuracao = configuracao
+        self.central = CentralAtendimento(politica=politica)
+        self.relogio = RelogioSimulado(configuracao.inicio)
+        self._aleatorio = random.Random(semente)
+        self._eventos: list = []
+        self._sequencia = 0
+        self._servico: dict[int, float] = {}
+        for (origem, destino), custo in configuracao.custos.items():
+            self.central.despacho.definir_custo(origem, destino, custo)
+        for regiao, quantidade in configuracao.equipes_por_regiao.items():
+            for numero in range(1, quantidade + 1):
+                self.central.adicionar_equipe(Equipe(f"{regiao} {numero}", regiao))
+        self._regioes = list(configuracao.pesos_regiao)
+        self._pesos_regioes = list(configuracao.pesos_regiao.values())
+        self._severidades = list(configuracao.pesos_severidade)
+        self._pesos_severidades = list(configuracao.pesos_severidade.values())
+
+    def minutos_deslocamento(self, origem: str, destino: str) -> float:
+        """Tempo de deslocamento de uma equipe entre duas regiões."""
+        if origem == destino:
+            return self.configuracao.minutos_deslocamento_local
+        custo = self.central.despacho.custos.get((origem, destino), self.central.despacho.custo_padrao)
+        return custo * self.configuracao.minutos_por_custo
+
+    def _agendar(self, segundos: float, tipo: int, ocorrencia=None, equipe=None):
+        self._sequencia += 1
+        heapq.heappush(self._eventos, (segundos, tipo, self._sequencia, ocorrencia, equipe))
+
+    def _proxima_chegada(self, agora: float, horizonte: float):
+        """Agenda o próximo foco se ele cair dentro do período de chegadas."""
+        instante = agora + self._aleatorio.expovariate(self.configuracao.chegadas_por_hora / 3600.0)
+        if instante <= horizonte:
+            self._agendar(instante, EVENTO_CHEGADA)
+
+    def executar(self) -> dict:
+        """
+        Executa a simulação até o fim do período de chegadas e do atendimento dos focos restantes.
+
+        Returns:
+            dict: Estatísticas de espera, resposta, fila e utilização (ver _estatisticas)
+        """
+        configuracao = self.configuracao
+        central = self.central
+        fila = central.fila_prioridade
+        horizonte = configuracao.dias * 86400.0
+        inicio = configuracao.inicio
+        esperas = array("d")  # Minutos entre o registro e o despacho
+        esperas_por_severidade: dict[int, array] = {severidade: array("d") for severidade in self._severidades}
+        respostas = array("d")  # Minutos entre o registro e a chegada da equipe ao local
+        ocupacao = 0.0  # Soma dos segundos em que cada equipe esteve fora da base
+        saida: dict[Equipe, float] = {}
+        area_fila = 0.0
+        fila_maxima = 0
+        anterior = 0.0
+
+        relogio_anterior = definir_relogio(self.relogio)
+        try:
+            self._proxima_chegada(0.0, horizonte)
+            while self._eventos:
+                agora, tipo, _, ocorrencia, equipe = heapq.heappop(self._eventos)
+                pendentes = len(fila)
+                area_fila += pendentes * (agora - anterior)
+                fila_maxima = max(fila_maxima, pendentes)
+                anterior = agora
+                self.relogio.avancar_para(inicio + timedelta(seconds=agora))
+
+                if tipo == EVENTO_CHEGADA:
+                    regiao = self._aleatorio.choices(self._regioes, self._pesos_regioes)[0]
+                    severidade = self._aleatorio.choices(self._severidades, self._pesos_severidades)[0]
+                    ocorrencia = central.registrar_ocorrencia(Ocorrencia(regiao, severidade, "Foco simulado"))
+                    self._servico[ocorrencia.id] = self._aleatorio.expovariate(1.0 / configuracao.minutos_servico[severidade])
+                    self._proxima_chegada(agora, horizonte)
+                elif tipo == EVENTO_NO_LOCAL:
+                    respostas.append((self.relogio.instante - ocorrencia.data_registro).total_seconds() / 60.0)
+                    self._agendar(agora + self._servico.pop(ocorrencia.id) * 60.0, EVENTO_CONCLUSAO, ocorrencia, equipe)
+                elif tipo == EVENTO_CONCLUSAO:
+                    central.concluir(ocorrencia.id)
+                    # A equipe só volta a ficar livre quando chega de volta à base
+                    if equipe.disponivel:
+                        central.despacho.ocupar(equipe)
+                    retorno = self.minutos_deslocamento(ocorrencia.regiao, equipe.regiao_base) * 60.0
+                    self._agendar(agora + retorno, EVENTO_RETORNO, equipe=equipe)
+                else:
+                    ocupacao += agora - saida.pop(equipe)
+                    if equipe.disponivel:
+                        central.despacho.liberar(equipe)
+
+                for ocorrencia, equipe in central.despachar():
+                    espera = (self.relogio.instante - ocorrencia.data_registro).total_seconds() / 60.0
+                    esperas.append(espera)
+                    esperas_por_severidade[ocorrencia.severidade].append(espera)
+                    saida[equipe] = agora
+                    ida = self.minutos_deslocamento(equipe.regiao_base, ocorrencia.regiao) * 60.0
+                    self._agendar(agora + ida, EVENTO_NO_LOCAL, ocorrencia, equipe)
+        finally:
+            definir_relogio(relogio_anterior)
+
+        return self._estatisticas(esperas, esperas_por_severidade, respostas, ocupacao, area_fila, fila_maxima, anterior)
+
+    def _estatisticas(self, esperas, esperas_por_severidade, respostas, ocupacao, area_fila, fila_maxima, duracao) -> dict:
+        """
+        Resume as medidas coletadas.
+
+        Returns:
+            dict: ocorrencias, espera_media_min, espera_p50_min, espera_p90_min,
+                espera_p99_min, espera_media_por_severidade, resposta_media_min,
+                utilizacao (fração do tempo com as equipes fora da base),
+                fila_media, fila_maxima e dias_simulados
+        """
+        ordenadas = sorted(esperas)
+        total_equipes = len(self.central.equipes)
+        return {
+            "ocorrencias": len(esperas),
+            "espera_media_min": sum(esperas) / len(esperas) if esperas else 0.0,
+            "espera_p50_min": percentil(ordenadas, 0.50),
+            "espera_p90_min": percentil(ordenadas, 0.90),
+            "espera_p99_min": percentil(ordenadas, 0.99),
+            "espera_media_por_severidade": {
+                severidade: sum(valores) / len(valores) if valores else 0.0
+                for severidade, valores in sorted(esperas_por_severidade.items())
+            },
+            "resposta_media_min": sum(respostas) / len(respostas) if respostas else 0.0,
+            "utilizacao": ocupacao / (total_equipes * duracao) if total_equipes and duracao else 0.0,
+            "fila_media": area_fila / duracao if duracao else 0.0,
+            "fila_maxima": fila_maxima,
+            "dias_simulados": duracao / 86400.0,
+        }
+
+
+def comparar_politicas(configuracao: ConfiguracaoSimulacao, politicas=None, semente=42) -> dict[str, dict]:
+    """
+    Simula a mesma sequência de focos com cada política de prioridade.
+
+    Args:
+        configuracao (ConfiguracaoSimulacao): Parâmetros da simulação
+        politicas (dict[str, PoliticaPrioridade] | None): Políticas por nome
+            (padrão: severidade e envelhecimento de 10 e 60 minutos por nível)
+        semente (int): Semente comum a todas as simulações
+
+    Returns:
+        dict[str, dict]: Estatísticas de cada política, com o tempo de parede em "segundos_parede"
+    """
+    if politicas is None:
+        politicas = {
+            "severidade": PoliticaSeveridade(),
+            "envelhecimento 10min": PoliticaEnvelhecimento(600.0),
+            "envelhecimento 60min": PoliticaEnvelhecimento(3600.0),
+        }
+    resultados = {}
+    for nome, politica in politicas.items():
+        inicio = time.perf_counter()
+        estatisticas = Simulador(configuracao, politica, semente).executar()
+        estatisticas["segundos_parede"] = time.perf_counter() - inicio
+        resultados[nome] = estatisticas
+    return resultados
+
+
+def main():
+    dias = float(sys.argv[1]) if len(sys.argv) > 1 else 90.0
+    chegadas_por_hora = float(sys.argv[2]) if len(sys.argv) > 2 else 4.0
+    semente = int(sys.argv[3]) if len(sys.argv) > 3 else 42
+    configuracao = ConfiguracaoSimulacao(dias=dias, chegadas_por_hora=chegadas_por_hora)
+    resultados = comparar_politicas(configuracao, semente=semente)
+
+    print("\n" + "="*96)
+    print(f"🔥 SIMULAÇÃO: {dias:g} dias, {chegadas_por_hora:g} focos/hora, "
+          f"{sum(configuracao.equipes_por_regiao.values())} equipes, semente {semente}")
+    print("="*96)
+    print(f"{'política':<22} | {'focos':>6} | {'espera média':>12} | {'p90':>7} | {'p99':>7} | "
+          f"{'sev 5':>7} | {'sev 1':>7} | {'utiliz.':>7} | {'parede':>7}")
+    print("-"*96)
+    for nome, r in resultados.items():
+        por_severidade = r["espera_media_por_severidade"]
+        print(f"{nome:<22} | {r['ocorrencias']:>6} | {r['espera_media_min']:>8.1f} min | "
+              f"{r['espera_p90_min']:>7.1f} | {r['espera_p99_min']:>7.1f} | "
+              f"{por_severidade.get(5, 0.0):>7.1f} | {por_severidade.get(1, 0.0):>7.1f} | "
+              f"{r['utilizacao']:>6.1%} | {r['segundos_parede']:>6.2f}s")
+    print("Tempos de espera em minutos (registro até o despacho).")
+
+
+if __name__ == "__main__":
+    main()